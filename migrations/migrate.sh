@@ -464,7 +464,7 @@ run_sql_migrations() {
         
         # Run the migration with timing
         local start_time=$(date +%s)
-        if psql "$TIMESCALE_DSN" < "$migration_file"; then
+        if psql -v ON_ERROR_STOP=1 "$TIMESCALE_DSN" < "$migration_file"; then
             local end_time=$(date +%s)
             local execution_time=$(( (end_time - start_time) * 1000 ))
             
@@ -564,7 +564,7 @@ rollback_sql_migration() {
     log_info "  🔄 Rolling back $up_filename..."
     
     local start_time=$(date +%s)
-    if psql "$TIMESCALE_DSN" < "$down_file"; then
+    if psql -v ON_ERROR_STOP=1 "$TIMESCALE_DSN" < "$down_file"; then
         local end_time=$(date +%s)
         local execution_time=$(( (end_time - start_time) * 1000 ))
         
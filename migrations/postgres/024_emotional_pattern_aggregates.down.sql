@@ -0,0 +1,9 @@
+-- Down: Remove running aggregate columns from emotional_patterns
+-- Rows rebuilt or merged by the up migration are kept; their frequency and
+-- averages now cover all stored states rather than the last 24 hours.
+
+DROP INDEX IF EXISTS uniq_emotional_patterns_key;
+
+ALTER TABLE emotional_patterns
+  DROP COLUMN IF EXISTS arousal_m2,
+  DROP COLUMN IF EXISTS valence_m2;
@@ -0,0 +1,120 @@
+-- Running (Welford) aggregates for emotional patterns
+-- One row per (user_id, pattern_type, dominant_emotion), updated in O(1) by an
+-- upsert on every recorded state instead of rescanning the last 24 hours.
+--   frequency        -> sample count n
+--   average_valence  -> running mean of valence
+--   average_arousal  -> running mean of arousal
+--   valence_m2       -> sum of squared deviations of valence (variance = m2 / n)
+--   arousal_m2       -> sum of squared deviations of arousal
+
+ALTER TABLE emotional_patterns
+  ADD COLUMN IF NOT EXISTS valence_m2 FLOAT NOT NULL DEFAULT 0.0,
+  ADD COLUMN IF NOT EXISTS arousal_m2 FLOAT NOT NULL DEFAULT 0.0;
+
+-- Backfill: existing "triggered" rows (the only type the service writes and
+-- the only one the upsert extends) summarised just the last 24 hours and have
+-- no M2, so they cannot be folded into. They are rebuilt from every stored
+-- state in emotional_memories instead: n, means, M2 (= var_pop * n), time
+-- span and the most recent distinct triggers. The rebuild also merges any
+-- duplicate rows per key. Keys with no stored states left are dropped and
+-- start fresh on the next recorded state.
+DELETE FROM emotional_patterns WHERE pattern_type = 'triggered';
+
+INSERT INTO emotional_patterns (
+    id, user_id, pattern_type, start_time, end_time, dominant_emotion,
+    average_valence, average_arousal, valence_m2, arousal_m2,
+    frequency, confidence, triggers, metadata
+)
+SELECT
+    gen_random_uuid(), s.user_id, 'triggered', s.start_time, s.end_time,
+    s.emotional_state, s.mean_valence, s.mean_arousal, s.valence_m2,
+    s.arousal_m2, s.n,
+    GREATEST(0.0, LEAST(1.0,
+        1.0 - (s.valence_m2 + s.arousal_m2) / (2.0 * s.n))),
+    t.triggers,
+    jsonb_build_object('updated_at', now(), 'backfilled', true)
+FROM (
+    SELECT user_id, emotional_state,
+           COUNT(*) AS n,
+           AVG(valence) AS mean_valence,
+           AVG(arousal) AS mean_arousal,
+           VAR_POP(valence) * COUNT(*) AS valence_m2,
+           VAR_POP(arousal) * COUNT(*) AS arousal_m2,
+           MIN(timestamp) AS start_time,
+           MAX(timestamp) AS end_time
+    FROM emotional_memories
+    WHERE emotional_state IS NOT NULL
+      AND valence IS NOT NULL
+      AND arousal IS NOT NULL
+    GROUP BY user_id, emotional_state
+) s
+LEFT JOIN LATERAL (
+    SELECT array_agg(trigger_event ORDER BY last_seen) AS triggers
+    FROM (
+        SELECT m.trigger_event, MAX(m.timestamp) AS last_seen
+        FROM emotional_memories m
+        WHERE m.user_id = s.user_id
+          AND m.emotional_state = s.emotional_state
+          AND m.valence IS NOT NULL
+          AND m.arousal IS NOT NULL
+          AND COALESCE(m.trigger_event, '') <> ''
+        GROUP BY m.trigger_event
+        ORDER BY last_seen DESC
+        LIMIT 20  -- PATTERN_MAX_TRIGGERS
+    ) recent
+) t ON TRUE;
+
+-- Other pattern types have no source rows to rebuild from: merge duplicates
+-- per key into the most recent row (summed counts, count-weighted means and
+-- the between-row M2), then drop the merged copies.
+WITH copies AS (
+    SELECT id, user_id, pattern_type, dominant_emotion, frequency,
+           average_valence, average_arousal, start_time, end_time,
+           SUM(frequency) OVER k AS n,
+           SUM(frequency * average_valence) OVER k / SUM(frequency) OVER k
+             AS mean_valence,
+           SUM(frequency * average_arousal) OVER k / SUM(frequency) OVER k
+             AS mean_arousal,
+           COUNT(*) OVER k AS copy_count,
+           ROW_NUMBER() OVER (
+             PARTITION BY user_id, pattern_type, dominant_emotion
+             ORDER BY COALESCE(end_time, start_time) DESC, id DESC
+           ) AS recency
+    FROM emotional_patterns
+    WHERE pattern_type <> 'triggered'
+    WINDOW k AS (PARTITION BY user_id, pattern_type, dominant_emotion)
+), merged AS (
+    SELECT user_id, pattern_type, dominant_emotion,
+           (array_agg(id ORDER BY recency))[1] AS keep_id,
+           MAX(n) AS n,
+           MAX(mean_valence) AS mean_valence,
+           MAX(mean_arousal) AS mean_arousal,
+           SUM(frequency * (average_valence - mean_valence) ^ 2) AS valence_m2,
+           SUM(frequency * (average_arousal - mean_arousal) ^ 2) AS arousal_m2,
+           MIN(start_time) AS start_time,
+           MAX(end_time) AS end_time
+    FROM copies
+    WHERE copy_count > 1
+    GROUP BY user_id, pattern_type, dominant_emotion
+)
+UPDATE emotional_patterns p
+SET frequency = m.n,
+    average_valence = m.mean_valence,
+    average_arousal = m.mean_arousal,
+    valence_m2 = m.valence_m2,
+    arousal_m2 = m.arousal_m2,
+    start_time = m.start_time,
+    end_time = m.end_time
+FROM merged m
+WHERE p.id = m.keep_id;
+
+DELETE FROM emotional_patterns p
+USING emotional_patterns newer
+WHERE p.user_id = newer.user_id
+  AND p.pattern_type = newer.pattern_type
+  AND p.dominant_emotion = newer.dominant_emotion
+  AND (COALESCE(newer.end_time, newer.start_time), newer.id)
+    > (COALESCE(p.end_time, p.start_time), p.id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uniq_emotional_patterns_key
+  ON emotional_patterns (user_id, pattern_type, dominant_emotion);
@@ -0,0 +1,3 @@
+-- Rollback: Remove batch-claim worker column
+
+ALTER TABLE scheduled_intents DROP COLUMN IF EXISTS claimed_by;
@@ -0,0 +1,7 @@
+-- Batch claim: record which worker holds an intent's claim
+-- Set by POST /v1/intents/claim-batch alongside claimed_at, cleared on fire
+
+ALTER TABLE scheduled_intents
+ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(128);
+
+COMMENT ON COLUMN scheduled_intents.claimed_by IS 'Worker ID that holds the current claim (NULL when unclaimed or claimed via the single-intent endpoint)';
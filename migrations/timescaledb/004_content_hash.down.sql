@@ -0,0 +1,13 @@
+-- Rollback content hashes on episodic and emotional memories
+
+DROP PROCEDURE IF EXISTS backfill_content_hash(TEXT, INTEGER, BOOLEAN);
+
+DROP TRIGGER IF EXISTS trg_episodic_content_hash ON episodic_memories;
+DROP FUNCTION IF EXISTS set_episodic_content_hash();
+DROP INDEX IF EXISTS idx_episodic_user_content_hash;
+ALTER TABLE episodic_memories DROP COLUMN IF EXISTS content_hash;
+
+DROP TRIGGER IF EXISTS trg_emotional_content_hash ON emotional_memories;
+DROP FUNCTION IF EXISTS set_emotional_content_hash();
+DROP INDEX IF EXISTS idx_emotional_user_content_hash;
+ALTER TABLE emotional_memories DROP COLUMN IF EXISTS content_hash;
@@ -0,0 +1,99 @@
+-- Content hashes for set-based dedup of episodic and emotional memories
+-- Dedup joins rows on (user_id, content_hash) instead of partitioning on full TEXT.
+--
+-- content_hash is a plain nullable column kept current by a BEFORE INSERT/UPDATE
+-- trigger. Adding it is a metadata-only change that TimescaleDB allows on
+-- compressed hypertables, so compression and its policies stay untouched and
+-- no rows are rewritten here. Every statement is idempotent, so a failed run
+-- can simply be re-applied.
+--
+-- Existing rows keep content_hash NULL until backfilled. NULL hashes never
+-- match, so un-backfilled rows are skipped by dedup rather than mis-matched.
+-- Backfill is a separate, resumable operational step (see
+-- migrations/README.md) that runs in small committed batches:
+--
+--   CALL backfill_content_hash('episodic_memories');
+--   CALL backfill_content_hash('emotional_memories');
+
+-- Episodic: hash of the content text
+ALTER TABLE episodic_memories ADD COLUMN IF NOT EXISTS content_hash BYTEA;
+
+CREATE OR REPLACE FUNCTION set_episodic_content_hash() RETURNS trigger AS $$
+BEGIN
+    NEW.content_hash := decode(md5(coalesce(NEW.content, '')), 'hex');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_episodic_content_hash ON episodic_memories;
+CREATE TRIGGER trg_episodic_content_hash
+    BEFORE INSERT OR UPDATE OF content ON episodic_memories
+    FOR EACH ROW EXECUTE FUNCTION set_episodic_content_hash();
+
+CREATE INDEX IF NOT EXISTS idx_episodic_user_content_hash
+    ON episodic_memories (user_id, content_hash);
+
+-- Emotional: hash of (emotional_state, trigger_event), the dedup grouping key
+ALTER TABLE emotional_memories ADD COLUMN IF NOT EXISTS content_hash BYTEA;
+
+CREATE OR REPLACE FUNCTION set_emotional_content_hash() RETURNS trigger AS $$
+BEGIN
+    NEW.content_hash := decode(
+        md5(coalesce(NEW.emotional_state, '') || '|' || coalesce(NEW.trigger_event, '')),
+        'hex'
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_emotional_content_hash ON emotional_memories;
+CREATE TRIGGER trg_emotional_content_hash
+    BEFORE INSERT OR UPDATE OF emotional_state, trigger_event ON emotional_memories
+    FOR EACH ROW EXECUTE FUNCTION set_emotional_content_hash();
+
+CREATE INDEX IF NOT EXISTS idx_emotional_user_content_hash
+    ON emotional_memories (user_id, content_hash);
+
+-- Resumable backfill: one uncompressed chunk at a time, batch_size rows per
+-- committed transaction, only rows whose hash is still NULL. Compressed chunks
+-- are skipped unless include_compressed is true (updating them decompresses
+-- the touched segments); they are older than the dedup lookback by default.
+CREATE OR REPLACE PROCEDURE backfill_content_hash(
+    hypertable TEXT,
+    batch_size INTEGER DEFAULT 5000,
+    include_compressed BOOLEAN DEFAULT FALSE
+) LANGUAGE plpgsql AS $$
+DECLARE
+    hash_expr TEXT;
+    chunk REGCLASS;
+    updated INTEGER;
+BEGIN
+    IF hypertable = 'episodic_memories' THEN
+        hash_expr := $h$decode(md5(coalesce(content, '')), 'hex')$h$;
+    ELSIF hypertable = 'emotional_memories' THEN
+        hash_expr := $h$decode(md5(coalesce(emotional_state, '') || '|' || coalesce(trigger_event, '')), 'hex')$h$;
+    ELSE
+        RAISE EXCEPTION 'backfill_content_hash: unsupported table %', hypertable;
+    END IF;
+
+    FOR chunk IN
+        SELECT format('%I.%I', chunk_schema, chunk_name)::regclass
+        FROM timescaledb_information.chunks
+        WHERE hypertable_name = hypertable
+          AND (include_compressed OR NOT is_compressed)
+        ORDER BY range_end DESC
+    LOOP
+        LOOP
+            EXECUTE format(
+                'UPDATE %s SET content_hash = %s WHERE ctid = ANY(ARRAY('
+                'SELECT ctid FROM %s WHERE content_hash IS NULL LIMIT %s))',
+                chunk, hash_expr, chunk, batch_size
+            );
+            GET DIAGNOSTICS updated = ROW_COUNT;
+            COMMIT;
+            EXIT WHEN updated < batch_size;
+        END LOOP;
+        RAISE NOTICE 'backfill_content_hash: % done', chunk;
+    END LOOP;
+END;
+$$;
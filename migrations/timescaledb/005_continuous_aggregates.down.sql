@@ -0,0 +1,9 @@
+-- Rollback continuous aggregates for emotional and episodic memories
+
+SELECT remove_continuous_aggregate_policy('episodic_daily', if_exists => TRUE);
+SELECT remove_continuous_aggregate_policy('emotional_daily', if_exists => TRUE);
+SELECT remove_continuous_aggregate_policy('emotional_hourly', if_exists => TRUE);
+
+DROP MATERIALIZED VIEW IF EXISTS episodic_daily;
+DROP MATERIALIZED VIEW IF EXISTS emotional_daily;
+DROP MATERIALIZED VIEW IF EXISTS emotional_hourly;
@@ -0,0 +1,89 @@
+-- Continuous aggregates for emotional trajectories and episodic timelines
+-- Long-range queries read these buckets instead of raw hypertable rows.
+-- Sums are stored next to averages so coarser rollups can be re-weighted.
+-- materialized_only = false adds not-yet-materialized recent rows at query time.
+
+-- Hourly emotional buckets per user
+CREATE MATERIALIZED VIEW IF NOT EXISTS emotional_hourly
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    user_id,
+    time_bucket(INTERVAL '1 hour', timestamp) AS bucket,
+    COUNT(*) AS state_count,
+    AVG(valence) AS avg_valence,
+    MIN(valence) AS min_valence,
+    MAX(valence) AS max_valence,
+    AVG(arousal) AS avg_arousal,
+    AVG(intensity) AS avg_intensity,
+    MAX(intensity) AS max_intensity,
+    SUM(valence) AS sum_valence,
+    SUM(arousal) AS sum_arousal,
+    SUM(intensity) AS sum_intensity
+FROM emotional_memories
+GROUP BY user_id, time_bucket(INTERVAL '1 hour', timestamp)
+WITH NO DATA;
+
+SELECT add_continuous_aggregate_policy('emotional_hourly',
+    start_offset => INTERVAL '3 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '30 minutes',
+    if_not_exists => TRUE);
+
+-- Daily emotional buckets per user
+CREATE MATERIALIZED VIEW IF NOT EXISTS emotional_daily
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    user_id,
+    time_bucket(INTERVAL '1 day', timestamp) AS bucket,
+    COUNT(*) AS state_count,
+    AVG(valence) AS avg_valence,
+    MIN(valence) AS min_valence,
+    MAX(valence) AS max_valence,
+    AVG(arousal) AS avg_arousal,
+    AVG(intensity) AS avg_intensity,
+    MAX(intensity) AS max_intensity,
+    SUM(valence) AS sum_valence,
+    SUM(arousal) AS sum_arousal,
+    SUM(intensity) AS sum_intensity
+FROM emotional_memories
+GROUP BY user_id, time_bucket(INTERVAL '1 day', timestamp)
+WITH NO DATA;
+
+SELECT add_continuous_aggregate_policy('emotional_daily',
+    start_offset => INTERVAL '7 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '1 hour',
+    if_not_exists => TRUE);
+
+-- Daily episodic counts and importance stats per user
+CREATE MATERIALIZED VIEW IF NOT EXISTS episodic_daily
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    user_id,
+    time_bucket(INTERVAL '1 day', event_timestamp) AS bucket,
+    COUNT(*) AS event_count,
+    AVG(importance_score) AS avg_importance,
+    MAX(importance_score) AS max_importance,
+    AVG(emotional_valence) AS avg_valence,
+    AVG(emotional_arousal) AS avg_arousal
+FROM episodic_memories
+GROUP BY user_id, time_bucket(INTERVAL '1 day', event_timestamp)
+WITH NO DATA;
+
+SELECT add_continuous_aggregate_policy('episodic_daily',
+    start_offset => INTERVAL '14 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '1 hour',
+    if_not_exists => TRUE);
+
+CREATE INDEX IF NOT EXISTS idx_emotional_hourly_user_bucket
+    ON emotional_hourly (user_id, bucket DESC);
+CREATE INDEX IF NOT EXISTS idx_emotional_daily_user_bucket
+    ON emotional_daily (user_id, bucket DESC);
+CREATE INDEX IF NOT EXISTS idx_episodic_daily_user_bucket
+    ON episodic_daily (user_id, bucket DESC);
+
+-- Backfill existing history once; the policies keep recent buckets fresh
+CALL refresh_continuous_aggregate('emotional_hourly', NULL, NOW() - INTERVAL '1 hour');
+CALL refresh_continuous_aggregate('emotional_daily', NULL, NOW() - INTERVAL '1 hour');
+CALL refresh_continuous_aggregate('episodic_daily', NULL, NOW() - INTERVAL '1 hour');
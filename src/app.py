@@ -1,8 +1,9 @@
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 import logging
 from zoneinfo import ZoneInfo
-import os
+import threading
 from typing import Any, Dict, List, Optional
 import json
 
@@ -11,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from os import getenv
 
 from src.schemas import (
+    CompactionProgress,
     ForgetRequest,
     MaintenanceRequest,
     MaintenanceResponse,
@@ -38,9 +40,14 @@ from src.schemas import (
     PersonaSelection,
     PersonaExplainability,
 )
-from src.dependencies.chroma import get_chroma_client
-from src.dependencies.timescale import ping_timescale
-from src.dependencies.redis_client import get_redis_client
+from src.dependencies.chroma import close_chroma_client, get_chroma_client
+from src.dependencies.event_loop import set_app_loop
+from src.dependencies.timescale import close_async_timescale_pool, ping_timescale
+from src.dependencies.redis_client import (
+    close_async_redis_client,
+    get_async_redis_client,
+    get_redis_client,
+)
 from src.config import (
     get_openai_api_key,
     get_chroma_host,
@@ -54,6 +61,9 @@ from src.config import get_xai_base_url, get_chroma_tenant, get_chroma_database
 import httpx
 from src.services.reconstruction import ReconstructionService
 from src.services.retrieval import (  # noqa: F401
+    asearch_memories,
+    decode_metadata,
+    iter_user_memories,
     search_memories,
     _standard_collection_name as _standard_collection_name,
 )
@@ -76,6 +86,8 @@ except Exception:
     BackgroundScheduler = None  # type: ignore
 from datetime import datetime as _dt, timezone as _tz, timedelta as _td
 from src.services.forget import run_compaction_for_user
+from src.services.compaction_queue import drain_queue, enqueue_users, queue_progress
+from src.services.intent_scheduler import start_intent_scheduler
 from src.services.persona_retrieval import PersonaCoPilot
 from src.routers import profile, portfolio, intents, memories
 
@@ -118,6 +130,9 @@ def _update_llm_cache(
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
+    # Sync callers in worker threads run async retrieval on this loop
+    set_app_loop(asyncio.get_running_loop())
+
     # Startup: Check LLM configuration
     if not is_llm_configured():
         raise RuntimeError(
@@ -171,6 +186,13 @@ async def lifespan(app: FastAPI):
             logging.getLogger("agentic_memories.api").info(
                 f"Chroma connected. Collections: {len(collections)}"
             )
+            # Resolve the embedding dimension and cache the collection handle
+            # once so request paths skip the probe and collection lookup.
+            collection_name = _standard_collection_name()
+            client.get_or_create_collection(collection_name)
+            logging.getLogger("agentic_memories.api").info(
+                "[startup] Chroma collection resolved: %s", collection_name
+            )
     except Exception as e:
         logging.getLogger("agentic_memories.api").warning(
             f"Chroma connection warning: {e}"
@@ -179,11 +201,26 @@ async def lifespan(app: FastAPI):
     # Startup: Start scheduler
     _start_scheduler()
 
+    # Startup: Start embedded intent trigger scheduler (opt-in)
+    intent_scheduler = start_intent_scheduler()
+
     yield
 
+    # Shutdown: Stop intent trigger scheduler
+    if intent_scheduler is not None:
+        intent_scheduler.stop()
+
     # Shutdown: Close memory orchestrator
     await _memory_orchestrator.shutdown()
 
+    # Shutdown: Release pooled Chroma connections
+    await close_chroma_client()
+
+    # Shutdown: Release async Redis / Postgres clients used by request paths
+    await close_async_redis_client()
+    await close_async_timescale_pool()
+    set_app_loop(None)
+
 
 app = FastAPI(title="Agentic Memories API", version="0.1.0", lifespan=lifespan)
 
@@ -201,39 +238,12 @@ def _run_daily_compaction() -> None:
     if r is None:
         logger.info("[maint.compaction] skipped: redis unavailable")
         return
-
-    # Use Redis Lock object for safe distributed locking
-    # - blocking=False: Don't wait if lock is held
-    # - timeout: Lock auto-expires if holder crashes
-    # - Lock.release() uses Lua script to atomically verify ownership
-    lock_key = "compaction_lock:daily"
-    lock_ttl = 3600  # 1 hour max lock duration
-    worker_id = f"worker-{os.getpid()}"
-
-    lock = r.lock(lock_key, timeout=lock_ttl, blocking=False)
-    acquired = lock.acquire()
-    if not acquired:
-        logger.info("[maint.compaction] skipped: another worker holds lock")
-        return
-
-    logger.info("[maint.compaction] lock acquired by %s", worker_id)
-
-    try:
-        _execute_compaction(r)
-    finally:
-        try:
-            lock.release()
-            logger.info("[maint.compaction] lock released by %s", worker_id)
-        except Exception as release_err:
-            # Lock may have expired - that's OK, just log it
-            logger.info(
-                "[maint.compaction] lock release skipped (may have expired): %s",
-                release_err,
-            )
+    _enqueue_recent_users(r)
+    _drain_compaction_queue()
 
 
-def _execute_compaction(r) -> None:
-    """Execute the actual compaction logic."""
+def _enqueue_recent_users(r) -> int:
+    """Queue compaction jobs for users active yesterday or today."""
     # Look at yesterday's activity set (the day we intend to compact)
     now = _dt.now(_tz.utc)
     day_key = (now - _td(days=1)).strftime("%Y%m%d")
@@ -251,14 +261,33 @@ def _execute_compaction(r) -> None:
             logger.info("[maint.compaction] failed to read %s: %s", k, exc)
     if not users:
         logger.info("[maint.compaction] no active users in last 24h")
-        return
-    # TODO: enqueue compaction graph per user (placeholder log)
-    for uid in sorted(users):
-        try:
-            stats = run_compaction_for_user(uid)
-            logger.info("[maint.compaction.done] user_id=%s stats=%s", uid, stats)
-        except Exception as exc:
-            logger.info("[maint.compaction.error] user_id=%s %s", uid, exc)
+        return 0
+    # Enqueueing is idempotent, so every worker process may do it.
+    return enqueue_users(r, users)
+
+
+def _drain_compaction_queue() -> None:
+    """Work the compaction queue with this process's worker pool."""
+    try:
+        drain_queue()
+    except Exception as exc:
+        logger.info("[maint.compaction] queue drain failed: %s", exc)
+
+
+def _drain_compaction_queue_in_background() -> None:
+    threading.Thread(
+        target=_drain_compaction_queue, name="compaction-drain", daemon=True
+    ).start()
+
+
+def _compaction_progress(r) -> Optional[CompactionProgress]:
+    if r is None:
+        return None
+    try:
+        return CompactionProgress(**queue_progress(r))
+    except Exception as exc:
+        logger.info("[maint.compaction] progress unavailable: %s", exc)
+        return None
 
 
 def _start_scheduler() -> None:
@@ -273,6 +302,11 @@ def _start_scheduler() -> None:
             _scheduler.add_job(
                 _run_daily_compaction, "cron", hour=0, minute=0, id="daily_compaction"
             )
+            # Picks up retries whose backoff has elapsed and jobs enqueued by
+            # other nodes.
+            _scheduler.add_job(
+                _drain_compaction_queue, "interval", minutes=5, id="compaction_queue"
+            )
             _scheduler.start()
             logger.info(
                 "[sched] started APScheduler with daily compaction job at 00:00 UTC"
@@ -905,6 +939,14 @@ def health_full() -> dict:
         pass  # Non-critical, just stats
     checks["record_counts"] = record_counts
 
+    # Embedding cache hit/miss counters (informational)
+    from src.services.embedding_cache import get_embedding_cache
+
+    embedding_cache = get_embedding_cache()
+    checks["embedding_cache"] = (
+        embedding_cache.stats() if embedding_cache is not None else {"enabled": False}
+    )
+
     # Release connection after all table checks
     if conn:
         release_timescale_conn(conn)
@@ -991,7 +1033,7 @@ def health_full() -> dict:
     # Critical: chroma, timescale, memory_tables, llm_connectivity
     # Important: intents_tables, profile_tables, portfolio_tables, chroma_collections, hypertables, migrations
     # Optional (None=not configured is OK): redis, langfuse
-    # Informational (no impact on status): record_counts
+    # Informational (no impact on status): record_counts, embedding_cache
     critical_ok = chroma_ok and ts_ok and memory_tables_ok and (llm_ok is True)
     important_ok = (
         intents_tables_ok
@@ -1020,15 +1062,16 @@ def health_full() -> dict:
 
 
 @app.post("/v1/store", response_model=StoreResponse)
-def store_transcript(body: TranscriptRequest) -> StoreResponse:
+async def store_transcript(body: TranscriptRequest) -> StoreResponse:
     # Guard: enforce LLM configuration
     if not is_llm_configured():
         raise HTTPException(status_code=400, detail="LLM is not configured")
 
-    # Use unified ingestion graph (replaces old extraction + routing)
-    from src.services.unified_ingestion_graph import run_unified_ingestion
+    # Use unified ingestion graph (replaces old extraction + routing); it runs on
+    # the dedicated ingestion pool so the event loop stays free meanwhile
+    from src.services.unified_ingestion_graph import arun_unified_ingestion
 
-    final_state = run_unified_ingestion(body)
+    final_state = await arun_unified_ingestion(body)
 
     # Extract results from final state
     memories = final_state.get("memories", [])
@@ -1036,14 +1079,16 @@ def store_transcript(body: TranscriptRequest) -> StoreResponse:
 
     # Bump Redis namespace for this user to invalidate short-term caches
     try:
-        redis = get_redis_client()
+        redis = get_async_redis_client()
         if redis is not None:
-            redis.incr(f"mem:ns:{body.user_id}")
-            # Record daily activity for compaction trigger (UTC date key)
+            # Record daily activity for compaction trigger (UTC date key) and
+            # track all users, in a single round trip
             day_key = datetime.now(timezone.utc).strftime("%Y%m%d")
-            redis.sadd(f"recent_users:{day_key}", body.user_id)
-            # Also track all users set
-            redis.sadd("all_users", body.user_id)
+            pipe = redis.pipeline(transaction=False)
+            pipe.incr(f"mem:ns:{body.user_id}")
+            pipe.sadd(f"recent_users:{day_key}", body.user_id)
+            pipe.sadd("all_users", body.user_id)
+            await pipe.execute()
     except Exception:
         pass
     items = [
@@ -1100,7 +1145,7 @@ def store_transcript(body: TranscriptRequest) -> StoreResponse:
 
 
 @app.get("/v1/retrieve", response_model=RetrieveResponse)
-def retrieve(
+async def retrieve(
     user_id: str = Query(...),
     query: Optional[str] = Query(
         default=None, description="Search query (optional - omit to get all memories)"
@@ -1143,7 +1188,7 @@ def retrieve(
     sorting = sort in ("newest", "oldest")
     fetch_limit = max(limit + offset, 1000) if sorting else limit + offset
 
-    persona_results = _persona_copilot.retrieve(
+    persona_results = await _persona_copilot.aretrieve(
         user_id=user_id,
         query=query or "",
         limit=fetch_limit,
@@ -1176,7 +1221,7 @@ def retrieve(
         # When sorting, fetch a larger pool first, sort, then paginate
         # (Fixes bug: previously sorted only the paginated page, not full results)
         if sorting:
-            pool, total = search_memories(
+            pool, total = await asearch_memories(
                 user_id=user_id,
                 query=query or "",
                 filters=fallback_filters,
@@ -1186,7 +1231,7 @@ def retrieve(
             pool.sort(key=_ts_key, reverse=(sort == "newest"))
             raw_items = pool[offset : offset + limit]
         else:
-            raw_items, total = search_memories(
+            raw_items, total = await asearch_memories(
                 user_id=user_id,
                 query=query or "",
                 filters=fallback_filters,
@@ -1297,7 +1342,7 @@ def retrieve(
 
 
 @app.post("/v1/retrieve", response_model=PersonaRetrieveResponse)
-def retrieve_persona(body: PersonaRetrieveRequest) -> PersonaRetrieveResponse:
+async def retrieve_persona(body: PersonaRetrieveRequest) -> PersonaRetrieveResponse:
     metadata_filters: Dict[str, Any] = dict(body.filters or {})
     if body.persona_context:
         if hasattr(body.persona_context, "model_dump"):
@@ -1307,7 +1352,7 @@ def retrieve_persona(body: PersonaRetrieveRequest) -> PersonaRetrieveResponse:
     else:
         persona_context = {}
     limit_with_offset = body.limit + body.offset
-    persona_results = _persona_copilot.retrieve(
+    persona_results = await _persona_copilot.aretrieve(
         user_id=body.user_id,
         query=body.query or "",
         limit=limit_with_offset,
@@ -1330,7 +1375,7 @@ def retrieve_persona(body: PersonaRetrieveRequest) -> PersonaRetrieveResponse:
 
     if persona_payload is None:
         fallback_filters = dict(metadata_filters)
-        raw_page, total_count = search_memories(
+        raw_page, total_count = await asearch_memories(
             user_id=body.user_id,
             query=body.query or "",
             filters=fallback_filters,
@@ -1362,14 +1407,18 @@ def retrieve_persona(body: PersonaRetrieveRequest) -> PersonaRetrieveResponse:
 
     state_snapshot_id = None
     try:
-        state = _persona_copilot.state_store.get_state(body.user_id)
+        state = await asyncio.to_thread(
+            _persona_copilot.state_store.get_state, body.user_id
+        )
         state_snapshot_id = f"{state.user_id}:{int(state.updated_at.timestamp())}"
     except Exception:
         state_snapshot_id = None
 
     narrative_text = None
     if body.include_narrative and raw_page:
-        narrative = _reconstruction.build_narrative(
+        # Narrative generation is a sync LLM call; keep it off the event loop
+        narrative = await asyncio.to_thread(
+            _reconstruction.build_narrative,
             user_id=body.user_id,
             query=body.query,
             limit=body.limit,
@@ -1426,20 +1475,26 @@ def retrieve_structured(body: StructuredRetrieveRequest) -> StructuredRetrieveRe
     if not is_llm_configured():
         raise HTTPException(status_code=400, detail="LLM is not configured")
 
-    # Pull ALL memories for the user (paginate with empty query)
+    # Pull ALL memories for the user, streamed page by page without embeddings
     all_results: List[dict] = []
-    batch_limit = max(10000, body.limit)
-    offset = 0
-    while True:
-        batch, _ = search_memories(
-            user_id=body.user_id, query="", filters={}, limit=batch_limit, offset=offset
-        )
-        if not batch:
-            break
-        all_results.extend(batch)
-        if len(batch) < batch_limit:
-            break
-        offset += batch_limit
+    try:
+        for page in iter_user_memories(
+            body.user_id, include=("documents", "metadatas")
+        ):
+            for mid, doc, meta in zip(
+                page.ids, page.documents or [], page.metadatas or []
+            ):
+                all_results.append(
+                    {
+                        "id": mid,
+                        "content": doc,
+                        "metadata": decode_metadata(meta),
+                        "score": 0.0,
+                    }
+                )
+    except RuntimeError as exc:
+        # Chroma is not available; organize an empty candidate set
+        logger.warning("[retrieve.structured] chroma unavailable: %s", exc)
 
     # Map candidates into a lightweight payload
     candidates = [
@@ -1693,12 +1748,35 @@ def forget(body: ForgetRequest) -> dict:
 @app.post("/v1/maintenance", response_model=MaintenanceResponse)
 def maintenance(body: MaintenanceRequest) -> MaintenanceResponse:
     jobs = body.jobs or ["compaction"]
+    r = get_redis_client()
     if "compaction" in jobs:
+        # Compaction only runs through the Redis queue; without it there is
+        # nothing for callers to poll, so say so instead of reporting "queued"
+        if r is None:
+            raise HTTPException(
+                status_code=503, detail="Compaction queue unavailable: Redis is down"
+            )
         try:
-            _run_daily_compaction()
+            _enqueue_recent_users(r)
+            _drain_compaction_queue_in_background()
         except Exception as exc:
-            logger.info("[maint.api] compaction trigger failed: %s", exc)
-    return MaintenanceResponse(jobs_started=jobs, status="running")
+            logger.warning("[maint.api] compaction trigger failed: %s", exc)
+            raise HTTPException(
+                status_code=503, detail="Failed to enqueue compaction jobs"
+            )
+    return MaintenanceResponse(
+        jobs_started=jobs, status="queued", progress=_compaction_progress(r)
+    )
+
+
+@app.get("/v1/maintenance", response_model=MaintenanceResponse)
+def maintenance_status() -> MaintenanceResponse:
+    """Report compaction queue progress."""
+    progress = _compaction_progress(get_redis_client())
+    busy = progress is not None and (progress.queued or progress.running)
+    return MaintenanceResponse(
+        jobs_started=[], status="running" if busy else "idle", progress=progress
+    )
 
 
 @app.get("/v1/portfolio/summary", response_model=PortfolioSummaryResponse)
@@ -1893,15 +1971,13 @@ def compact_all_users() -> MaintenanceResponse:
     if not users:
         logger.info("[maint.compact_all] no users found")
         return MaintenanceResponse(jobs_started=["compaction-none"], status="running")
-    for uid in sorted(users):
-        try:
-            stats = run_compaction_for_user(uid)
-            logger.info(
-                "[maint.compaction.done] user_id=%s (manual) stats=%s", uid, stats
-            )
-        except Exception as exc:
-            logger.info("[maint.compaction.error] user_id=%s (manual) %s", uid, exc)
-    return MaintenanceResponse(jobs_started=["compaction_all"], status="running")
+    enqueue_users(r, users)
+    _drain_compaction_queue_in_background()
+    return MaintenanceResponse(
+        jobs_started=["compaction_all"],
+        status="queued",
+        progress=_compaction_progress(r),
+    )
 
 
 @app.post("/v1/maintenance/compact")
@@ -1914,16 +1990,24 @@ def compact_single_user(
         default=False,
         description="Skip memory consolidation into golden records (default: false - consolidation runs)",
     ),
+    full_recluster: bool = Query(
+        default=False,
+        description="Process the whole memory set instead of only memories added since the last run",
+    ),
 ) -> dict:
     """Run compaction for a single user.
 
     By default, runs TTL cleanup, deduplication, and consolidation.
     Set skip_reextract=false to enable full LLM re-extraction (slow, expensive).
     Set skip_consolidate=true to disable memory consolidation.
+    Set full_recluster=true to ignore the user's compaction watermark.
     """
     try:
         stats = run_compaction_for_user(
-            user_id, skip_reextract=skip_reextract, skip_consolidate=skip_consolidate
+            user_id,
+            skip_reextract=skip_reextract,
+            skip_consolidate=skip_consolidate,
+            incremental=False if full_recluster else None,
         )
         logger.info(
             "[maint.compaction.done] user_id=%s skip_reextract=%s skip_consolidate=%s stats=%s",
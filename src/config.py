@@ -47,6 +47,23 @@ def is_llm_configured() -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
+def get_llm_max_connections() -> int:
+    """Connection pool size for shared OpenAI/xAI clients."""
+    try:
+        return int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+    except ValueError:
+        return 100
+
+
+@lru_cache(maxsize=1)
+def get_llm_max_keepalive_connections() -> int:
+    try:
+        return int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    except ValueError:
+        return 20
+
+
 @lru_cache(maxsize=1)
 def get_chroma_host() -> str:
     return os.getenv("CHROMA_HOST", "localhost")
@@ -115,6 +132,211 @@ def get_embedding_model_name() -> str:
     return os.getenv("EMBEDDING_MODEL", "text-embedding-3-large")
 
 
+@lru_cache(maxsize=1)
+def get_embedding_dimension() -> Optional[int]:
+    """Optional EMBEDDING_DIMENSION override; skips the startup dimension probe.
+
+    The configured value is confirmed lazily against the first real embedding.
+    """
+    raw = os.getenv("EMBEDDING_DIMENSION")
+    if not raw or not raw.strip():
+        return None
+    try:
+        dim = int(raw)
+    except ValueError:
+        return None
+    return dim if dim > 0 else None
+
+
+@lru_cache(maxsize=1)
+def is_embedding_cache_enabled() -> bool:
+    return os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+@lru_cache(maxsize=1)
+def get_embedding_cache_max_items() -> int:
+    """In-process LRU size; each 3072-dim float32 entry is ~12KB."""
+    try:
+        return int(os.getenv("EMBEDDING_CACHE_MAX_ITEMS", "2048"))
+    except ValueError:
+        return 2048
+
+
+@lru_cache(maxsize=1)
+def get_embedding_cache_ttl_seconds() -> int:
+    try:
+        return int(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+    except ValueError:
+        return 30 * 24 * 3600
+
+
+@lru_cache(maxsize=1)
+def is_hybrid_retrieval_parallel() -> bool:
+    return os.getenv("HYBRID_RETRIEVAL_PARALLEL", "true").lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+@lru_cache(maxsize=1)
+def get_hybrid_retrieval_timeout_seconds() -> float:
+    """Per-strategy deadline; slower strategies are dropped from the response."""
+    try:
+        return float(os.getenv("HYBRID_RETRIEVAL_TIMEOUT_SECONDS", "5.0"))
+    except ValueError:
+        return 5.0
+
+
+@lru_cache(maxsize=1)
+def get_temporal_aggregate_after_days() -> int:
+    """Temporal ranges longer than this read only the top days (0, the default = never).
+
+    Opt-in: capped ranges return at most TEMPORAL_TOP_DAYS * TEMPORAL_ROWS_PER_DAY
+    rows per table instead of every row in the range.
+    """
+    try:
+        return int(os.getenv("TEMPORAL_AGGREGATE_AFTER_DAYS", "0"))
+    except ValueError:
+        return 0
+
+
+@lru_cache(maxsize=1)
+def get_temporal_top_days() -> int:
+    """Days read per long-range temporal query, most significant first."""
+    try:
+        return int(os.getenv("TEMPORAL_TOP_DAYS", "14"))
+    except ValueError:
+        return 14
+
+
+@lru_cache(maxsize=1)
+def get_temporal_rows_per_day() -> int:
+    """Raw rows read from each of those days."""
+    try:
+        return int(os.getenv("TEMPORAL_ROWS_PER_DAY", "10"))
+    except ValueError:
+        return 10
+
+
+@lru_cache(maxsize=1)
+def get_ingestion_max_concurrency() -> int:
+    """In-flight /v1/store ingestions per worker (dedicated thread pool size)."""
+    try:
+        return int(os.getenv("INGESTION_MAX_CONCURRENCY", "32"))
+    except ValueError:
+        return 32
+
+
+@lru_cache(maxsize=1)
+def get_compaction_full_recluster_days() -> int:
+    """Days between full compaction runs; runs in between only process new
+    memories. 0 disables incremental compaction."""
+    try:
+        return int(os.getenv("COMPACTION_FULL_RECLUSTER_DAYS", "7"))
+    except ValueError:
+        return 7
+
+
+@lru_cache(maxsize=1)
+def get_compaction_dedup_lookback_days() -> int:
+    """History covered by TimescaleDB dedup on full compaction runs; incremental
+    runs cover only the time since the watermark. 0 scans the whole history."""
+    try:
+        return int(os.getenv("COMPACTION_DEDUP_LOOKBACK_DAYS", "30"))
+    except ValueError:
+        return 30
+
+
+@lru_cache(maxsize=1)
+def get_compaction_workers() -> int:
+    """Compaction queue worker threads per process."""
+    try:
+        return int(os.getenv("COMPACTION_WORKERS", "4"))
+    except ValueError:
+        return 4
+
+
+@lru_cache(maxsize=1)
+def get_compaction_lease_seconds() -> int:
+    """Per-user job lease; workers heartbeat at a third of this interval."""
+    try:
+        return int(os.getenv("COMPACTION_LEASE_SECONDS", "300"))
+    except ValueError:
+        return 300
+
+
+@lru_cache(maxsize=1)
+def get_compaction_max_attempts() -> int:
+    """Attempts before a user's job moves to the dead-letter set."""
+    try:
+        return int(os.getenv("COMPACTION_MAX_ATTEMPTS", "3"))
+    except ValueError:
+        return 3
+
+
+@lru_cache(maxsize=1)
+def get_compaction_retry_backoff_seconds() -> int:
+    """Base retry delay, doubled per attempt (capped at one hour)."""
+    try:
+        return int(os.getenv("COMPACTION_RETRY_BACKOFF_SECONDS", "60"))
+    except ValueError:
+        return 60
+
+
+@lru_cache(maxsize=1)
+def get_compaction_llm_concurrency() -> int:
+    """In-flight LLM calls (consolidation, re-extraction) per process."""
+    try:
+        return int(os.getenv("COMPACTION_LLM_CONCURRENCY", "4"))
+    except ValueError:
+        return 4
+
+
+@lru_cache(maxsize=1)
+def get_compaction_consolidate_parallelism() -> int:
+    """Clusters consolidated concurrently within one compaction run."""
+    try:
+        return int(os.getenv("COMPACTION_CONSOLIDATE_PARALLELISM", "4"))
+    except ValueError:
+        return 4
+
+
+@lru_cache(maxsize=1)
+def get_compaction_llm_rate_per_minute() -> int:
+    """Compaction LLM request budget per process; 0 disables the limit."""
+    try:
+        return int(os.getenv("COMPACTION_LLM_RATE_PER_MINUTE", "120"))
+    except ValueError:
+        return 120
+
+
+@lru_cache(maxsize=1)
+def is_intent_scheduler_enabled() -> bool:
+    """Run the embedded intent trigger scheduler (default: false)."""
+    return os.getenv("INTENT_SCHEDULER_ENABLED", "false").lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+@lru_cache(maxsize=1)
+def get_intent_scheduler_resync_seconds() -> int:
+    """Seconds between full reloads of upcoming intents by the scheduler."""
+    try:
+        return int(os.getenv("INTENT_SCHEDULER_RESYNC_SECONDS", "60"))
+    except ValueError:
+        return 60
+
+
 @lru_cache(maxsize=1)
 def get_aggressive_mode() -> bool:
     return os.getenv("EXTRACTION_AGGRESSIVE", "true").lower() in {
@@ -1,6 +1,13 @@
 import os
 import json
-from typing import Any, Dict, Optional
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
 
 # Workaround for ChromaDB 0.5.3 v1 API limitation
 # Create a custom client that bypasses tenant validation
@@ -13,12 +20,36 @@ except Exception:  # pragma: no cover
     Client = None  # type: ignore
     Settings = None  # type: ignore
 
+logger = logging.getLogger("agentic_memories.chroma")
+
 
 def _env_bool(name: str, default: str = "false") -> bool:
     val = os.getenv(name, default).strip().lower()
     return val in {"1", "true", "yes", "on"}
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # type: ignore  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 def _load_headers() -> Optional[Dict[str, str]]:
     # Prefer explicit JSON headers
     raw = os.getenv("CHROMA_HEADERS")
@@ -35,6 +66,53 @@ def _load_headers() -> Optional[Dict[str, str]]:
     return None
 
 
+class ChromaNotFoundError(Exception):
+    """Raised when the v2 API answers 404 (e.g. a collection that was dropped)."""
+
+
+class CollectionRegistry:
+    """Process-wide cache of resolved V2Collection handles keyed by name.
+
+    Resolving a handle costs a full ``list collections`` GET, so handles are
+    resolved once and reused. A handle is only re-resolved after a request
+    against it returns 404 (see ``V2Collection._post``).
+    """
+
+    def __init__(self) -> None:
+        self._handles: Dict[Tuple[str, str, str, str], "V2Collection"] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(client: "V2ChromaClient", name: str) -> Tuple[str, str, str, str]:
+        return (client._base_url, client.tenant, client.database, name)
+
+    def get(self, client: "V2ChromaClient", name: str) -> Optional["V2Collection"]:
+        with self._lock:
+            return self._handles.get(self._key(client, name))
+
+    def put(self, client: "V2ChromaClient", collection: "V2Collection") -> None:
+        with self._lock:
+            self._handles[self._key(client, collection.name)] = collection
+
+    def invalidate(
+        self, client: Optional["V2ChromaClient"] = None, name: Optional[str] = None
+    ) -> None:
+        """Drop one cached handle, or every handle when called without arguments."""
+        with self._lock:
+            if client is None or name is None:
+                self._handles.clear()
+            else:
+                self._handles.pop(self._key(client, name), None)
+
+
+_collection_registry = CollectionRegistry()
+
+
+def get_collection_registry() -> CollectionRegistry:
+    """Return the process-wide collection handle registry."""
+    return _collection_registry
+
+
 class V2ChromaClient:
     """Custom Chroma client that works with v2 APIs by bypassing tenant validation."""
 
@@ -46,6 +124,11 @@ class V2ChromaClient:
         database: str,
         ssl: bool = False,
         headers: Optional[Dict[str, str]] = None,
+        http2: bool = False,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        retry_backoff: float = 0.5,
     ):
         self.host = host
         self.port = port
@@ -54,7 +137,96 @@ class V2ChromaClient:
         self.ssl = ssl
         self.headers = headers or {}
         self._base_url = f"{'https' if ssl else 'http'}://{host}:{port}/api/v2"
-        self._collections = {}  # Cache for collections
+        self._collections = _collection_registry  # Shared handle cache
+
+        # Transport settings. The pooled clients are created lazily and reused
+        # for every request so connections (and TLS sessions) stay alive.
+        if http2 and not _http2_available():
+            logger.warning(
+                "CHROMA_HTTP2 requested but 'h2' is not installed; using HTTP/1.1"
+            )
+            http2 = False
+        self.http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # Longer timeout for external connections
+        self._timeout = httpx.Timeout(connect=30.0, read=60.0, write=30.0, pool=30.0)
+        self._retry_backoff = retry_backoff
+        self._http: Optional[httpx.Client] = None
+        self._async_http: Optional[httpx.AsyncClient] = None
+        self._http_lock = threading.Lock()
+
+    def _client_kwargs(self) -> Dict[str, Any]:
+        return {
+            "base_url": self._base_url,
+            "headers": {**self.headers, "Content-Type": "application/json"},
+            "timeout": self._timeout,
+            "limits": self._limits,
+            "http2": self.http2,
+        }
+
+    def _get_http(self) -> httpx.Client:
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    self._http = httpx.Client(**self._client_kwargs())
+        return self._http
+
+    def _get_async_http(self) -> httpx.AsyncClient:
+        # AsyncClient connections are bound to the running event loop; the app
+        # runs a single loop, so one lazily-created client is shared.
+        if self._async_http is None:
+            with self._http_lock:
+                if self._async_http is None:
+                    self._async_http = httpx.AsyncClient(**self._client_kwargs())
+        return self._async_http
+
+    def close(self) -> None:
+        """Close the pooled sync transport."""
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+    async def aclose(self) -> None:
+        """Close both pooled transports (call from the event loop on shutdown)."""
+        client = self._async_http
+        self._async_http = None
+        if client is not None:
+            await client.aclose()
+        self.close()
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # Exponential backoff with jitter: ~0.5s, 1s, 2s (capped at 8s)
+        base = min(self._retry_backoff * (2**attempt), 8.0)
+        return base * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def _build_request(method: str, endpoint: str, json_data: Optional[Dict]):
+        method = method.upper()
+        if method not in {"GET", "POST", "PUT"}:
+            raise ValueError(f"Unsupported method: {method}")
+        return method, endpoint, (json_data if method != "GET" else None)
+
+    @staticmethod
+    def _parse_response(resp: httpx.Response):
+        resp.raise_for_status()
+        return resp.json() if resp.content else {}
+
+    @staticmethod
+    def _wrap_error(e: Exception) -> Exception:
+        if isinstance(e, httpx.HTTPStatusError):
+            message = f"API request failed: {e} - Response: {e.response.text}"
+            if e.response.status_code == 404:
+                return ChromaNotFoundError(message)
+            return Exception(message)
+        # Include response text for debugging
+        if hasattr(e, "response") and e.response:
+            return Exception(f"API request failed: {e} - Response: {e.response.text}")
+        return Exception(f"API request failed: {e}")
 
     def _make_request(
         self,
@@ -63,31 +235,18 @@ class V2ChromaClient:
         json_data: Optional[Dict] = None,
         retries: int = 3,
     ):
-        """Make HTTP request to v2 API with retry logic for external Chroma."""
-        import httpx
-        import time
-
-        url = f"{self._base_url}{endpoint}"
-        headers = {**self.headers, "Content-Type": "application/json"}
-
-        # Longer timeout for external connections
-        timeout = httpx.Timeout(connect=30.0, read=60.0, write=30.0, pool=30.0)
+        """Make HTTP request to v2 API with retry logic for external Chroma.
 
+        Uses the pooled keep-alive client. Sync callers run on worker threads,
+        so the backoff sleep never blocks the event loop; async callers should
+        use ``_amake_request`` instead.
+        """
         last_exception = None
         for attempt in range(retries + 1):
             try:
-                with httpx.Client(timeout=timeout) as client:
-                    if method.upper() == "GET":
-                        resp = client.get(url, headers=headers)
-                    elif method.upper() == "POST":
-                        resp = client.post(url, headers=headers, json=json_data)
-                    elif method.upper() == "PUT":
-                        resp = client.put(url, headers=headers, json=json_data)
-                    else:
-                        raise ValueError(f"Unsupported method: {method}")
-
-                    resp.raise_for_status()
-                    return resp.json() if resp.content else {}
+                method_, path, body = self._build_request(method, endpoint, json_data)
+                resp = self._get_http().request(method_, path, json=body)
+                return self._parse_response(resp)
             except (
                 httpx.ConnectTimeout,
                 httpx.ConnectError,
@@ -95,9 +254,13 @@ class V2ChromaClient:
             ) as e:
                 last_exception = e
                 if attempt < retries:
-                    wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
-                    print(
-                        f"Chroma connection failed (attempt {attempt + 1}/{retries + 1}), retrying in {wait_time}s: {e}"
+                    wait_time = self._backoff_delay(attempt)
+                    logger.warning(
+                        "Chroma connection failed (attempt %d/%d), retrying in %.2fs: %s",
+                        attempt + 1,
+                        retries + 1,
+                        wait_time,
+                        e,
                     )
                     time.sleep(wait_time)
                     continue
@@ -106,45 +269,90 @@ class V2ChromaClient:
                     f"Chroma database connection failed after {retries + 1} attempts. Last error: {e}"
                 )
             except Exception as e:
-                # Include response text for debugging
-                if hasattr(e, "response") and e.response:
-                    error_text = e.response.text
-                    raise Exception(f"API request failed: {e} - Response: {error_text}")
-                raise Exception(f"API request failed: {e}")
+                raise self._wrap_error(e)
 
         # This should never be reached, but just in case
         raise Exception(
             f"Chroma database connection failed after {retries + 1} attempts. Last error: {last_exception}"
         )
 
+    async def _amake_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict] = None,
+        retries: int = 3,
+    ):
+        """Async twin of ``_make_request`` on the pooled ``httpx.AsyncClient``."""
+        last_exception = None
+        for attempt in range(retries + 1):
+            try:
+                method_, path, body = self._build_request(method, endpoint, json_data)
+                resp = await self._get_async_http().request(method_, path, json=body)
+                return self._parse_response(resp)
+            except (
+                httpx.ConnectTimeout,
+                httpx.ConnectError,
+                httpx.TimeoutException,
+            ) as e:
+                last_exception = e
+                if attempt < retries:
+                    wait_time = self._backoff_delay(attempt)
+                    logger.warning(
+                        "Chroma connection failed (attempt %d/%d), retrying in %.2fs: %s",
+                        attempt + 1,
+                        retries + 1,
+                        wait_time,
+                        e,
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise Exception(
+                    f"Chroma database connection failed after {retries + 1} attempts. Last error: {e}"
+                )
+            except Exception as e:
+                raise self._wrap_error(e)
+
+        raise Exception(
+            f"Chroma database connection failed after {retries + 1} attempts. Last error: {last_exception}"
+        )
+
     def heartbeat(self):
         """Call heartbeat via v2 API."""
         return self._make_request("GET", "/heartbeat")
 
     def health_check(self, max_retries: int = 10) -> bool:
         """Check if Chroma is healthy and ready, with retries."""
-        import time
-
         for attempt in range(max_retries):
             try:
                 self.heartbeat()
-                print(f"Chroma health check passed on attempt {attempt + 1}")
+                logger.info("Chroma health check passed on attempt %d", attempt + 1)
                 return True
             except Exception as e:
                 if attempt < max_retries - 1:
                     wait_time = 2 ** min(attempt, 5)  # Cap at 32 seconds
-                    print(
-                        f"Chroma health check failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s: {e}"
+                    logger.warning(
+                        "Chroma health check failed (attempt %d/%d), retrying in %ds: %s",
+                        attempt + 1,
+                        max_retries,
+                        wait_time,
+                        e,
                     )
                     time.sleep(wait_time)
                 else:
-                    print(
-                        f"Chroma health check failed after {max_retries} attempts: {e}"
+                    logger.error(
+                        "Chroma health check failed after %d attempts: %s",
+                        max_retries,
+                        e,
                     )
         return False
 
     def get_or_create_collection(self, name: str):
-        """Get or create collection using v2 API."""
+        """Get or create collection using v2 API (handles are cached by name)."""
+        cached = self._collections.get(self, name)
+        if cached is not None:
+            return cached
+
         # Check if collection exists
         try:
             collections = self._make_request(
@@ -152,7 +360,9 @@ class V2ChromaClient:
             )
             for col in collections:
                 if col.get("name") == name:
-                    return V2Collection(self, name, col.get("id"))
+                    collection = V2Collection(self, name, col.get("id"))
+                    self._collections.put(self, collection)
+                    return collection
         except Exception:
             pass
 
@@ -164,18 +374,47 @@ class V2ChromaClient:
             create_data,
         )
         collection_id = result.get("id")
-        return V2Collection(self, name, collection_id)
+        collection = V2Collection(self, name, collection_id)
+        self._collections.put(self, collection)
+        return collection
 
     def get_collection(self, name: str):
-        """Get collection using v2 API."""
+        """Get collection using v2 API (handles are cached by name)."""
+        cached = self._collections.get(self, name)
+        if cached is not None:
+            return cached
+
         collections = self._make_request(
             "GET", f"/tenants/{self.tenant}/databases/{self.database}/collections"
         )
         for col in collections:
             if col.get("name") == name:
-                return V2Collection(self, name, col.get("id"))
+                collection = V2Collection(self, name, col.get("id"))
+                self._collections.put(self, collection)
+                return collection
         raise ValueError(f"Collection {name} not found")
 
+    async def aget_collection(self, name: str):
+        """Async twin of ``get_collection``."""
+        cached = self._collections.get(self, name)
+        if cached is not None:
+            return cached
+
+        collections = await self._amake_request(
+            "GET", f"/tenants/{self.tenant}/databases/{self.database}/collections"
+        )
+        for col in collections:
+            if col.get("name") == name:
+                collection = V2Collection(self, name, col.get("id"))
+                self._collections.put(self, collection)
+                return collection
+        raise ValueError(f"Collection {name} not found")
+
+    def refresh_collection(self, name: str):
+        """Drop the cached handle for ``name`` and resolve it again."""
+        self._collections.invalidate(self, name)
+        return self.get_collection(name)
+
     def list_collections(self):
         """List collections using v2 API."""
         result = self._make_request(
@@ -193,26 +432,47 @@ class V2Collection:
         self.id = collection_id
         self._endpoint_base = f"/tenants/{client.tenant}/databases/{client.database}/collections/{collection_id}"
 
-    def get(
-        self,
+    def _post(self, operation: str, data: Dict[str, Any]):
+        """POST to a collection endpoint, re-resolving the handle once on 404.
+
+        A 404 means the collection was dropped or recreated under a new id since
+        this handle was cached, so look it up again by name and retry.
+        """
+        try:
+            return self.client._make_request(
+                "POST", f"{self._endpoint_base}/{operation}", data
+            )
+        except ChromaNotFoundError:
+            self._refresh()
+            return self.client._make_request(
+                "POST", f"{self._endpoint_base}/{operation}", data
+            )
+
+    async def _apost(self, operation: str, data: Dict[str, Any]):
+        """Async twin of ``_post``."""
+        try:
+            return await self.client._amake_request(
+                "POST", f"{self._endpoint_base}/{operation}", data
+            )
+        except ChromaNotFoundError:
+            await asyncio.to_thread(self._refresh)
+            return await self.client._amake_request(
+                "POST", f"{self._endpoint_base}/{operation}", data
+            )
+
+    def _refresh(self) -> None:
+        fresh = self.client.refresh_collection(self.name)
+        self.id = fresh.id
+        self._endpoint_base = fresh._endpoint_base
+
+    @staticmethod
+    def _get_payload(
         ids: Optional[list] = None,
         where: Optional[Dict] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         include: Optional[list] = None,
-    ):
-        """Fetch items by ID or metadata filter using v2 API.
-
-        Args:
-                ids: Optional list of IDs to fetch (takes precedence over where)
-                where: Optional metadata filter (used if ids not provided)
-                limit: Maximum number of items to return
-                offset: Number of items to skip
-                include: List of fields to include in response (e.g., ["documents", "metadatas"])
-
-        Returns:
-                Dict with ids, documents, metadatas based on include parameter
-        """
+    ) -> Dict[str, Any]:
         # Chroma v2 does not support 'ids' in include; ids are returned by default.
         data: Dict[str, Any] = {
             "include": include or ["documents", "metadatas"],
@@ -228,10 +488,12 @@ class V2Collection:
             data["limit"] = limit
         if offset is not None:
             data["offset"] = offset
-        return self.client._make_request("POST", f"{self._endpoint_base}/get", data)
+        return data
 
-    def upsert(self, ids: list, documents: list, embeddings: list, metadatas: list):
-        """Upsert documents to collection."""
+    @staticmethod
+    def _upsert_payload(
+        ids: list, documents: list, embeddings: list, metadatas: list
+    ) -> Dict[str, Any]:
         # Coerce metadata values to scalars (v2 requires scalar values). Lists/dicts -> JSON strings.
         coerced_metadatas = []
         for md in metadatas or []:
@@ -242,20 +504,17 @@ class V2Collection:
                 else:
                     fixed[k] = v
             coerced_metadatas.append(fixed)
-        data = {
+        return {
             "ids": ids,
             "documents": documents,
             "embeddings": embeddings,
             "metadatas": coerced_metadatas,
         }
-        return self.client._make_request("POST", f"{self._endpoint_base}/upsert", data)
 
-    def delete(
-        self, ids: Optional[list] = None, where: Optional[Dict[str, Any]] = None
-    ):
-        """Delete items by ids or where filter using v2 API.
-        Exactly one of ids or where should be provided.
-        """
+    @staticmethod
+    def _delete_payload(
+        ids: Optional[list] = None, where: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         if (ids is None and where is None) or (ids is not None and where is not None):
             raise ValueError("Provide either ids or where, exclusively")
         payload: Dict[str, Any] = {}
@@ -263,39 +522,147 @@ class V2Collection:
             payload["ids"] = ids
         if where is not None:
             payload["where"] = where
-        return self.client._make_request(
-            "POST", f"{self._endpoint_base}/delete", payload
-        )
+        return payload
 
-    def query(
-        self,
+    @staticmethod
+    def _query_payload(
         query_texts: list = None,
         query_embeddings: list = None,
         n_results: int = 10,
         where: Optional[Dict] = None,
-    ):
-        """Query collection.
-        Supports either query_texts (if server embeds) or query_embeddings (preferred)."""
+        include: Optional[list] = None,
+    ) -> Dict[str, Any]:
         data: Dict[str, Any] = {
             "n_results": n_results,
             "where": where or {},
         }
+        if include is not None:
+            data["include"] = include
         if query_embeddings is not None:
             data["query_embeddings"] = query_embeddings
         elif query_texts is not None:
             data["query_texts"] = query_texts
         else:
             raise ValueError("Either query_embeddings or query_texts must be provided")
-        return self.client._make_request("POST", f"{self._endpoint_base}/query", data)
+        return data
+
+    def get(
+        self,
+        ids: Optional[list] = None,
+        where: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include: Optional[list] = None,
+    ):
+        """Fetch items by ID or metadata filter using v2 API.
+
+        Args:
+                ids: Optional list of IDs to fetch (takes precedence over where)
+                where: Optional metadata filter (used if ids not provided)
+                limit: Maximum number of items to return
+                offset: Number of items to skip
+                include: List of fields to include in response (e.g., ["documents", "metadatas"])
+
+        Returns:
+                Dict with ids, documents, metadatas based on include parameter
+        """
+        return self._post("get", self._get_payload(ids, where, limit, offset, include))
+
+    def upsert(self, ids: list, documents: list, embeddings: list, metadatas: list):
+        """Upsert documents to collection."""
+        return self._post(
+            "upsert", self._upsert_payload(ids, documents, embeddings, metadatas)
+        )
+
+    def delete(
+        self, ids: Optional[list] = None, where: Optional[Dict[str, Any]] = None
+    ):
+        """Delete items by ids or where filter using v2 API.
+        Exactly one of ids or where should be provided.
+        """
+        return self._post("delete", self._delete_payload(ids, where))
+
+    def query(
+        self,
+        query_texts: list = None,
+        query_embeddings: list = None,
+        n_results: int = 10,
+        where: Optional[Dict] = None,
+        include: Optional[list] = None,
+    ):
+        """Query collection.
+        Supports either query_texts (if server embeds) or query_embeddings (preferred).
+        ``include`` defaults to the server's (documents, metadatas, distances)."""
+        return self._post(
+            "query",
+            self._query_payload(
+                query_texts, query_embeddings, n_results, where, include
+            ),
+        )
+
+    # Async twins for callers running on the event loop.
+
+    async def aget(
+        self,
+        ids: Optional[list] = None,
+        where: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include: Optional[list] = None,
+    ):
+        """Async variant of ``get``."""
+        return await self._apost(
+            "get", self._get_payload(ids, where, limit, offset, include)
+        )
+
+    async def aupsert(
+        self, ids: list, documents: list, embeddings: list, metadatas: list
+    ):
+        """Async variant of ``upsert``."""
+        return await self._apost(
+            "upsert", self._upsert_payload(ids, documents, embeddings, metadatas)
+        )
+
+    async def adelete(
+        self, ids: Optional[list] = None, where: Optional[Dict[str, Any]] = None
+    ):
+        """Async variant of ``delete``."""
+        return await self._apost("delete", self._delete_payload(ids, where))
+
+    async def aquery(
+        self,
+        query_texts: list = None,
+        query_embeddings: list = None,
+        n_results: int = 10,
+        where: Optional[Dict] = None,
+        include: Optional[list] = None,
+    ):
+        """Async variant of ``query``."""
+        return await self._apost(
+            "query",
+            self._query_payload(
+                query_texts, query_embeddings, n_results, where, include
+            ),
+        )
+
+
+_chroma_client: Optional[V2ChromaClient] = None
+_chroma_client_lock = threading.Lock()
 
 
 def get_chroma_client() -> Any:
-    """Create a Chroma v2 client that works with v2-only servers.
+    """Return the process-wide Chroma v2 client that works with v2-only servers.
 
-    Workaround for ChromaDB 0.5.3 v1 API limitation.
+    Workaround for ChromaDB 0.5.3 v1 API limitation. The client is created once
+    so its pooled keep-alive transport is shared by every caller. Pool tuning:
+    CHROMA_HTTP2, CHROMA_MAX_CONNECTIONS, CHROMA_MAX_KEEPALIVE_CONNECTIONS,
+    CHROMA_KEEPALIVE_EXPIRY and CHROMA_RETRY_BACKOFF.
     """
+    global _chroma_client
     if Client is None or Settings is None:
         return None
+    if _chroma_client is not None:
+        return _chroma_client
 
     host = os.getenv("CHROMA_HOST", "localhost")
     try:
@@ -307,14 +674,33 @@ def get_chroma_client() -> Any:
     ssl = _env_bool("CHROMA_SSL", "false")
     headers = _load_headers()
 
-    try:
-        return V2ChromaClient(
-            host=host,
-            port=port,
-            tenant=tenant,
-            database=database,
-            ssl=ssl,
-            headers=headers,
-        )
-    except Exception:
-        return None
+    with _chroma_client_lock:
+        if _chroma_client is not None:
+            return _chroma_client
+        try:
+            _chroma_client = V2ChromaClient(
+                host=host,
+                port=port,
+                tenant=tenant,
+                database=database,
+                ssl=ssl,
+                headers=headers,
+                http2=_env_bool("CHROMA_HTTP2", "false"),
+                max_connections=_env_int("CHROMA_MAX_CONNECTIONS", 50),
+                max_keepalive_connections=_env_int(
+                    "CHROMA_MAX_KEEPALIVE_CONNECTIONS", 20
+                ),
+                keepalive_expiry=_env_float("CHROMA_KEEPALIVE_EXPIRY", 30.0),
+                retry_backoff=_env_float("CHROMA_RETRY_BACKOFF", 0.5),
+            )
+        except Exception:
+            return None
+    return _chroma_client
+
+
+async def close_chroma_client() -> None:
+    """Close the shared client's pooled transports (app shutdown)."""
+    global _chroma_client
+    client, _chroma_client = _chroma_client, None
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,72 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_app_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def set_app_loop(loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Register the application's event loop (lifespan startup; None on shutdown).
+
+    The asyncio clients (Chroma, Redis, Postgres pool) bind to the loop that
+    first uses them, so sync callers in worker threads must run their
+    coroutines on this same loop.
+    """
+    global _app_loop
+    _app_loop = loop
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Loop for processes without a running app (scripts, workers, tests)."""
+    global _background_loop
+    if _background_loop is None:
+        with _background_lock:
+            if _background_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="async-bridge", daemon=True
+                ).start()
+                _background_loop = loop
+    return _background_loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the shared event loop and block until it finishes.
+
+    Lets sync code (worker threads, sync endpoints) call the async
+    implementation. The caller's context vars carry over, so tracing spans
+    nest as before. Must not be called from the event loop thread itself;
+    await the coroutine there instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("run_sync called on the event loop; await instead")
+
+    loop = _app_loop if _app_loop is not None and _app_loop.is_running() else None
+    loop = loop or _get_background_loop()
+    ctx = contextvars.copy_context()
+    done: "concurrent.futures.Future[T]" = concurrent.futures.Future()
+
+    def settle(task: "asyncio.Task[T]") -> None:
+        if task.cancelled():
+            done.cancel()
+        elif task.exception() is not None:
+            done.set_exception(task.exception())
+        else:
+            done.set_result(task.result())
+
+    def start() -> None:
+        loop.create_task(coro, context=ctx).add_done_callback(settle)
+
+    loop.call_soon_threadsafe(start)
+    return done.result()
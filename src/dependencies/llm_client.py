@@ -0,0 +1,138 @@
+"""
+Shared OpenAI-compatible client registry for embeddings and LLM calls.
+
+Clients are created once per (provider, base_url, api_key) and reused so the
+underlying httpx connection pool (and its TLS sessions) survives across calls.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from src.config import (
+    get_llm_max_connections,
+    get_llm_max_keepalive_connections,
+    get_openai_api_key,
+    get_xai_api_key,
+    get_xai_base_url,
+)
+
+# (provider, base_url, api_key, is_async) -> client
+_clients: Dict[Tuple[str, Optional[str], str, bool], Any] = {}
+_clients_lock = threading.Lock()
+
+
+@lru_cache(maxsize=2)
+def _client_classes(instrumented: bool) -> Tuple[Any, Any]:
+    """Resolve (OpenAI, AsyncOpenAI) once, preferring the Langfuse wrapper."""
+    if instrumented:
+        try:
+            from langfuse.openai import AsyncOpenAI, OpenAI  # type: ignore
+
+            return OpenAI, AsyncOpenAI
+        except ImportError:
+            pass
+    from openai import AsyncOpenAI, OpenAI  # type: ignore
+
+    return OpenAI, AsyncOpenAI
+
+
+def _http_limits() -> Any:
+    import httpx
+
+    return httpx.Limits(
+        max_connections=get_llm_max_connections(),
+        max_keepalive_connections=get_llm_max_keepalive_connections(),
+    )
+
+
+def _resolve_credentials(
+    provider: str, api_key: Optional[str], base_url: Optional[str]
+) -> Tuple[str, Optional[str]]:
+    if provider == "xai":
+        return (api_key or get_xai_api_key() or "").strip(), (
+            base_url or get_xai_base_url()
+        )
+    return (api_key or get_openai_api_key() or "").strip(), base_url
+
+
+def _get_client(
+    provider: str,
+    api_key: Optional[str],
+    base_url: Optional[str],
+    is_async: bool,
+) -> Any:
+    key, url = _resolve_credentials(provider, api_key, base_url)
+    if not key:
+        raise RuntimeError(f"API key for provider '{provider}' is not configured")
+
+    cache_key = (provider, url, key, is_async)
+    client = _clients.get(cache_key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is not None:
+            return client
+
+        import openai
+        from src.config import is_langfuse_enabled
+
+        sync_cls, async_cls = _client_classes(is_langfuse_enabled())
+        kwargs: Dict[str, Any] = {"api_key": key}
+        if url:
+            kwargs["base_url"] = url
+        if is_async:
+            kwargs["http_client"] = openai.DefaultAsyncHttpxClient(
+                limits=_http_limits()
+            )
+            client = async_cls(**kwargs)
+        else:
+            kwargs["http_client"] = openai.DefaultHttpxClient(limits=_http_limits())
+            client = sync_cls(**kwargs)
+        _clients[cache_key] = client
+        return client
+
+
+def get_llm_client(
+    provider: str = "openai",
+    *,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+) -> Any:
+    """Return the shared sync OpenAI-compatible client for ``provider``.
+
+    Raises:
+            RuntimeError: If no API key is configured for the provider.
+    """
+    return _get_client(provider, api_key, base_url, is_async=False)
+
+
+def get_async_llm_client(
+    provider: str = "openai",
+    *,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+) -> Any:
+    """Return the shared async OpenAI-compatible client for ``provider``.
+
+    Raises:
+            RuntimeError: If no API key is configured for the provider.
+    """
+    return _get_client(provider, api_key, base_url, is_async=True)
+
+
+def reset_llm_clients() -> None:
+    """Drop cached clients (e.g. after rotating keys, and in tests)."""
+    with _clients_lock:
+        for (_, _, _, is_async), client in list(_clients.items()):
+            if not is_async:
+                try:
+                    client.close()
+                except Exception:
+                    pass
+        _clients.clear()
+    _client_classes.cache_clear()
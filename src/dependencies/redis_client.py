@@ -1,6 +1,8 @@
+from functools import lru_cache
 from typing import Optional
 
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 
 from src.config import get_redis_url
 
@@ -11,3 +13,41 @@ def get_redis_client() -> Optional[Redis]:
     if not redis_url:
         return None
     return Redis.from_url(redis_url, decode_responses=True)
+
+
+@lru_cache(maxsize=1)
+def get_redis_binary_client() -> Optional[Redis]:
+    """Return a shared Redis client that keeps responses as raw bytes.
+
+    Used for compact binary payloads (e.g. float32 embedding blobs) that must
+    not be decoded as UTF-8.
+    """
+    redis_url = get_redis_url()
+    if not redis_url:
+        return None
+    return Redis.from_url(redis_url, decode_responses=False)
+
+
+@lru_cache(maxsize=1)
+def get_async_redis_client() -> Optional[AsyncRedis]:
+    """Return the shared asyncio Redis client if REDIS_URL is configured.
+
+    The client's connections bind to the event loop that first uses them, so
+    only call this from the application's loop (request handlers, lifespan).
+    """
+    redis_url = get_redis_url()
+    if not redis_url:
+        return None
+    return AsyncRedis.from_url(redis_url, decode_responses=True)
+
+
+async def close_async_redis_client() -> None:
+    """Close the shared asyncio client (application shutdown)."""
+    if get_async_redis_client.cache_info().currsize:
+        client = get_async_redis_client()
+        get_async_redis_client.cache_clear()
+        if client is not None:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
@@ -1,14 +1,18 @@
 """TimescaleDB / PostgreSQL connection management with connection pooling."""
 
-from typing import Optional
-from psycopg import Connection
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from psycopg import AsyncConnection, Connection
 from psycopg.rows import dict_row
-from psycopg_pool import ConnectionPool
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
 
 from src.config import get_timescale_dsn
 
 
 _pool: Optional[ConnectionPool] = None
+_async_pool: Optional[AsyncConnectionPool] = None
+_async_pool_lock: Optional[asyncio.Lock] = None
 
 
 def get_timescale_pool() -> Optional[ConnectionPool]:
@@ -83,6 +87,71 @@ def release_timescale_conn(conn: Connection):
             print(f"Failed to return connection to pool: {e}")
 
 
+async def get_async_timescale_pool() -> Optional[AsyncConnectionPool]:
+    """
+    Get the asyncio connection pool singleton, opening it on first use.
+    Sized like the sync pool; both pools share the server's connection budget.
+    """
+    global _async_pool, _async_pool_lock
+    if _async_pool is not None:
+        return _async_pool
+
+    dsn = get_timescale_dsn()
+    if not dsn:
+        return None
+
+    if _async_pool_lock is None:
+        _async_pool_lock = asyncio.Lock()
+    async with _async_pool_lock:
+        if _async_pool is not None:
+            return _async_pool
+        try:
+            pool = AsyncConnectionPool(
+                dsn,
+                min_size=2,
+                max_size=10,
+                kwargs={"row_factory": dict_row},
+                open=False,
+            )
+            await pool.open()
+            _async_pool = pool
+            return _async_pool
+        except Exception as e:
+            print(f"Failed to create async connection pool: {e}")
+            return None
+
+
+@asynccontextmanager
+async def async_timescale_conn() -> AsyncIterator[Optional[AsyncConnection]]:
+    """
+    Borrow a connection from the asyncio pool (None when unavailable).
+
+    The pool commits on clean exit and rolls back if the block raises, so
+    callers do not manage the transaction themselves:
+            async with async_timescale_conn() as conn:
+                    if conn:
+                            async with conn.cursor() as cur:
+                                    await cur.execute(...)
+    """
+    pool = await get_async_timescale_pool()
+    if not pool:
+        yield None
+        return
+    async with pool.connection() as conn:
+        yield conn
+
+
+async def close_async_timescale_pool() -> None:
+    """Close the asyncio pool (application shutdown)."""
+    global _async_pool
+    pool, _async_pool = _async_pool, None
+    if pool is not None:
+        try:
+            await pool.close()
+        except Exception as e:
+            print(f"Failed to close async connection pool: {e}")
+
+
 def ping_timescale() -> tuple[bool, Optional[str]]:
     conn = None
     try:
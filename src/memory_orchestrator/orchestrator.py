@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from src.models import Memory
-from src.services.retrieval import search_memories
+from src.services.retrieval import asearch_memories
 from src.services.storage import upsert_memories
 
 from .client_api import (
@@ -26,9 +37,11 @@ logger = logging.getLogger("agentic_memories.orchestrator")
 
 
 PersistFn = Callable[[str, Sequence[Memory]], Sequence[str]]
+SearchResult = Tuple[List[Dict[str, object]], int]
+# Async (the default, asearch_memories) or sync; sync results are used as-is
 SearchFn = Callable[
     [str, str, Optional[Dict[str, object]], int, int],
-    Tuple[List[Dict[str, object]], int],
+    Union[SearchResult, Awaitable[SearchResult]],
 ]
 
 
@@ -47,7 +60,7 @@ class AdaptiveMemoryOrchestrator(MemoryOrchestratorClient):
         self._ingestion = IngestionController(ingestion_policy)
         self._retrieval = RetrievalOrchestrator(retrieval_policy)
         self._persist = persist_fn or upsert_memories
-        self._search = search_fn or search_memories
+        self._search = search_fn or asearch_memories
         self._listeners: List[tuple[InjectionListener, str | None]] = []
         self._lock = asyncio.Lock()
         self._closed = False
@@ -66,7 +79,7 @@ class AdaptiveMemoryOrchestrator(MemoryOrchestratorClient):
             for batch in batches:
                 self._persist_batch(batch)
 
-            injections = self._maybe_retrieve(adapted)
+            injections = await self._maybe_retrieve(adapted)
         await self._publish(injections)
 
     async def fetch_memories(
@@ -85,7 +98,7 @@ class AdaptiveMemoryOrchestrator(MemoryOrchestratorClient):
         user_id = metadata.get("user_id") or conversation_id
 
         try:
-            results, _ = self._search(user_id, query, None, limit, offset)
+            results, _ = await self._run_search(user_id, query, limit, offset)
         except Exception:
             logger.exception("[orchestrator.retrieve.error] user=%s", user_id)
             return []
@@ -156,10 +169,18 @@ class AdaptiveMemoryOrchestrator(MemoryOrchestratorClient):
                 batch.user_id,
             )
 
-    def _maybe_retrieve(self, event: MessageEvent) -> List[MemoryInjection]:
+    async def _run_search(
+        self, user_id: str, query: str, limit: int, offset: int
+    ) -> SearchResult:
+        result = self._search(user_id, query, None, limit, offset)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _maybe_retrieve(self, event: MessageEvent) -> List[MemoryInjection]:
         user_id = event.metadata.get("user_id") or event.conversation_id
         try:
-            results, _ = self._search(user_id, event.content, None, 6, 0)
+            results, _ = await self._run_search(user_id, event.content, 6, 0)
         except Exception:
             logger.exception("[orchestrator.retrieve.error] user=%s", user_id)
             return []
@@ -19,17 +19,28 @@ from src.schemas import (
     ScheduledIntentResponse,
     IntentFireRequest,
     IntentFireResponse,
+    IntentFireBatchRequest,
+    IntentFireBatchResponse,
     IntentExecutionResponse,
     IntentClaimResponse,
+    IntentClaimBatchResponse,
 )
 from src.dependencies.timescale import get_timescale_conn, release_timescale_conn
-from src.services.intent_service import IntentService
+from src.services.intent_scheduler import notify_intent_changes
+from src.services.intent_service import MAX_CLAIM_BATCH, IntentService
 
 logger = logging.getLogger("agentic_memories.intents_api")
 
 router = APIRouter(prefix="/v1/intents", tags=["intents"])
 
 
+def _notify_scheduler(intent: ScheduledIntentResponse) -> None:
+    """Let running intent schedulers re-arm this intent (no-op when disabled)."""
+    notify_intent_changes(
+        [(intent.id, intent.next_check, intent.enabled, intent.trigger_type)]
+    )
+
+
 # =============================================================================
 # POST /v1/intents - Create Intent (AC1)
 # =============================================================================
@@ -76,6 +87,7 @@ def create_intent(request: ScheduledIntentCreate):
             request.user_id,
             result.intent.id,
         )
+        _notify_scheduler(result.intent)
 
         return JSONResponse(
             status_code=201, content=result.intent.model_dump(mode="json")
@@ -294,6 +306,17 @@ def fire_intent(intent_id: UUID, request: IntentFireRequest):
             result.response.next_check,
             result.response.enabled,
         )
+        if not result.response.cooldown_active:
+            notify_intent_changes(
+                [
+                    (
+                        intent_id,
+                        result.response.next_check,
+                        result.response.enabled,
+                        None,
+                    )
+                ]
+            )
 
         return result.response.model_dump(mode="json")
 
@@ -320,6 +343,76 @@ def fire_intent(intent_id: UUID, request: IntentFireRequest):
             release_timescale_conn(conn)
 
 
+# =============================================================================
+# POST /v1/intents/fire-batch - Report Many Execution Results
+# =============================================================================
+
+
+@router.post("/fire-batch", response_model=IntentFireBatchResponse)
+def fire_intents_batch(request: IntentFireBatchRequest):
+    """
+    Report many execution results in one transaction.
+
+    Applies the same rules as POST /{id}/fire to each item, with one bulk
+    update of scheduled_intents and one bulk insert into intent_executions.
+    Results are returned per item in request order; unknown or repeated
+    intent IDs fail individually without affecting the rest of the batch.
+    """
+    logger.info("[intents.api.fire_batch] count=%d", len(request.results))
+
+    conn = None
+    try:
+        conn = get_timescale_conn()
+        if conn is None:
+            logger.error("[intents.api.fire_batch] database_unavailable")
+            raise HTTPException(
+                status_code=500, detail="Database connection unavailable"
+            )
+
+        service = IntentService(conn)
+        result = service.fire_intents_batch(request.results)
+
+        if not result.success:
+            raise HTTPException(
+                status_code=500,
+                detail=result.errors[0] if result.errors else "Unknown error",
+            )
+
+        logger.info(
+            "[intents.api.fire_batch] count=%d succeeded=%d failed=%d",
+            len(request.results),
+            result.response.succeeded,
+            result.response.failed,
+        )
+        notify_intent_changes(
+            (item.intent_id, item.response.next_check, item.response.enabled, None)
+            for item in result.response.results
+            if item.success and not item.response.cooldown_active
+        )
+
+        return result.response.model_dump(mode="json")
+
+    except HTTPException:
+        raise
+    except DatabaseError as e:
+        logger.error(
+            "[intents.api.fire_batch] database_error=%s",
+            e,
+            exc_info=True,
+        )
+        raise HTTPException(status_code=503, detail="Database temporarily unavailable")
+    except Exception as e:
+        logger.error(
+            "[intents.api.fire_batch] unexpected_error=%s",
+            e,
+            exc_info=True,
+        )
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+    finally:
+        if conn is not None:
+            release_timescale_conn(conn)
+
+
 # =============================================================================
 # POST /v1/intents/{id}/claim - Claim Intent for Processing (Story 6.3)
 # =============================================================================
@@ -405,6 +498,90 @@ def claim_intent(intent_id: UUID):
             release_timescale_conn(conn)
 
 
+# =============================================================================
+# POST /v1/intents/claim-batch - Atomically Claim Due Intents
+# =============================================================================
+
+
+@router.post("/claim-batch", response_model=IntentClaimBatchResponse)
+def claim_intents_batch(
+    worker_id: str = Query(
+        ..., min_length=1, max_length=128, description="Claiming worker ID"
+    ),
+    limit: int = Query(
+        50, ge=1, le=MAX_CLAIM_BATCH, description="Maximum intents to claim"
+    ),
+    user_id: Optional[str] = Query(None, description="Optional user filter"),
+):
+    """
+    Claim up to `limit` due intents for one worker in a single statement.
+
+    Equivalent to GET /pending followed by POST /{id}/claim for each result,
+    without the N+1 round trips or the race between them. Intents locked or
+    claimed by other workers are skipped, so concurrent workers receive
+    disjoint batches. Each intent carries the `in_cooldown` metadata flag.
+
+    Multi-worker Flow:
+        1. POST /v1/intents/claim-batch?worker_id=...&limit=N
+        2. [Process each claimed intent]
+        3. POST /v1/intents/{id}/fire - Report result, clear claim, update next_check
+    """
+    logger.info(
+        "[intents.api.claim_batch] worker_id=%s limit=%d user_id=%s",
+        worker_id,
+        limit,
+        user_id,
+    )
+
+    conn = None
+    try:
+        conn = get_timescale_conn()
+        if conn is None:
+            logger.error("[intents.api.claim_batch] database_unavailable")
+            raise HTTPException(
+                status_code=500, detail="Database connection unavailable"
+            )
+
+        service = IntentService(conn)
+        result = service.claim_intents_batch(worker_id, limit, user_id=user_id)
+
+        if not result.success:
+            raise HTTPException(
+                status_code=500,
+                detail=result.errors[0] if result.errors else "Unknown error",
+            )
+
+        logger.info(
+            "[intents.api.claim_batch] worker_id=%s claimed=%d",
+            worker_id,
+            len(result.response.intents),
+        )
+
+        return result.response.model_dump(mode="json")
+
+    except HTTPException:
+        raise
+    except DatabaseError as e:
+        logger.error(
+            "[intents.api.claim_batch] worker_id=%s database_error=%s",
+            worker_id,
+            e,
+            exc_info=True,
+        )
+        raise HTTPException(status_code=503, detail="Database temporarily unavailable")
+    except Exception as e:
+        logger.error(
+            "[intents.api.claim_batch] worker_id=%s unexpected_error=%s",
+            worker_id,
+            e,
+            exc_info=True,
+        )
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
+    finally:
+        if conn is not None:
+            release_timescale_conn(conn)
+
+
 # =============================================================================
 # GET /v1/intents/{id}/history - Get Execution History (Story 5.7)
 # =============================================================================
@@ -582,6 +759,7 @@ def update_intent(intent_id: UUID, request: ScheduledIntentUpdate):
             return JSONResponse(status_code=400, content={"errors": result.errors})
 
         logger.info("[intents.api.update] intent_id=%s updated", intent_id)
+        _notify_scheduler(result.intent)
 
         return result.intent.model_dump(mode="json")
 
@@ -641,6 +819,7 @@ def delete_intent(intent_id: UUID):
             raise HTTPException(status_code=404, detail="Intent not found")
 
         logger.info("[intents.api.delete] intent_id=%s deleted", intent_id)
+        notify_intent_changes([(intent_id, None, False, None)])
 
         return Response(status_code=204)
 
@@ -12,18 +12,28 @@ import json
 import logging
 import time
 import uuid
-from datetime import datetime, timezone
-from typing import Dict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Literal, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, Query
 
 from src.dependencies.chroma import get_chroma_client
 from src.dependencies.timescale import get_timescale_conn, release_timescale_conn
 from src.models import Memory
-from src.schemas import DeleteMemoryResponse, DirectMemoryRequest, DirectMemoryResponse
+from src.schemas import (
+    DeleteMemoryResponse,
+    DirectMemoryRequest,
+    DirectMemoryResponse,
+    EmotionalTrajectoryResponse,
+    EpisodicTimelineResponse,
+)
 from src.services.embedding_utils import generate_embedding
 from src.services.retrieval import _standard_collection_name
 from src.services.storage import upsert_memories
+from src.services.temporal_aggregates import (
+    get_emotional_trajectory,
+    get_episodic_timeline,
+)
 
 logger = logging.getLogger("agentic_memories.memories")
 
@@ -910,3 +920,62 @@ def delete_memory(
             storage=storage_status,
             message="Failed to delete from ChromaDB",
         )
+
+
+# =============================================================================
+# Pre-aggregated trajectories and timelines (continuous aggregates)
+# =============================================================================
+
+
+def _time_range(
+    start: Optional[datetime], end: Optional[datetime], days: int
+) -> Tuple[datetime, datetime]:
+    end = end or datetime.now(timezone.utc)
+    start = start or end - timedelta(days=days)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    return start, end
+
+
+@router.get("/emotional-trajectory", response_model=EmotionalTrajectoryResponse)
+def emotional_trajectory(
+    user_id: str = Query(..., description="User ID"),
+    bucket: Literal["hour", "day"] = Query("day", description="Bucket width"),
+    start: Optional[datetime] = Query(
+        None, description="Range start (default: end - days)"
+    ),
+    end: Optional[datetime] = Query(None, description="Range end (default: now)"),
+    days: int = Query(
+        30, ge=1, le=3650, description="Range length when start is omitted"
+    ),
+) -> EmotionalTrajectoryResponse:
+    """Valence/arousal/intensity trajectory served from pre-aggregated buckets."""
+    start, end = _time_range(start, end, days)
+    rows = get_emotional_trajectory(user_id, start, end, bucket=bucket)
+    return EmotionalTrajectoryResponse(
+        user_id=user_id, bucket=bucket, start=start, end=end, buckets=rows
+    )
+
+
+@router.get("/timeline", response_model=EpisodicTimelineResponse)
+def episodic_timeline(
+    user_id: str = Query(..., description="User ID"),
+    start: Optional[datetime] = Query(
+        None, description="Range start (default: end - days)"
+    ),
+    end: Optional[datetime] = Query(None, description="Range end (default: now)"),
+    days: int = Query(
+        90, ge=1, le=3650, description="Range length when start is omitted"
+    ),
+) -> EpisodicTimelineResponse:
+    """Daily episodic timeline overview served from pre-aggregated buckets."""
+    start, end = _time_range(start, end, days)
+    rows = get_episodic_timeline(user_id, start, end)
+    return EpisodicTimelineResponse(
+        user_id=user_id,
+        start=start,
+        end=end,
+        total_events=sum(int(r.get("event_count") or 0) for r in rows),
+        active_days=sum(1 for r in rows if r.get("event_count")),
+        buckets=rows,
+    )
@@ -164,10 +164,24 @@ class MaintenanceRequest(BaseModel):
     since_hours: Optional[int] = None
 
 
+class CompactionProgress(BaseModel):
+    """Snapshot of the per-user compaction job queue."""
+
+    queued: int = 0
+    ready: int = 0
+    running: int = 0
+    dead: int = 0
+    enqueued: int = 0
+    completed: int = 0
+    retried: int = 0
+    dead_lettered: int = 0
+
+
 class MaintenanceResponse(BaseModel):
     jobs_started: List[str]
-    status: Literal["running", "queued"] = "running"
+    status: Literal["running", "queued", "idle"] = "running"
     started_at: datetime = Field(default_factory=datetime.utcnow)
+    progress: Optional[CompactionProgress] = None
 
 
 # Structured retrieval
@@ -493,6 +507,39 @@ class IntentFireResponse(BaseModel):
     )
 
 
+class IntentFireBatchItem(IntentFireRequest):
+    """One execution result in a POST /v1/intents/fire-batch request."""
+
+    intent_id: UUID
+
+
+class IntentFireBatchRequest(BaseModel):
+    """Request model for reporting many execution results in one transaction."""
+
+    results: List[IntentFireBatchItem] = Field(min_length=1, max_length=500)
+
+
+class IntentFireItemResult(BaseModel):
+    """Outcome of one item in a fire-batch request.
+
+    ``response`` is set on success (including ``cooldown_active``);
+    ``error`` explains why the item was not applied.
+    """
+
+    intent_id: UUID
+    success: bool
+    response: Optional[IntentFireResponse] = None
+    error: Optional[str] = None
+
+
+class IntentFireBatchResponse(BaseModel):
+    """Response model for POST /v1/intents/fire-batch, in request order."""
+
+    results: List[IntentFireItemResult]
+    succeeded: int
+    failed: int
+
+
 class IntentClaimResponse(BaseModel):
     """Response model for claiming an intent for exclusive processing (Story 6.3).
 
@@ -506,6 +553,21 @@ class IntentClaimResponse(BaseModel):
     )
 
 
+class IntentClaimBatchResponse(BaseModel):
+    """Response model for atomically claiming a batch of due intents.
+
+    Each intent carries the same ``in_cooldown`` metadata flag as
+    GET /v1/intents/pending. An empty list means nothing was due or every
+    due intent is held by another worker.
+    """
+
+    worker_id: str
+    claimed_at: datetime = Field(
+        description="Timestamp when the claims were made (expire after 5 minutes)"
+    )
+    intents: List[ScheduledIntentResponse] = Field(default_factory=list)
+
+
 class IntentExecutionResponse(BaseModel):
     """Response model for an intent execution history record.
 
@@ -742,3 +804,48 @@ class DeleteMemoryResponse(BaseModel):
         description="Status or error message providing details about the deletion operation",
         example="Memory deleted successfully from all backends",
     )
+
+
+class EmotionalTrajectoryBucket(BaseModel):
+    """One hourly or daily emotional bucket from the continuous aggregates."""
+
+    bucket: datetime = Field(..., description="Bucket start (UTC)")
+    state_count: int = Field(..., description="Emotional states recorded in the bucket")
+    avg_valence: Optional[float] = None
+    min_valence: Optional[float] = None
+    max_valence: Optional[float] = None
+    avg_arousal: Optional[float] = None
+    avg_intensity: Optional[float] = None
+    max_intensity: Optional[float] = None
+
+
+class EmotionalTrajectoryResponse(BaseModel):
+    """Emotional trajectory for a user over a time range."""
+
+    user_id: str
+    bucket: Literal["hour", "day"]
+    start: datetime
+    end: datetime
+    buckets: List[EmotionalTrajectoryBucket] = Field(default_factory=list)
+
+
+class EpisodicTimelineBucket(BaseModel):
+    """One day of episodic activity from the continuous aggregates."""
+
+    bucket: datetime = Field(..., description="Day start (UTC)")
+    event_count: int = Field(..., description="Episodic memories on that day")
+    avg_importance: Optional[float] = None
+    max_importance: Optional[float] = None
+    avg_valence: Optional[float] = None
+    avg_arousal: Optional[float] = None
+
+
+class EpisodicTimelineResponse(BaseModel):
+    """Daily episodic timeline overview for a user over a time range."""
+
+    user_id: str
+    start: datetime
+    end: datetime
+    total_events: int = Field(0, description="Episodic memories across all buckets")
+    active_days: int = Field(0, description="Days with at least one memory")
+    buckets: List[EpisodicTimelineBucket] = Field(default_factory=list)
@@ -1,22 +1,41 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
+import contextvars
 import logging
 import json
+import threading
 import time as _time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+
+import numpy as np
 
 from langgraph.graph import StateGraph, END  # type: ignore
 
+from src.config import (
+    get_compaction_consolidate_parallelism,
+    get_compaction_dedup_lookback_days,
+    get_compaction_llm_concurrency,
+    get_compaction_llm_rate_per_minute,
+)
 from src.services.compaction_ops import (
     ttl_cleanup,
     simple_deduplicate,
     deduplicate_episodic,
     deduplicate_emotional,
     ttl_cleanup_timescale,
+    SIMILARITY_TILE_ELEMENTS,
+    fetch_user_embeddings,
+    incremental_deduplicate,
+    normalize_embeddings,
+    user_where,
     _get_collection,
 )
-from src.services.embedding_utils import generate_embedding
+from src.services.embedding_utils import get_embeddings
+from src.services.retrieval import iter_user_memories
 from src.services.storage import upsert_memories
 from src.models import Memory
 from src.services.extraction import extract_from_transcript
@@ -27,8 +46,136 @@ from src.services.prompts import CONSOLIDATION_PROMPT
 logger = logging.getLogger("agentic_memories.compaction_graph")
 
 
+@lru_cache(maxsize=1)
+def _llm_slots() -> threading.BoundedSemaphore:
+    """Process-wide cap on in-flight compaction LLM calls (shared by queue workers)."""
+    return threading.BoundedSemaphore(max(1, get_compaction_llm_concurrency()))
+
+
+class _RateLimiter:
+    """Spaces calls evenly to stay within ``per_minute`` (0 disables)."""
+
+    def __init__(self, per_minute: int):
+        self._interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = _time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        if slot > now:
+            _time.sleep(slot - now)
+
+
+@lru_cache(maxsize=1)
+def _llm_rate_limiter() -> _RateLimiter:
+    """Process-wide compaction LLM request budget."""
+    return _RateLimiter(get_compaction_llm_rate_per_minute())
+
+
+# Cluster size bounds: skip pairs, prevent over-merging.
+_CLUSTER_MIN_SIZE = 3
+_CLUSTER_MAX_SIZE = 10
+
+
+def _greedy_cluster_indices(
+    vectors: Any, threshold: float, tile_rows: Optional[int] = None
+) -> List[List[int]]:
+    """Greedy complete-linkage clustering over the rows of an embedding matrix.
+
+    Rows are visited in order; each unassigned row seeds a cluster and absorbs
+    later unassigned rows whose cosine similarity to *every* member is
+    >= threshold, up to ``_CLUSTER_MAX_SIZE``. Zero vectors never cluster.
+
+    Similarities are computed on a unit-normalized float32 copy, one tile of
+    seed rows against all later rows at a time, so peak memory stays around
+    ``SIMILARITY_TILE_ELEMENTS`` floats regardless of user size.
+
+    Returns:
+            Row-index lists for clusters with 3-10 members, in seed order
+    """
+    matrix, available = normalize_embeddings(vectors)
+    n = matrix.shape[0]
+    if n == 0:
+        return []
+
+    if tile_rows is None:
+        tile_rows = max(1, SIMILARITY_TILE_ELEMENTS // n)
+
+    clusters: List[List[int]] = []
+    for start in range(0, n, tile_rows):
+        seeds = np.flatnonzero(available[start : start + tile_rows]) + start
+        if not seeds.size:
+            continue
+        # Similarity of each seed row against every row from the tile start on.
+        tile = matrix[seeds] @ matrix[start:].T
+
+        for row, i in zip(tile, seeds):
+            if not available[i]:
+                continue  # absorbed by an earlier seed in this tile
+            available[i] = False
+            later = row[i + 1 - start :]
+            candidates = np.flatnonzero((later >= threshold) & available[i + 1 :])
+            candidates += i + 1
+
+            members = [int(i)]
+            linked = np.ones(candidates.size, dtype=bool)
+            for pos, j in enumerate(candidates):
+                if not linked[pos]:
+                    continue
+                members.append(int(j))
+                available[j] = False
+                if len(members) == _CLUSTER_MAX_SIZE:
+                    break
+                # Complete linkage: remaining candidates must also match j.
+                rest = np.flatnonzero(linked[pos + 1 :]) + pos + 1
+                linked[rest] = matrix[candidates[rest]] @ matrix[j] >= threshold
+
+            if _CLUSTER_MIN_SIZE <= len(members) <= _CLUSTER_MAX_SIZE:
+                clusters.append(members)
+
+    return clusters
+
+
+def _embed_for_clustering(
+    memories: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Tuple[List[int], List[List[float]]]]]:
+    """Embed memory contents, grouping rows by vector dimension.
+
+    Vectors of different dimensions never cluster together, so each dimension
+    is clustered on its own and results are merged in seed order.
+    """
+    embeddings: List[List[float]] = []
+    valid_memories: List[Dict[str, Any]] = []
+
+    candidates = [mem for mem in memories if mem.get("content", "")]
+    try:
+        vectors = get_embeddings([mem["content"] for mem in candidates])
+    except Exception as e:
+        logger.warning("[cluster.embed.error] count=%s error=%s", len(candidates), e)
+        return [], []
+    for mem, emb in zip(candidates, vectors):
+        if emb:
+            embeddings.append(emb)
+            valid_memories.append(mem)
+
+    by_dim: Dict[int, List[int]] = {}
+    for idx, emb in enumerate(embeddings):
+        by_dim.setdefault(len(emb), []).append(idx)
+    groups = [
+        (indices, [embeddings[idx] for idx in indices]) for indices in by_dim.values()
+    ]
+    return valid_memories, groups
+
+
 def _cluster_memories(
-    memories: List[Dict[str, Any]], threshold: float = 0.75
+    memories: List[Dict[str, Any]],
+    threshold: float = 0.75,
+    embeddings: Optional[np.ndarray] = None,
 ) -> List[List[Dict[str, Any]]]:
     """Cluster memories by embedding similarity.
 
@@ -39,6 +186,8 @@ def _cluster_memories(
     Args:
             memories: List of memory dicts with 'id', 'content', 'metadata'
             threshold: Similarity threshold for clustering (default 0.75)
+            embeddings: Optional stored vectors, one row per memory; when
+                    omitted, memories are embedded here
 
     Returns:
             List of clusters, where each cluster is a list of memory dicts
@@ -46,80 +195,29 @@ def _cluster_memories(
     if len(memories) < 5:
         return []
 
-    # Generate embeddings for all memories
-    embeddings: List[List[float]] = []
-    valid_memories: List[Dict[str, Any]] = []
-
-    for mem in memories:
-        content = mem.get("content", "")
-        if not content:
-            continue
-        try:
-            emb = generate_embedding(content)
-            if emb:
-                embeddings.append(emb)
-                valid_memories.append(mem)
-        except Exception as e:
-            logger.warning("[cluster.embed.error] id=%s error=%s", mem.get("id"), e)
-            continue
+    if embeddings is not None:
+        keep = [idx for idx, mem in enumerate(memories) if mem.get("content", "")]
+        valid_memories = [memories[idx] for idx in keep]
+        groups = [(list(range(len(keep))), embeddings[keep])]
+    else:
+        valid_memories, groups = _embed_for_clustering(memories)
 
     if len(valid_memories) < 3:
         return []
 
-    # Compute similarity matrix and cluster using greedy approach
-    n = len(valid_memories)
-    used = set()
-    clusters: List[List[Dict[str, Any]]] = []
+    index_clusters: List[List[int]] = []
+    for indices, matrix in groups:
+        for members in _greedy_cluster_indices(matrix, threshold):
+            index_clusters.append([indices[m] for m in members])
+    index_clusters.sort(key=lambda members: members[0])
 
-    for i in range(n):
-        if i in used:
-            continue
-
-        cluster = [valid_memories[i]]
-        used.add(i)
-
-        for j in range(i + 1, n):
-            if j in used:
-                continue
-
-            # Compute cosine similarity
-            a, b = embeddings[i], embeddings[j]
-            if len(a) != len(b):
-                continue
-
-            dot = sum(x * y for x, y in zip(a, b))
-            na = sum(x * x for x in a) ** 0.5
-            nb = sum(y * y for y in b) ** 0.5
-
-            if na <= 0 or nb <= 0:
-                continue
+    clusters = [[valid_memories[idx] for idx in members] for members in index_clusters]
 
-            cos_sim = dot / (na * nb)
-
-            if cos_sim >= threshold:
-                # Check similarity with ALL cluster members (complete linkage)
-                is_similar_to_all = True
-                for k_idx, k_mem in enumerate(cluster):
-                    if k_idx == 0:
-                        continue  # Already checked with i
-                    k_orig_idx = valid_memories.index(k_mem)
-                    k_emb = embeddings[k_orig_idx]
-                    dot_k = sum(x * y for x, y in zip(k_emb, b))
-                    na_k = sum(x * x for x in k_emb) ** 0.5
-                    cos_k = dot_k / (na_k * nb) if na_k > 0 else 0
-                    if cos_k < threshold:
-                        is_similar_to_all = False
-                        break
-
-                if is_similar_to_all and len(cluster) < 10:  # Max cluster size
-                    cluster.append(valid_memories[j])
-                    used.add(j)
-
-        # Only keep clusters with 3-10 memories
-        if 3 <= len(cluster) <= 10:
-            clusters.append(cluster)
-
-    logger.info("[cluster] found=%s clusters from %s memories", len(clusters), n)
+    logger.info(
+        "[cluster] found=%s clusters from %s memories",
+        len(clusters),
+        len(valid_memories),
+    )
     return clusters
 
 
@@ -212,7 +310,7 @@ def _consolidate_cluster(user_id: str, cluster: List[Dict[str, Any]]) -> Dict[st
             layer="semantic",
             type="explicit",
             confidence=max_confidence,
-            embedding=generate_embedding(content),
+            # Embedded in one batch when the golden records are applied
             metadata={
                 "source": "consolidation",
                 "tags": list(all_tags),
@@ -232,38 +330,210 @@ def _consolidate_cluster(user_id: str, cluster: List[Dict[str, Any]]) -> Dict[st
 
     except Exception as e:
         logger.error("[consolidate.error] user_id=%s error=%s", user_id, e)
-        return {"memory": None, "source_ids": []}
+        return {"memory": None, "source_ids": [], "error": True}
 
 
 def _fetch_user_memories(
-    user_id: str, limit: int = 200, offset: int = 0
+    user_id: str, limit: int = 200, since: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """Fetch a batch of user memories with ids, content, and metadata.
-    Best-effort using v2 collection get.
+    Streams pages from the v2 collection without embeddings. With ``since``,
+    only memories stored after that epoch second are returned.
     """
-    col = _get_collection()
-    res = col.get(
-        where={"user_id": user_id},
-        limit=limit,
-        offset=offset,
-        include=["documents", "metadatas"],
-    )  # type: ignore[attr-defined]
-    ids = res.get("ids", [])
-    docs = res.get("documents", [])
-    metas = res.get("metadatas", [])
     items: List[Dict[str, Any]] = []
-    for i, mid in enumerate(ids or []):
-        if i >= len(docs) or i >= len(metas):
-            continue
-        items.append({"id": mid, "content": docs[i], "metadata": metas[i]})
+    for page in iter_user_memories(
+        user_id,
+        include=("documents", "metadatas"),
+        limit=limit,
+        where=user_where(user_id, since),
+        col=_get_collection(),
+    ):
+        for mid, doc, meta in zip(page.ids, page.documents or [], page.metadatas or []):
+            items.append({"id": mid, "content": doc, "metadata": meta})
     return items
 
 
+def _consolidate_clusters(
+    user_id: str, clusters: List[List[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """Consolidate clusters concurrently; results are aligned with ``clusters``.
+
+    Parallelism comes from COMPACTION_CONSOLIDATE_PARALLELISM; every LLM call
+    also draws from the process-wide rate budget and concurrency cap. A failed
+    cluster yields an empty result flagged with ``error`` without affecting the
+    others.
+    """
+    empty: Dict[str, Any] = {"memory": None, "source_ids": []}
+
+    def run(cluster: List[Dict[str, Any]]) -> Dict[str, Any]:
+        _llm_rate_limiter().acquire()
+        with _llm_slots():
+            return _consolidate_cluster(user_id, cluster)
+
+    workers = max(1, min(len(clusters), get_compaction_consolidate_parallelism()))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="compaction-consolidate"
+    ) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, run, cluster)
+            for cluster in clusters
+        ]
+        results: List[Dict[str, Any]] = []
+        for future in futures:
+            try:
+                results.append(future.result() or empty)
+            except Exception as exc:
+                logger.error(
+                    "[graph.consolidate.error] user_id=%s error=%s", user_id, exc
+                )
+                results.append({**empty, "error": True})
+    return results
+
+
+def _apply_consolidations(
+    user_id: str, golden: List[Dict[str, Any]]
+) -> Tuple[int, int, int]:
+    """Store golden records and delete their sources in one upsert and one delete.
+
+    Sources are only deleted once their golden record is stored. If the batched
+    upsert fails, records are applied one cluster at a time so a single bad
+    record cannot block the rest. Returns (consolidated, sources_removed,
+    failures), where failures counts clusters that could not be stored plus a
+    failed source delete.
+    """
+    memories = [result["memory"] for result in golden]
+    try:
+        vectors = get_embeddings([memory.content for memory in memories])
+        for memory, vector in zip(memories, vectors):
+            if vector:
+                memory.embedding = vector
+    except Exception as exc:
+        # upsert_memories embeds records that still lack a vector
+        logger.warning(
+            "[graph.consolidate.embed_error] user_id=%s error=%s", user_id, exc
+        )
+
+    try:
+        upsert_memories(user_id, memories)
+        stored = golden
+    except Exception as exc:
+        logger.error(
+            "[graph.consolidate.batch_upsert_error] user_id=%s error=%s — "
+            "falling back to per-cluster upserts",
+            user_id,
+            exc,
+        )
+        stored = []
+        for result in golden:
+            try:
+                upsert_memories(user_id, [result["memory"]])
+                stored.append(result)
+            except Exception as cluster_exc:
+                logger.error(
+                    "[graph.consolidate.error] user_id=%s error=%s",
+                    user_id,
+                    cluster_exc,
+                )
+
+    failures = len(golden) - len(stored)
+    source_ids = [sid for result in stored for sid in result["source_ids"]]
+    if not source_ids:
+        return len(stored), 0, failures
+    try:
+        _get_collection().delete(ids=source_ids)  # type: ignore[attr-defined]
+    except Exception as exc:
+        # Golden records are stored; the leftover sources are near-duplicates
+        # of them and get removed by a later dedup pass.
+        logger.error(
+            "[graph.consolidate.delete_error] user_id=%s sources=%s error=%s",
+            user_id,
+            len(source_ids),
+            exc,
+        )
+        return len(stored), 0, failures + 1
+    for result in stored:
+        logger.info(
+            "[graph.consolidate] merged %s → 1 user_id=%s",
+            len(result["source_ids"]),
+            user_id,
+        )
+    return len(stored), len(source_ids), failures
+
+
+def _query_column(res: Dict[str, Any], key: str, row: int) -> List[Any]:
+    values = res.get(key) or []
+    return (values[row] if row < len(values) else None) or []
+
+
+def _load_consolidation_candidates(
+    user_id: str, limit: int, since: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], np.ndarray, Optional[set]]:
+    """Memories and their stored vectors to cluster in the consolidate stage.
+
+    Full runs (``since`` is None) take the whole corpus. Incremental runs take
+    the memories stored after ``since`` followed by their nearest existing
+    neighbours, and also return the new ids so that only clusters touching a
+    new memory are merged.
+    """
+    stored = fetch_user_embeddings(user_id, limit=limit, since=since)
+    memories = [
+        {"id": mid, "content": doc, "metadata": meta}
+        for mid, doc, meta in zip(stored.ids, stored.documents, stored.metadatas)
+    ]
+    if since is None:
+        return memories, stored.embeddings, None
+
+    fresh_ids = set(stored.ids)
+    rows = [i for i in range(len(stored.ids)) if stored.embeddings[i].any()]
+    if not rows:
+        return memories, stored.embeddings, fresh_ids
+
+    res = _get_collection().query(
+        query_embeddings=stored.embeddings[rows].tolist(),
+        n_results=_CLUSTER_MAX_SIZE,
+        where={"user_id": user_id},
+        include=["documents", "metadatas", "embeddings"],
+    )  # type: ignore[attr-defined]
+    dim = stored.embeddings.shape[1]
+    seen = set(fresh_ids)
+    neighbour_vectors: List[Any] = []
+    for q in range(len(res.get("ids") or [])):
+        ids_row = _query_column(res, "ids", q)
+        docs_row = _query_column(res, "documents", q)
+        metas_row = _query_column(res, "metadatas", q)
+        embs_row = _query_column(res, "embeddings", q)
+        for i, mid in enumerate(ids_row):
+            emb = embs_row[i] if i < len(embs_row) else None
+            if mid in seen or emb is None or len(emb) != dim:
+                continue
+            seen.add(mid)
+            memories.append(
+                {
+                    "id": mid,
+                    "content": (docs_row[i] if i < len(docs_row) else None) or "",
+                    "metadata": (metas_row[i] if i < len(metas_row) else None) or {},
+                }
+            )
+            neighbour_vectors.append(emb)
+
+    matrix = stored.embeddings
+    if neighbour_vectors:
+        matrix = np.vstack([matrix, np.asarray(neighbour_vectors, dtype=np.float32)])
+    logger.info(
+        "[graph.consolidate.incremental] user_id=%s new=%s neighbours=%s",
+        user_id,
+        len(fresh_ids),
+        len(neighbour_vectors),
+    )
+    return memories, matrix, fresh_ids
+
+
 def _reextract_memories(
     user_id: str, candidates: List[Dict[str, Any]]
 ) -> Dict[str, Any]:
     """Re-run the store/extraction pipeline per memory content to reclassify and normalize.
-    Returns dict with keys: new_memories (List[Memory]), delete_ids (List[str]).
+    Returns dict with keys: new_memories (List[Memory]), delete_ids (List[str]),
+    errors (int, candidates whose extraction raised).
     """
     new_mems: List[Memory] = []
     delete_ids: List[str] = []
@@ -298,7 +568,9 @@ def _reextract_memories(
         )
 
         try:
-            result = extract_from_transcript(req)
+            _llm_rate_limiter().acquire()
+            with _llm_slots():
+                result = extract_from_transcript(req)
             if result.memories and len(result.memories) > 0:
                 # Validate that new memories have proper structure
                 valid_memories = []
@@ -353,7 +625,27 @@ def _reextract_memories(
         error_count,
     )
 
-    return {"new_memories": new_mems, "delete_ids": delete_ids}
+    return {"new_memories": new_mems, "delete_ids": delete_ids, "errors": error_count}
+
+
+def _timescale_dedup_lookback(since: Optional[int]) -> Optional[timedelta]:
+    """Window for the TimescaleDB dedup passes.
+
+    Incremental runs cover the time since the watermark (plus an hour, so the
+    emotional pass sees whole hour buckets); full runs cover the last
+    COMPACTION_DEDUP_LOOKBACK_DAYS days, or the whole history when that is 0.
+    """
+    if since is not None:
+        return timedelta(seconds=max(_time.time() - since, 0) + 3600)
+    days = get_compaction_dedup_lookback_days()
+    return timedelta(days=days) if days > 0 else None
+
+
+def _record_stage_error(state: Dict[str, Any], stage: str) -> None:
+    """Note a failed stage in ``metrics["errors"]``; the watermark holds while any are set."""
+    errors = state.setdefault("metrics", {}).setdefault("errors", [])
+    if stage not in errors:
+        errors.append(stage)
 
 
 def build_compaction_graph() -> StateGraph:
@@ -401,6 +693,7 @@ def build_compaction_graph() -> StateGraph:
         except Exception as exc:
             logger.warning("[graph.ttl.timescale_error] %s", exc)
             state["metrics"]["ttl_timescale_deleted"] = 0
+            _record_stage_error(state, "ttl")
 
         latency_ms = int((_time.perf_counter() - _t) * 1000)
         logger.info(
@@ -431,8 +724,12 @@ def build_compaction_graph() -> StateGraph:
 
         _t = _time.perf_counter()
 
-        # ChromaDB dedup
-        stats = simple_deduplicate(str(user_id), limit=lim)
+        # ChromaDB dedup (only memories newer than the watermark when incremental)
+        since = state.get("since")
+        if since is not None:
+            stats = incremental_deduplicate(str(user_id), since, limit=lim)
+        else:
+            stats = simple_deduplicate(str(user_id), limit=lim)
         state["metrics"].update(
             {
                 "dedup_scanned": stats.get("scanned", 0),
@@ -440,25 +737,30 @@ def build_compaction_graph() -> StateGraph:
             }
         )
 
+        # TimescaleDB dedup is bounded like the ChromaDB pass above
+        lookback = _timescale_dedup_lookback(since)
+
         # TimescaleDB episodic dedup (best-effort)
         try:
-            ep_stats = deduplicate_episodic(str(user_id), limit=lim)
+            ep_stats = deduplicate_episodic(str(user_id), lookback=lookback)
             state["metrics"]["dedup_episodic_scanned"] = ep_stats.get("scanned", 0)
             state["metrics"]["dedup_episodic_removed"] = ep_stats.get("removed", 0)
         except Exception as exc:
             logger.warning("[graph.dedup.episodic_error] user_id=%s %s", user_id, exc)
             state["metrics"]["dedup_episodic_scanned"] = 0
             state["metrics"]["dedup_episodic_removed"] = 0
+            _record_stage_error(state, "dedup")
 
         # TimescaleDB emotional dedup (best-effort)
         try:
-            em_stats = deduplicate_emotional(str(user_id), limit=lim)
+            em_stats = deduplicate_emotional(str(user_id), lookback=lookback)
             state["metrics"]["dedup_emotional_scanned"] = em_stats.get("scanned", 0)
             state["metrics"]["dedup_emotional_removed"] = em_stats.get("removed", 0)
         except Exception as exc:
             logger.warning("[graph.dedup.emotional_error] user_id=%s %s", user_id, exc)
             state["metrics"]["dedup_emotional_scanned"] = 0
             state["metrics"]["dedup_emotional_removed"] = 0
+            _record_stage_error(state, "dedup")
 
         latency_ms = int((_time.perf_counter() - _t) * 1000)
         logger.info(
@@ -504,9 +806,11 @@ def build_compaction_graph() -> StateGraph:
 
         _t = _time.perf_counter()
 
-        # 1. Load all memories for user
+        # 1. Load memories for user, with the vectors Chroma already stores
         limit = int(state.get("limit") or 500)
-        memories = _fetch_user_memories(user_id, limit=limit)
+        memories, embeddings, fresh_ids = _load_consolidation_candidates(
+            user_id, limit, since=state.get("since")
+        )
 
         if len(memories) < 5:
             logger.info(
@@ -521,7 +825,9 @@ def build_compaction_graph() -> StateGraph:
             return state
 
         # 2. Cluster by embedding similarity
-        clusters = _cluster_memories(memories, threshold=0.75)
+        clusters = _cluster_memories(memories, threshold=0.75, embeddings=embeddings)
+        if fresh_ids is not None:
+            clusters = [c for c in clusters if any(m["id"] in fresh_ids for m in c)]
 
         if not clusters:
             logger.info(
@@ -533,51 +839,31 @@ def build_compaction_graph() -> StateGraph:
             end_span(output={"skipped": True, "reason": "no_clusters"})
             return state
 
-        # 3. For each cluster >= 3 memories: consolidate via LLM
-        consolidated_count = 0
-        sources_removed = 0
+        # 3. Consolidate every cluster via LLM, concurrently
         dry_run = state.get("dry_run", False)
+        results = _consolidate_clusters(user_id, clusters)
+        golden = [r for r in results if r.get("memory") and r.get("source_ids")]
+        if any(r.get("error") for r in results):
+            _record_stage_error(state, "consolidate")
 
-        for cluster in clusters:
-            result = _consolidate_cluster(user_id, cluster)
-
-            if result.get("memory") and result.get("source_ids"):
-                if dry_run:
-                    logger.info(
-                        "[graph.consolidate.dry_run] user_id=%s would_merge=%s",
-                        user_id,
-                        len(result["source_ids"]),
-                    )
-                    consolidated_count += 1
-                    sources_removed += len(result["source_ids"])
-                else:
-                    try:
-                        # 4. Store consolidated, delete sources (transaction safety)
-                        memory = result["memory"]
-                        source_ids = result["source_ids"]
-
-                        # Upsert consolidated memory first
-                        upsert_memories(user_id, [memory])
-
-                        # Delete source memories only after successful upsert
-                        col = _get_collection()
-                        col.delete(ids=source_ids)  # type: ignore[attr-defined]
-
-                        consolidated_count += 1
-                        sources_removed += len(source_ids)
-
-                        logger.info(
-                            "[graph.consolidate] merged %s → 1 user_id=%s",
-                            len(source_ids),
-                            user_id,
-                        )
-                    except Exception as exc:
-                        logger.error(
-                            "[graph.consolidate.error] user_id=%s error=%s",
-                            user_id,
-                            exc,
-                        )
-                        continue
+        # 4. Store golden records, then delete their sources (batched)
+        if dry_run:
+            for result in golden:
+                logger.info(
+                    "[graph.consolidate.dry_run] user_id=%s would_merge=%s",
+                    user_id,
+                    len(result["source_ids"]),
+                )
+            consolidated_count = len(golden)
+            sources_removed = sum(len(r["source_ids"]) for r in golden)
+        elif golden:
+            consolidated_count, sources_removed, failures = _apply_consolidations(
+                user_id, golden
+            )
+            if failures:
+                _record_stage_error(state, "consolidate")
+        else:
+            consolidated_count, sources_removed = 0, 0
 
         state.setdefault("metrics", {})
         state["metrics"]["consolidated_count"] = consolidated_count
@@ -614,7 +900,7 @@ def build_compaction_graph() -> StateGraph:
         )
 
         _t = _time.perf_counter()
-        cands = _fetch_user_memories(user_id, limit=limit)
+        cands = _fetch_user_memories(user_id, limit=limit, since=state.get("since"))
         state["candidates"] = cands
 
         # Safety check: if no candidates, force skip re-extraction
@@ -670,6 +956,8 @@ def build_compaction_graph() -> StateGraph:
 
         out = _reextract_memories(user_id, state.get("candidates", []))
         state["reextract"] = out
+        if out.get("errors"):
+            _record_stage_error(state, "reextract")
         latency_ms = int((_time.perf_counter() - _t) * 1000)
         logger.info(
             "[graph.reextract] user_id=%s new=%s delete=%s latency_ms=%s",
@@ -743,11 +1031,12 @@ def build_compaction_graph() -> StateGraph:
                     )
                 except Exception as exc:
                     logger.error(
-                        "[graph.apply.error] user_id=%s upserted=%s failed=%s error=%s",
+                        "[graph.apply.error] user_id=%s upserted=%s error=%s",
                         user_id,
                         upserted_count,
                         exc,
                     )
+                    _record_stage_error(state, "apply")
                     # Don't delete if upsert failed
             elif new_mems:
                 # Only upsert
@@ -760,6 +1049,7 @@ def build_compaction_graph() -> StateGraph:
                     logger.error(
                         "[graph.apply.upsert.error] user_id=%s error=%s", user_id, exc
                     )
+                    _record_stage_error(state, "apply")
             elif delete_ids:
                 # Only delete
                 try:
@@ -770,6 +1060,7 @@ def build_compaction_graph() -> StateGraph:
                     logger.error(
                         "[graph.apply.delete.error] user_id=%s error=%s", user_id, exc
                     )
+                    _record_stage_error(state, "apply")
 
         state["metrics"]["applied_upserts"] = upserted_count
         state["metrics"]["applied_deletes"] = deleted_count
@@ -818,6 +1109,7 @@ def run_compaction_graph(
     limit: int = 10000,
     skip_reextract: bool = True,
     skip_consolidate: bool = False,
+    incremental: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """Run the minimal compaction graph for a single user and return the final state.
 
@@ -827,8 +1119,22 @@ def run_compaction_graph(
             limit: Max memories to process
             skip_reextract: If True, skip expensive LLM re-extraction (default True for speed/cost)
             skip_consolidate: If True, skip memory consolidation (default False - runs by default)
+            incremental: True/False forces an incremental/full run; None (default)
+                    runs incrementally from the user's watermark until the full
+                    re-cluster cadence is due
     """
     from src.services.tracing import start_trace
+    from src.services.compaction_watermark import (
+        CompactionWatermark,
+        get_watermark,
+        plan_since,
+        set_watermark,
+    )
+
+    run_started = int(_time.time())
+    watermark = get_watermark(user_id)
+    since = plan_since(watermark, incremental)
+    mode = "full" if since is None else "incremental"
 
     # Start a trace for this compaction job
     trace = start_trace(
@@ -839,6 +1145,7 @@ def run_compaction_graph(
             "limit": limit,
             "skip_reextract": skip_reextract,
             "skip_consolidate": skip_consolidate,
+            "mode": mode,
             "trigger": "manual",
         },
     )
@@ -851,10 +1158,26 @@ def run_compaction_graph(
         "limit": limit,
         "skip_reextract": skip_reextract,
         "skip_consolidate": skip_consolidate,
+        "since": since,
     }
     final: Dict[str, Any] = graph.compile().invoke(initial)  # type: ignore
     final.setdefault("metrics", {})
     final["metrics"]["duration_ms"] = int((_time.perf_counter() - _t0) * 1000)
+    final["metrics"]["mode"] = mode
+    errors = final["metrics"].setdefault("errors", [])
+
+    if errors and not dry_run:
+        # Keep the old watermark so the failed window is retried next run.
+        logger.warning("[graph.watermark.held] user_id=%s errors=%s", user_id, errors)
+    elif not dry_run:
+        # Memories stored during this second are picked up again next run.
+        set_watermark(
+            user_id,
+            CompactionWatermark(
+                stored_at=run_started - 1,
+                full_at=run_started if since is None else watermark.full_at,
+            ),
+        )
     logger.info("[graph.done] user_id=%s metrics=%s", user_id, final.get("metrics"))
 
     # Update trace with final metrics
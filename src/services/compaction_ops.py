@@ -1,18 +1,47 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
+
 from src.dependencies.chroma import get_chroma_client
 from src.dependencies.timescale import get_timescale_conn, release_timescale_conn
-from src.services.embedding_utils import generate_embedding
-from src.services.retrieval import _standard_collection_name
+from src.services.embedding_utils import get_embeddings
+from src.services.retrieval import _standard_collection_name, iter_user_memories
+from src.services.temporal_aggregates import refresh_aggregates
 
 
 logger = logging.getLogger("agentic_memories.compaction_ops")
 
+# Rows per Chroma ``get`` when paging through a user's stored embeddings.
+EMBEDDING_FETCH_PAGE_SIZE = 500
+# Upper bound on float32 similarity-tile elements held at once (16M ≈ 64 MB).
+SIMILARITY_TILE_ELEMENTS = 1 << 24
+# Nearest existing memories checked per new memory in incremental dedup.
+INCREMENTAL_DEDUP_NEIGHBOURS = 5
+# Hypertable chunk intervals (migrations/timescaledb 001 and 002); SQL dedup
+# deletes one window of this size per statement.
+EPISODIC_CHUNK_INTERVAL = timedelta(days=7)
+EMOTIONAL_CHUNK_INTERVAL = timedelta(days=3)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class StoredEmbeddings:
+    """A user's memories fetched together with their stored vectors.
+
+    ``embeddings`` is a contiguous float32 array with one row per id.
+    """
+
+    ids: List[str]
+    documents: List[str]
+    metadatas: List[Dict[str, Any]]
+    embeddings: np.ndarray
+
 
 def _get_collection() -> Any:
     client = get_chroma_client()
@@ -42,6 +71,129 @@ def ttl_cleanup() -> int:
         return 0
 
 
+def user_where(user_id: str, since: Optional[int] = None) -> Dict[str, Any]:
+    """Chroma filter for a user's memories, optionally only those stored after ``since``."""
+    if since is None:
+        return {"user_id": user_id}
+    return {"$and": [{"user_id": user_id}, {"stored_at": {"$gt": since}}]}
+
+
+def fetch_user_embeddings(
+    user_id: str,
+    limit: int = 10000,
+    page_size: int = EMBEDDING_FETCH_PAGE_SIZE,
+    col: Optional[Any] = None,
+    since: Optional[int] = None,
+    include: Sequence[str] = ("documents", "metadatas"),
+) -> StoredEmbeddings:
+    """Page through a user's memories, including the vectors Chroma already holds.
+
+    With ``since``, only memories stored after that epoch second are returned.
+    ``include`` selects which of documents/metadatas to keep alongside the
+    vectors; fields left out come back as empty lists. Each page is reduced to
+    float32 rows as it arrives, so the raw payload is never held for the whole
+    user. Rows stored without a vector are embedded on the fly (best-effort); if
+    that fails they are left as zero rows, which never match anything.
+    """
+    col = col if col is not None else _get_collection()
+    keep_docs = "documents" in include
+    keep_metas = "metadatas" in include
+    ids: List[str] = []
+    docs: List[str] = []
+    metas: List[Dict[str, Any]] = []
+    vectors: List[Optional[np.ndarray]] = []
+
+    for page in iter_user_memories(
+        user_id,
+        page_size=page_size,
+        include=[f for f in ("documents", "metadatas") if f in include]
+        + ["embeddings"],
+        limit=limit,
+        where=user_where(user_id, since),
+        col=col,
+    ):
+        ids.extend(page.ids)
+        if keep_docs:
+            docs.extend(page.documents or [])
+        if keep_metas:
+            metas.extend(page.metadatas or [])
+        vectors.extend(
+            np.asarray(vec, dtype=np.float32) if vec is not None and len(vec) else None
+            for vec in page.embeddings or []
+        )
+
+    missing = [i for i, vec in enumerate(vectors) if vec is None]
+    if missing:
+        try:
+            if keep_docs:
+                texts = [docs[i] for i in missing]
+            else:
+                res = col.get(ids=[ids[i] for i in missing], include=["documents"])  # type: ignore[attr-defined]
+                by_id = dict(zip(res.get("ids") or [], res.get("documents") or []))
+                texts = [by_id.get(ids[i]) or "" for i in missing]
+            pairs = [(i, t) for i, t in zip(missing, texts) if t]
+            if pairs:
+                embedded = get_embeddings([t for _, t in pairs])
+                for (i, _), vec in zip(pairs, embedded):
+                    if vec:
+                        vectors[i] = np.asarray(vec, dtype=np.float32)
+                logger.info(
+                    "[forget.embeddings.backfill] user_id=%s missing=%s",
+                    user_id,
+                    len(pairs),
+                )
+        except Exception as exc:
+            logger.info(
+                "[forget.embeddings.backfill_error] user_id=%s missing=%s %s",
+                user_id,
+                len(missing),
+                exc,
+            )
+
+    dim = next((vec.shape[0] for vec in vectors if vec is not None), 0)
+    matrix = np.zeros((len(vectors), dim), dtype=np.float32)
+    for row, vec in enumerate(vectors):
+        if vec is not None and vec.shape[0] == dim:
+            matrix[row] = vec
+    return StoredEmbeddings(ids=ids, documents=docs, metadatas=metas, embeddings=matrix)
+
+
+def normalize_embeddings(vectors: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Return a unit-normalized float32 copy of ``vectors`` and its non-zero row mask."""
+    matrix = np.array(vectors, dtype=np.float32, ndmin=2)
+    norms = np.linalg.norm(matrix, axis=1)
+    nonzero = norms > 0
+    matrix[nonzero] /= norms[nonzero, None]
+    return matrix, nonzero
+
+
+def near_duplicate_rows(vectors: Any, similarity_threshold: float) -> List[int]:
+    """Indices of rows to drop as near-duplicates of an earlier kept row.
+
+    Rows are visited in order; each kept row removes every later kept row with
+    cosine similarity >= threshold. Zero rows are never compared.
+    """
+    matrix, live = normalize_embeddings(vectors)
+    n = matrix.shape[0]
+    removed: List[int] = []
+    tile_rows = max(1, SIMILARITY_TILE_ELEMENTS // max(n, 1))
+    for start in range(0, n, tile_rows):
+        seeds = np.flatnonzero(live[start : start + tile_rows]) + start
+        if not seeds.size:
+            continue
+        tile = matrix[seeds] @ matrix[start:].T
+        for row, i in zip(tile, seeds):
+            if not live[i]:
+                continue
+            dupes = np.flatnonzero(
+                (row[i + 1 - start :] >= similarity_threshold) & live[i + 1 :]
+            )
+            dupes += i + 1
+            live[dupes] = False
+            removed.extend(dupes.tolist())
+    return removed
+
+
 def simple_deduplicate(
     user_id: str, similarity_threshold: float = 0.85, limit: int = 10000
 ) -> Dict[str, int]:
@@ -50,43 +202,20 @@ def simple_deduplicate(
     Threshold lowered from 0.90 to 0.80 (Story 4.3) to catch semantic duplicates
     that are worded differently (e.g., "User likes Buffett" vs "User admires Buffett").
 
+    Uses the embeddings already stored in Chroma rather than re-embedding.
+
     Returns stats dict with 'scanned' and 'removed' counts.
     """
     col = _get_collection()
     try:
-        res = col.get(
-            where={"user_id": user_id}, limit=limit, include=["documents", "metadatas"]
-        )  # type: ignore[attr-defined]
-        ids = res.get("ids", [])
-        docs = res.get("documents", [])
-        N = len(ids)
+        stored = fetch_user_embeddings(user_id, limit=limit, col=col, include=())
+        N = len(stored.ids)
         if N <= 1:
             return {"scanned": N, "removed": 0}
-        embs: List[List[float]] = []
-        for doc in docs:
-            try:
-                embs.append(generate_embedding(doc) or [])
-            except Exception:
-                embs.append([])
-        removed: List[str] = []
-        for i in range(N):
-            if ids[i] in removed:
-                continue
-            for j in range(i + 1, N):
-                if ids[j] in removed:
-                    continue
-                a = embs[i]
-                b = embs[j]
-                if not a or not b or len(a) != len(b):
-                    continue
-                dot = sum(x * y for x, y in zip(a, b))
-                na = sum(x * x for x in a) ** 0.5
-                nb = sum(y * y for y in b) ** 0.5
-                if na <= 0 or nb <= 0:
-                    continue
-                cos = dot / (na * nb)
-                if cos >= similarity_threshold:
-                    removed.append(ids[j])
+        removed = [
+            stored.ids[i]
+            for i in near_duplicate_rows(stored.embeddings, similarity_threshold)
+        ]
         if removed:
             col.delete(ids=removed)  # type: ignore[attr-defined]
             logger.info(
@@ -98,179 +227,251 @@ def simple_deduplicate(
         return {"scanned": 0, "removed": 0}
 
 
-def deduplicate_episodic(user_id: str, limit: int = 1000) -> Dict[str, int]:
-    """Deduplicate episodic_memories for a user by exact content match.
+def incremental_deduplicate(
+    user_id: str,
+    since: int,
+    similarity_threshold: float = 0.85,
+    limit: int = 10000,
+    col: Optional[Any] = None,
+) -> Dict[str, int]:
+    """Dedup only memories stored after ``since`` against the rest of the corpus.
 
-    Groups rows by identical content, keeps the row with the highest
-    importance_score in each group, and deletes the rest.
+    New memories are first deduplicated among themselves, then each survivor is
+    checked against its nearest existing memories via one multi-vector query.
+    The existing memory is always the one kept.
 
     Returns stats dict with 'scanned' and 'removed' counts.
     """
-    conn = get_timescale_conn()
-    if not conn:
-        logger.warning("[forget.dedup_episodic] no TimescaleDB connection")
-        return {"scanned": 0, "removed": 0}
-
+    col = col if col is not None else _get_collection()
     try:
-        with conn.cursor() as cur:
-            # Find duplicate IDs to delete: for each group of identical content,
-            # keep the row with the highest importance_score (tie-break by newest timestamp).
-            cur.execute(
-                """
-				WITH ranked AS (
-					SELECT id, content,
-					       ROW_NUMBER() OVER (
-					           PARTITION BY content
-					           ORDER BY importance_score DESC NULLS LAST,
-					                    event_timestamp DESC
-					       ) AS rn
-					FROM episodic_memories
-					WHERE user_id = %s
-					ORDER BY event_timestamp DESC
-					LIMIT %s
-				)
-				SELECT id FROM ranked WHERE rn > 1
-			""",
-                (user_id, limit),
-            )
-            rows = cur.fetchall()
-            delete_ids = [row["id"] for row in rows]
-
-            # Count total scanned
-            cur.execute(
-                """
-				SELECT COUNT(*) AS cnt FROM episodic_memories
-				WHERE user_id = %s
-			""",
-                (user_id,),
-            )
-            scanned = cur.fetchone()["cnt"]
-
-            if delete_ids:
-                cur.execute(
-                    """
-					DELETE FROM episodic_memories WHERE id = ANY(%s)
-				""",
-                    (delete_ids,),
-                )
-
-            conn.commit()
-
-        logger.info(
-            "[forget.dedup_episodic] user_id=%s scanned=%s removed=%s",
-            user_id,
-            scanned,
-            len(delete_ids),
+        fresh = fetch_user_embeddings(
+            user_id, limit=limit, col=col, since=since, include=()
         )
-        return {"scanned": scanned, "removed": len(delete_ids)}
+        N = len(fresh.ids)
+        if N == 0:
+            return {"scanned": 0, "removed": 0}
+        drop = set(near_duplicate_rows(fresh.embeddings, similarity_threshold))
+        rows = [i for i in range(N) if i not in drop and fresh.embeddings[i].any()]
+        if rows:
+            res = col.query(
+                query_embeddings=fresh.embeddings[rows].tolist(),
+                n_results=INCREMENTAL_DEDUP_NEIGHBOURS,
+                where={"user_id": user_id},
+                include=["embeddings"],
+            )  # type: ignore[attr-defined]
+            fresh_ids = set(fresh.ids)
+            queries, _ = normalize_embeddings(fresh.embeddings[rows])
+            hit_ids = res.get("ids") or []
+            hit_embs = res.get("embeddings") or []
+            for pos, row in enumerate(rows):
+                ids_row = hit_ids[pos] if pos < len(hit_ids) else []
+                embs_row = hit_embs[pos] if pos < len(hit_embs) else []
+                existing = [
+                    emb
+                    for mid, emb in zip(ids_row, embs_row)
+                    if mid not in fresh_ids
+                    and emb is not None
+                    and len(emb) == queries.shape[1]
+                ]
+                if not existing:
+                    continue
+                neighbours, _ = normalize_embeddings(existing)
+                if np.max(neighbours @ queries[pos]) >= similarity_threshold:
+                    drop.add(row)
+        removed = [fresh.ids[i] for i in sorted(drop)]
+        if removed:
+            col.delete(ids=removed)  # type: ignore[attr-defined]
+            logger.info(
+                "[forget.dedup.incremental] user_id=%s removed=%s of %s new",
+                user_id,
+                len(removed),
+                N,
+            )
+        return {"scanned": N, "removed": len(removed)}
     except Exception as exc:
-        if conn:
-            conn.rollback()
-        logger.error("[forget.dedup_episodic.error] user_id=%s %s", user_id, exc)
+        logger.info("[forget.dedup.incremental_error] user_id=%s %s", user_id, exc)
         return {"scanned": 0, "removed": 0}
-    finally:
-        if conn:
-            release_timescale_conn(conn)
-
 
-def deduplicate_emotional(user_id: str, limit: int = 1000) -> Dict[str, int]:
-    """Deduplicate emotional_memories for a user.
 
-    Groups rows by (emotional_state, trigger_event) within a 1-hour time window.
-    Keeps the row with the highest intensity in each group, deletes the rest.
+def _chunk_windows(
+    first: datetime, last: datetime, interval: timedelta
+) -> List[Tuple[datetime, datetime]]:
+    """Epoch-aligned ``[start, end)`` windows of ``interval`` covering first..last."""
+    step = interval.total_seconds()
+    offset = (first - _EPOCH).total_seconds() // step * step
+    start = _EPOCH + timedelta(seconds=offset)
+    windows: List[Tuple[datetime, datetime]] = []
+    while start <= last:
+        windows.append((start, start + interval))
+        start += interval
+    return windows
+
+
+def _dedup_by_chunk(
+    name: str,
+    table: str,
+    time_column: str,
+    delete_sql: str,
+    interval: timedelta,
+    user_id: str,
+    lookback: Optional[timedelta],
+) -> Dict[str, int]:
+    """Run ``delete_sql`` once per chunk-sized window of the user's history.
 
-    Returns stats dict with 'scanned' and 'removed' counts.
+    Each statement is bounded by ``%(start)s``/``%(end)s`` on the partitioning
+    column, so TimescaleDB prunes it to the chunk(s) in that window, and each
+    window commits on its own to keep transactions short. The continuous
+    aggregates are then refreshed over the windows that lost rows.
     """
     conn = get_timescale_conn()
     if not conn:
-        logger.warning("[forget.dedup_emotional] no TimescaleDB connection")
+        logger.warning("[forget.%s] no TimescaleDB connection", name)
         return {"scanned": 0, "removed": 0}
 
     try:
+        cutoff = None
+        if lookback:
+            # Hour-aligned so emotional hour buckets are never split
+            cutoff = (datetime.now(timezone.utc) - lookback).replace(
+                minute=0, second=0, microsecond=0
+            )
+        bound = f" AND {time_column} >= %(cutoff)s" if cutoff else ""
+        removed = 0
+        touched: List[datetime] = []
         with conn.cursor() as cur:
-            # Fetch emotional memories ordered by timestamp
             cur.execute(
-                """
-				SELECT id, emotional_state, trigger_event, intensity, timestamp
-				FROM emotional_memories
-				WHERE user_id = %s
-				ORDER BY timestamp DESC
-				LIMIT %s
+                f"""
+				SELECT COUNT(*) AS cnt, MIN({time_column}) AS first,
+				       MAX({time_column}) AS last
+				FROM {table}
+				WHERE user_id = %(user_id)s{bound}
 			""",
-                (user_id, limit),
+                {"user_id": user_id, "cutoff": cutoff},
             )
-            rows = cur.fetchall()
-            scanned = len(rows)
-
-            if scanned <= 1:
-                conn.commit()
-                return {"scanned": scanned, "removed": 0}
-
-            # Group by (emotional_state, trigger_event) within 1-hour windows
-            # For each group, keep the row with the highest intensity
-            delete_ids = []
-            groups: Dict[str, List[Dict]] = {}
-
-            for row in rows:
-                state = row.get("emotional_state") or ""
-                trigger = row.get("trigger_event") or ""
-                ts = row.get("timestamp")
-                # Create a bucket key: state + trigger + hour-rounded timestamp
-                if ts:
-                    hour_bucket = ts.replace(
-                        minute=0, second=0, microsecond=0
-                    ).isoformat()
-                else:
-                    hour_bucket = "none"
-                group_key = f"{state}|{trigger}|{hour_bucket}"
-
-                if group_key not in groups:
-                    groups[group_key] = []
-                groups[group_key].append(row)
-
-            for group_key, group_rows in groups.items():
-                if len(group_rows) <= 1:
-                    continue
-                # Sort by intensity descending, keep the first
-                group_rows.sort(
-                    key=lambda r: float(r.get("intensity") or 0), reverse=True
-                )
-                for row in group_rows[1:]:
-                    delete_ids.append(row["id"])
-
-            if delete_ids:
-                cur.execute(
-                    """
-					DELETE FROM emotional_memories WHERE id = ANY(%s)
-				""",
-                    (delete_ids,),
-                )
-
+            span = cur.fetchone() or {}
+            scanned = int(span.get("cnt") or 0)
             conn.commit()
+            if scanned > 1:
+                for start, end in _chunk_windows(span["first"], span["last"], interval):
+                    start = max(start, cutoff) if cutoff else start
+                    cur.execute(
+                        delete_sql, {"user_id": user_id, "start": start, "end": end}
+                    )
+                    if cur.rowcount and cur.rowcount > 0:
+                        removed += cur.rowcount
+                        touched += [start, end]
+                    conn.commit()
+        if touched:
+            refresh_aggregates(conn, table, min(touched), max(touched))
 
         logger.info(
-            "[forget.dedup_emotional] user_id=%s scanned=%s removed=%s",
+            "[forget.%s] user_id=%s scanned=%s removed=%s",
+            name,
             user_id,
             scanned,
-            len(delete_ids),
+            removed,
         )
-        return {"scanned": scanned, "removed": len(delete_ids)}
+        return {"scanned": scanned, "removed": removed}
     except Exception as exc:
         if conn:
             conn.rollback()
-        logger.error("[forget.dedup_emotional.error] user_id=%s %s", user_id, exc)
+        logger.error("[forget.%s.error] user_id=%s %s", name, user_id, exc)
         return {"scanned": 0, "removed": 0}
     finally:
         if conn:
             release_timescale_conn(conn)
 
 
+# A row is deleted when an identical row (same content_hash and content) ranks
+# higher: greater importance_score (NULLs lowest), then newer, then larger id.
+_EPISODIC_DEDUP_SQL = """
+	DELETE FROM episodic_memories d
+	USING episodic_memories k
+	WHERE d.user_id = %(user_id)s
+	  AND d.event_timestamp >= %(start)s
+	  AND d.event_timestamp < %(end)s
+	  AND k.user_id = d.user_id
+	  AND k.content_hash = d.content_hash
+	  AND k.content IS NOT DISTINCT FROM d.content
+	  AND (COALESCE(k.importance_score, '-Infinity'::float8), k.event_timestamp, k.id)
+	    > (COALESCE(d.importance_score, '-Infinity'::float8), d.event_timestamp, d.id)
+"""
+
+# Within an hour bucket, a row is deleted when a row with the same
+# (emotional_state, trigger_event) ranks higher (NULL and '' triggers count as
+# the same, as content_hash does): greater intensity, then newer,
+# then larger id. Windows are hour-aligned, so the keeper lies in the same window.
+_EMOTIONAL_DEDUP_SQL = """
+	DELETE FROM emotional_memories d
+	USING emotional_memories k
+	WHERE d.user_id = %(user_id)s
+	  AND d.timestamp >= %(start)s
+	  AND d.timestamp < %(end)s
+	  AND k.user_id = d.user_id
+	  AND k.timestamp >= %(start)s
+	  AND k.timestamp < %(end)s
+	  AND k.content_hash = d.content_hash
+	  AND k.emotional_state IS NOT DISTINCT FROM d.emotional_state
+	  AND COALESCE(k.trigger_event, '') = COALESCE(d.trigger_event, '')
+	  AND time_bucket(INTERVAL '1 hour', k.timestamp)
+	    = time_bucket(INTERVAL '1 hour', d.timestamp)
+	  AND (COALESCE(k.intensity, 0), k.timestamp, k.id)
+	    > (COALESCE(d.intensity, 0), d.timestamp, d.id)
+"""
+
+
+def deduplicate_episodic(
+    user_id: str, lookback: Optional[timedelta] = None
+) -> Dict[str, int]:
+    """Deduplicate episodic_memories for a user by exact content match.
+
+    Rows are matched on the indexed ``content_hash``; in each group the row
+    with the highest importance_score (then the newest) is kept. Deletes run
+    set-based inside TimescaleDB, one chunk-sized window at a time. ``lookback``
+    limits the pass to recent history.
+
+    Returns stats dict with 'scanned' and 'removed' counts.
+    """
+    return _dedup_by_chunk(
+        "dedup_episodic",
+        "episodic_memories",
+        "event_timestamp",
+        _EPISODIC_DEDUP_SQL,
+        EPISODIC_CHUNK_INTERVAL,
+        user_id,
+        lookback,
+    )
+
+
+def deduplicate_emotional(
+    user_id: str, lookback: Optional[timedelta] = None
+) -> Dict[str, int]:
+    """Deduplicate emotional_memories for a user.
+
+    Groups rows by (emotional_state, trigger_event) within a 1-hour time bucket
+    and keeps the row with the highest intensity (then the newest). Deletes run
+    set-based inside TimescaleDB, one chunk-sized window at a time.
+
+    Returns stats dict with 'scanned' and 'removed' counts.
+    """
+    return _dedup_by_chunk(
+        "dedup_emotional",
+        "emotional_memories",
+        "timestamp",
+        _EMOTIONAL_DEDUP_SQL,
+        EMOTIONAL_CHUNK_INTERVAL,
+        user_id,
+        lookback,
+    )
+
+
 def ttl_cleanup_timescale() -> int:
     """TTL-based cleanup of stale TimescaleDB memories.
 
     - Episodic: delete where importance_score < 0.3 AND older than 90 days
     - Emotional: delete where intensity < 0.2 AND older than 60 days
 
+    The continuous aggregates are refreshed over the span of deleted rows.
     Returns total number of rows deleted.
     """
     conn = get_timescale_conn()
@@ -285,28 +486,45 @@ def ttl_cleanup_timescale() -> int:
             cutoff_episodic = datetime.now(timezone.utc) - timedelta(days=90)
             cur.execute(
                 """
-				DELETE FROM episodic_memories
-				WHERE importance_score < 0.3
-				  AND event_timestamp < %s
+				WITH gone AS (
+					DELETE FROM episodic_memories
+					WHERE importance_score < 0.3
+					  AND event_timestamp < %s
+					RETURNING event_timestamp AS ts
+				)
+				SELECT COUNT(*) AS cnt, MIN(ts) AS first, MAX(ts) AS last FROM gone
 			""",
                 (cutoff_episodic,),
             )
-            episodic_deleted = cur.rowcount
+            episodic_span = cur.fetchone() or {}
+            episodic_deleted = int(episodic_span.get("cnt") or 0)
 
             # Emotional TTL: low intensity + old
             cutoff_emotional = datetime.now(timezone.utc) - timedelta(days=60)
             cur.execute(
                 """
-				DELETE FROM emotional_memories
-				WHERE intensity < 0.2
-				  AND timestamp < %s
+				WITH gone AS (
+					DELETE FROM emotional_memories
+					WHERE intensity < 0.2
+					  AND timestamp < %s
+					RETURNING timestamp AS ts
+				)
+				SELECT COUNT(*) AS cnt, MIN(ts) AS first, MAX(ts) AS last FROM gone
 			""",
                 (cutoff_emotional,),
             )
-            emotional_deleted = cur.rowcount
+            emotional_span = cur.fetchone() or {}
+            emotional_deleted = int(emotional_span.get("cnt") or 0)
 
             conn.commit()
 
+        for table, span in (
+            ("episodic_memories", episodic_span),
+            ("emotional_memories", emotional_span),
+        ):
+            if span.get("cnt"):
+                refresh_aggregates(conn, table, span["first"], span["last"])
+
         total_deleted = episodic_deleted + emotional_deleted
         logger.info(
             "[forget.ttl_timescale] episodic_deleted=%s emotional_deleted=%s total=%s",
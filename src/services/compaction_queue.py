@@ -0,0 +1,278 @@
+"""
+Redis-backed per-user compaction job queue.
+
+Keys:
+- ``compaction:queue``         ZSET user_id -> ready-at epoch (retries are due later)
+- ``compaction:running``       ZSET user_id -> last heartbeat epoch
+- ``compaction:lease:{uid}``   per-user lease (redis-py Lock; expires unless heartbeated)
+- ``compaction:attempts``      HASH user_id -> failed attempts so far
+- ``compaction:dead``          SET of user_ids that exhausted their attempts
+- ``compaction:errors``        HASH user_id -> last error
+- ``compaction:progress``      HASH of counters (enqueued, completed, retried, dead_lettered)
+
+Workers in any process or node claim one user at a time. The lease guarantees
+a single worker per user; a job whose lease lapses (crashed or stuck worker)
+is retried like a failure, with exponential backoff, until it lands in the
+dead-letter set.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from redis.exceptions import LockError
+
+from src.config import (
+    get_compaction_lease_seconds,
+    get_compaction_max_attempts,
+    get_compaction_retry_backoff_seconds,
+    get_compaction_workers,
+)
+from src.dependencies.redis_client import get_redis_client
+
+
+logger = logging.getLogger("agentic_memories.compaction_queue")
+
+QUEUE_KEY = "compaction:queue"
+RUNNING_KEY = "compaction:running"
+LEASE_KEY = "compaction:lease:{user_id}"
+ATTEMPTS_KEY = "compaction:attempts"
+DEAD_KEY = "compaction:dead"
+ERRORS_KEY = "compaction:errors"
+PROGRESS_KEY = "compaction:progress"
+
+_MAX_BACKOFF_SECONDS = 3600
+# Ready jobs inspected per claim attempt (others may be leased elsewhere)
+_CLAIM_SCAN = 16
+
+
+@dataclass
+class CompactionLease:
+    user_id: str
+    lock: Any
+    attempt: int
+
+
+def retry_delay_seconds(attempt: int) -> int:
+    """Exponential backoff after the given failed attempt (1-based)."""
+    base = get_compaction_retry_backoff_seconds()
+    return min(_MAX_BACKOFF_SECONDS, base * 2 ** max(0, attempt - 1))
+
+
+def enqueue_users(r: Any, user_ids: Iterable[str], now: Optional[float] = None) -> int:
+    """Queue users for compaction; users already queued keep their slot."""
+    now = time.time() if now is None else now
+    ids = sorted(set(user_ids))
+    if not ids:
+        return 0
+    added = r.zadd(QUEUE_KEY, {uid: now for uid in ids}, nx=True)
+    if added:
+        r.hincrby(PROGRESS_KEY, "enqueued", added)
+    logger.info("[compaction.queue.enqueue] requested=%s added=%s", len(ids), added)
+    return added
+
+
+def _release(lock: Any) -> None:
+    try:
+        lock.release()
+    except LockError:
+        pass  # lease already lapsed
+
+
+def claim_job(
+    r: Any, worker_id: str, now: Optional[float] = None
+) -> Optional[CompactionLease]:
+    """Lease the next ready user, or return None when nothing is ready."""
+    now = time.time() if now is None else now
+    reap_expired_leases(r, now)
+    for uid in r.zrangebyscore(QUEUE_KEY, "-inf", now, start=0, num=_CLAIM_SCAN):
+        lock = r.lock(
+            LEASE_KEY.format(user_id=uid),
+            timeout=get_compaction_lease_seconds(),
+            blocking=False,
+        )
+        if not lock.acquire(blocking=False):
+            continue  # another worker holds this user
+        pipe = r.pipeline(transaction=True)
+        pipe.zrem(QUEUE_KEY, uid)
+        pipe.zadd(RUNNING_KEY, {uid: now})
+        removed, _ = pipe.execute()
+        if not removed:
+            # Finished by another worker between our scan and the lease
+            r.zrem(RUNNING_KEY, uid)
+            _release(lock)
+            continue
+        attempt = int(r.hget(ATTEMPTS_KEY, uid) or 0) + 1
+        logger.info(
+            "[compaction.queue.claim] worker=%s user_id=%s attempt=%s",
+            worker_id,
+            uid,
+            attempt,
+        )
+        return CompactionLease(user_id=uid, lock=lock, attempt=attempt)
+    return None
+
+
+def heartbeat(r: Any, lease: CompactionLease, now: Optional[float] = None) -> bool:
+    """Extend the lease; False means it lapsed and the job may run elsewhere."""
+    now = time.time() if now is None else now
+    try:
+        lease.lock.extend(get_compaction_lease_seconds(), replace_ttl=True)
+    except LockError:
+        logger.warning("[compaction.queue.lease_lost] user_id=%s", lease.user_id)
+        return False
+    r.zadd(RUNNING_KEY, {lease.user_id: now})
+    return True
+
+
+def complete_job(r: Any, lease: CompactionLease) -> None:
+    pipe = r.pipeline(transaction=True)
+    pipe.zrem(RUNNING_KEY, lease.user_id)
+    pipe.hdel(ATTEMPTS_KEY, lease.user_id)
+    pipe.hdel(ERRORS_KEY, lease.user_id)
+    pipe.srem(DEAD_KEY, lease.user_id)
+    pipe.hincrby(PROGRESS_KEY, "completed", 1)
+    pipe.execute()
+    _release(lease.lock)
+
+
+def fail_job(
+    r: Any, lease: CompactionLease, error: str, now: Optional[float] = None
+) -> str:
+    """Record a failed attempt; returns "retry" or "dead_lettered"."""
+    outcome = _record_failure(r, lease.user_id, error, now)
+    _release(lease.lock)
+    return outcome
+
+
+def _record_failure(
+    r: Any, user_id: str, error: str, now: Optional[float] = None
+) -> str:
+    now = time.time() if now is None else now
+    attempts = r.hincrby(ATTEMPTS_KEY, user_id, 1)
+    pipe = r.pipeline(transaction=True)
+    pipe.zrem(RUNNING_KEY, user_id)
+    pipe.hset(ERRORS_KEY, user_id, (error or "")[:500])
+    if attempts >= get_compaction_max_attempts():
+        pipe.sadd(DEAD_KEY, user_id)
+        pipe.hdel(ATTEMPTS_KEY, user_id)
+        pipe.hincrby(PROGRESS_KEY, "dead_lettered", 1)
+        outcome = "dead_lettered"
+    else:
+        pipe.zadd(QUEUE_KEY, {user_id: now + retry_delay_seconds(attempts)})
+        pipe.hincrby(PROGRESS_KEY, "retried", 1)
+        outcome = "retry"
+    pipe.execute()
+    logger.info(
+        "[compaction.queue.failed] user_id=%s attempts=%s outcome=%s error=%s",
+        user_id,
+        attempts,
+        outcome,
+        error,
+    )
+    return outcome
+
+
+def reap_expired_leases(r: Any, now: Optional[float] = None) -> int:
+    """Treat running jobs whose lease lapsed as failed attempts."""
+    reaped = 0
+    for uid in r.zrange(RUNNING_KEY, 0, -1):
+        if r.exists(LEASE_KEY.format(user_id=uid)):
+            continue
+        if not r.zrem(RUNNING_KEY, uid):
+            continue  # reaped by another worker
+        _record_failure(r, uid, "lease expired", now)
+        reaped += 1
+    return reaped
+
+
+def queue_progress(r: Any, now: Optional[float] = None) -> Dict[str, int]:
+    now = time.time() if now is None else now
+    counters = r.hgetall(PROGRESS_KEY) or {}
+    progress = {
+        "queued": int(r.zcard(QUEUE_KEY)),
+        "ready": int(r.zcount(QUEUE_KEY, "-inf", now)),
+        "running": int(r.zcard(RUNNING_KEY)),
+        "dead": int(r.scard(DEAD_KEY)),
+    }
+    for name in ("enqueued", "completed", "retried", "dead_lettered"):
+        progress[name] = int(counters.get(name, 0))
+    return progress
+
+
+def _run_leased(r: Any, lease: CompactionLease) -> bool:
+    """Run one user's compaction while heartbeating its lease."""
+    from src.services.forget import run_compaction_for_user
+
+    done = threading.Event()
+    interval = max(1.0, get_compaction_lease_seconds() / 3)
+
+    def beat() -> None:
+        while not done.wait(interval):
+            if not heartbeat(r, lease):
+                return
+
+    beater = threading.Thread(
+        target=beat, name=f"compaction-heartbeat-{lease.user_id}", daemon=True
+    )
+    beater.start()
+    try:
+        stats = run_compaction_for_user(lease.user_id)
+    except Exception as exc:
+        stats = {"error": str(exc)}
+    finally:
+        done.set()
+        beater.join()
+
+    if stats.get("error"):
+        fail_job(r, lease, str(stats["error"]))
+        return False
+    complete_job(r, lease)
+    logger.info(
+        "[maint.compaction.done] user_id=%s attempt=%s stats=%s",
+        lease.user_id,
+        lease.attempt,
+        stats,
+    )
+    return True
+
+
+def run_worker(
+    worker_id: str, r: Any = None, stop: Optional[threading.Event] = None
+) -> int:
+    """Claim and run jobs until nothing is ready; returns jobs processed."""
+    r = r if r is not None else get_redis_client()
+    if r is None:
+        return 0
+    processed = 0
+    while stop is None or not stop.is_set():
+        lease = claim_job(r, worker_id)
+        if lease is None:
+            break
+        _run_leased(r, lease)
+        processed += 1
+    return processed
+
+
+def drain_queue(workers: Optional[int] = None, r: Any = None) -> int:
+    """Run a pool of workers in this process until nothing is ready."""
+    r = r if r is not None else get_redis_client()
+    if r is None:
+        logger.info("[compaction.queue] skipped: redis unavailable")
+        return 0
+    count = max(1, workers or get_compaction_workers())
+    prefix = f"{socket.gethostname()}-{os.getpid()}"
+    with ThreadPoolExecutor(
+        max_workers=count, thread_name_prefix="compaction-worker"
+    ) as pool:
+        futures = [pool.submit(run_worker, f"{prefix}-{i}", r) for i in range(count)]
+        processed = sum(f.result() for f in futures)
+    logger.info("[compaction.queue.drained] workers=%s processed=%s", count, processed)
+    return processed
@@ -0,0 +1,87 @@
+"""
+Per-user compaction watermarks.
+
+A watermark records the newest memory ``stored_at`` (epoch seconds) a
+compaction run has covered and when the user last had a full run. Between
+full runs, compaction only loads memories written after the watermark and
+compares them against the existing corpus through the vector index, so its
+cost follows daily write volume instead of total history. Watermarks live in
+Redis under ``compaction_watermark:{user_id}``; without Redis every run is a
+full run.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from src.config import get_compaction_full_recluster_days
+from src.dependencies.redis_client import get_redis_client
+
+
+logger = logging.getLogger("agentic_memories.compaction_watermark")
+
+WATERMARK_KEY = "compaction_watermark:{user_id}"
+
+
+@dataclass
+class CompactionWatermark:
+    stored_at: int  # newest memory stored_at covered by the last run
+    full_at: int  # epoch seconds of the last full run
+
+
+def get_watermark(user_id: str) -> Optional[CompactionWatermark]:
+    """Return the user's watermark, or None if absent or unreadable."""
+    r = get_redis_client()
+    if r is None:
+        return None
+    try:
+        raw = r.get(WATERMARK_KEY.format(user_id=user_id))
+        if not raw:
+            return None
+        data = json.loads(raw)
+        return CompactionWatermark(
+            stored_at=int(data["stored_at"]), full_at=int(data["full_at"])
+        )
+    except Exception as exc:
+        logger.info("[compaction.watermark.read_error] user_id=%s %s", user_id, exc)
+        return None
+
+
+def set_watermark(user_id: str, watermark: CompactionWatermark) -> None:
+    r = get_redis_client()
+    if r is None:
+        return
+    try:
+        r.set(
+            WATERMARK_KEY.format(user_id=user_id),
+            json.dumps(
+                {"stored_at": watermark.stored_at, "full_at": watermark.full_at}
+            ),
+        )
+    except Exception as exc:
+        logger.info("[compaction.watermark.write_error] user_id=%s %s", user_id, exc)
+
+
+def plan_since(
+    watermark: Optional[CompactionWatermark],
+    incremental: Optional[bool] = None,
+    now: Optional[float] = None,
+) -> Optional[int]:
+    """Return the ``stored_at`` lower bound for an incremental run, or None for full.
+
+    ``incremental=False`` forces a full run; ``True`` runs incrementally whenever
+    a watermark exists; ``None`` also falls back to a full run once the
+    configured cadence (COMPACTION_FULL_RECLUSTER_DAYS) has elapsed.
+    """
+    if watermark is None or incremental is False:
+        return None
+    if incremental is None:
+        cadence_days = get_compaction_full_recluster_days()
+        now = time.time() if now is None else now
+        if cadence_days <= 0 or now - watermark.full_at >= cadence_days * 86400:
+            return None
+    return watermark.stored_at
@@ -0,0 +1,93 @@
+"""
+Cached, pre-parsed cron schedules for next-check computation.
+
+Parsing a cron expression and resolving its timezone used to happen on every
+create, fire and validation. ``get_cron_schedule`` keeps an LRU cache of
+``CronSchedule`` objects keyed by (expression, timezone); each one holds the
+expanded croniter and the ZoneInfo, and answers next-fire queries by
+re-seeding that iterator instead of building a new one.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from croniter import croniter
+
+
+DEFAULT_TIMEZONE = "America/Los_Angeles"
+CRON_SCHEDULE_CACHE_SIZE = 16384  # ~1.2 KB per parsed schedule
+
+
+class CronSchedule:
+    """A parsed cron expression bound to an IANA timezone.
+
+    Fire times are computed in the schedule's timezone (so "0 9 * * *" means
+    9am local across DST changes) and returned in UTC.
+    """
+
+    def __init__(self, expression: str, tz_name: str = DEFAULT_TIMEZONE) -> None:
+        self.expression = expression
+        self.tz_name = tz_name
+        self.tz = ZoneInfo(tz_name)
+        # Raises on an invalid expression, so bad input is never cached
+        self._iter = croniter(expression, datetime.now(self.tz))
+        # croniter is stateful; one lock per schedule keeps re-seeding safe
+        # across FastAPI's worker threads
+        self._lock = threading.Lock()
+        self._last: Optional[Tuple[datetime, datetime]] = None
+
+    def next_fires(
+        self, after: datetime, count: int = 1, until: Optional[datetime] = None
+    ) -> List[datetime]:
+        """Up to ``count`` fire times strictly after ``after``, in UTC.
+
+        Args:
+            after: Start point; naive datetimes are taken as UTC
+            count: Maximum number of fire times to return
+            until: Optional inclusive upper bound; iteration stops past it
+
+        Returns:
+            Ascending list of UTC datetimes
+        """
+        if after.tzinfo is None:
+            after = after.replace(tzinfo=timezone.utc)
+        fires: List[datetime] = []
+        with self._lock:
+            self._iter.set_current(after.astimezone(self.tz), force=True)
+            while len(fires) < count:
+                fire = self._iter.get_next(datetime)
+                if until is not None and fire > until:
+                    break
+                fires.append(fire.astimezone(timezone.utc))
+        return fires
+
+    def next_fire(self, after: datetime) -> datetime:
+        """The first fire time strictly after ``after``, in UTC.
+
+        The last answer is remembered: any ``after`` between the previous
+        query and its fire time maps to that same fire, which is the common
+        case for repeated pending polls of one overdue intent.
+        """
+        if after.tzinfo is None:
+            after = after.replace(tzinfo=timezone.utc)
+        last = self._last
+        if last is not None and last[0] <= after < last[1]:
+            return last[1]
+        fire = self.next_fires(after, 1)[0]
+        self._last = (after, fire)
+        return fire
+
+
+@lru_cache(maxsize=CRON_SCHEDULE_CACHE_SIZE)
+def get_cron_schedule(expression: str, tz_name: str = DEFAULT_TIMEZONE) -> CronSchedule:
+    """Cached ``CronSchedule`` for (expression, timezone).
+
+    Raises whatever croniter/zoneinfo raise for invalid input; failures are
+    not cached.
+    """
+    return CronSchedule(expression, tz_name)
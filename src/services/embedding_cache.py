@@ -0,0 +1,261 @@
+"""
+Content-addressed embedding cache.
+
+Vectors are keyed by (model, sha256(text)) and stored in two tiers: a bounded
+in-process LRU in front of Redis. Redis holds compact float32 byte blobs rather
+than JSON. Invalidation is per model via a namespace counter
+(``emb:ns:{model}``), mirroring the ``mem:ns:{user_id}`` scheme used by
+retrieval caching.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.config import (
+    get_embedding_cache_max_items,
+    get_embedding_cache_ttl_seconds,
+    is_embedding_cache_enabled,
+)
+from src.dependencies.redis_client import get_redis_binary_client
+
+
+logger = logging.getLogger("agentic_memories.embedding_cache")
+
+# How long a model's namespace version is trusted before re-reading Redis
+_NAMESPACE_TTL_SECONDS = 30.0
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def encode_vector(vector: Sequence[float]) -> bytes:
+    """Pack a vector as little-endian float32 bytes."""
+    packed = array("f", vector)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def decode_vector(blob: bytes) -> List[float]:
+    """Inverse of ``encode_vector``."""
+    packed = array("f")
+    packed.frombytes(blob)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tolist()
+
+
+class EmbeddingCache:
+    """Two-tier (LRU + Redis) embedding cache with hit/miss counters."""
+
+    def __init__(
+        self,
+        max_items: int,
+        ttl_seconds: int,
+        redis_factory: Any = get_redis_binary_client,
+    ) -> None:
+        self.max_items = max(0, max_items)
+        self.ttl_seconds = ttl_seconds
+        self._redis_factory = redis_factory
+        self._local: "OrderedDict[Tuple[str, int, str], bytes]" = OrderedDict()
+        self._namespaces: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "redis_errors": 0,
+        }
+
+    # -- namespace handling -------------------------------------------------
+
+    def _redis(self) -> Any:
+        try:
+            return self._redis_factory()
+        except Exception:
+            return None
+
+    def _namespace(self, model: str) -> int:
+        now = time.monotonic()
+        cached = self._namespaces.get(model)
+        if cached and now - cached[1] < _NAMESPACE_TTL_SECONDS:
+            return cached[0]
+        version = cached[0] if cached else 0
+        redis = self._redis()
+        if redis is not None:
+            try:
+                raw = redis.get(f"emb:ns:{model}")
+                version = int(raw) if raw else 0
+            except Exception:
+                self._count("redis_errors")
+        self._namespaces[model] = (version, now)
+        return version
+
+    @staticmethod
+    def _redis_key(model: str, namespace: int, digest: str) -> str:
+        return f"emb:{model}:v{namespace}:{digest}"
+
+    # -- local tier ---------------------------------------------------------
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def _local_get(self, key: Tuple[str, int, str]) -> Optional[bytes]:
+        with self._lock:
+            blob = self._local.get(key)
+            if blob is not None:
+                self._local.move_to_end(key)
+            return blob
+
+    def _local_put(self, key: Tuple[str, int, str], blob: bytes) -> None:
+        if self.max_items <= 0:
+            return
+        with self._lock:
+            self._local[key] = blob
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_items:
+                self._local.popitem(last=False)
+
+    # -- public API ---------------------------------------------------------
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Return cached vectors aligned with ``texts`` (None for misses)."""
+        namespace = self._namespace(model)
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        remote: List[Tuple[int, str]] = []
+
+        for idx, text in enumerate(texts):
+            digest = _digest(text)
+            blob = self._local_get((model, namespace, digest))
+            if blob is not None:
+                results[idx] = decode_vector(blob)
+                self._count("local_hits")
+            else:
+                remote.append((idx, digest))
+
+        if remote:
+            redis = self._redis()
+            blobs: List[Optional[bytes]] = [None] * len(remote)
+            if redis is not None:
+                try:
+                    blobs = redis.mget(
+                        [self._redis_key(model, namespace, d) for _, d in remote]
+                    )
+                except Exception as exc:
+                    self._count("redis_errors")
+                    logger.debug("[embedding_cache.redis_get_error] %s", exc)
+            for (idx, digest), blob in zip(remote, blobs):
+                if blob:
+                    results[idx] = decode_vector(blob)
+                    self._local_put((model, namespace, digest), blob)
+                    self._count("redis_hits")
+                else:
+                    self._count("misses")
+
+        return results
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        return self.get_many(model, [text])[0]
+
+    def put_many(
+        self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]
+    ) -> None:
+        """Store vectors in both tiers; empty vectors are skipped."""
+        namespace = self._namespace(model)
+        entries: Dict[str, bytes] = {}
+        for text, vector in zip(texts, vectors):
+            if not vector:
+                continue
+            digest = _digest(text)
+            blob = encode_vector(vector)
+            self._local_put((model, namespace, digest), blob)
+            entries[self._redis_key(model, namespace, digest)] = blob
+        if not entries:
+            return
+        self._count("writes", len(entries))
+
+        redis = self._redis()
+        if redis is None:
+            return
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for key, blob in entries.items():
+                pipe.setex(key, self.ttl_seconds, blob)
+            pipe.execute()
+        except Exception as exc:
+            self._count("redis_errors")
+            logger.debug("[embedding_cache.redis_put_error] %s", exc)
+
+    def put(self, model: str, text: str, vector: Sequence[float]) -> None:
+        self.put_many(model, [text], [vector])
+
+    def invalidate_model(self, model: str) -> None:
+        """Drop every cached vector for ``model`` in both tiers.
+
+        Redis entries are orphaned by bumping the model namespace and then
+        expire through their TTL.
+        """
+        redis = self._redis()
+        version = self._namespaces.get(model, (0, 0.0))[0] + 1
+        if redis is not None:
+            try:
+                version = int(redis.incr(f"emb:ns:{model}"))
+            except Exception:
+                self._count("redis_errors")
+        with self._lock:
+            for key in [k for k in self._local if k[0] == model]:
+                del self._local[key]
+            self._namespaces[model] = (version, time.monotonic())
+        logger.info(
+            "[embedding_cache.invalidate] model=%s namespace=%s", model, version
+        )
+
+    def clear(self) -> None:
+        """Reset the in-process tier and counters (Redis is left untouched)."""
+        with self._lock:
+            self._local.clear()
+            self._namespaces.clear()
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["local_size"] = len(self._local)
+        lookups = stats["local_hits"] + stats["redis_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            round((stats["local_hits"] + stats["redis_hits"]) / lookups, 4)
+            if lookups
+            else None
+        )
+        return stats
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Return the process-wide cache, or None when EMBEDDING_CACHE_ENABLED is off."""
+    global _cache
+    if not is_embedding_cache_enabled():
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache(
+                    max_items=get_embedding_cache_max_items(),
+                    ttl_seconds=get_embedding_cache_ttl_seconds(),
+                )
+    return _cache
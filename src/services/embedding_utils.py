@@ -4,19 +4,40 @@ Embedding utilities for memory extraction and retrieval.
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional
 
 from src.config import get_embedding_model_name
+from src.dependencies.llm_client import get_async_llm_client, get_llm_client
+from src.services.embedding_cache import get_embedding_cache
 
 
 EMBEDDING_MODEL = get_embedding_model_name()
 
+# OpenAI embeddings accept up to 2048 inputs and ~300k tokens per request;
+# stay comfortably below both.
+EMBEDDING_BATCH_MAX_ITEMS = 256
+EMBEDDING_BATCH_MAX_TOKENS = 200_000
+EMBEDDING_BATCH_RETRIES = 2
+EMBEDDING_RETRY_BACKOFF_SECONDS = 0.5
+
+# Length of the most recent embedding returned by the provider. Lets callers
+# confirm the collection dimension without paying for a dedicated probe call.
+_observed_dimension: Optional[int] = None
+
+
+def get_observed_dimension() -> Optional[int]:
+    """Return the dimension of the last embedding generated in this process."""
+    return _observed_dimension
+
 
 def generate_embedding(text: str) -> Optional[List[float]]:
     """
-    Generate embedding for text using OpenAI.
-    Uses Langfuse OpenAI wrapper for auto-instrumentation.
+    Generate embedding for text using OpenAI, served from the embedding cache
+    when possible. Uses the shared provider client (Langfuse-wrapped when
+    tracing is enabled).
 
     Args:
             text: Input text to generate embedding for
@@ -27,52 +48,275 @@ def generate_embedding(text: str) -> Optional[List[float]]:
     Raises:
             RuntimeError: If OPENAI_API_KEY is not configured or API call fails
     """
-    from src.config import is_langfuse_enabled
+    global _observed_dimension
+    api_key = _require_api_key()
 
-    api_key = os.getenv("OPENAI_API_KEY")
-
-    if not api_key or api_key.strip() == "":
-        raise RuntimeError(
-            "OPENAI_API_KEY is not configured. Set OPENAI_API_KEY environment variable."
-        )
+    cache = get_embedding_cache()
+    if cache is not None:
+        cached = cache.get(EMBEDDING_MODEL, text)
+        if cached:
+            _observed_dimension = len(cached)
+            return cached
 
     try:
-        # Use Langfuse OpenAI wrapper for auto-instrumentation if enabled
-        if is_langfuse_enabled():
-            try:
-                from langfuse.openai import OpenAI  # type: ignore
-            except ImportError:
-                from openai import OpenAI  # type: ignore
-        else:
-            from openai import OpenAI  # type: ignore
-
-        client = OpenAI(api_key=api_key)
+        # Shared client (Langfuse-instrumented when enabled) keeps its pool alive
+        client = get_llm_client("openai", api_key=api_key)
         resp = client.embeddings.create(model=EMBEDDING_MODEL, input=text)
         embedding = list(resp.data[0].embedding)
+        _observed_dimension = len(embedding) or _observed_dimension
+        if cache is not None:
+            cache.put(EMBEDDING_MODEL, text, embedding)
         return embedding
     except Exception as e:
-        from src.services.tracing import trace_error
-
-        trace_error(
-            e,
-            metadata={
-                "model": EMBEDDING_MODEL,
-                "context": "embedding_generation",
-            },
-        )
+        raise _embedding_failure(e, {"context": "embedding_generation"}) from e
+
+
+async def agenerate_embedding(text: str) -> Optional[List[float]]:
+    """Async twin of ``generate_embedding`` using the shared AsyncOpenAI client."""
+    global _observed_dimension
+    api_key = _require_api_key()
+
+    cache = get_embedding_cache()
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get, EMBEDDING_MODEL, text)
+        if cached:
+            _observed_dimension = len(cached)
+            return cached
+
+    try:
+        client = get_async_llm_client("openai", api_key=api_key)
+        resp = await client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        embedding = list(resp.data[0].embedding)
+        _observed_dimension = len(embedding) or _observed_dimension
+        if cache is not None:
+            await asyncio.to_thread(cache.put, EMBEDDING_MODEL, text, embedding)
+        return embedding
+    except Exception as e:
+        raise _embedding_failure(e, {"context": "embedding_generation"}) from e
+
+
+def _require_api_key() -> str:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key or api_key.strip() == "":
         raise RuntimeError(
-            f"OpenAI embedding generation failed: {e}. "
-            "Check your API key and billing at https://platform.openai.com/account/billing"
-        ) from e
+            "OPENAI_API_KEY is not configured. Set OPENAI_API_KEY environment variable."
+        )
+    return api_key
+
+
+def _embedding_failure(exc: Exception, metadata: Dict[str, object]) -> RuntimeError:
+    """Report ``exc`` to tracing and build the error raised to callers."""
+    from src.services.tracing import trace_error
+
+    trace_error(exc, metadata={"model": EMBEDDING_MODEL, **metadata})
+    return RuntimeError(
+        f"OpenAI embedding generation failed: {exc}. "
+        "Check your API key and billing at https://platform.openai.com/account/billing"
+    )
+
+
+def _estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English text; avoids a tokenizer dependency
+    return len(text) // 4 + 1
+
+
+def _plan_embedding_batches(texts: List[str]) -> List[List[int]]:
+    """Group input indices into sub-batches under the provider's item/token caps."""
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for idx, text in enumerate(texts):
+        tokens = _estimate_tokens(text)
+        if current and (
+            len(current) >= EMBEDDING_BATCH_MAX_ITEMS
+            or current_tokens + tokens > EMBEDDING_BATCH_MAX_TOKENS
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(idx)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
 
 
 def get_embeddings(texts: List[str]) -> List[List[float]]:
     """
-    Batch helper to generate embeddings for a list of texts.
+    Generate embeddings for a list of texts with batched provider calls.
+
+    Cached vectors (see embedding_cache) are served without a provider call;
+    the remaining distinct texts are sent in sub-batches that stay under the
+    provider's item and token limits. Output order matches input order. A
+    sub-batch failing with a retryable error (rate limit, 5xx, connection) is
+    retried on its own with exponential backoff, up to EMBEDDING_BATCH_RETRIES
+    times, without resending the others.
     Always returns a list of vectors (never None entries).
+
+    Raises:
+            RuntimeError: If OPENAI_API_KEY is not configured or a sub-batch keeps failing
     """
-    results: List[List[float]] = []
-    for t in texts or []:
-        vec = generate_embedding(t or "") or []
-        results.append(vec)
+    inputs = [t or "" for t in texts or []]
+    if not inputs:
+        return []
+
+    api_key = _require_api_key()
+    cache = get_embedding_cache()
+    results: List[List[float]] = [[] for _ in inputs]
+    if cache is not None:
+        _apply_cached(results, cache.get_many(EMBEDDING_MODEL, inputs))
+
+    positions = _pending_positions(inputs, results)
+    pending = list(positions)
+    if not pending:
+        return results
+
+    client = get_llm_client("openai", api_key=api_key)
+    for batch in _plan_embedding_batches(pending):
+        batch_texts = [pending[i] for i in batch]
+        last_exc: Optional[Exception] = None
+        for attempt in range(EMBEDDING_BATCH_RETRIES + 1):
+            try:
+                resp = client.embeddings.create(
+                    model=EMBEDDING_MODEL, input=batch_texts
+                )
+                last_exc = None
+                break
+            except Exception as exc:
+                last_exc = exc
+                if not _should_retry(exc, attempt):
+                    break
+                time.sleep(_retry_delay(attempt))
+        if last_exc is not None:
+            raise _batch_failure(last_exc, len(batch)) from last_exc
+
+        vectors = _ordered_vectors(resp, len(batch))
+        # Cache each successful sub-batch right away so a later failure does
+        # not throw away work that was already paid for.
+        if cache is not None:
+            cache.put_many(EMBEDDING_MODEL, batch_texts, vectors)
+        _assign_vectors(results, positions, batch_texts, vectors)
+
     return results
+
+
+async def aget_embeddings(texts: List[str]) -> List[List[float]]:
+    """
+    Async twin of ``get_embeddings``: same batching, caching and retry rules,
+    but sub-batches are sent through the shared AsyncOpenAI client so the event
+    loop stays free while the provider responds.
+
+    Raises:
+            RuntimeError: If OPENAI_API_KEY is not configured or a sub-batch keeps failing
+    """
+    inputs = [t or "" for t in texts or []]
+    if not inputs:
+        return []
+
+    api_key = _require_api_key()
+    cache = get_embedding_cache()
+    results: List[List[float]] = [[] for _ in inputs]
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get_many, EMBEDDING_MODEL, inputs)
+        _apply_cached(results, cached)
+
+    positions = _pending_positions(inputs, results)
+    pending = list(positions)
+    if not pending:
+        return results
+
+    client = get_async_llm_client("openai", api_key=api_key)
+    for batch in _plan_embedding_batches(pending):
+        batch_texts = [pending[i] for i in batch]
+        last_exc: Optional[Exception] = None
+        for attempt in range(EMBEDDING_BATCH_RETRIES + 1):
+            try:
+                resp = await client.embeddings.create(
+                    model=EMBEDDING_MODEL, input=batch_texts
+                )
+                last_exc = None
+                break
+            except Exception as exc:
+                last_exc = exc
+                if not _should_retry(exc, attempt):
+                    break
+                await asyncio.sleep(_retry_delay(attempt))
+        if last_exc is not None:
+            raise _batch_failure(last_exc, len(batch)) from last_exc
+
+        vectors = _ordered_vectors(resp, len(batch))
+        if cache is not None:
+            await asyncio.to_thread(
+                cache.put_many, EMBEDDING_MODEL, batch_texts, vectors
+            )
+        _assign_vectors(results, positions, batch_texts, vectors)
+
+    return results
+
+
+def _apply_cached(
+    results: List[List[float]], cached: List[Optional[List[float]]]
+) -> None:
+    global _observed_dimension
+    for idx, vec in enumerate(cached):
+        if vec:
+            results[idx] = vec
+            _observed_dimension = len(vec)
+
+
+def _pending_positions(
+    inputs: List[str], results: List[List[float]]
+) -> Dict[str, List[int]]:
+    """Map each distinct uncached text to the input positions it fills."""
+    positions: Dict[str, List[int]] = {}
+    for idx, text in enumerate(inputs):
+        if not results[idx]:
+            positions.setdefault(text, []).append(idx)
+    return positions
+
+
+def _ordered_vectors(resp: object, size: int) -> List[List[float]]:
+    # Provider returns one item per input, tagged with its position
+    vectors: List[List[float]] = [[] for _ in range(size)]
+    for item in resp.data:  # type: ignore[attr-defined]
+        vectors[item.index] = list(item.embedding)
+    return vectors
+
+
+def _assign_vectors(
+    results: List[List[float]],
+    positions: Dict[str, List[int]],
+    batch_texts: List[str],
+    vectors: List[List[float]],
+) -> None:
+    global _observed_dimension
+    for text, vec in zip(batch_texts, vectors):
+        for idx in positions[text]:
+            results[idx] = vec
+    if vectors and vectors[0]:
+        _observed_dimension = len(vectors[0])
+
+
+def _should_retry(exc: Exception, attempt: int) -> bool:
+    """Retry rate limits, server errors and dropped connections, not bad requests."""
+    if attempt >= EMBEDDING_BATCH_RETRIES:
+        return False
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return status in (408, 409, 429) or status >= 500
+    try:
+        import openai
+    except ImportError:  # pragma: no cover - openai is a hard dependency
+        return False
+    return isinstance(exc, openai.APIConnectionError)
+
+
+def _retry_delay(attempt: int) -> float:
+    # The client has already retried underneath; back off before going again
+    return EMBEDDING_RETRY_BACKOFF_SECONDS * (2**attempt)
+
+
+def _batch_failure(exc: Exception, batch_size: int) -> RuntimeError:
+    return _embedding_failure(
+        exc,
+        {"context": "embedding_batch_generation", "batch_size": batch_size},
+    )
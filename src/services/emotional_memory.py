@@ -68,6 +68,100 @@ class EmotionalPattern:
     metadata: Optional[Dict[str, Any]] = None
 
 
+# Patterns are running aggregates keyed by (user_id, pattern_type, emotion) and
+# only surface once this many states have been folded in.
+PATTERN_TYPE = "triggered"
+PATTERN_MIN_STATES = 3
+# Distinct trigger events remembered per pattern (most recently seen last).
+PATTERN_MAX_TRIGGERS = 20
+
+# Merges a batch aggregate (EXCLUDED) into the stored one with Chan's parallel
+# form of Welford's update; a single state is the batch n=1, m2=0. Confidence
+# is 1 - mean(valence variance, arousal variance), as before.
+_PATTERN_UPSERT_SQL = """
+    INSERT INTO emotional_patterns AS p (
+        id, user_id, pattern_type, start_time, end_time, dominant_emotion,
+        average_valence, average_arousal, valence_m2, arousal_m2,
+        frequency, confidence, triggers, metadata
+    ) VALUES (
+        %(id)s, %(user_id)s, %(pattern_type)s, %(start_time)s, %(end_time)s,
+        %(emotion)s, %(mean_valence)s, %(mean_arousal)s, %(m2_valence)s,
+        %(m2_arousal)s, %(count)s,
+        GREATEST(0.0, LEAST(1.0,
+            1.0 - (%(m2_valence)s + %(m2_arousal)s) / (2.0 * %(count)s))),
+        %(triggers)s, %(metadata)s
+    )
+    ON CONFLICT (user_id, pattern_type, dominant_emotion) DO UPDATE SET
+        start_time = LEAST(p.start_time, EXCLUDED.start_time),
+        end_time = GREATEST(p.end_time, EXCLUDED.end_time),
+        frequency = p.frequency + EXCLUDED.frequency,
+        average_valence = p.average_valence
+            + (EXCLUDED.average_valence - p.average_valence)
+              * EXCLUDED.frequency / (p.frequency + EXCLUDED.frequency),
+        average_arousal = p.average_arousal
+            + (EXCLUDED.average_arousal - p.average_arousal)
+              * EXCLUDED.frequency / (p.frequency + EXCLUDED.frequency),
+        valence_m2 = p.valence_m2 + EXCLUDED.valence_m2
+            + (EXCLUDED.average_valence - p.average_valence) ^ 2
+              * p.frequency * EXCLUDED.frequency / (p.frequency + EXCLUDED.frequency),
+        arousal_m2 = p.arousal_m2 + EXCLUDED.arousal_m2
+            + (EXCLUDED.average_arousal - p.average_arousal) ^ 2
+              * p.frequency * EXCLUDED.frequency / (p.frequency + EXCLUDED.frequency),
+        confidence = GREATEST(0.0, LEAST(1.0, 1.0 - (
+            p.valence_m2 + EXCLUDED.valence_m2
+            + (EXCLUDED.average_valence - p.average_valence) ^ 2
+              * p.frequency * EXCLUDED.frequency / (p.frequency + EXCLUDED.frequency)
+            + p.arousal_m2 + EXCLUDED.arousal_m2
+            + (EXCLUDED.average_arousal - p.average_arousal) ^ 2
+              * p.frequency * EXCLUDED.frequency / (p.frequency + EXCLUDED.frequency)
+        ) / (2.0 * (p.frequency + EXCLUDED.frequency)))),
+        triggers = (
+            SELECT (array_agg(t ORDER BY pos))[
+                GREATEST(1, count(*)::int - %(max_triggers)s + 1):count(*)::int
+            ]
+            FROM (
+                SELECT t, max(pos) AS pos
+                FROM unnest(
+                    COALESCE(p.triggers, '{}') || COALESCE(EXCLUDED.triggers, '{}')
+                ) WITH ORDINALITY AS u(t, pos)
+                GROUP BY t
+            ) AS distinct_triggers
+        ),
+        metadata = EXCLUDED.metadata
+"""
+
+
+def _aggregate_states(memories: List[EmotionalMemory]) -> Dict[str, Dict[str, Any]]:
+    """Per-emotion count, means and M2 (Welford) plus time span and triggers."""
+    aggregates: Dict[str, Dict[str, Any]] = {}
+    for memory in memories:
+        agg = aggregates.get(memory.emotional_state)
+        if agg is None:
+            agg = aggregates[memory.emotional_state] = {
+                "count": 0,
+                "mean_valence": 0.0,
+                "mean_arousal": 0.0,
+                "m2_valence": 0.0,
+                "m2_arousal": 0.0,
+                "start_time": memory.timestamp,
+                "end_time": memory.timestamp,
+                "triggers": [],
+            }
+        agg["count"] += 1
+        for axis, value in (("valence", memory.valence), ("arousal", memory.arousal)):
+            delta = float(value) - agg[f"mean_{axis}"]
+            agg[f"mean_{axis}"] += delta / agg["count"]
+            agg[f"m2_{axis}"] += delta * (float(value) - agg[f"mean_{axis}"])
+        agg["start_time"] = min(agg["start_time"], memory.timestamp)
+        agg["end_time"] = max(agg["end_time"], memory.timestamp)
+        if memory.trigger_event and memory.trigger_event not in agg["triggers"]:
+            agg["triggers"].append(memory.trigger_event)
+    for agg in aggregates.values():
+        agg["triggers"] = agg["triggers"] or None
+        agg["max_triggers"] = PATTERN_MAX_TRIGGERS
+    return aggregates
+
+
 class EmotionalMemoryService:
     """Service for managing emotional memories and patterns"""
 
@@ -85,6 +179,7 @@ class EmotionalMemoryService:
         trigger_event: Optional[str] = None,
         intensity: Optional[float] = None,
         dominance: Optional[float] = None,
+        embedding: Optional[List[float]] = None,
     ) -> str:
         """
         Record a new emotional state
@@ -98,20 +193,79 @@ class EmotionalMemoryService:
             trigger_event: Optional triggering event
             intensity: Optional intensity score (0.0 to 1.0)
             dominance: Optional dominance score (0.0 to 1.0)
+            embedding: Optional precomputed vector for the state; when omitted
+                the searchable text is embedded here
 
         Returns:
             str: Memory ID
         """
-        memory_id = str(uuid.uuid4())
+        memory = self._new_memory(
+            user_id,
+            emotional_state,
+            valence,
+            arousal,
+            context=context,
+            trigger_event=trigger_event,
+            intensity=intensity,
+            dominance=dominance,
+        )
+
+        # Store in TimescaleDB and update emotional patterns
+        self._store_emotional_memory(memory)
+
+        # Store in ChromaDB for semantic search
+        self._store_in_chroma(memory, embedding)
+
+        return memory.id
+
+    def record_emotional_states_bulk(
+        self, user_id: str, states: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Record a batch of emotional states with a constant number of round trips
+
+        Each entry takes the keyword arguments of ``record_emotional_state``
+        (emotional_state, valence, arousal and optional context, trigger_event,
+        intensity, dominance, embedding). The rows are inserted and folded into
+        the running patterns (one upsert per emotion) in a single transaction,
+        and ChromaDB receives a single upsert.
+
+        Returns:
+            List[str]: Memory IDs, aligned with ``states``
+        """
+        if not states:
+            return []
+        memories = []
+        embeddings = []
+        for fields in states:
+            fields = dict(fields)
+            embeddings.append(fields.pop("embedding", None))
+            memories.append(self._new_memory(user_id, **fields))
+
+        self._store_emotional_memories(memories)
+        self._store_many_in_chroma(memories, embeddings)
+
+        return [memory.id for memory in memories]
+
+    def _new_memory(
+        self,
+        user_id: str,
+        emotional_state: str,
+        valence: float,
+        arousal: float,
+        context: Optional[str] = None,
+        trigger_event: Optional[str] = None,
+        intensity: Optional[float] = None,
+        dominance: Optional[float] = None,
+    ) -> EmotionalMemory:
         timestamp = datetime.now(timezone.utc)
 
         # Calculate intensity if not provided
         if intensity is None:
             intensity = self._calculate_intensity(valence, arousal)
 
-        # Create emotional memory
-        memory = EmotionalMemory(
-            id=memory_id,
+        return EmotionalMemory(
+            id=str(uuid.uuid4()),
             user_id=user_id,
             timestamp=timestamp,
             emotional_state=emotional_state,
@@ -124,19 +278,16 @@ class EmotionalMemoryService:
             metadata={"recorded_at": timestamp.isoformat()},
         )
 
-        # Store in TimescaleDB
-        self._store_emotional_memory(memory)
-
-        # Update emotional patterns
-        self._update_emotional_patterns(user_id, memory)
-
-        # Store in ChromaDB for semantic search
-        self._store_in_chroma(memory)
+    def _store_emotional_memory(self, memory: EmotionalMemory) -> None:
+        """Store emotional memory in TimescaleDB and update its pattern"""
+        self._store_emotional_memories([memory])
 
-        return memory_id
+    def _store_emotional_memories(self, memories: List[EmotionalMemory]) -> None:
+        """Insert emotional memories and fold them into the patterns in one transaction
 
-    def _store_emotional_memory(self, memory: EmotionalMemory) -> None:
-        """Store emotional memory in TimescaleDB"""
+        All memories belong to the same user. A failure rolls back both the rows
+        and the pattern update, so the aggregates never count unstored states.
+        """
         conn = get_timescale_conn()
         if not conn:
             raise Exception("TimescaleDB connection not available")
@@ -145,7 +296,7 @@ class EmotionalMemoryService:
             import json
 
             with conn.cursor() as cur:
-                cur.execute(
+                cur.executemany(
                     """
                     INSERT INTO emotional_memories (
                         id, user_id, timestamp, emotional_state, valence, arousal,
@@ -154,21 +305,25 @@ class EmotionalMemoryService:
                         %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
                     )
                 """,
-                    (
-                        memory.id,
-                        memory.user_id,
-                        memory.timestamp,
-                        memory.emotional_state,
-                        memory.valence,
-                        memory.arousal,
-                        memory.dominance,
-                        memory.context,
-                        memory.trigger_event,
-                        memory.intensity,
-                        memory.duration_minutes,
-                        json.dumps(memory.metadata) if memory.metadata else None,
-                    ),
+                    [
+                        (
+                            memory.id,
+                            memory.user_id,
+                            memory.timestamp,
+                            memory.emotional_state,
+                            memory.valence,
+                            memory.arousal,
+                            memory.dominance,
+                            memory.context,
+                            memory.trigger_event,
+                            memory.intensity,
+                            memory.duration_minutes,
+                            json.dumps(memory.metadata) if memory.metadata else None,
+                        )
+                        for memory in memories
+                    ],
                 )
+                self._update_emotional_patterns(cur, memories[0].user_id, memories)
             # Commit the transaction
             conn.commit()
         except Exception as e:
@@ -181,33 +336,55 @@ class EmotionalMemoryService:
             if conn:
                 release_timescale_conn(conn)
 
-    def _store_in_chroma(self, memory: EmotionalMemory) -> None:
+    def _store_in_chroma(
+        self, memory: EmotionalMemory, embedding: Optional[List[float]] = None
+    ) -> None:
         """Store emotional memory in ChromaDB for semantic search"""
+        self._store_many_in_chroma([memory], [embedding])
+
+    def _store_many_in_chroma(
+        self,
+        memories: List[EmotionalMemory],
+        embeddings: Optional[List[Optional[List[float]]]] = None,
+    ) -> None:
+        """Upsert emotional memories into ChromaDB in one call"""
         if not self.chroma_client:
             return
 
         try:
             # Create searchable text
-            search_text = f"{memory.emotional_state} {memory.context or ''} {memory.trigger_event or ''}"
-
-            # Get embeddings
-            from src.services.embedding_utils import get_embeddings
-
-            embeddings = get_embeddings([search_text])
-            if not embeddings:
-                return
+            search_texts = [
+                f"{m.emotional_state} {m.context or ''} {m.trigger_event or ''}"
+                for m in memories
+            ]
+
+            # Get embeddings (reuse the caller's vectors when available)
+            vectors = list(embeddings or [])
+            vectors += [None] * (len(memories) - len(vectors))
+            missing = [i for i, vec in enumerate(vectors) if not vec]
+            if missing:
+                from src.services.embedding_utils import get_embeddings
+
+                embedded = get_embeddings([search_texts[i] for i in missing])
+                if not embedded:
+                    return
+                for i, vec in zip(missing, embedded):
+                    vectors[i] = vec
 
             # Prepare metadata
-            metadata = {
-                "user_id": memory.user_id,
-                "emotional_state": memory.emotional_state,
-                "valence": memory.valence,
-                "arousal": memory.arousal,
-                "intensity": memory.intensity or 0.0,
-                "timestamp": memory.timestamp.isoformat(),
-                "context": memory.context or "",
-                "trigger_event": memory.trigger_event or "",
-            }
+            metadatas = [
+                {
+                    "user_id": m.user_id,
+                    "emotional_state": m.emotional_state,
+                    "valence": m.valence,
+                    "arousal": m.arousal,
+                    "intensity": m.intensity or 0.0,
+                    "timestamp": m.timestamp.isoformat(),
+                    "context": m.context or "",
+                    "trigger_event": m.trigger_event or "",
+                }
+                for m in memories
+            ]
 
             # Store in ChromaDB
             collection = self.chroma_client.get_or_create_collection(
@@ -215,10 +392,10 @@ class EmotionalMemoryService:
             )
 
             collection.upsert(
-                embeddings=embeddings,
-                documents=[search_text],
-                metadatas=[metadata],
-                ids=[memory.id],
+                embeddings=vectors,
+                documents=search_texts,
+                metadatas=metadatas,
+                ids=[m.id for m in memories],
             )
 
         except Exception as e:
@@ -234,21 +411,30 @@ class EmotionalMemoryService:
         intensity = (valence_distance + arousal_distance) / 1.5
         return min(intensity, 1.0)
 
-    def _update_emotional_patterns(self, user_id: str, memory: EmotionalMemory) -> None:
-        """Update emotional patterns based on new memory"""
-        try:
-            # Get recent emotional states (last 24 hours)
-            recent_states = self._get_recent_emotional_states(user_id, hours=24)
-
-            # Analyze for patterns
-            patterns = self._analyze_emotional_patterns(recent_states)
+    def _update_emotional_patterns(
+        self, cur: Any, user_id: str, memories: List[EmotionalMemory]
+    ) -> None:
+        """Fold new states into the running pattern aggregates (one upsert per emotion)
 
-            # Store/update patterns
-            for pattern in patterns:
-                self._store_emotional_pattern(pattern)
-
-        except Exception as e:
-            print(f"Error updating emotional patterns: {e}")
+        Runs on the caller's cursor so it shares the insert's transaction.
+        """
+        import json
+
+        rows = []
+        for emotion, agg in _aggregate_states(memories).items():
+            rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "user_id": user_id,
+                    "pattern_type": PATTERN_TYPE,
+                    "emotion": emotion,
+                    "metadata": json.dumps(
+                        {"updated_at": datetime.now(timezone.utc).isoformat()}
+                    ),
+                    **agg,
+                }
+            )
+        cur.executemany(_PATTERN_UPSERT_SQL, rows)
 
     def _get_recent_emotional_states(
         self, user_id: str, hours: int
@@ -303,149 +489,6 @@ class EmotionalMemoryService:
             if conn:
                 release_timescale_conn(conn)
 
-    def _analyze_emotional_patterns(
-        self, states: List[EmotionalMemory]
-    ) -> List[EmotionalPattern]:
-        """Analyze emotional states for patterns"""
-        if len(states) < 3:  # Need at least 3 states for pattern analysis
-            return []
-
-        patterns = []
-
-        # Group by emotional state
-        state_groups = {}
-        for state in states:
-            if state.emotional_state not in state_groups:
-                state_groups[state.emotional_state] = []
-            state_groups[state.emotional_state].append(state)
-
-        # Find dominant patterns
-        for emotional_state, state_list in state_groups.items():
-            if len(state_list) >= 3:  # Pattern threshold
-                # Calculate averages
-                avg_valence = sum(s.valence for s in state_list) / len(state_list)
-                avg_arousal = sum(s.arousal for s in state_list) / len(state_list)
-
-                # Calculate confidence based on consistency
-                valence_variance = sum(
-                    (s.valence - avg_valence) ** 2 for s in state_list
-                ) / len(state_list)
-                arousal_variance = sum(
-                    (s.arousal - avg_arousal) ** 2 for s in state_list
-                ) / len(state_list)
-                confidence = 1.0 - (valence_variance + arousal_variance) / 2.0
-
-                # Extract triggers
-                triggers = []
-                for state in state_list:
-                    if state.trigger_event and state.trigger_event not in triggers:
-                        triggers.append(state.trigger_event)
-
-                pattern = EmotionalPattern(
-                    id=str(uuid.uuid4()),
-                    user_id=state_list[0].user_id,
-                    pattern_type="triggered",
-                    start_time=min(s.timestamp for s in state_list),
-                    end_time=max(s.timestamp for s in state_list),
-                    dominant_emotion=emotional_state,
-                    average_valence=avg_valence,
-                    average_arousal=avg_arousal,
-                    frequency=len(state_list),
-                    confidence=max(confidence, 0.0),
-                    triggers=triggers if triggers else None,
-                    metadata={"analyzed_at": datetime.now(timezone.utc).isoformat()},
-                )
-
-                patterns.append(pattern)
-
-        return patterns
-
-    def _store_emotional_pattern(self, pattern: EmotionalPattern) -> None:
-        """Store emotional pattern in TimescaleDB"""
-        conn = get_timescale_conn()
-        if not conn:
-            return
-
-        try:
-            import json
-
-            with conn.cursor() as cur:
-                # Check if pattern already exists
-                cur.execute(
-                    """
-                    SELECT id FROM emotional_patterns 
-                    WHERE user_id = %s AND pattern_type = %s AND dominant_emotion = %s
-                """,
-                    (pattern.user_id, pattern.pattern_type, pattern.dominant_emotion),
-                )
-
-                existing = cur.fetchone()
-
-                if existing:
-                    # Update existing pattern
-                    cur.execute(
-                        """
-                        UPDATE emotional_patterns SET
-                            end_time = %s,
-                            average_valence = %s,
-                            average_arousal = %s,
-                            frequency = %s,
-                            confidence = %s,
-                            triggers = %s,
-                            metadata = %s
-                        WHERE id = %s
-                    """,
-                        (
-                            pattern.end_time,
-                            pattern.average_valence,
-                            pattern.average_arousal,
-                            pattern.frequency,
-                            pattern.confidence,
-                            pattern.triggers,
-                            json.dumps(pattern.metadata) if pattern.metadata else None,
-                            existing["id"],
-                        ),
-                    )
-                else:
-                    # Insert new pattern
-                    cur.execute(
-                        """
-                        INSERT INTO emotional_patterns (
-                            id, user_id, pattern_type, start_time, end_time,
-                            dominant_emotion, average_valence, average_arousal,
-                            frequency, confidence, triggers, metadata
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                    """,
-                        (
-                            pattern.id,
-                            pattern.user_id,
-                            pattern.pattern_type,
-                            pattern.start_time,
-                            pattern.end_time,
-                            pattern.dominant_emotion,
-                            pattern.average_valence,
-                            pattern.average_arousal,
-                            pattern.frequency,
-                            pattern.confidence,
-                            pattern.triggers,
-                            json.dumps(pattern.metadata) if pattern.metadata else None,
-                        ),
-                    )
-
-            # Commit the transaction
-            conn.commit()
-
-        except Exception as e:
-            # Rollback on error
-            if conn:
-                conn.rollback()
-            print(f"Error storing emotional pattern: {e}")
-        finally:
-            if conn:
-                release_timescale_conn(conn)
-
     def get_emotional_state_history(
         self, user_id: str, hours: int = 24
     ) -> List[EmotionalMemory]:
@@ -466,10 +509,10 @@ class EmotionalMemoryService:
                            dominant_emotion, average_valence, average_arousal,
                            frequency, confidence, triggers, metadata
                     FROM emotional_patterns
-                    WHERE user_id = %s
+                    WHERE user_id = %s AND frequency >= %s
                     ORDER BY confidence DESC, frequency DESC
                 """,
-                    (user_id,),
+                    (user_id, PATTERN_MIN_STATES),
                 )
 
                 rows = cur.fetchall()
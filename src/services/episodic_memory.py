@@ -16,6 +16,17 @@ from src.dependencies.chroma import get_chroma_client
 from src.services.embedding_utils import get_embeddings
 
 
+_INSERT_SQL = """
+    INSERT INTO episodic_memories (
+        id, user_id, event_timestamp, event_type, content,
+        location, participants, emotional_valence, emotional_arousal,
+        importance_score, tags, metadata
+    ) VALUES (
+        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+    )
+"""
+
+
 @dataclass
 class EpisodicMemory:
     """Episodic memory data structure"""
@@ -41,12 +52,16 @@ class EpisodicMemoryService:
         self.chroma_client = get_chroma_client()
         self.collection_name = "episodic_memories"
 
-    def store_memory(self, memory: EpisodicMemory) -> bool:
+    def store_memory(
+        self, memory: EpisodicMemory, embedding: Optional[List[float]] = None
+    ) -> bool:
         """
         Store an episodic memory across all storage systems
 
         Args:
             memory: EpisodicMemory object to store
+            embedding: Optional precomputed vector for memory.content; when
+                omitted the content is embedded here
 
         Returns:
             bool: True if successful, False otherwise
@@ -56,7 +71,7 @@ class EpisodicMemoryService:
             self._store_in_timescale(memory)
 
             # 2. Store in ChromaDB (vector search)
-            self._store_in_chroma(memory)
+            self._store_in_chroma(memory, embedding)
 
             return True
 
@@ -64,43 +79,70 @@ class EpisodicMemoryService:
             print(f"Error storing episodic memory: {e}")
             return False
 
+    def store_memories_bulk(
+        self,
+        memories: List[EpisodicMemory],
+        embeddings: Optional[List[Optional[List[float]]]] = None,
+    ) -> int:
+        """
+        Store a batch of episodic memories with a constant number of round trips
+
+        All rows go to TimescaleDB in one transaction on one pooled connection,
+        and to ChromaDB in a single upsert.
+
+        Args:
+            memories: EpisodicMemory objects to store
+            embeddings: Optional precomputed vectors aligned with ``memories``;
+                missing entries are embedded together in one call
+
+        Returns:
+            int: Number of memories stored (0 if the batch failed)
+        """
+        if not memories:
+            return 0
+        try:
+            self._store_many_in_timescale(memories)
+            self._store_many_in_chroma(memories, embeddings)
+            return len(memories)
+
+        except Exception as e:
+            print(f"Error storing episodic memories in bulk: {e}")
+            return 0
+
+    @staticmethod
+    def _timescale_row(memory: EpisodicMemory) -> tuple:
+        import json
+
+        return (
+            memory.id,
+            memory.user_id,
+            memory.event_timestamp,
+            memory.event_type,
+            memory.content,
+            json.dumps(memory.location) if memory.location else None,
+            memory.participants
+            if memory.participants
+            else None,  # TEXT[] array, not JSON
+            memory.emotional_valence,
+            memory.emotional_arousal,
+            memory.importance_score,
+            memory.tags if memory.tags else None,  # TEXT[] array, not JSON
+            json.dumps(memory.metadata) if memory.metadata else None,
+        )
+
     def _store_in_timescale(self, memory: EpisodicMemory) -> None:
         """Store memory in TimescaleDB"""
-        import json
+        self._store_many_in_timescale([memory])
 
+    def _store_many_in_timescale(self, memories: List[EpisodicMemory]) -> None:
+        """Insert memories in one transaction (executemany is pipelined by psycopg)"""
         conn = get_timescale_conn()
         if not conn:
             raise Exception("TimescaleDB connection not available")
 
         try:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO episodic_memories (
-                        id, user_id, event_timestamp, event_type, content,
-                        location, participants, emotional_valence, emotional_arousal,
-                        importance_score, tags, metadata
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                """,
-                    (
-                        memory.id,
-                        memory.user_id,
-                        memory.event_timestamp,
-                        memory.event_type,
-                        memory.content,
-                        json.dumps(memory.location) if memory.location else None,
-                        memory.participants
-                        if memory.participants
-                        else None,  # TEXT[] array, not JSON
-                        memory.emotional_valence,
-                        memory.emotional_arousal,
-                        memory.importance_score,
-                        memory.tags if memory.tags else None,  # TEXT[] array, not JSON
-                        json.dumps(memory.metadata) if memory.metadata else None,
-                    ),
-                )
+                cur.executemany(_INSERT_SQL, [self._timescale_row(m) for m in memories])
             conn.commit()  # Explicit commit
             release_timescale_conn(conn)  # Return to pool
         except Exception as e:
@@ -110,18 +152,9 @@ class EpisodicMemoryService:
             print(f"Error storing episodic memory in TimescaleDB: {e}")
             raise
 
-    def _store_in_chroma(self, memory: EpisodicMemory) -> None:
-        """Store memory in ChromaDB for vector search"""
-        if not self.chroma_client:
-            raise Exception("ChromaDB connection not available")
-
-        # Get embeddings for the content
-        embeddings = get_embeddings([memory.content])
-        if not embeddings:
-            return
-
-        # Prepare metadata
-        metadata = {
+    @staticmethod
+    def _chroma_metadata(memory: EpisodicMemory) -> Dict[str, Any]:
+        return {
             "user_id": memory.user_id,
             "event_type": memory.event_type,
             "timestamp": memory.event_timestamp.isoformat(),
@@ -132,16 +165,42 @@ class EpisodicMemoryService:
             "participants": memory.participants or [],
         }
 
+    def _store_in_chroma(
+        self, memory: EpisodicMemory, embedding: Optional[List[float]] = None
+    ) -> None:
+        """Store memory in ChromaDB for vector search"""
+        self._store_many_in_chroma([memory], [embedding])
+
+    def _store_many_in_chroma(
+        self,
+        memories: List[EpisodicMemory],
+        embeddings: Optional[List[Optional[List[float]]]] = None,
+    ) -> None:
+        """Upsert memories into ChromaDB in one call"""
+        if not self.chroma_client:
+            raise Exception("ChromaDB connection not available")
+
+        # Reuse the caller's vectors when available, otherwise embed the content
+        vectors = list(embeddings or [])
+        vectors += [None] * (len(memories) - len(vectors))
+        missing = [i for i, vec in enumerate(vectors) if not vec]
+        if missing:
+            embedded = get_embeddings([memories[i].content for i in missing])
+            if not embedded:
+                return
+            for i, vec in zip(missing, embedded):
+                vectors[i] = vec
+
         # Store in ChromaDB
         collection = self.chroma_client.get_or_create_collection(
             name=self.collection_name
         )
 
         collection.upsert(
-            embeddings=embeddings,
-            documents=[memory.content],
-            metadatas=[metadata],
-            ids=[memory.id],
+            embeddings=vectors,
+            documents=[m.content for m in memories],
+            metadatas=[self._chroma_metadata(m) for m in memories],
+            ids=[m.id for m in memories],
         )
 
     def calculate_importance_score(
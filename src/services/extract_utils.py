@@ -15,6 +15,7 @@ from src.config import (
     get_xai_api_key,
     get_xai_base_url,
 )
+from src.dependencies.llm_client import get_llm_client
 
 
 EXTRACTION_MODEL = get_extraction_model_name()
@@ -88,9 +89,7 @@ def _parse_json_from_text(text: str, expect_array: bool) -> Any:
 def _call_llm_json(
     system_prompt: str, user_payload: Dict[str, Any], *, expect_array: bool = False
 ) -> Optional[Any]:
-    """Call LLM and parse JSON response. Uses Langfuse OpenAI wrapper for auto-instrumentation."""
-    from src.config import is_langfuse_enabled
-
+    """Call LLM and parse JSON response. Uses the shared (Langfuse-instrumented) client."""
     logger = logging.getLogger("extraction")
     provider = get_llm_provider()
 
@@ -104,16 +103,8 @@ def _call_llm_json(
             if not api_key:
                 return None
 
-            # Use Langfuse OpenAI wrapper for auto-instrumentation if enabled
-            if is_langfuse_enabled():
-                try:
-                    from langfuse.openai import OpenAI  # type: ignore
-                except ImportError:
-                    from openai import OpenAI  # type: ignore
-            else:
-                from openai import OpenAI  # type: ignore
-
-            client = OpenAI(api_key=api_key)
+            # Shared client (Langfuse-instrumented when enabled)
+            client = get_llm_client("openai", api_key=api_key)
             for _ in range(retries + 1):
                 try:
                     resp = client.chat.completions.create(
@@ -151,16 +142,7 @@ def _call_llm_json(
                 return None
 
             # xAI uses OpenAI-compatible API with custom base_url
-            # Langfuse wrapper supports base_url parameter
-            if is_langfuse_enabled():
-                try:
-                    from langfuse.openai import OpenAI  # type: ignore
-                except ImportError:
-                    from openai import OpenAI  # type: ignore
-            else:
-                from openai import OpenAI  # type: ignore
-
-            client = OpenAI(api_key=api_key, base_url=get_xai_base_url())
+            client = get_llm_client("xai", api_key=api_key, base_url=get_xai_base_url())
             for _ in range(retries + 1):
                 try:
                     resp = client.chat.completions.create(
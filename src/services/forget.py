@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
 import logging
 from datetime import datetime, timezone
 from src.dependencies.chroma import get_chroma_client
-from src.services.embedding_utils import generate_embedding
+from src.services.compaction_ops import fetch_user_embeddings, near_duplicate_rows
 
 from src.services.compaction_graph import run_compaction_graph
 
@@ -46,47 +46,18 @@ def simple_deduplicate(
     user_id: str, similarity_threshold: float = 0.88, limit: int = 10000
 ) -> Dict[str, int]:
     """Naive per-user dedup: compare each doc embedding to others and remove near-duplicates.
-    Returns stats dict.
+    Uses the embeddings already stored in Chroma. Returns stats dict.
     """
     col = _get_collection()
     try:
-        res = col.get(
-            where={"user_id": user_id}, limit=limit, include=["documents", "metadatas"]
-        )  # type: ignore[attr-defined]
-        ids = res.get("ids", [])
-        docs = res.get("documents", [])
-        _metas = res.get("metadatas", [])
-        N = len(ids)
+        stored = fetch_user_embeddings(user_id, limit=limit, col=col, include=())
+        N = len(stored.ids)
         if N <= 1:
             return {"scanned": N, "removed": 0}
-        # Pre-compute embeddings
-        embs: List[List[float]] = []
-        for doc in docs:
-            try:
-                embs.append(generate_embedding(doc) or [])
-            except Exception:
-                embs.append([])
-        removed: List[str] = []
-        for i in range(N):
-            if ids[i] in removed:
-                continue
-            for j in range(i + 1, N):
-                if ids[j] in removed:
-                    continue
-                # Cosine similarity
-                a = embs[i]
-                b = embs[j]
-                if not a or not b or len(a) != len(b):
-                    continue
-                # compute dot / (||a||*||b||)
-                dot = sum(x * y for x, y in zip(a, b))
-                na = sum(x * x for x in a) ** 0.5
-                nb = sum(y * y for y in b) ** 0.5
-                if na <= 0 or nb <= 0:
-                    continue
-                cos = dot / (na * nb)
-                if cos >= similarity_threshold:
-                    removed.append(ids[j])
+        removed = [
+            stored.ids[i]
+            for i in near_duplicate_rows(stored.embeddings, similarity_threshold)
+        ]
         if removed:
             col.delete(ids=removed)  # type: ignore[attr-defined]
             logger.info(
@@ -99,7 +70,10 @@ def simple_deduplicate(
 
 
 def run_compaction_for_user(
-    user_id: str, skip_reextract: bool = True, skip_consolidate: bool = False
+    user_id: str,
+    skip_reextract: bool = True,
+    skip_consolidate: bool = False,
+    incremental: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """Run LangGraph-based compaction for a single user and return summary metrics.
 
@@ -107,10 +81,15 @@ def run_compaction_for_user(
             user_id: User to compact
             skip_reextract: If True, skip expensive LLM re-extraction (default True)
             skip_consolidate: If True, skip memory consolidation (default False - runs by default)
+            incremental: Force an incremental (True) or full (False) run; None
+                    follows the user's watermark and full re-cluster cadence
     """
     try:
         final = run_compaction_graph(
-            user_id, skip_reextract=skip_reextract, skip_consolidate=skip_consolidate
+            user_id,
+            skip_reextract=skip_reextract,
+            skip_consolidate=skip_consolidate,
+            incremental=incremental,
         )
         metrics = final.get("metrics", {})
         logger.info("[forget.compact] user_id=%s metrics=%s", user_id, metrics)
@@ -7,20 +7,33 @@ with intelligent ranking and fusion algorithms.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
-from src.dependencies.timescale import get_timescale_conn, release_timescale_conn  # noqa: E402
+from src.config import (  # noqa: E402
+    get_hybrid_retrieval_timeout_seconds,
+    get_temporal_aggregate_after_days,
+    get_temporal_rows_per_day,
+    get_temporal_top_days,
+    is_hybrid_retrieval_parallel,
+)
+from src.dependencies.timescale import (  # noqa: E402
+    async_timescale_conn,
+    get_timescale_conn,
+    release_timescale_conn,
+)
 from src.dependencies.chroma import get_chroma_client  # noqa: E402
+from src.dependencies.event_loop import run_sync  # noqa: E402
 from src.services.episodic_memory import EpisodicMemoryService  # noqa: E402
 from src.services.emotional_memory import EmotionalMemoryService  # noqa: E402
 from src.services.procedural_memory import ProceduralMemoryService  # noqa: E402
-from src.services.embedding_utils import get_embeddings  # noqa: E402
+from src.services.embedding_utils import aget_embeddings  # noqa: E402
 
 
 def _deserialize_metadata_lists(metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -42,6 +55,133 @@ def _deserialize_metadata_lists(metadata: Dict[str, Any]) -> Dict[str, Any]:
     return metadata
 
 
+# Queries shared by the sync and async strategy implementations.
+_BROWSE_EPISODIC_SQL = """
+    SELECT id, content, event_timestamp, importance_score,
+           emotional_valence, emotional_arousal, location, participants, tags, metadata
+    FROM episodic_memories
+    WHERE user_id = %s
+    ORDER BY event_timestamp DESC
+    LIMIT %s
+"""
+
+_BROWSE_EMOTIONAL_SQL = """
+    SELECT id, context, timestamp, valence, arousal, intensity, emotional_state
+    FROM emotional_memories
+    WHERE user_id = %s
+    ORDER BY timestamp DESC
+    LIMIT %s
+"""
+
+_TEMPORAL_EPISODIC_SQL = """
+    SELECT id, content, event_timestamp, importance_score, emotional_valence, emotional_arousal
+    FROM episodic_memories
+    WHERE user_id = %s AND event_timestamp BETWEEN %s AND %s
+    ORDER BY event_timestamp DESC
+"""
+
+_TEMPORAL_EMOTIONAL_SQL = """
+    SELECT id, context, timestamp, valence, arousal, intensity
+    FROM emotional_memories
+    WHERE user_id = %s AND timestamp BETWEEN %s AND %s
+    ORDER BY timestamp DESC
+"""
+
+# Opt-in (TEMPORAL_AGGREGATE_AFTER_DAYS > 0): longer ranges read the daily
+# continuous aggregates first and only fetch TEMPORAL_ROWS_PER_DAY raw rows
+# from each of the TEMPORAL_TOP_DAYS most significant days.
+_TEMPORAL_EPISODIC_TOP_DAYS_SQL = """
+    WITH days AS (
+        SELECT bucket FROM episodic_daily
+        WHERE user_id = %(user_id)s
+          AND bucket >= time_bucket(INTERVAL '1 day', %(start)s::timestamptz)
+          AND bucket <= %(end)s
+        ORDER BY max_importance DESC NULLS LAST, event_count DESC, bucket DESC
+        LIMIT %(days)s
+    )
+    SELECT e.* FROM days
+    CROSS JOIN LATERAL (
+        SELECT id, content, event_timestamp, importance_score, emotional_valence, emotional_arousal
+        FROM episodic_memories
+        WHERE user_id = %(user_id)s
+          AND event_timestamp >= GREATEST(days.bucket, %(start)s)
+          AND event_timestamp < days.bucket + INTERVAL '1 day'
+          AND event_timestamp <= %(end)s
+        ORDER BY importance_score DESC NULLS LAST, event_timestamp DESC
+        LIMIT %(per_day)s
+    ) e
+    ORDER BY e.event_timestamp DESC
+"""
+
+_TEMPORAL_EMOTIONAL_TOP_DAYS_SQL = """
+    WITH days AS (
+        SELECT bucket FROM emotional_daily
+        WHERE user_id = %(user_id)s
+          AND bucket >= time_bucket(INTERVAL '1 day', %(start)s::timestamptz)
+          AND bucket <= %(end)s
+        ORDER BY max_intensity DESC NULLS LAST, state_count DESC, bucket DESC
+        LIMIT %(days)s
+    )
+    SELECT e.* FROM days
+    CROSS JOIN LATERAL (
+        SELECT id, context, timestamp, valence, arousal, intensity
+        FROM emotional_memories
+        WHERE user_id = %(user_id)s
+          AND timestamp >= GREATEST(days.bucket, %(start)s)
+          AND timestamp < days.bucket + INTERVAL '1 day'
+          AND timestamp <= %(end)s
+        ORDER BY intensity DESC NULLS LAST, timestamp DESC
+        LIMIT %(per_day)s
+    ) e
+    ORDER BY e.timestamp DESC
+"""
+
+
+def _temporal_statements(query: "RetrievalQuery") -> List[Tuple[str, Any]]:
+    """(episodic, emotional) statements for the query's time range.
+
+    By default every row in the range is scanned. With
+    TEMPORAL_AGGREGATE_AFTER_DAYS set, longer ranges pick the most significant
+    days from the continuous aggregates and read a few raw rows from each, so
+    they return at most TEMPORAL_TOP_DAYS * TEMPORAL_ROWS_PER_DAY rows per table.
+    """
+    start_time, end_time = query.time_range
+    after_days = get_temporal_aggregate_after_days()
+    if after_days <= 0 or end_time - start_time <= timedelta(days=after_days):
+        params = (query.user_id, start_time, end_time)
+        return [(_TEMPORAL_EPISODIC_SQL, params), (_TEMPORAL_EMOTIONAL_SQL, params)]
+    params = {
+        "user_id": query.user_id,
+        "start": start_time,
+        "end": end_time,
+        "days": get_temporal_top_days(),
+        "per_day": get_temporal_rows_per_day(),
+    }
+    return [
+        (_TEMPORAL_EPISODIC_TOP_DAYS_SQL, params),
+        (_TEMPORAL_EMOTIONAL_TOP_DAYS_SQL, params),
+    ]
+
+
+_EMOTIONAL_STATES_SQL = """
+    SELECT id, context, timestamp, valence, arousal, intensity, emotional_state
+    FROM emotional_memories
+    WHERE user_id = %s
+    ORDER BY timestamp DESC
+    LIMIT 50
+"""
+
+_EMOTIONAL_EPISODIC_SQL = """
+    SELECT id, content, event_timestamp, emotional_valence, emotional_arousal, importance_score
+    FROM episodic_memories
+    WHERE user_id = %s
+    AND emotional_valence IS NOT NULL
+    AND emotional_arousal IS NOT NULL
+    ORDER BY event_timestamp DESC
+    LIMIT 50
+"""
+
+
 class RetrievalStrategy(Enum):
     """Retrieval strategy types"""
 
@@ -85,6 +225,9 @@ class RetrievalQuery:
     weight_overrides: Optional[Dict[str, float]] = None
 
 
+_Strategy = Callable[["RetrievalQuery"], Awaitable[List["RetrievalResult"]]]
+
+
 class HybridRetrievalService:
     """Service for hybrid memory retrieval and ranking"""
 
@@ -94,16 +237,36 @@ class HybridRetrievalService:
         self.emotional_service = EmotionalMemoryService()
         self.procedural_service = ProceduralMemoryService()
 
-    def retrieve_memories(self, query: RetrievalQuery) -> List[RetrievalResult]:
+    def retrieve_memories(
+        self, query: RetrievalQuery, parallel: Optional[bool] = None
+    ) -> List[RetrievalResult]:
         """
         Retrieve memories using hybrid approach
 
+        Sync entry point for worker threads and sync endpoints; runs
+        ``aretrieve_memories`` on the shared event loop.
+
         Args:
             query: RetrievalQuery object with search parameters
+            parallel: Run strategies concurrently with per-strategy timeouts;
+                defaults to HYBRID_RETRIEVAL_PARALLEL
 
         Returns:
             List[RetrievalResult]: Ranked list of memories
         """
+        return run_sync(self.aretrieve_memories(query, parallel=parallel))
+
+    async def aretrieve_memories(
+        self, query: RetrievalQuery, parallel: Optional[bool] = None
+    ) -> List[RetrievalResult]:
+        """
+        Retrieve memories using hybrid approach, on the event loop.
+
+        Strategies use async Chroma, AsyncOpenAI and the asyncio Postgres pool.
+        In parallel mode they run concurrently, each bounded by
+        HYBRID_RETRIEVAL_TIMEOUT_SECONDS; a strategy that times out or fails is
+        dropped from the response.
+        """
         from src.services.tracing import start_span, end_span
 
         _span = start_span(
@@ -118,31 +281,28 @@ class HybridRetrievalService:
             },
         )
 
-        all_results = []
-
-        # 1. Semantic retrieval (query) or browse-all (no query)
-        if query.query_text:
-            semantic_results = self._semantic_retrieval(query)
-            all_results.extend(semantic_results)
+        # 1-4. Semantic/browse, temporal, emotional and procedural strategies
+        strategies = self._plan_strategies(query)
+        if parallel is None:
+            parallel = is_hybrid_retrieval_parallel()
+        if parallel and len(strategies) > 1:
+            all_results, degraded = await self._run_strategies_parallel(
+                strategies, query
+            )
         else:
-            browse_results = self._browse_all(query)
-            all_results.extend(browse_results)
-
-        # 2. Temporal retrieval (if time range provided)
-        if query.time_range:
-            temporal_results = self._temporal_retrieval(query)
-            all_results.extend(temporal_results)
-
-        # 3. Emotional retrieval (if emotional context provided)
-        if query.emotional_context:
-            emotional_results = self._emotional_retrieval(query)
-            all_results.extend(emotional_results)
+            all_results, degraded = await self._run_strategies_sequential(
+                strategies, query
+            )
 
-        # 4. Procedural retrieval (if procedural memories requested)
-        if not query.memory_types or "procedural" in query.memory_types:
-            procedural_results = self._procedural_retrieval(query)
-            all_results.extend(procedural_results)
+        return self._finalize(all_results, degraded, query, end_span)
 
+    def _finalize(
+        self,
+        all_results: List[RetrievalResult],
+        degraded: List[str],
+        query: RetrievalQuery,
+        end_span: Callable[..., Any],
+    ) -> List[RetrievalResult]:
         # 5. Deduplicate and rank results
         unique_results = self._deduplicate_results(all_results)
         ranked_results = self._rank_results(unique_results, query)
@@ -156,143 +316,251 @@ class HybridRetrievalService:
                 "total_raw_results": len(all_results),
                 "unique_results": len(unique_results),
                 "final_count": len(final_results),
+                "degraded_strategies": degraded,
             }
         )
 
         return final_results
 
-    def _semantic_retrieval(self, query: RetrievalQuery) -> List[RetrievalResult]:
-        """Perform semantic search across all memory types"""
-        results = []
+    def _plan_strategies(self, query: RetrievalQuery) -> List[Tuple[str, _Strategy]]:
+        """Select the strategies that apply to ``query``, in merge order."""
+        strategies: List[Tuple[str, _Strategy]] = []
+
+        # Semantic retrieval (query) or browse-all (no query)
+        if query.query_text:
+            strategies.append(("semantic", self._semantic_retrieval))
+        else:
+            strategies.append(("browse", self._browse_all))
+
+        # Temporal retrieval (if time range provided)
+        if query.time_range:
+            strategies.append(("temporal", self._temporal_retrieval))
 
+        # Emotional retrieval (if emotional context provided)
+        if query.emotional_context:
+            strategies.append(("emotional", self._emotional_retrieval))
+
+        # Procedural retrieval (if procedural memories requested)
+        if not query.memory_types or "procedural" in query.memory_types:
+            strategies.append(("procedural", self._procedural_retrieval))
+
+        return strategies
+
+    async def _run_strategies_sequential(
+        self,
+        strategies: List[Tuple[str, _Strategy]],
+        query: RetrievalQuery,
+    ) -> Tuple[List[RetrievalResult], List[str]]:
+        all_results: List[RetrievalResult] = []
+        for _, strategy in strategies:
+            all_results.extend(await strategy(query))
+        return all_results, []
+
+    async def _run_strategies_parallel(
+        self,
+        strategies: List[Tuple[str, _Strategy]],
+        query: RetrievalQuery,
+    ) -> Tuple[List[RetrievalResult], List[str]]:
+        """Run strategies concurrently, each bounded by the same deadline.
+
+        Results are merged in plan order so deduplication keeps preferring the
+        semantic (ChromaDB) entries. A strategy that fails or misses the
+        deadline contributes nothing and is reported as degraded.
+        """
+        timeout = get_hybrid_retrieval_timeout_seconds()
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(strategy(query), timeout) for _, strategy in strategies),
+            return_exceptions=True,
+        )
+
+        all_results: List[RetrievalResult] = []
+        degraded: List[str] = []
+        for (name, _), outcome in zip(strategies, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                degraded.append(name)
+                logger.warning(
+                    "[hybrid.strategy_timeout] user_id=%s strategy=%s timeout=%.2fs",
+                    query.user_id,
+                    name,
+                    timeout,
+                )
+            elif isinstance(outcome, BaseException):
+                degraded.append(name)
+                logger.warning(
+                    "[hybrid.strategy_error] user_id=%s strategy=%s error=%s",
+                    query.user_id,
+                    name,
+                    outcome,
+                )
+            else:
+                all_results.extend(outcome)
+        return all_results, degraded
+
+    async def _semantic_retrieval(self, query: RetrievalQuery) -> List[RetrievalResult]:
+        """Perform semantic search across all memory types"""
         if not query.query_text or not self.chroma_client:
-            return results
+            return []
 
         try:
             # Get query embeddings
-            query_embeddings = get_embeddings([query.query_text])
+            query_embeddings = await aget_embeddings([query.query_text])
             if not query_embeddings:
-                return results
+                return []
 
             # Use the standard unified collection used by /v1/store
             from src.services.retrieval import _standard_collection_name
 
             collection_name = _standard_collection_name()
             try:
-                collection = self.chroma_client.get_collection(collection_name)
-                search_results = collection.query(
+                collection = await self.chroma_client.aget_collection(collection_name)
+                search_results = await collection.aquery(
                     query_embeddings=query_embeddings,
                     n_results=query.limit,
                     where={"user_id": query.user_id},
                 )
-                if (
-                    search_results
-                    and search_results.get("ids")
-                    and search_results["ids"][0]
-                ):
-                    for i, memory_id in enumerate(search_results["ids"][0]):
-                        distance = (
-                            search_results["distances"][0][i]
-                            if search_results.get("distances")
-                            else 0.0
-                        )
-                        similarity = 1.0 - distance
-                        metadata = _deserialize_metadata_lists(
-                            search_results["metadatas"][0][i] or {}
-                        )
-
-                        # Extract timestamp and calculate recency score
-                        timestamp_str = metadata.get("timestamp")
-                        if timestamp_str:
-                            try:
-                                timestamp = datetime.fromisoformat(
-                                    timestamp_str.replace("Z", "+00:00")
-                                )
-                                recency = self._calculate_recency_score(timestamp)
-                            except (ValueError, TypeError):
-                                recency = 0.5
-                        else:
-                            recency = 0.5
-
-                        # Extract importance from metadata
-                        try:
-                            importance = float(metadata.get("importance", 0.5))
-                        except (ValueError, TypeError):
-                            importance = 0.5
-
-                        result = RetrievalResult(
-                            memory_id=memory_id,
-                            memory_type="semantic",
-                            content=search_results["documents"][0][i],
-                            relevance_score=similarity,
-                            recency_score=recency,
-                            importance_score=importance,
-                            semantic_similarity=similarity,
-                            metadata=metadata,
-                        )
-                        results.append(result)
+                return self._semantic_hits(search_results)
             except Exception as e:
                 logger.error("Error searching collection %s: %s", collection_name, e)
 
         except Exception as e:
             logger.error("Error in semantic retrieval: %s", e)
 
+        return []
+
+    def _semantic_hits(self, search_results: Dict[str, Any]) -> List[RetrievalResult]:
+        results = []
+        if not (
+            search_results and search_results.get("ids") and search_results["ids"][0]
+        ):
+            return results
+        for i, memory_id in enumerate(search_results["ids"][0]):
+            distance = (
+                search_results["distances"][0][i]
+                if search_results.get("distances")
+                else 0.0
+            )
+            similarity = 1.0 - distance
+            metadata = _deserialize_metadata_lists(
+                search_results["metadatas"][0][i] or {}
+            )
+
+            # Extract timestamp and calculate recency score
+            timestamp_str = metadata.get("timestamp")
+            if timestamp_str:
+                try:
+                    timestamp = datetime.fromisoformat(
+                        timestamp_str.replace("Z", "+00:00")
+                    )
+                    recency = self._calculate_recency_score(timestamp)
+                except (ValueError, TypeError):
+                    recency = 0.5
+            else:
+                recency = 0.5
+
+            # Extract importance from metadata
+            try:
+                importance = float(metadata.get("importance", 0.5))
+            except (ValueError, TypeError):
+                importance = 0.5
+
+            result = RetrievalResult(
+                memory_id=memory_id,
+                memory_type="semantic",
+                content=search_results["documents"][0][i],
+                relevance_score=similarity,
+                recency_score=recency,
+                importance_score=importance,
+                semantic_similarity=similarity,
+                metadata=metadata,
+            )
+            results.append(result)
         return results
 
-    def _browse_all(self, query: RetrievalQuery) -> List[RetrievalResult]:
+    async def _browse_all(self, query: RetrievalQuery) -> List[RetrievalResult]:
         """Fetch all memories across every layer when no query text is provided (browse mode)."""
-        results = []
+        results: List[RetrievalResult] = []
 
         # 1. ChromaDB (semantic / short-term / long-term)
         if self.chroma_client:
             try:
                 from src.services.retrieval import _standard_collection_name
 
-                collection_name = _standard_collection_name()
-                collection = self.chroma_client.get_collection(collection_name)
-                browse_results = collection.get(
-                    where={"user_id": query.user_id},
-                    limit=query.limit,
+                collection = await self.chroma_client.aget_collection(
+                    _standard_collection_name()
                 )
-                ids = browse_results.get("ids", [])
-                docs = browse_results.get("documents", [])
-                metas = browse_results.get("metadatas", [])
-
-                for i, memory_id in enumerate(ids):
-                    if i >= len(docs) or i >= len(metas):
-                        continue
-                    metadata = _deserialize_metadata_lists(metas[i] or {})
-                    timestamp_str = metadata.get("timestamp")
-                    recency = 0.5
-                    if timestamp_str:
-                        try:
-                            timestamp = datetime.fromisoformat(
-                                timestamp_str.replace("Z", "+00:00")
-                            )
-                            recency = self._calculate_recency_score(timestamp)
-                        except (ValueError, TypeError):
-                            pass
-                    try:
-                        importance = float(metadata.get("importance", 0.5))
-                    except (ValueError, TypeError):
-                        importance = 0.5
-
-                    results.append(
-                        RetrievalResult(
-                            memory_id=memory_id,
-                            memory_type=metadata.get("layer", "semantic"),
-                            content=docs[i],
-                            relevance_score=0.5,
-                            recency_score=recency,
-                            importance_score=importance,
-                            semantic_similarity=0.0,
-                            metadata=metadata,
-                        )
-                    )
+                browse_results = await collection.aget(
+                    where={"user_id": query.user_id}, limit=query.limit
+                )
+                results.extend(self._browse_chroma_hits(browse_results))
             except Exception as e:
                 logger.error("Error in browse-all ChromaDB retrieval: %s", e)
 
-        # 2. Episodic memories (TimescaleDB)
+        # 2. Episodic and 3. emotional memories (TimescaleDB)
+        seen_ids = self._browse_seen_ids(results)
+        try:
+            async with async_timescale_conn() as conn:
+                if conn:
+                    async with conn.cursor() as cur:
+                        await cur.execute(
+                            _BROWSE_EPISODIC_SQL, (query.user_id, query.limit)
+                        )
+                        results.extend(
+                            self._browse_episodic_rows(await cur.fetchall(), seen_ids)
+                        )
+                        await cur.execute(
+                            _BROWSE_EMOTIONAL_SQL, (query.user_id, query.limit)
+                        )
+                        results.extend(
+                            self._browse_emotional_rows(await cur.fetchall(), seen_ids)
+                        )
+        except Exception as e:
+            logger.error("Error in browse-all TimescaleDB retrieval: %s", e)
+
+        return results
+
+    def _browse_chroma_hits(
+        self, browse_results: Dict[str, Any]
+    ) -> List[RetrievalResult]:
+        results = []
+        ids = browse_results.get("ids", [])
+        docs = browse_results.get("documents", [])
+        metas = browse_results.get("metadatas", [])
+
+        for i, memory_id in enumerate(ids):
+            if i >= len(docs) or i >= len(metas):
+                continue
+            metadata = _deserialize_metadata_lists(metas[i] or {})
+            timestamp_str = metadata.get("timestamp")
+            recency = 0.5
+            if timestamp_str:
+                try:
+                    timestamp = datetime.fromisoformat(
+                        timestamp_str.replace("Z", "+00:00")
+                    )
+                    recency = self._calculate_recency_score(timestamp)
+                except (ValueError, TypeError):
+                    pass
+            try:
+                importance = float(metadata.get("importance", 0.5))
+            except (ValueError, TypeError):
+                importance = 0.5
+
+            results.append(
+                RetrievalResult(
+                    memory_id=memory_id,
+                    memory_type=metadata.get("layer", "semantic"),
+                    content=docs[i],
+                    relevance_score=0.5,
+                    recency_score=recency,
+                    importance_score=importance,
+                    semantic_similarity=0.0,
+                    metadata=metadata,
+                )
+            )
+        return results
+
+    @staticmethod
+    def _browse_seen_ids(results: List[RetrievalResult]) -> set:
         # Build seen_ids from both memory_id AND typed_table_id to avoid duplicates
         # When stored via direct API, ChromaDB has mem_XXXX with typed_table_id metadata
         # pointing to the UUID in the typed table
@@ -301,315 +569,266 @@ class HybridRetrievalService:
             typed_id = (r.metadata or {}).get("typed_table_id")
             if typed_id:
                 seen_ids.add(typed_id)
-        conn = get_timescale_conn()
-        if conn:
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        SELECT id, content, event_timestamp, importance_score,
-                               emotional_valence, emotional_arousal, location, participants, tags, metadata
-                        FROM episodic_memories
-                        WHERE user_id = %s
-                        ORDER BY event_timestamp DESC
-                        LIMIT %s
-                    """,
-                        (query.user_id, query.limit),
-                    )
-                    for row in cur.fetchall():
-                        mid = str(row["id"])
-                        if mid in seen_ids:
-                            continue
-                        seen_ids.add(mid)
-                        recency = (
-                            self._calculate_recency_score(row["event_timestamp"])
-                            if row.get("event_timestamp")
-                            else 0.5
-                        )
-                        meta = row.get("metadata") or {}
-                        if row.get("event_timestamp"):
-                            meta["timestamp"] = row["event_timestamp"].isoformat()
-                        meta["layer"] = "episodic"
-                        meta["emotional_valence"] = row.get("emotional_valence")
-                        meta["emotional_arousal"] = row.get("emotional_arousal")
-                        results.append(
-                            RetrievalResult(
-                                memory_id=mid,
-                                memory_type="episodic",
-                                content=row["content"] or "",
-                                relevance_score=0.5,
-                                recency_score=recency,
-                                importance_score=float(
-                                    row.get("importance_score") or 0.5
-                                ),
-                                semantic_similarity=0.0,
-                                metadata=meta,
-                            )
-                        )
-                conn.commit()
-
-                # 3. Emotional memories (TimescaleDB)
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        SELECT id, context, timestamp, valence, arousal, intensity, emotional_state
-                        FROM emotional_memories
-                        WHERE user_id = %s
-                        ORDER BY timestamp DESC
-                        LIMIT %s
-                    """,
-                        (query.user_id, query.limit),
-                    )
-                    for row in cur.fetchall():
-                        mid = str(row["id"])
-                        if mid in seen_ids:
-                            continue
-                        seen_ids.add(mid)
-                        recency = (
-                            self._calculate_recency_score(row["timestamp"])
-                            if row.get("timestamp")
-                            else 0.5
-                        )
-                        meta = {
-                            "layer": "emotional",
-                            "timestamp": row["timestamp"].isoformat()
-                            if row.get("timestamp")
-                            else None,
-                            "emotional_valence": row.get("valence"),
-                            "emotional_arousal": row.get("arousal"),
-                            "dominant_emotion": row.get("emotional_state"),
-                        }
-                        results.append(
-                            RetrievalResult(
-                                memory_id=mid,
-                                memory_type="emotional",
-                                content=row["context"] or "",
-                                relevance_score=0.5,
-                                recency_score=recency,
-                                importance_score=float(row.get("intensity") or 0.5),
-                                semantic_similarity=0.0,
-                                metadata=meta,
-                            )
-                        )
-                conn.commit()
-            except Exception as e:
-                logger.error("Error in browse-all TimescaleDB retrieval: %s", e)
-            finally:
-                release_timescale_conn(conn)
+        return seen_ids
 
+    def _browse_episodic_rows(self, rows: list, seen_ids: set) -> List[RetrievalResult]:
+        results = []
+        for row in rows:
+            mid = str(row["id"])
+            if mid in seen_ids:
+                continue
+            seen_ids.add(mid)
+            recency = (
+                self._calculate_recency_score(row["event_timestamp"])
+                if row.get("event_timestamp")
+                else 0.5
+            )
+            meta = row.get("metadata") or {}
+            if row.get("event_timestamp"):
+                meta["timestamp"] = row["event_timestamp"].isoformat()
+            meta["layer"] = "episodic"
+            meta["emotional_valence"] = row.get("emotional_valence")
+            meta["emotional_arousal"] = row.get("emotional_arousal")
+            results.append(
+                RetrievalResult(
+                    memory_id=mid,
+                    memory_type="episodic",
+                    content=row["content"] or "",
+                    relevance_score=0.5,
+                    recency_score=recency,
+                    importance_score=float(row.get("importance_score") or 0.5),
+                    semantic_similarity=0.0,
+                    metadata=meta,
+                )
+            )
         return results
 
-    def _temporal_retrieval(self, query: RetrievalQuery) -> List[RetrievalResult]:
-        """Retrieve memories by time range"""
+    def _browse_emotional_rows(
+        self, rows: list, seen_ids: set
+    ) -> List[RetrievalResult]:
         results = []
+        for row in rows:
+            mid = str(row["id"])
+            if mid in seen_ids:
+                continue
+            seen_ids.add(mid)
+            recency = (
+                self._calculate_recency_score(row["timestamp"])
+                if row.get("timestamp")
+                else 0.5
+            )
+            meta = {
+                "layer": "emotional",
+                "timestamp": row["timestamp"].isoformat()
+                if row.get("timestamp")
+                else None,
+                "emotional_valence": row.get("valence"),
+                "emotional_arousal": row.get("arousal"),
+                "dominant_emotion": row.get("emotional_state"),
+            }
+            results.append(
+                RetrievalResult(
+                    memory_id=mid,
+                    memory_type="emotional",
+                    content=row["context"] or "",
+                    relevance_score=0.5,
+                    recency_score=recency,
+                    importance_score=float(row.get("intensity") or 0.5),
+                    semantic_similarity=0.0,
+                    metadata=meta,
+                )
+            )
+        return results
 
+    async def _temporal_retrieval(self, query: RetrievalQuery) -> List[RetrievalResult]:
+        """Retrieve memories by time range"""
         if not query.time_range:
-            return results
-
-        conn = get_timescale_conn()
-        if not conn:
-            return results
+            return []
 
-        start_time, end_time = query.time_range
+        (episodic_sql, episodic_params), (emotional_sql, emotional_params) = (
+            _temporal_statements(query)
+        )
 
+        results: List[RetrievalResult] = []
         try:
-            with conn.cursor() as cur:
-                # Search episodic memories
-                cur.execute(
-                    """
-                    SELECT id, content, event_timestamp, importance_score, emotional_valence, emotional_arousal
-                    FROM episodic_memories
-                    WHERE user_id = %s AND event_timestamp BETWEEN %s AND %s
-                    ORDER BY event_timestamp DESC
-                """,
-                    (query.user_id, start_time, end_time),
-                )
+            # The pool commits the read-only transaction on release
+            async with async_timescale_conn() as conn:
+                if conn:
+                    async with conn.cursor() as cur:
+                        # Search episodic memories
+                        await cur.execute(episodic_sql, episodic_params)
+                        results.extend(
+                            self._temporal_episodic_rows(await cur.fetchall(), query)
+                        )
 
-                episodic_rows = cur.fetchall()
+                        # Search emotional memories
+                        await cur.execute(emotional_sql, emotional_params)
+                        results.extend(
+                            self._temporal_emotional_rows(await cur.fetchall(), query)
+                        )
+        except Exception as e:
+            logger.error("Error in temporal retrieval: %s", e)
 
-                for row in episodic_rows:
-                    # Calculate temporal relevance (closer to query time = higher score)
-                    time_diff = abs(
-                        (row["event_timestamp"] - start_time).total_seconds()
-                    )
-                    max_diff = (end_time - start_time).total_seconds()
-                    temporal_relevance = (
-                        1.0 - (time_diff / max_diff) if max_diff > 0 else 1.0
-                    )
+        return results
 
-                    result = RetrievalResult(
-                        memory_id=row["id"],
-                        memory_type="episodic",
-                        content=row["content"],
-                        relevance_score=temporal_relevance,
-                        recency_score=self._calculate_recency_score(
-                            row["event_timestamp"]
-                        ),
-                        importance_score=row["importance_score"] or 0.5,
-                        temporal_relevance=temporal_relevance,
-                        metadata={
-                            "timestamp": row["event_timestamp"].isoformat(),
-                            "emotional_valence": row["emotional_valence"],
-                            "emotional_arousal": row["emotional_arousal"],
-                        },
-                    )
-                    results.append(result)
+    @staticmethod
+    def _temporal_relevance(timestamp: datetime, query: RetrievalQuery) -> float:
+        # Closer to the start of the query window = higher score
+        start_time, end_time = query.time_range
+        time_diff = abs((timestamp - start_time).total_seconds())
+        max_diff = (end_time - start_time).total_seconds()
+        return 1.0 - (time_diff / max_diff) if max_diff > 0 else 1.0
 
-                # Search emotional memories
-                cur.execute(
-                    """
-                    SELECT id, context, timestamp, valence, arousal, intensity
-                    FROM emotional_memories
-                    WHERE user_id = %s AND timestamp BETWEEN %s AND %s
-                    ORDER BY timestamp DESC
-                """,
-                    (query.user_id, start_time, end_time),
+    def _temporal_episodic_rows(
+        self, rows: list, query: RetrievalQuery
+    ) -> List[RetrievalResult]:
+        results = []
+        for row in rows:
+            temporal_relevance = self._temporal_relevance(row["event_timestamp"], query)
+            results.append(
+                RetrievalResult(
+                    memory_id=row["id"],
+                    memory_type="episodic",
+                    content=row["content"],
+                    relevance_score=temporal_relevance,
+                    recency_score=self._calculate_recency_score(row["event_timestamp"]),
+                    importance_score=row["importance_score"] or 0.5,
+                    temporal_relevance=temporal_relevance,
+                    metadata={
+                        "timestamp": row["event_timestamp"].isoformat(),
+                        "emotional_valence": row["emotional_valence"],
+                        "emotional_arousal": row["emotional_arousal"],
+                    },
                 )
+            )
+        return results
 
-                emotional_rows = cur.fetchall()
+    def _temporal_emotional_rows(
+        self, rows: list, query: RetrievalQuery
+    ) -> List[RetrievalResult]:
+        results = []
+        for row in rows:
+            temporal_relevance = self._temporal_relevance(row["timestamp"], query)
+            results.append(
+                RetrievalResult(
+                    memory_id=row["id"],
+                    memory_type="emotional",
+                    content=row["context"] or "",
+                    relevance_score=temporal_relevance,
+                    recency_score=self._calculate_recency_score(row["timestamp"]),
+                    importance_score=row["intensity"] or 0.5,
+                    temporal_relevance=temporal_relevance,
+                    metadata={
+                        "timestamp": row["timestamp"].isoformat(),
+                        "valence": row["valence"],
+                        "arousal": row["arousal"],
+                        "intensity": row["intensity"],
+                    },
+                )
+            )
+        return results
 
-                for row in emotional_rows:
-                    time_diff = abs((row["timestamp"] - start_time).total_seconds())
-                    max_diff = (end_time - start_time).total_seconds()
-                    temporal_relevance = (
-                        1.0 - (time_diff / max_diff) if max_diff > 0 else 1.0
-                    )
+    async def _emotional_retrieval(
+        self, query: RetrievalQuery
+    ) -> List[RetrievalResult]:
+        """Retrieve memories based on emotional context"""
+        if not query.emotional_context:
+            return []
+
+        results: List[RetrievalResult] = []
+        try:
+            async with async_timescale_conn() as conn:
+                if conn:
+                    async with conn.cursor() as cur:
+                        # Search emotional memories with similar emotional state
+                        await cur.execute(_EMOTIONAL_STATES_SQL, (query.user_id,))
+                        results.extend(
+                            self._emotional_state_rows(await cur.fetchall(), query)
+                        )
+
+                        # Search episodic memories with emotional context
+                        await cur.execute(_EMOTIONAL_EPISODIC_SQL, (query.user_id,))
+                        results.extend(
+                            self._emotional_episodic_rows(await cur.fetchall(), query)
+                        )
+        except Exception as e:
+            logger.error("Error in emotional retrieval: %s", e)
+
+        return results
 
-                    result = RetrievalResult(
+    def _emotional_state_rows(
+        self, rows: list, query: RetrievalQuery
+    ) -> List[RetrievalResult]:
+        results = []
+        target_valence = query.emotional_context.get("valence", 0.0)
+        target_arousal = query.emotional_context.get("arousal", 0.5)
+        for row in rows:
+            # Calculate emotional similarity
+            valence_diff = abs(row["valence"] - target_valence)
+            arousal_diff = abs(row["arousal"] - target_arousal)
+            emotional_similarity = 1.0 - (valence_diff + arousal_diff) / 2.0
+
+            if emotional_similarity > 0.3:  # Threshold for emotional relevance
+                results.append(
+                    RetrievalResult(
                         memory_id=row["id"],
                         memory_type="emotional",
                         content=row["context"] or "",
-                        relevance_score=temporal_relevance,
+                        relevance_score=emotional_similarity,
                         recency_score=self._calculate_recency_score(row["timestamp"]),
                         importance_score=row["intensity"] or 0.5,
-                        temporal_relevance=temporal_relevance,
+                        emotional_relevance=emotional_similarity,
                         metadata={
                             "timestamp": row["timestamp"].isoformat(),
                             "valence": row["valence"],
                             "arousal": row["arousal"],
                             "intensity": row["intensity"],
+                            "emotional_state": row["emotional_state"],
                         },
                     )
-                    results.append(result)
-
-            # Commit read-only transaction before releasing
-            conn.commit()
-
-        except Exception as e:
-            logger.error("Error in temporal retrieval: %s", e)
-
+                )
         return results
 
-    def _emotional_retrieval(self, query: RetrievalQuery) -> List[RetrievalResult]:
-        """Retrieve memories based on emotional context"""
+    def _emotional_episodic_rows(
+        self, rows: list, query: RetrievalQuery
+    ) -> List[RetrievalResult]:
         results = []
-
-        if not query.emotional_context:
-            return results
-
-        conn = get_timescale_conn()
-        if not conn:
-            return results
-
-        try:
-            target_valence = query.emotional_context.get("valence", 0.0)
-            target_arousal = query.emotional_context.get("arousal", 0.5)
-
-            with conn.cursor() as cur:
-                # Search emotional memories with similar emotional state
-                cur.execute(
-                    """
-                    SELECT id, context, timestamp, valence, arousal, intensity, emotional_state
-                    FROM emotional_memories
-                    WHERE user_id = %s
-                    ORDER BY timestamp DESC
-                    LIMIT 50
-                """,
-                    (query.user_id,),
-                )
-
-                emotional_rows = cur.fetchall()
-
-                for row in emotional_rows:
-                    # Calculate emotional similarity
-                    valence_diff = abs(row["valence"] - target_valence)
-                    arousal_diff = abs(row["arousal"] - target_arousal)
-                    emotional_similarity = 1.0 - (valence_diff + arousal_diff) / 2.0
-
-                    if emotional_similarity > 0.3:  # Threshold for emotional relevance
-                        result = RetrievalResult(
-                            memory_id=row["id"],
-                            memory_type="emotional",
-                            content=row["context"] or "",
-                            relevance_score=emotional_similarity,
-                            recency_score=self._calculate_recency_score(
-                                row["timestamp"]
-                            ),
-                            importance_score=row["intensity"] or 0.5,
-                            emotional_relevance=emotional_similarity,
-                            metadata={
-                                "timestamp": row["timestamp"].isoformat(),
-                                "valence": row["valence"],
-                                "arousal": row["arousal"],
-                                "intensity": row["intensity"],
-                                "emotional_state": row["emotional_state"],
-                            },
-                        )
-                        results.append(result)
-
-                # Search episodic memories with emotional context
-                cur.execute(
-                    """
-                    SELECT id, content, event_timestamp, emotional_valence, emotional_arousal, importance_score
-                    FROM episodic_memories
-                    WHERE user_id = %s 
-                    AND emotional_valence IS NOT NULL 
-                    AND emotional_arousal IS NOT NULL
-                    ORDER BY event_timestamp DESC
-                    LIMIT 50
-                """,
-                    (query.user_id,),
+        target_valence = query.emotional_context.get("valence", 0.0)
+        target_arousal = query.emotional_context.get("arousal", 0.5)
+        for row in rows:
+            valence_diff = abs(row["emotional_valence"] - target_valence)
+            arousal_diff = abs(row["emotional_arousal"] - target_arousal)
+            emotional_similarity = 1.0 - (valence_diff + arousal_diff) / 2.0
+
+            if emotional_similarity > 0.3:
+                results.append(
+                    RetrievalResult(
+                        memory_id=row["id"],
+                        memory_type="episodic",
+                        content=row["content"],
+                        relevance_score=emotional_similarity,
+                        recency_score=self._calculate_recency_score(
+                            row["event_timestamp"]
+                        ),
+                        importance_score=row["importance_score"] or 0.5,
+                        emotional_relevance=emotional_similarity,
+                        metadata={
+                            "timestamp": row["event_timestamp"].isoformat(),
+                            "valence": row["emotional_valence"],
+                            "arousal": row["emotional_arousal"],
+                        },
+                    )
                 )
-
-                episodic_rows = cur.fetchall()
-
-                for row in episodic_rows:
-                    valence_diff = abs(row["emotional_valence"] - target_valence)
-                    arousal_diff = abs(row["emotional_arousal"] - target_arousal)
-                    emotional_similarity = 1.0 - (valence_diff + arousal_diff) / 2.0
-
-                    if emotional_similarity > 0.3:
-                        result = RetrievalResult(
-                            memory_id=row["id"],
-                            memory_type="episodic",
-                            content=row["content"],
-                            relevance_score=emotional_similarity,
-                            recency_score=self._calculate_recency_score(
-                                row["event_timestamp"]
-                            ),
-                            importance_score=row["importance_score"] or 0.5,
-                            emotional_relevance=emotional_similarity,
-                            metadata={
-                                "timestamp": row["event_timestamp"].isoformat(),
-                                "valence": row["emotional_valence"],
-                                "arousal": row["emotional_arousal"],
-                            },
-                        )
-                        results.append(result)
-
-            # Commit read-only transaction before releasing
-            conn.commit()
-
-        except Exception as e:
-            logger.error("Error in emotional retrieval: %s", e)
-        finally:
-            if conn:
-                release_timescale_conn(conn)
-
         return results
 
-    def _procedural_retrieval(self, query: RetrievalQuery) -> List[RetrievalResult]:
+    async def _procedural_retrieval(
+        self, query: RetrievalQuery
+    ) -> List[RetrievalResult]:
         """Retrieve procedural memories"""
+        # ProceduralMemoryService is sync-only; keep it off the event loop
+        return await asyncio.to_thread(self._procedural_results, query)
+
+    def _procedural_results(self, query: RetrievalQuery) -> List[RetrievalResult]:
         results = []
 
         try:
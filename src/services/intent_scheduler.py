@@ -0,0 +1,382 @@
+"""
+Embedded trigger scheduler for time-based (cron/interval/once) intents.
+
+Instead of workers polling ``next_check <= NOW()``, one thread per process
+keeps the intents due within the next resync horizon in an in-memory min-heap
+keyed by due time and sleeps until the earliest one. When intents fall due it
+claims them through ``IntentService.claim_intents_batch`` (so several
+scheduler processes never hand out the same intent twice) and appends each
+claimed intent to a Redis stream that workers consume with XREADGROUP before
+reporting back via ``POST /v1/intents/{id}/fire``.
+
+Keys:
+- ``intents:changes``  pub/sub channel; the intents API publishes
+  ``{"id", "next_check", "enabled", "trigger_type"}`` after create, update,
+  delete and fire so the heap follows changes without polling
+- ``intents:due``      stream of claimed intents
+  (intent_id, user_id, trigger_type, next_check, claimed_at)
+
+A periodic reload of upcoming intents repairs anything a missed pub/sub
+message or an expired claim left behind.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.config import (
+    get_intent_scheduler_resync_seconds,
+    is_intent_scheduler_enabled,
+)
+from src.dependencies.redis_client import get_redis_client
+from src.dependencies.timescale import get_timescale_conn, release_timescale_conn
+from src.services.intent_service import (
+    CLAIM_TIMEOUT_MINUTES,
+    MAX_CLAIM_BATCH,
+    IntentService,
+)
+
+
+logger = logging.getLogger("agentic_memories.intent_scheduler")
+
+CHANGES_CHANNEL = "intents:changes"
+DUE_STREAM = "intents:due"
+DUE_STREAM_MAXLEN = 100_000
+SCHEDULED_TRIGGER_TYPES = ("cron", "interval", "once")
+
+# Longest sleep between checks, so shutdown and resyncs stay prompt
+_MAX_WAIT_SECONDS = 1.0
+# Change messages applied per loop iteration before dispatching again
+_MAX_CHANGES_PER_TICK = 1000
+
+# Claimed intents are scheduled for when their claim expires
+_LOAD_SQL = """
+    SELECT id, GREATEST(next_check, claimed_at + %(claim_timeout)s) AS due_at
+    FROM scheduled_intents
+    WHERE enabled = true
+      AND next_check IS NOT NULL
+      AND next_check <= %(horizon)s
+      AND trigger_type = ANY(%(trigger_types)s)
+"""
+
+
+class TriggerHeap:
+    """Min-heap of intent due times with O(log n) reschedule and removal.
+
+    Rescheduling or removing an intent only updates ``_due``; superseded heap
+    entries are skipped when they reach the top and compacted away once they
+    outnumber live ones.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, str]] = []
+        self._due: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, intent_id: str) -> bool:
+        return intent_id in self._due
+
+    def schedule(self, intent_id: str, due_at: float) -> None:
+        if self._due.get(intent_id) == due_at:
+            return
+        self._due[intent_id] = due_at
+        heapq.heappush(self._heap, (due_at, intent_id))
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(ts, iid) for iid, ts in self._due.items()]
+            heapq.heapify(self._heap)
+
+    def remove(self, intent_id: str) -> None:
+        self._due.pop(intent_id, None)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._due.clear()
+
+    def next_due(self) -> Optional[float]:
+        """Earliest live due time, or None when empty."""
+        while self._heap:
+            due_at, intent_id = self._heap[0]
+            if self._due.get(intent_id) == due_at:
+                return due_at
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: float) -> List[str]:
+        """Remove and return every intent due at or before ``now``, earliest first."""
+        due: List[str] = []
+        while True:
+            due_at = self.next_due()
+            if due_at is None or due_at > now:
+                return due
+            _, intent_id = heapq.heappop(self._heap)
+            del self._due[intent_id]
+            due.append(intent_id)
+
+
+def _timestamp(value: Optional[Any]) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class IntentScheduler:
+    """Heap-driven dispatcher of due cron/interval/once intents to a Redis stream.
+
+    Usage:
+        scheduler = IntentScheduler(get_redis_client())
+        scheduler.start()
+        ...
+        scheduler.stop()
+    """
+
+    def __init__(
+        self,
+        r: Any,
+        resync_seconds: Optional[int] = None,
+        worker_id: Optional[str] = None,
+    ) -> None:
+        self._r = r
+        self._resync_seconds = resync_seconds or get_intent_scheduler_resync_seconds()
+        # Intents further out are picked up by a later resync
+        self._horizon_seconds = 2 * self._resync_seconds
+        self.worker_id = worker_id or f"scheduler-{socket.gethostname()}-{os.getpid()}"
+        self.heap = TriggerHeap()
+        self._next_resync = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def resync(self, now: Optional[float] = None) -> int:
+        """Reload every enabled intent due within the horizon; returns the count."""
+        now = time.time() if now is None else now
+        self._next_resync = now + self._resync_seconds
+        conn = get_timescale_conn()
+        if conn is None:
+            logger.warning("[intent.scheduler.resync] no database connection")
+            return len(self.heap)
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    _LOAD_SQL,
+                    {
+                        "claim_timeout": timedelta(minutes=CLAIM_TIMEOUT_MINUTES),
+                        "horizon": datetime.fromtimestamp(
+                            now + self._horizon_seconds, timezone.utc
+                        ),
+                        "trigger_types": list(SCHEDULED_TRIGGER_TYPES),
+                    },
+                )
+                rows = cur.fetchall()
+            conn.commit()
+        except Exception as exc:
+            conn.rollback()
+            logger.error("[intent.scheduler.resync.error] %s", exc)
+            return len(self.heap)
+        finally:
+            release_timescale_conn(conn)
+
+        self.heap.clear()
+        for row in rows:
+            self.heap.schedule(str(row["id"]), _timestamp(row["due_at"]))
+        logger.info("[intent.scheduler.resync] scheduled=%d", len(self.heap))
+        return len(self.heap)
+
+    def apply_change(self, payload: Any, now: Optional[float] = None) -> None:
+        """Apply one ``intents:changes`` message to the heap."""
+        now = time.time() if now is None else now
+        try:
+            change = json.loads(payload) if isinstance(payload, str) else payload
+            intent_id = str(change["id"])
+            due_at = _timestamp(change.get("next_check"))
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("[intent.scheduler.change] bad message %r: %s", payload, exc)
+            return
+
+        trigger_type = change.get("trigger_type")
+        if (
+            not change.get("enabled", True)
+            or due_at is None
+            or due_at > now + self._horizon_seconds
+            or (
+                trigger_type is not None and trigger_type not in SCHEDULED_TRIGGER_TYPES
+            )
+        ):
+            self.heap.remove(intent_id)
+        else:
+            self.heap.schedule(intent_id, due_at)
+
+    def dispatch(self, now: Optional[float] = None) -> int:
+        """Claim due intents and push them to the due stream; returns the count."""
+        now = time.time() if now is None else now
+        due = self.heap.pop_due(now)
+        if not due:
+            return 0
+
+        conn = get_timescale_conn()
+        if conn is None:
+            logger.warning("[intent.scheduler.dispatch] no database connection")
+            self._retry_later(due, now)
+            return 0
+
+        pushed = 0
+        try:
+            service = IntentService(conn)
+            # Claims every due time-based intent, including ones this heap
+            # missed; entries whose next_check moved are simply not returned.
+            while True:
+                result = service.claim_intents_batch(
+                    self.worker_id,
+                    MAX_CLAIM_BATCH,
+                    trigger_types=list(SCHEDULED_TRIGGER_TYPES),
+                )
+                if not result.success:
+                    # Claims that did succeed moved next_check, so re-arming
+                    # those ids only costs an empty claim on the retry.
+                    logger.error(
+                        "[intent.scheduler.dispatch.error] %s",
+                        "; ".join(result.errors or []),
+                    )
+                    self._retry_later(due, now)
+                    break
+                intents = result.response.intents
+                self._push(intents, result.response.claimed_at)
+                pushed += len(intents)
+                if len(intents) < MAX_CLAIM_BATCH:
+                    break
+        finally:
+            release_timescale_conn(conn)
+
+        logger.info("[intent.scheduler.dispatch] due=%d pushed=%d", len(due), pushed)
+        return pushed
+
+    def _retry_later(self, intent_ids: List[str], now: float) -> None:
+        for intent_id in intent_ids:
+            self.heap.schedule(intent_id, now + _MAX_WAIT_SECONDS)
+
+    def _push(self, intents: List[Any], claimed_at: datetime) -> None:
+        if not intents:
+            return
+        pipe = self._r.pipeline(transaction=False)
+        for intent in intents:
+            pipe.xadd(
+                DUE_STREAM,
+                {
+                    "intent_id": str(intent.id),
+                    "user_id": intent.user_id,
+                    "trigger_type": intent.trigger_type,
+                    "next_check": (
+                        intent.next_check.isoformat() if intent.next_check else ""
+                    ),
+                    "claimed_at": claimed_at.isoformat(),
+                },
+                maxlen=DUE_STREAM_MAXLEN,
+                approximate=True,
+            )
+        pipe.execute()
+
+    def _wait_seconds(self, now: float) -> float:
+        wait = min(_MAX_WAIT_SECONDS, self._next_resync - now)
+        next_due = self.heap.next_due()
+        if next_due is not None:
+            wait = min(wait, next_due - now)
+        return max(0.0, wait)
+
+    def run(self) -> None:
+        """Scheduler loop; returns after stop() is called."""
+        pubsub = self._r.pubsub(ignore_subscribe_messages=True)
+        # Subscribe before the first resync so no change falls in between
+        pubsub.subscribe(CHANGES_CHANNEL)
+        try:
+            while not self._stop.is_set():
+                try:
+                    if time.time() >= self._next_resync:
+                        self.resync()
+                    self.dispatch()
+                    message = pubsub.get_message(
+                        timeout=self._wait_seconds(time.time())
+                    )
+                    applied = 0
+                    while message is not None and applied < _MAX_CHANGES_PER_TICK:
+                        self.apply_change(message["data"])
+                        applied += 1
+                        message = pubsub.get_message(timeout=0)
+                except Exception as exc:
+                    logger.error("[intent.scheduler.error] %s", exc)
+                    self._stop.wait(_MAX_WAIT_SECONDS)
+        finally:
+            pubsub.close()
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run, name="intent-scheduler", daemon=True
+        )
+        self._thread.start()
+        logger.info("[intent.scheduler] started worker_id=%s", self.worker_id)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+def start_intent_scheduler() -> Optional[IntentScheduler]:
+    """Start the embedded scheduler when enabled and Redis is configured."""
+    if not is_intent_scheduler_enabled():
+        return None
+    r = get_redis_client()
+    if r is None:
+        logger.info("[intent.scheduler] skipped: redis unavailable")
+        return None
+    scheduler = IntentScheduler(r)
+    scheduler.start()
+    return scheduler
+
+
+def notify_intent_changes(
+    changes: Iterable[Tuple[Any, Optional[datetime], bool, Optional[str]]],
+    r: Any = None,
+) -> None:
+    """Publish (intent_id, next_check, enabled, trigger_type) changes to schedulers.
+
+    Best-effort: a lost message only delays the intent until the next resync.
+    """
+    if not is_intent_scheduler_enabled():
+        return
+    changes = list(changes)
+    if not changes:
+        return
+    try:
+        r = r if r is not None else get_redis_client()
+        if r is None:
+            return
+        pipe = r.pipeline(transaction=False)
+        for intent_id, next_check, enabled, trigger_type in changes:
+            pipe.publish(
+                CHANGES_CHANNEL,
+                json.dumps(
+                    {
+                        "id": str(intent_id),
+                        "next_check": next_check.isoformat() if next_check else None,
+                        "enabled": enabled,
+                        "trigger_type": trigger_type,
+                    }
+                ),
+            )
+        pipe.execute()
+    except Exception as exc:
+        logger.warning("[intent.scheduler.notify] failed: %s", exc)
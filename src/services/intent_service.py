@@ -13,8 +13,6 @@ from zoneinfo import ZoneInfo
 import logging
 import json
 
-from croniter import croniter
-
 from src.schemas import (
     ScheduledIntentCreate,
     ScheduledIntentUpdate,
@@ -23,9 +21,14 @@ from src.schemas import (
     TriggerCondition,
     IntentFireRequest,
     IntentFireResponse,
+    IntentFireBatchItem,
+    IntentFireItemResult,
+    IntentFireBatchResponse,
     IntentExecutionResponse,
     IntentClaimResponse,
+    IntentClaimBatchResponse,
 )
+from src.services.cron_schedule import DEFAULT_TIMEZONE, get_cron_schedule
 from src.services.intent_validation import IntentValidationService
 
 logger = logging.getLogger("agentic_memories.intent_service")
@@ -62,6 +65,21 @@ class IntentFireResult:
     errors: Optional[List[str]] = None
 
 
+@dataclass
+class IntentFireBatchResult:
+    """Result of reporting a batch of execution results.
+
+    Attributes:
+        success: True if the batch transaction committed (items may still fail)
+        response: Per-item results and totals
+        errors: List of error messages if the whole batch failed
+    """
+
+    success: bool
+    response: Optional[IntentFireBatchResponse] = None
+    errors: Optional[List[str]] = None
+
+
 @dataclass
 class IntentHistoryResult:
     """Result of getting intent execution history (Story 5.7).
@@ -94,12 +112,80 @@ class IntentClaimResult:
     errors: Optional[List[str]] = None
 
 
+@dataclass
+class IntentClaimBatchResult:
+    """Result of atomically claiming a batch of due intents.
+
+    Attributes:
+        success: True if the claim query succeeded (even if nothing was claimed)
+        response: The claimed intents, worker_id and claimed_at
+        errors: List of error messages if failed
+    """
+
+    success: bool
+    response: Optional[IntentClaimBatchResponse] = None
+    errors: Optional[List[str]] = None
+
+
 # Condition-based trigger types that support cooldown
 CONDITION_TRIGGER_TYPES = {"price", "silence", "portfolio"}
 
 # Claim expiration timeout in minutes
 CLAIM_TIMEOUT_MINUTES = 5
 
+# Upper bound on intents claimed per claim-batch call
+MAX_CLAIM_BATCH = 500
+
+# Claims up to %(limit)s due intents in one statement. The inner SELECT matches
+# the idx_intents_pending partial index and skips rows other workers hold, so
+# concurrent callers always receive disjoint batches.
+_CLAIM_BATCH_SQL = """
+    UPDATE scheduled_intents
+    SET claimed_at = %(now)s, claimed_by = %(worker_id)s, updated_at = NOW()
+    WHERE id IN (
+        SELECT id FROM scheduled_intents
+        WHERE enabled = true
+          AND next_check IS NOT NULL
+          AND next_check <= %(now)s
+          AND (claimed_at IS NULL OR claimed_at < %(claim_expiry)s)
+          {filters}
+        ORDER BY next_check ASC
+        LIMIT %(limit)s
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING *
+"""
+
+# Applies one fire report (Story 5.6); shared by fire_intent and fire_intents_batch
+_FIRE_UPDATE_SQL = """
+    UPDATE scheduled_intents
+    SET last_checked = %(last_checked)s,
+        last_executed = %(last_executed)s,
+        execution_count = %(execution_count)s,
+        last_execution_status = %(last_execution_status)s,
+        last_execution_error = %(last_execution_error)s,
+        last_message_id = %(last_message_id)s,
+        next_check = %(next_check)s,
+        enabled = %(enabled)s,
+        last_condition_fire = %(last_condition_fire)s,
+        claimed_at = NULL,
+        claimed_by = NULL,
+        updated_at = NOW()
+    WHERE id = %(id)s
+"""
+
+_EXECUTION_INSERT_SQL = """
+    INSERT INTO intent_executions (
+        intent_id, user_id, executed_at, trigger_type, trigger_data,
+        status, gate_result, message_id, message_preview,
+        evaluation_ms, generation_ms, delivery_ms, error_message
+    ) VALUES (
+        %(intent_id)s, %(user_id)s, %(executed_at)s, %(trigger_type)s, %(trigger_data)s,
+        %(status)s, %(gate_result)s, %(message_id)s, %(message_preview)s,
+        %(evaluation_ms)s, %(generation_ms)s, %(delivery_ms)s, %(error_message)s
+    )
+"""
+
 
 class IntentService:
     """Service for managing scheduled intents.
@@ -658,25 +744,7 @@ class IntentService:
                 rows = cur.fetchall()
 
                 # Convert rows to responses with in_cooldown flag (Story 6.3)
-                intents = []
-                for row in rows:
-                    intent = self._row_to_response(row)
-
-                    # Calculate in_cooldown flag for condition-based triggers
-                    trigger_condition = row.get("trigger_condition") or {}
-                    cooldown_hours = trigger_condition.get("cooldown_hours", 24)
-                    last_condition_fire = row.get("last_condition_fire")
-
-                    is_in_cooldown, _ = self._check_cooldown(
-                        intent.trigger_type, last_condition_fire, cooldown_hours, now
-                    )
-
-                    # Add in_cooldown to metadata for Annie's flexibility
-                    intent_metadata = intent.metadata or {}
-                    intent_metadata["in_cooldown"] = is_in_cooldown
-                    intent.metadata = intent_metadata
-
-                    intents.append(intent)
+                intents = [self._row_to_pending_response(row, now) for row in rows]
 
                 logger.info(
                     "[intent.service.pending] user_id=%s count=%d",
@@ -765,7 +833,7 @@ class IntentService:
                 cur.execute(
                     """
                     UPDATE scheduled_intents
-                    SET claimed_at = %s, updated_at = NOW()
+                    SET claimed_at = %s, claimed_by = NULL, updated_at = NOW()
                     WHERE id = %s
                     RETURNING *
                     """,
@@ -794,6 +862,117 @@ class IntentService:
                 success=False, errors=[f"Database error: {str(e)}"]
             )
 
+    def claim_intents_batch(
+        self,
+        worker_id: str,
+        limit: int,
+        user_id: Optional[str] = None,
+        trigger_types: Optional[List[str]] = None,
+    ) -> IntentClaimBatchResult:
+        """Atomically claim up to ``limit`` due intents for one worker.
+
+        Replaces the pending → claim-per-intent round trips with a single
+        ``UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING *``.
+        Rows locked or claimed by other workers are skipped rather than
+        waited on, so workers polling concurrently get disjoint batches.
+
+        Args:
+            worker_id: Identifier of the claiming worker (stored in claimed_by)
+            limit: Maximum number of intents to claim (capped at MAX_CLAIM_BATCH)
+            user_id: Optional filter to claim only one user's intents
+            trigger_types: Optional filter on trigger_type
+
+        Returns:
+            IntentClaimBatchResult with the claimed intents ordered by next_check ASC
+        """
+        limit = min(limit, MAX_CLAIM_BATCH)
+        now = datetime.now(timezone.utc)
+        params: Dict[str, Any] = {
+            "now": now,
+            "worker_id": worker_id,
+            "claim_expiry": now - timedelta(minutes=CLAIM_TIMEOUT_MINUTES),
+            "limit": limit,
+        }
+        filters = []
+        if user_id is not None:
+            filters.append("AND user_id = %(user_id)s")
+            params["user_id"] = user_id
+        if trigger_types is not None:
+            filters.append("AND trigger_type = ANY(%(trigger_types)s)")
+            params["trigger_types"] = list(trigger_types)
+
+        try:
+            with self._conn.cursor() as cur:
+                cur.execute(_CLAIM_BATCH_SQL.format(filters=" ".join(filters)), params)
+                rows = cur.fetchall()
+            self._conn.commit()
+        except Exception as e:
+            logger.error(
+                "[intent.service.claim_batch] worker_id=%s error=%s", worker_id, e
+            )
+            self._conn.rollback()
+            return IntentClaimBatchResult(
+                success=False, errors=[f"Database error: {str(e)}"]
+            )
+
+        # RETURNING order is unspecified; hand back most overdue first
+        rows.sort(key=lambda row: row["next_check"])
+        intents = [self._row_to_pending_response(row, now) for row in rows]
+
+        logger.info(
+            "[intent.service.claim_batch] worker_id=%s user_id=%s limit=%d claimed=%d",
+            worker_id,
+            user_id,
+            limit,
+            len(intents),
+        )
+
+        return IntentClaimBatchResult(
+            success=True,
+            response=IntentClaimBatchResponse(
+                worker_id=worker_id, claimed_at=now, intents=intents
+            ),
+        )
+
+    def _row_to_pending_response(
+        self, row: Dict[str, Any], now: datetime
+    ) -> ScheduledIntentResponse:
+        """Convert a due intent row, adding pending metadata flags.
+
+        - in_cooldown: condition trigger is still cooling down (Story 6.3)
+        - next_scheduled_fire: for cron triggers, the first slot after now,
+          so workers can tell how stale an overdue fire is
+        """
+        intent = self._row_to_response(row)
+
+        # Calculate in_cooldown flag for condition-based triggers
+        trigger_condition = row.get("trigger_condition") or {}
+        cooldown_hours = trigger_condition.get("cooldown_hours", 24)
+        is_in_cooldown, _ = self._check_cooldown(
+            intent.trigger_type, row.get("last_condition_fire"), cooldown_hours, now
+        )
+
+        # Add in_cooldown to metadata for Annie's flexibility
+        intent_metadata = intent.metadata or {}
+        intent_metadata["in_cooldown"] = is_in_cooldown
+
+        schedule = intent.trigger_schedule or {}
+        if intent.trigger_type == "cron" and schedule.get("cron"):
+            try:
+                cron = get_cron_schedule(
+                    schedule["cron"], schedule.get("timezone") or DEFAULT_TIMEZONE
+                )
+                intent_metadata["next_scheduled_fire"] = cron.next_fire(now).isoformat()
+            except Exception as e:
+                logger.warning(
+                    "[intent.service.pending] intent_id=%s cron_error=%s",
+                    intent.id,
+                    e,
+                )
+
+        intent.metadata = intent_metadata
+        return intent
+
     def _check_cooldown(
         self,
         trigger_type: str,
@@ -858,210 +1037,316 @@ class IntentService:
                     )
                     return IntentFireResult(success=False, errors=["Intent not found"])
 
-                intent = self._row_to_response(row)
                 now = datetime.now(timezone.utc)
-
-                # Story 6.3: Check cooldown for condition-based triggers
-                trigger_condition = row.get("trigger_condition") or {}
-                cooldown_hours = trigger_condition.get("cooldown_hours", 24)
-                last_condition_fire = row.get("last_condition_fire")
-
-                is_in_cooldown, remaining_hours = self._check_cooldown(
-                    intent.trigger_type, last_condition_fire, cooldown_hours, now
+                response, update_params, execution_params = self._plan_fire(
+                    intent_id, row, request, now
                 )
 
-                if is_in_cooldown:
+                if update_params is None:
                     # Return early with cooldown info - don't log to executions
-                    logger.info(
-                        "[intent.service.fire] intent_id=%s cooldown_active=true remaining_hours=%.2f",
-                        intent_id,
-                        remaining_hours,
-                    )
-                    return IntentFireResult(
-                        success=True,
-                        response=IntentFireResponse(
-                            intent_id=intent_id,
-                            status="cooldown_active",
-                            next_check=intent.next_check,
-                            enabled=intent.enabled,
-                            execution_count=intent.execution_count,
-                            cooldown_active=True,
-                            cooldown_remaining_hours=remaining_hours,
-                            last_condition_fire=last_condition_fire,
-                        ),
-                    )
+                    return IntentFireResult(success=True, response=response)
 
-                # Always update last_checked (AC2)
-                new_last_checked = now
-
-                # Update execution state on success (AC3)
-                new_last_executed = intent.last_executed
-                new_execution_count = intent.execution_count
-                new_last_execution_status = request.status
-                new_last_message_id = intent.last_message_id
-                new_last_execution_error = request.error_message
-
-                # Story 6.3: Track last_condition_fire for condition-based triggers
-                new_last_condition_fire = last_condition_fire
-
-                if request.status == "success":
-                    new_last_executed = now
-                    new_execution_count = intent.execution_count + 1
-                    new_last_message_id = request.message_id
-
-                    # Update last_condition_fire for condition-based triggers on success
-                    if intent.trigger_type in CONDITION_TRIGGER_TYPES:
-                        new_last_condition_fire = now
-
-                # Calculate next_check based on trigger type and result (AC4)
-                trigger_schedule = None
-                if intent.trigger_schedule:
-                    if isinstance(intent.trigger_schedule, dict):
-                        trigger_schedule = TriggerSchedule(**intent.trigger_schedule)
-                    else:
-                        trigger_schedule = intent.trigger_schedule
+                # Update intent record and log execution (AC2-AC6)
+                cur.execute(_FIRE_UPDATE_SQL, update_params)
+                cur.execute(_EXECUTION_INSERT_SQL, execution_params)
 
-                new_next_check = self._calculate_next_check_after_fire(
-                    intent.trigger_type, trigger_schedule, request.status, now
-                )
+                self._conn.commit()
 
-                # Check auto-disable conditions (AC5)
-                new_enabled = intent.enabled
-                was_disabled_reason = None
+                return IntentFireResult(success=True, response=response)
 
-                # Disable one-time triggers after success
-                if intent.trigger_type == "once" and request.status == "success":
-                    new_enabled = False
-                    new_next_check = None
-                    was_disabled_reason = "one-time trigger executed"
+        except Exception as e:
+            logger.error("[intent.service.fire] intent_id=%s error=%s", intent_id, e)
+            self._conn.rollback()
+            return IntentFireResult(success=False, errors=[f"Database error: {str(e)}"])
 
-                # Disable if max_executions reached
-                if (
-                    intent.max_executions is not None
-                    and new_execution_count >= intent.max_executions
-                ):
-                    new_enabled = False
-                    was_disabled_reason = (
-                        f"max_executions ({intent.max_executions}) reached"
-                    )
+    def fire_intents_batch(
+        self, items: List[IntentFireBatchItem]
+    ) -> IntentFireBatchResult:
+        """Report many execution results in one transaction.
 
-                # Disable if expires_at passed
-                if intent.expires_at is not None and now >= intent.expires_at:
-                    new_enabled = False
-                    was_disabled_reason = "expires_at passed"
+        Locks every referenced intent with a single SELECT, applies the same
+        per-intent rules as fire_intent(), then writes all intent updates and
+        intent_executions rows with one executemany each and commits once.
+        Unknown or repeated intent IDs are reported per item and do not fail
+        the rest of the batch; a database error rolls back the whole batch.
 
-                # Story 6.4: Disable fire_mode='once' condition triggers after success
-                if (
-                    request.status == "success"
-                    and intent.trigger_type in CONDITION_TRIGGER_TYPES
-                    and trigger_condition.get("fire_mode") == "once"
-                ):
-                    new_enabled = False
-                    new_next_check = None
-                    was_disabled_reason = "fire_mode_once"
-                    logger.info(
-                        "[intents.fire] fire_mode_once disabled intent_id=%s", intent_id
-                    )
+        Args:
+            items: Execution results, each naming its intent_id
 
-                # Update intent record in database (AC2, AC3, AC4, AC5, Story 6.3, Story 6.4)
+        Returns:
+            IntentFireBatchResult with one item result per input, in input order
+        """
+        ids = sorted({str(item.intent_id) for item in items})
+
+        try:
+            with self._conn.cursor() as cur:
+                # Lock in id order so overlapping concurrent batches cannot deadlock
                 cur.execute(
-                    """
-                    UPDATE scheduled_intents
-                    SET last_checked = %s,
-                        last_executed = %s,
-                        execution_count = %s,
-                        last_execution_status = %s,
-                        last_execution_error = %s,
-                        last_message_id = %s,
-                        next_check = %s,
-                        enabled = %s,
-                        last_condition_fire = %s,
-                        claimed_at = NULL,
-                        updated_at = NOW()
-                    WHERE id = %s
-                    """,
-                    (
-                        new_last_checked,
-                        new_last_executed,
-                        new_execution_count,
-                        new_last_execution_status,
-                        new_last_execution_error,
-                        new_last_message_id,
-                        new_next_check,
-                        new_enabled,
-                        new_last_condition_fire,
-                        str(intent_id),
-                    ),
+                    "SELECT * FROM scheduled_intents WHERE id = ANY(%s) "
+                    "ORDER BY id FOR UPDATE",
+                    (ids,),
                 )
+                rows = {str(row["id"]): row for row in cur.fetchall()}
 
-                # Log execution to intent_executions table (AC6)
-                trigger_data_json = (
-                    json.dumps(request.trigger_data) if request.trigger_data else None
-                )
-                gate_result_json = (
-                    json.dumps(request.gate_result) if request.gate_result else None
-                )
+                now = datetime.now(timezone.utc)
+                results: List[IntentFireItemResult] = []
+                updates: List[Dict[str, Any]] = []
+                executions: List[Dict[str, Any]] = []
+                seen = set()
+
+                for item in items:
+                    key = str(item.intent_id)
+                    if key in seen:
+                        results.append(
+                            IntentFireItemResult(
+                                intent_id=item.intent_id,
+                                success=False,
+                                error="Duplicate intent_id in batch",
+                            )
+                        )
+                        continue
+                    seen.add(key)
+
+                    row = rows.get(key)
+                    if row is None:
+                        results.append(
+                            IntentFireItemResult(
+                                intent_id=item.intent_id,
+                                success=False,
+                                error="Intent not found",
+                            )
+                        )
+                        continue
 
-                cur.execute(
-                    """
-                    INSERT INTO intent_executions (
-                        intent_id, user_id, executed_at, trigger_type, trigger_data,
-                        status, gate_result, message_id, message_preview,
-                        evaluation_ms, generation_ms, delivery_ms, error_message
-                    ) VALUES (
-                        %s, %s, %s, %s, %s,
-                        %s, %s, %s, %s,
-                        %s, %s, %s, %s
+                    try:
+                        response, update_params, execution_params = self._plan_fire(
+                            item.intent_id, row, item, now
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            "[intent.service.fire_batch] intent_id=%s error=%s",
+                            key,
+                            e,
+                        )
+                        results.append(
+                            IntentFireItemResult(
+                                intent_id=item.intent_id, success=False, error=str(e)
+                            )
+                        )
+                        continue
+
+                    if update_params is not None:
+                        updates.append(update_params)
+                        executions.append(execution_params)
+                    results.append(
+                        IntentFireItemResult(
+                            intent_id=item.intent_id, success=True, response=response
+                        )
                     )
-                    """,
-                    (
-                        str(intent_id),
-                        intent.user_id,
-                        now,
-                        intent.trigger_type,
-                        trigger_data_json,
-                        request.status,
-                        gate_result_json,
-                        request.message_id,
-                        request.message_preview,
-                        request.evaluation_ms,
-                        request.generation_ms,
-                        request.delivery_ms,
-                        request.error_message,
-                    ),
-                )
-
-                self._conn.commit()
 
-                # Build response with cooldown fields (Story 6.3)
-                response = IntentFireResponse(
-                    intent_id=intent_id,
-                    status=request.status,
-                    next_check=new_next_check,
-                    enabled=new_enabled,
-                    execution_count=new_execution_count,
-                    was_disabled_reason=was_disabled_reason,
-                    cooldown_active=False,
-                    cooldown_remaining_hours=None,
-                    last_condition_fire=new_last_condition_fire,
-                )
+                if updates:
+                    cur.executemany(_FIRE_UPDATE_SQL, updates)
+                    cur.executemany(_EXECUTION_INSERT_SQL, executions)
 
-                logger.info(
-                    "[intent.service.fire] intent_id=%s status=%s next_check=%s enabled=%s exec_count=%d disabled_reason=%s",
-                    intent_id,
-                    request.status,
-                    new_next_check,
-                    new_enabled,
-                    new_execution_count,
-                    was_disabled_reason,
-                )
-
-                return IntentFireResult(success=True, response=response)
+            self._conn.commit()
 
         except Exception as e:
-            logger.error("[intent.service.fire] intent_id=%s error=%s", intent_id, e)
+            logger.error("[intent.service.fire_batch] count=%d error=%s", len(items), e)
             self._conn.rollback()
-            return IntentFireResult(success=False, errors=[f"Database error: {str(e)}"])
+            return IntentFireBatchResult(
+                success=False, errors=[f"Database error: {str(e)}"]
+            )
+
+        failed = sum(1 for result in results if not result.success)
+        logger.info(
+            "[intent.service.fire_batch] count=%d applied=%d failed=%d",
+            len(items),
+            len(updates),
+            failed,
+        )
+
+        return IntentFireBatchResult(
+            success=True,
+            response=IntentFireBatchResponse(
+                results=results, succeeded=len(results) - failed, failed=failed
+            ),
+        )
+
+    def _plan_fire(
+        self,
+        intent_id: UUID,
+        row: Dict[str, Any],
+        request: IntentFireRequest,
+        now: datetime,
+    ) -> tuple[IntentFireResponse, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Compute the state change for one fire report (Story 5.6).
+
+        Pure with respect to the database: returns the response plus the
+        parameters for _FIRE_UPDATE_SQL and _EXECUTION_INSERT_SQL, or ``None``
+        for both when the intent is in cooldown and nothing must be written.
+
+        Args:
+            intent_id: The intent UUID
+            row: The current scheduled_intents row
+            request: The fire request with execution results
+            now: Current timestamp (UTC)
+
+        Returns:
+            Tuple of (response, update_params, execution_params)
+        """
+        intent = self._row_to_response(row)
+
+        # Story 6.3: Check cooldown for condition-based triggers
+        trigger_condition = row.get("trigger_condition") or {}
+        cooldown_hours = trigger_condition.get("cooldown_hours", 24)
+        last_condition_fire = row.get("last_condition_fire")
+
+        is_in_cooldown, remaining_hours = self._check_cooldown(
+            intent.trigger_type, last_condition_fire, cooldown_hours, now
+        )
+
+        if is_in_cooldown:
+            logger.info(
+                "[intent.service.fire] intent_id=%s cooldown_active=true remaining_hours=%.2f",
+                intent_id,
+                remaining_hours,
+            )
+            response = IntentFireResponse(
+                intent_id=intent_id,
+                status="cooldown_active",
+                next_check=intent.next_check,
+                enabled=intent.enabled,
+                execution_count=intent.execution_count,
+                cooldown_active=True,
+                cooldown_remaining_hours=remaining_hours,
+                last_condition_fire=last_condition_fire,
+            )
+            return response, None, None
+
+        # Update execution state on success (AC3)
+        new_last_executed = intent.last_executed
+        new_execution_count = intent.execution_count
+        new_last_message_id = intent.last_message_id
+
+        # Story 6.3: Track last_condition_fire for condition-based triggers
+        new_last_condition_fire = last_condition_fire
+
+        if request.status == "success":
+            new_last_executed = now
+            new_execution_count = intent.execution_count + 1
+            new_last_message_id = request.message_id
+
+            # Update last_condition_fire for condition-based triggers on success
+            if intent.trigger_type in CONDITION_TRIGGER_TYPES:
+                new_last_condition_fire = now
+
+        # Calculate next_check based on trigger type and result (AC4)
+        trigger_schedule = None
+        if intent.trigger_schedule:
+            if isinstance(intent.trigger_schedule, dict):
+                trigger_schedule = TriggerSchedule(**intent.trigger_schedule)
+            else:
+                trigger_schedule = intent.trigger_schedule
+
+        new_next_check = self._calculate_next_check_after_fire(
+            intent.trigger_type, trigger_schedule, request.status, now
+        )
+
+        # Check auto-disable conditions (AC5)
+        new_enabled = intent.enabled
+        was_disabled_reason = None
+
+        # Disable one-time triggers after success
+        if intent.trigger_type == "once" and request.status == "success":
+            new_enabled = False
+            new_next_check = None
+            was_disabled_reason = "one-time trigger executed"
+
+        # Disable if max_executions reached
+        if (
+            intent.max_executions is not None
+            and new_execution_count >= intent.max_executions
+        ):
+            new_enabled = False
+            was_disabled_reason = f"max_executions ({intent.max_executions}) reached"
+
+        # Disable if expires_at passed
+        if intent.expires_at is not None and now >= intent.expires_at:
+            new_enabled = False
+            was_disabled_reason = "expires_at passed"
+
+        # Story 6.4: Disable fire_mode='once' condition triggers after success
+        if (
+            request.status == "success"
+            and intent.trigger_type in CONDITION_TRIGGER_TYPES
+            and trigger_condition.get("fire_mode") == "once"
+        ):
+            new_enabled = False
+            new_next_check = None
+            was_disabled_reason = "fire_mode_once"
+            logger.info(
+                "[intents.fire] fire_mode_once disabled intent_id=%s", intent_id
+            )
+
+        # Always update last_checked (AC2); clear the worker claim
+        update_params = {
+            "id": str(intent_id),
+            "last_checked": now,
+            "last_executed": new_last_executed,
+            "execution_count": new_execution_count,
+            "last_execution_status": request.status,
+            "last_execution_error": request.error_message,
+            "last_message_id": new_last_message_id,
+            "next_check": new_next_check,
+            "enabled": new_enabled,
+            "last_condition_fire": new_last_condition_fire,
+        }
+
+        # Log execution to intent_executions table (AC6)
+        execution_params = {
+            "intent_id": str(intent_id),
+            "user_id": intent.user_id,
+            "executed_at": now,
+            "trigger_type": intent.trigger_type,
+            "trigger_data": (
+                json.dumps(request.trigger_data) if request.trigger_data else None
+            ),
+            "status": request.status,
+            "gate_result": (
+                json.dumps(request.gate_result) if request.gate_result else None
+            ),
+            "message_id": request.message_id,
+            "message_preview": request.message_preview,
+            "evaluation_ms": request.evaluation_ms,
+            "generation_ms": request.generation_ms,
+            "delivery_ms": request.delivery_ms,
+            "error_message": request.error_message,
+        }
+
+        # Build response with cooldown fields (Story 6.3)
+        response = IntentFireResponse(
+            intent_id=intent_id,
+            status=request.status,
+            next_check=new_next_check,
+            enabled=new_enabled,
+            execution_count=new_execution_count,
+            was_disabled_reason=was_disabled_reason,
+            cooldown_active=False,
+            cooldown_remaining_hours=None,
+            last_condition_fire=new_last_condition_fire,
+        )
+
+        logger.info(
+            "[intent.service.fire] intent_id=%s status=%s next_check=%s enabled=%s exec_count=%d disabled_reason=%s",
+            intent_id,
+            request.status,
+            new_next_check,
+            new_enabled,
+            new_execution_count,
+            was_disabled_reason,
+        )
+
+        return response, update_params, execution_params
 
     def get_intent_history(
         self, intent_id: UUID, limit: int = 50, offset: int = 0
@@ -1155,7 +1440,7 @@ class IntentService:
             return now + timedelta(minutes=5)
 
         # Get timezone from schedule or use default
-        tz_str = "America/Los_Angeles"
+        tz_str = DEFAULT_TIMEZONE
         if trigger_schedule and trigger_schedule.timezone:
             tz_str = trigger_schedule.timezone
 
@@ -1163,13 +1448,9 @@ class IntentService:
         if status == "success":
             if trigger_type == "cron" and trigger_schedule and trigger_schedule.cron:
                 try:
-                    # Calculate next occurrence in user's timezone, then convert to UTC
-                    tz = ZoneInfo(tz_str)
-                    now_local = now.astimezone(tz)
-                    cron = croniter(trigger_schedule.cron, now_local)
-                    next_local = cron.get_next(datetime)
-                    # Convert to UTC for storage
-                    return next_local.astimezone(timezone.utc)
+                    # Next occurrence in user's timezone, returned in UTC for storage
+                    schedule = get_cron_schedule(trigger_schedule.cron, tz_str)
+                    return schedule.next_fire(now)
                 except Exception as e:
                     logger.warning(
                         "[intent.service.next_check_fire] cron_error=%s tz=%s",
@@ -1254,19 +1535,15 @@ class IntentService:
         now_utc = datetime.now(timezone.utc)
 
         # Get timezone from schedule or use default
-        tz_str = "America/Los_Angeles"
+        tz_str = DEFAULT_TIMEZONE
         if trigger_schedule and trigger_schedule.timezone:
             tz_str = trigger_schedule.timezone
 
         if trigger_type == "cron" and trigger_schedule and trigger_schedule.cron:
             try:
-                # Calculate next occurrence in user's timezone, then convert to UTC
-                tz = ZoneInfo(tz_str)
-                now_local = datetime.now(tz)
-                cron = croniter(trigger_schedule.cron, now_local)
-                next_local = cron.get_next(datetime)
-                # Convert to UTC for storage
-                return next_local.astimezone(timezone.utc)
+                # Next occurrence in user's timezone, returned in UTC for storage
+                schedule = get_cron_schedule(trigger_schedule.cron, tz_str)
+                return schedule.next_fire(now_utc)
             except Exception as e:
                 logger.warning(
                     "[intent.service.next_check] cron_error=%s tz=%s", e, tz_str
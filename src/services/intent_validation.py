@@ -21,9 +21,8 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import logging
 import re
 
-from croniter import croniter
-
 from src.schemas import ScheduledIntentCreate, TriggerSchedule, TriggerCondition
+from src.services.cron_schedule import get_cron_schedule
 
 if TYPE_CHECKING:
     from psycopg import Connection
@@ -34,6 +33,7 @@ logger = logging.getLogger("agentic_memories.intent_validation")
 MAX_TRIGGERS_PER_USER = 25
 CRON_MIN_INTERVAL_SECONDS = 60
 CRON_MAX_FIRES_PER_DAY = 96
+CRON_FIRE_COUNT_LIMIT = 2001  # Safety cap when counting daily fires
 INTERVAL_MIN_MINUTES = 5
 
 # Required fields mapping by trigger type
@@ -247,33 +247,26 @@ class IntentValidationService:
 
         try:
             base_time = datetime.now(timezone.utc)
-            cron = croniter(cron_expression, base_time)
+            schedule = get_cron_schedule(cron_expression, "UTC")
+
+            # AC3: Count occurrences in 24 hours (capped as a safety limit);
+            # the same pass yields the first two fires for AC2
+            end_time = base_time + timedelta(hours=24)
+            fires = schedule.next_fires(
+                base_time, CRON_FIRE_COUNT_LIMIT, until=end_time
+            )
+            fire_count = len(fires)
+            if fire_count < 2:
+                fires = schedule.next_fires(base_time, 2)
 
             # AC2: Calculate interval between first two occurrences
-            first = cron.get_next(datetime)
-            second = cron.get_next(datetime)
-            delta_seconds = (second - first).total_seconds()
+            delta_seconds = (fires[1] - fires[0]).total_seconds()
 
             if delta_seconds < CRON_MIN_INTERVAL_SECONDS:
                 errors.append(
                     f"Cron too frequent: every {int(delta_seconds)}s. Minimum: {CRON_MIN_INTERVAL_SECONDS}s"
                 )
 
-            # AC3: Count occurrences in 24 hours
-            # Reset iterator and count fires in a day
-            cron = croniter(cron_expression, base_time)
-            end_time = base_time + timedelta(hours=24)
-            fire_count = 0
-
-            while True:
-                next_fire = cron.get_next(datetime)
-                if next_fire > end_time:
-                    break
-                fire_count += 1
-                # Safety limit to prevent infinite loop
-                if fire_count > 2000:
-                    break
-
             if fire_count > CRON_MAX_FIRES_PER_DAY:
                 errors.append(
                     f"Cron would fire {fire_count}x/day. Max: {CRON_MAX_FIRES_PER_DAY}"
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 import json
 from typing import Any, Dict, List, Optional
 
+from src.dependencies.event_loop import run_sync
 from src.services.hybrid_retrieval import HybridRetrievalService, RetrievalQuery
-from src.services.retrieval import search_memories
+from src.services.retrieval import asearch_memories
 from src.services.persona_state import PersonaState, PersonaStateStore
 from src.services.summary_manager import SummaryManager
 
@@ -110,13 +112,61 @@ class PersonaRetrievalAgent:
         query: str,
         limit: int = 10,
         metadata_filters: Optional[Dict[str, Any]] = None,
+    ) -> PersonaRetrievalResult:
+        """Sync entry point; runs ``aretrieve`` on the shared event loop."""
+        return run_sync(
+            self.aretrieve(
+                user_id=user_id,
+                query=query,
+                limit=limit,
+                metadata_filters=metadata_filters,
+            )
+        )
+
+    async def aretrieve(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 10,
+        metadata_filters: Optional[Dict[str, Any]] = None,
     ) -> PersonaRetrievalResult:
         metadata_filters = metadata_filters or {}
+        target_tags, persona_requested = self._target_tags(metadata_filters)
+        hybrid_query = self._build_query(user_id, query, limit)
+
+        hybrid_results = self._shape_results(
+            await self.hybrid.aretrieve_memories(hybrid_query),
+            metadata_filters,
+            target_tags,
+            persona_requested,
+        )
+        formatted = self._format(hybrid_results)
+
+        if not formatted:
+            # Fall back to baseline search. Only enforce persona filtering when
+            # the caller explicitly requested it to preserve backwards
+            # compatibility with legacy memories that lack persona tags.
+            fallback, _ = await asearch_memories(
+                user_id=user_id,
+                query=query,
+                filters=self._fallback_filters(
+                    metadata_filters, target_tags, persona_requested
+                ),
+                limit=limit,
+                offset=0,
+            )
+            formatted = self._order_fallback(fallback, persona_requested)
+
+        return self._result(formatted, hybrid_results)
+
+    def _target_tags(self, metadata_filters: Dict[str, Any]) -> tuple:
         target_tags = _normalize_persona_tags(metadata_filters.get("persona_tags"))
         persona_requested = bool(target_tags)
         if persona_requested and self.persona not in target_tags:
             target_tags.append(self.persona)
+        return target_tags, persona_requested
 
+    def _build_query(self, user_id: str, query: str, limit: int) -> RetrievalQuery:
         hybrid_query = RetrievalQuery(
             user_id=user_id,
             query_text=query,
@@ -130,8 +180,15 @@ class PersonaRetrievalAgent:
             "importance": self.weight_profile.get("importance"),
             "emotional": self.weight_profile.get("emotional"),
         }
+        return hybrid_query
 
-        hybrid_results = self.hybrid.retrieve_memories(hybrid_query)
+    def _shape_results(
+        self,
+        hybrid_results: List[Any],
+        metadata_filters: Dict[str, Any],
+        target_tags: List[str],
+        persona_requested: bool,
+    ) -> List[Any]:
         if persona_requested:
             filtered_results = []
             for result in hybrid_results:
@@ -173,7 +230,11 @@ class PersonaRetrievalAgent:
                         if str(meta_value) == str(value):
                             filtered_results.append(result)
                 hybrid_results = filtered_results
-        formatted = [
+        return hybrid_results
+
+    @staticmethod
+    def _format(hybrid_results: List[Any]) -> List[Dict[str, Any]]:
+        return [
             {
                 "id": r.memory_id,
                 "content": r.content,
@@ -183,37 +244,39 @@ class PersonaRetrievalAgent:
             for r in hybrid_results
         ]
 
-        if not formatted:
-            # Fall back to baseline search. Only enforce persona filtering when
-            # the caller explicitly requested it to preserve backwards
-            # compatibility with legacy memories that lack persona tags.
-            search_filters = dict(metadata_filters or {})
-            if persona_requested:
-                search_filters["persona_tags"] = target_tags
-            else:
-                search_filters.pop("persona_tags", None)
-            fallback, _ = search_memories(
-                user_id=user_id,
-                query=query,
-                filters=search_filters,
-                limit=limit,
-                offset=0,
+    @staticmethod
+    def _fallback_filters(
+        metadata_filters: Dict[str, Any],
+        target_tags: List[str],
+        persona_requested: bool,
+    ) -> Dict[str, Any]:
+        search_filters = dict(metadata_filters or {})
+        if persona_requested:
+            search_filters["persona_tags"] = target_tags
+        else:
+            search_filters.pop("persona_tags", None)
+        return search_filters
+
+    def _order_fallback(
+        self, fallback: List[Dict[str, Any]], persona_requested: bool
+    ) -> List[Dict[str, Any]]:
+        if persona_requested:
+            return fallback
+        prioritized = []
+        remainder = []
+        for item in fallback:
+            tags = _normalize_persona_tags(
+                (item.get("metadata") or {}).get("persona_tags")
             )
-            if not persona_requested:
-                prioritized = []
-                remainder = []
-                for item in fallback:
-                    tags = _normalize_persona_tags(
-                        (item.get("metadata") or {}).get("persona_tags")
-                    )
-                    if self.persona in tags:
-                        prioritized.append(item)
-                    else:
-                        remainder.append(item)
-                formatted = prioritized + remainder
+            if self.persona in tags:
+                prioritized.append(item)
             else:
-                formatted = fallback
+                remainder.append(item)
+        return prioritized + remainder
 
+    def _result(
+        self, formatted: List[Dict[str, Any]], hybrid_results: List[Any]
+    ) -> PersonaRetrievalResult:
         return PersonaRetrievalResult(
             persona=self.persona,
             items=formatted,
@@ -259,30 +322,68 @@ class PersonaCoPilot:
         include_summaries: bool = False,
         granularity: Optional[str] = None,
     ) -> Dict[str, PersonaRetrievalResult]:
+        """Sync entry point; runs ``aretrieve`` on the shared event loop."""
+        return run_sync(
+            self.aretrieve(
+                user_id=user_id,
+                query=query,
+                limit=limit,
+                persona_context=persona_context,
+                metadata_filters=metadata_filters,
+                include_summaries=include_summaries,
+                granularity=granularity,
+            )
+        )
+
+    async def aretrieve(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 10,
+        persona_context: Optional[Dict[str, Any]] = None,
+        metadata_filters: Optional[Dict[str, Any]] = None,
+        include_summaries: bool = False,
+        granularity: Optional[str] = None,
+    ) -> Dict[str, PersonaRetrievalResult]:
+        """Retrieve for each active persona concurrently.
+
+        Persona state and summaries stay on their sync stores and run in a
+        worker thread.
+        """
         persona_context = persona_context or {}
         forced = persona_context.get("forced_persona")
         if persona_context.get("active_personas"):
-            self.state_store.update_state(
-                user_id, active_personas=list(persona_context["active_personas"])
+            await asyncio.to_thread(
+                self.state_store.update_state,
+                user_id,
+                active_personas=list(persona_context["active_personas"]),
             )
         if persona_context.get("mood"):
-            self.state_store.update_state(user_id, mood=persona_context["mood"])
+            await asyncio.to_thread(
+                self.state_store.update_state, user_id, mood=persona_context["mood"]
+            )
 
-        state = self.state_store.get_state(user_id)
+        state = await asyncio.to_thread(self.state_store.get_state, user_id)
         personas = self._resolve_personas(state, forced_persona=forced)
 
-        results: Dict[str, PersonaRetrievalResult] = {}
-        for persona in personas:
-            agent = self._get_agent(persona)
-            persona_result = agent.retrieve(
-                user_id=user_id,
-                query=query,
-                limit=limit,
-                metadata_filters=metadata_filters,
+        persona_results = await asyncio.gather(
+            *(
+                self._get_agent(persona).aretrieve(
+                    user_id=user_id,
+                    query=query,
+                    limit=limit,
+                    metadata_filters=metadata_filters,
+                )
+                for persona in personas
             )
+        )
+
+        results: Dict[str, PersonaRetrievalResult] = {}
+        for persona, persona_result in zip(personas, persona_results):
             if include_summaries:
                 tier = self.summary_manager.resolve_tier(granularity)
-                persona_result.summaries = self.summary_manager.get_summaries(
+                persona_result.summaries = await asyncio.to_thread(
+                    self.summary_manager.get_summaries,
                     user_id=user_id,
                     persona=persona,
                     tier=tier,
@@ -0,0 +1,299 @@
+"""
+Vectorized evaluation of price-condition intents against batched price ticks.
+
+Price intents carry either ``trigger_condition.ticker/operator/value`` or an
+``expression`` such as ``"NVDA < 130"``; the expression wins when both are set.
+Each condition is compiled once into a ``CompiledCondition`` with a ticker,
+an opcode and a threshold. The conditions are stored in columns sorted by
+ticker, so each ticker's intents form one contiguous slice. A tick batch
+gathers the slices of the tickers it quotes. It then evaluates every
+affected intent in one NumPy pass: the comparison is a truth-table lookup on
+``sign(price - threshold)``, followed by the cooldown check.
+
+The engine holds no market connection. Callers feed it ``{ticker: price}``
+batches from a live feed, a replay or a synthetic generator. They fire the
+matches, for example through POST /v1/intents/fire-batch, and then report
+the fires back with ``record_fires``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+
+logger = logging.getLogger("agentic_memories.price_conditions")
+
+OPERATORS = ("<", "<=", ">", ">=", "==", "!=")
+_OPCODES = {op: code for code, op in enumerate(OPERATORS)}
+
+# Rows: opcode; columns: sign(price - threshold) + 1 -> below, equal, above
+_TRUTH = np.array(
+    [
+        [True, False, False],  # <
+        [True, True, False],  # <=
+        [False, False, True],  # >
+        [False, True, True],  # >=
+        [False, True, False],  # ==
+        [True, False, True],  # !=
+    ]
+)
+
+_PRICE_EXPR = re.compile(
+    r"^\s*([A-Z]{1,5})\s*(<=|>=|==|!=|<|>)\s*([0-9]+(?:\.[0-9]+)?)\s*$"
+)
+
+_PRICE_INTENTS_SQL = """
+    SELECT id, user_id, trigger_condition, last_condition_fire
+    FROM scheduled_intents
+    WHERE enabled = true AND trigger_type = 'price'
+"""
+
+
+@dataclass(frozen=True)
+class CompiledCondition:
+    """A price condition reduced to ``price <op> threshold`` for one ticker."""
+
+    ticker: str
+    opcode: int
+    threshold: float
+
+    @property
+    def operator(self) -> str:
+        return OPERATORS[self.opcode]
+
+
+@dataclass
+class ConditionMatch:
+    """A price intent whose condition holds for a tick and is out of cooldown."""
+
+    intent_id: str
+    user_id: str
+    ticker: str
+    price: float
+    operator: str
+    threshold: float
+
+
+@dataclass
+class _PriceIntent:
+    intent_id: str
+    user_id: str
+    condition: CompiledCondition
+    cooldown_hours: float
+    last_fire: float  # epoch seconds, NaN if never fired
+    fire_once: bool
+
+
+def compile_condition(trigger_condition: Mapping[str, Any]) -> CompiledCondition:
+    """Compile a price trigger_condition; raises ValueError if it is not one."""
+    expression = trigger_condition.get("expression")
+    if expression:
+        match = _PRICE_EXPR.match(expression)
+        if match is None:
+            raise ValueError(f"Unsupported price expression: {expression!r}")
+        ticker, operator, value = match.groups()
+    else:
+        ticker = trigger_condition.get("ticker")
+        operator = trigger_condition.get("operator")
+        value = trigger_condition.get("value")
+        if not ticker or operator not in _OPCODES or value is None:
+            raise ValueError(
+                "Price condition needs an expression or ticker/operator/value"
+            )
+    threshold = float(value)
+    if not math.isfinite(threshold):
+        raise ValueError(f"Price threshold must be finite: {value!r}")
+    return CompiledCondition(
+        ticker=ticker.upper(), opcode=_OPCODES[operator], threshold=threshold
+    )
+
+
+def _epoch(value: Optional[datetime]) -> float:
+    if value is None:
+        return math.nan
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class PriceConditionEngine:
+    """In-memory index of price intents evaluated in batches of ticks.
+
+    Usage:
+        engine = load_price_intents(conn)
+        matches = engine.evaluate({"NVDA": 128.4, "AAPL": 201.0})
+        # ... fire matches ...
+        engine.record_fires([m.intent_id for m in matches])
+    """
+
+    def __init__(self) -> None:
+        self._intents: Dict[str, _PriceIntent] = {}
+        self._dirty = True
+        self._slices: Dict[str, Tuple[int, int]] = {}
+        self._positions: Dict[str, int] = {}
+        self._records: List[_PriceIntent] = []
+        self._opcodes = np.empty(0, dtype=np.int8)
+        self._thresholds = np.empty(0)
+        self._cooldown_hours = np.empty(0)
+        self._last_fire = np.empty(0)
+
+    def __len__(self) -> int:
+        return len(self._intents)
+
+    def __contains__(self, intent_id: str) -> bool:
+        return str(intent_id) in self._intents
+
+    def add(
+        self,
+        intent_id: Any,
+        user_id: str,
+        trigger_condition: Mapping[str, Any],
+        last_condition_fire: Optional[datetime] = None,
+    ) -> bool:
+        """Compile and index one price intent; False if its condition is unsupported."""
+        try:
+            condition = compile_condition(trigger_condition)
+        except (TypeError, ValueError) as exc:
+            logger.warning(
+                "[price_conditions.compile] intent_id=%s skipped: %s", intent_id, exc
+            )
+            return False
+        self._intents[str(intent_id)] = _PriceIntent(
+            intent_id=str(intent_id),
+            user_id=user_id,
+            condition=condition,
+            cooldown_hours=float(trigger_condition.get("cooldown_hours", 24)),
+            last_fire=_epoch(last_condition_fire),
+            fire_once=trigger_condition.get("fire_mode") == "once",
+        )
+        self._dirty = True
+        return True
+
+    def remove(self, intent_id: Any) -> None:
+        if self._intents.pop(str(intent_id), None) is not None:
+            self._dirty = True
+
+    def load(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Index scheduled_intents rows; returns how many compiled."""
+        return sum(
+            self.add(
+                row["id"],
+                row["user_id"],
+                row.get("trigger_condition") or {},
+                row.get("last_condition_fire"),
+            )
+            for row in rows
+        )
+
+    def record_fires(
+        self, intent_ids: Iterable[Any], when: Optional[datetime] = None
+    ) -> None:
+        """Start cooldowns for fired intents; fire_mode='once' intents are dropped."""
+        ts = _epoch(when or datetime.now(timezone.utc))
+        for intent_id in intent_ids:
+            intent = self._intents.get(str(intent_id))
+            if intent is None:
+                continue
+            if intent.fire_once:
+                self.remove(intent.intent_id)
+                continue
+            intent.last_fire = ts
+            if not self._dirty:
+                self._last_fire[self._positions[intent.intent_id]] = ts
+
+    def evaluate(
+        self, prices: Mapping[str, float], now: Optional[datetime] = None
+    ) -> List[ConditionMatch]:
+        """Every intent whose condition holds for ``prices`` and is out of cooldown."""
+        if self._dirty:
+            self._build()
+        spans: List[Tuple[int, int]] = []
+        quotes: List[float] = []
+        for ticker, price in prices.items():
+            span = self._slices.get(ticker)
+            if span is None or price is None or not math.isfinite(price):
+                continue
+            spans.append(span)
+            quotes.append(price)
+        if not spans:
+            return []
+
+        # Gather the quoted slices without a Python-level concatenate
+        bounds = np.asarray(spans, dtype=np.int64)
+        counts = bounds[:, 1] - bounds[:, 0]
+        shift = bounds[:, 0] - (np.cumsum(counts) - counts)
+        selected = np.arange(int(counts.sum())) + np.repeat(shift, counts)
+        price = np.repeat(np.asarray(quotes, dtype=float), counts)
+
+        sign = np.sign(price - self._thresholds[selected]).astype(np.int8) + 1
+        hit = _TRUTH[self._opcodes[selected], sign]
+
+        # Vectorized IntentService._check_cooldown; never-fired (NaN) is not cooling
+        now_ts = _epoch(now or datetime.now(timezone.utc))
+        hours_since = (now_ts - self._last_fire[selected]) / 3600
+        hit &= ~(hours_since < self._cooldown_hours[selected])
+
+        matches = []
+        for pos, quote in zip(selected[hit].tolist(), price[hit].tolist()):
+            intent = self._records[pos]
+            matches.append(
+                ConditionMatch(
+                    intent_id=intent.intent_id,
+                    user_id=intent.user_id,
+                    ticker=intent.condition.ticker,
+                    price=quote,
+                    operator=intent.condition.operator,
+                    threshold=intent.condition.threshold,
+                )
+            )
+        return matches
+
+    def _build(self) -> None:
+        intents = sorted(self._intents.values(), key=lambda it: it.condition.ticker)
+        n = len(intents)
+        self._records = intents
+        self._opcodes = np.fromiter(
+            (it.condition.opcode for it in intents), dtype=np.int8, count=n
+        )
+        self._thresholds = np.fromiter(
+            (it.condition.threshold for it in intents), dtype=float, count=n
+        )
+        self._cooldown_hours = np.fromiter(
+            (it.cooldown_hours for it in intents), dtype=float, count=n
+        )
+        self._last_fire = np.fromiter(
+            (it.last_fire for it in intents), dtype=float, count=n
+        )
+        self._positions = {it.intent_id: pos for pos, it in enumerate(intents)}
+        self._slices = {}
+        start = 0
+        for pos in range(1, n + 1):
+            if (
+                pos == n
+                or intents[pos].condition.ticker != intents[start].condition.ticker
+            ):
+                self._slices[intents[start].condition.ticker] = (start, pos)
+                start = pos
+        self._dirty = False
+
+
+def load_price_intents(
+    conn, engine: Optional[PriceConditionEngine] = None
+) -> PriceConditionEngine:
+    """Build (or refill) an engine from every enabled price intent."""
+    engine = engine if engine is not None else PriceConditionEngine()
+    with conn.cursor() as cur:
+        cur.execute(_PRICE_INTENTS_SQL)
+        rows = cur.fetchall()
+    # Commit read-only transaction before the caller releases the connection
+    conn.commit()
+    loaded = engine.load(rows)
+    logger.info("[price_conditions.load] rows=%d compiled=%d", len(rows), loaded)
+    return engine
@@ -80,6 +80,7 @@ class ProceduralMemoryService:
         prerequisites: Optional[List[str]] = None,
         context: Optional[str] = None,
         tags: Optional[List[str]] = None,
+        embedding: Optional[List[float]] = None,
     ) -> str:
         """
         Learn a new skill or update existing skill
@@ -92,6 +93,8 @@ class ProceduralMemoryService:
             prerequisites: Optional list of prerequisite skills
             context: Optional context for the skill
             tags: Optional tags for categorization
+            embedding: Optional precomputed vector for the skill; when omitted
+                the searchable text is embedded here
 
         Returns:
             str: Skill ID
@@ -118,7 +121,7 @@ class ProceduralMemoryService:
         self._store_procedural_memory(memory)
 
         # Store in ChromaDB for semantic search
-        self._store_in_chroma(memory)
+        self._store_in_chroma(memory, embedding)
 
         # Record initial progression (now with explicit parameters)
         self._record_skill_progression(
@@ -222,7 +225,9 @@ class ProceduralMemoryService:
             if conn:
                 release_timescale_conn(conn)
 
-    def _store_in_chroma(self, memory: ProceduralMemory) -> None:
+    def _store_in_chroma(
+        self, memory: ProceduralMemory, embedding: Optional[List[float]] = None
+    ) -> None:
         """Store procedural memory in ChromaDB for semantic search"""
         if not self.chroma_client:
             return
@@ -233,10 +238,13 @@ class ProceduralMemoryService:
                 f"{memory.skill_name} {' '.join(memory.steps)} {memory.context or ''}"
             )
 
-            # Get embeddings
-            from src.services.embedding_utils import get_embeddings
+            # Get embeddings (reuse the caller's vector when available)
+            if embedding:
+                embeddings = [embedding]
+            else:
+                from src.services.embedding_utils import get_embeddings
 
-            embeddings = get_embeddings([search_text])
+                embeddings = get_embeddings([search_text])
             if not embeddings:
                 return
 
@@ -398,6 +406,103 @@ class ProceduralMemoryService:
             if conn:
                 release_timescale_conn(conn)
 
+    def practice_skills_bulk(self, user_id: str, sessions: List[Dict[str, Any]]) -> int:
+        """
+        Record a batch of practice sessions with a constant number of round trips
+
+        Each session takes the keyword arguments of ``practice_skill``
+        (skill_name and optional session_duration, success_rate, notes). Skill
+        updates, the proficiency lookup and progression inserts share one
+        transaction on one connection; updates apply in order, so repeated
+        sessions for a skill average exactly as sequential calls would.
+
+        Returns:
+            int: Number of sessions recorded (0 if the batch failed)
+        """
+        if not sessions:
+            return 0
+        conn = get_timescale_conn()
+        if not conn:
+            return 0
+
+        try:
+            import json
+
+            timestamp = datetime.now(timezone.utc)
+            metadata = {"recorded_at": timestamp.isoformat()}
+            with conn.cursor() as cur:
+                cur.executemany(
+                    """
+                    UPDATE procedural_memories SET
+                        last_practiced = %s,
+                        practice_count = practice_count + 1,
+                        success_rate = CASE
+                            WHEN success_rate IS NULL THEN %s
+                            ELSE (success_rate + %s) / 2
+                        END
+                    WHERE user_id = %s AND skill_name = %s
+                """,
+                    [
+                        (
+                            timestamp,
+                            s.get("success_rate"),
+                            s.get("success_rate"),
+                            user_id,
+                            s["skill_name"],
+                        )
+                        for s in sessions
+                    ],
+                )
+
+                cur.execute(
+                    """
+                    SELECT skill_name, proficiency_level FROM procedural_memories
+                    WHERE user_id = %s AND skill_name = ANY(%s)
+                """,
+                    (user_id, list({s["skill_name"] for s in sessions})),
+                )
+                levels = {
+                    row["skill_name"]: row["proficiency_level"]
+                    for row in cur.fetchall()
+                }
+
+                cur.executemany(
+                    """
+                    INSERT INTO skill_progressions (
+                        id, user_id, skill_name, timestamp, proficiency_level,
+                        practice_session_duration, success_rate, notes, metadata
+                    ) VALUES (
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s
+                    )
+                """,
+                    [
+                        (
+                            str(uuid.uuid4()),
+                            user_id,
+                            s["skill_name"],
+                            timestamp,
+                            levels.get(s["skill_name"]) or "beginner",
+                            s.get("session_duration"),
+                            s.get("success_rate"),
+                            s.get("notes"),
+                            json.dumps(metadata),
+                        )
+                        for s in sessions
+                    ],
+                )
+
+            conn.commit()
+            return len(sessions)
+
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            print(f"Error practicing skills in bulk: {e}")
+            return 0
+        finally:
+            if conn:
+                release_timescale_conn(conn)
+
     def _get_current_proficiency(self, user_id: str, skill_name: str) -> str:
         """Get current proficiency level for a skill"""
         conn = get_timescale_conn()
@@ -1,20 +1,33 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
+import contextvars
 import hashlib
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 import logging
 from src.dependencies.chroma import get_chroma_client
-from src.dependencies.redis_client import get_redis_client
-from src.config import get_embedding_model_name
-from src.services.embedding_utils import generate_embedding
+from src.dependencies.event_loop import run_sync
+from src.dependencies.redis_client import get_async_redis_client
+from src.config import get_embedding_dimension, get_embedding_model_name
+from src.services.embedding_utils import (
+    agenerate_embedding,
+    generate_embedding,
+    get_observed_dimension,
+)
 
 
 COLLECTION_NAME = "memories"
 logger = logging.getLogger("agentic_memories.retrieval")
 
+# Rows per Chroma ``get`` when scanning a user's memories.
+SCAN_PAGE_SIZE = 500
+_SCAN_FIELDS = ("documents", "metadatas", "embeddings")
+
 
 def _embedding_dim_from_model(model: str) -> int:
     name = (model or "").lower()
@@ -26,17 +39,65 @@ def _embedding_dim_from_model(model: str) -> int:
     return 3072
 
 
+# Resolved once per process; see _resolve_embedding_dim().
+_embedding_dim: Optional[int] = None
+_embedding_dim_confirmed = False
+_embedding_dim_lock = threading.Lock()
+
+
+def _resolve_embedding_dim() -> int:
+    """Return the embedding dimension used to pick the collection name.
+
+    Resolution order: EMBEDDING_DIMENSION from config (confirmed lazily against
+    the first real embedding), then a single probe embedding, then the model
+    name heuristic. The result is cached for the life of the process.
+    """
+    global _embedding_dim, _embedding_dim_confirmed
+    if _embedding_dim is not None and _embedding_dim_confirmed:
+        return _embedding_dim
+
+    with _embedding_dim_lock:
+        if _embedding_dim is None:
+            configured = get_embedding_dimension()
+            if configured:
+                _embedding_dim = configured
+            else:
+                try:
+                    probe = generate_embedding("dimension-probe") or []
+                    dim = len(probe)
+                except Exception:
+                    dim = 0
+                if dim > 0:
+                    _embedding_dim, _embedding_dim_confirmed = dim, True
+                else:
+                    _embedding_dim = _embedding_dim_from_model(
+                        get_embedding_model_name()
+                    )
+
+        if not _embedding_dim_confirmed:
+            observed = get_observed_dimension()
+            if observed:
+                if observed != _embedding_dim:
+                    logger.warning(
+                        "[retrieval.dimension.mismatch] assumed=%s observed=%s",
+                        _embedding_dim,
+                        observed,
+                    )
+                _embedding_dim, _embedding_dim_confirmed = observed, True
+
+        return _embedding_dim
+
+
+def _reset_embedding_dim() -> None:
+    """Forget the resolved dimension (used by tests and model switches)."""
+    global _embedding_dim, _embedding_dim_confirmed
+    with _embedding_dim_lock:
+        _embedding_dim, _embedding_dim_confirmed = None, False
+
+
 def _standard_collection_name() -> str:
-    # Prefer actual embedding dimension to align with storage collections
-    try:
-        probe = generate_embedding("dimension-probe") or []
-        dim = len(probe)
-    except Exception:
-        dim = 0
-    if dim <= 0:
-        model = get_embedding_model_name()
-        dim = _embedding_dim_from_model(model)
-    return f"{COLLECTION_NAME}_{dim}"
+    # Dimension is resolved once; no embedding round trip per call
+    return f"{COLLECTION_NAME}_{_resolve_embedding_dim()}"
 
 
 def _get_collection() -> Any:
@@ -44,11 +105,112 @@ def _get_collection() -> Any:
     if client is None:
         raise RuntimeError("Chroma client not available")
 
-    # Ensure Chroma is healthy before making requests
-    if not client.health_check():
-        raise RuntimeError("Chroma database is not available or not ready")
+    # Handles are cached by the client's collection registry, so this is only a
+    # network call the first time (or after the collection disappears).
+    try:
+        return client.get_collection(_standard_collection_name())  # type: ignore[attr-defined]
+    except Exception as exc:
+        raise RuntimeError(f"Chroma collection unavailable: {exc}") from exc
+
+
+async def _aget_collection() -> Any:
+    """Async twin of ``_get_collection``."""
+    client = get_chroma_client()
+    if client is None:
+        raise RuntimeError("Chroma client not available")
+
+    try:
+        return await client.aget_collection(_standard_collection_name())  # type: ignore[attr-defined]
+    except Exception as exc:
+        raise RuntimeError(f"Chroma collection unavailable: {exc}") from exc
+
+
+@dataclass
+class MemoryPage:
+    """One page of a memory scan.
+
+    Field lists are aligned with ``ids``; a field that was not requested is None.
+    """
+
+    ids: List[str]
+    documents: Optional[List[str]] = None
+    metadatas: Optional[List[Dict[str, Any]]] = None
+    embeddings: Optional[List[Any]] = None
+
+
+def _memory_page(res: Dict[str, Any], include: Sequence[str]) -> MemoryPage:
+    ids = list(res.get("ids") or [])
+
+    def column(name: str, empty: Optional[type] = None) -> Optional[List[Any]]:
+        if name not in include:
+            return None
+        values = res.get(name)
+        values = [] if values is None else list(values[: len(ids)])
+        values += [None] * (len(ids) - len(values))
+        return values if empty is None else [v or empty() for v in values]
+
+    return MemoryPage(
+        ids=ids,
+        documents=column("documents", str),
+        metadatas=column("metadatas", dict),
+        embeddings=column("embeddings"),
+    )
+
+
+def iter_user_memories(
+    user_id: str,
+    page_size: int = SCAN_PAGE_SIZE,
+    include: Sequence[str] = ("documents", "metadatas"),
+    limit: Optional[int] = None,
+    where: Optional[Dict[str, Any]] = None,
+    col: Optional[Any] = None,
+) -> Iterator[MemoryPage]:
+    """Stream a user's memories page by page via ``collection.get``.
+
+    ``include`` projects the fields to fetch (any of documents, metadatas,
+    embeddings), so callers only pay for what they read. While the caller works
+    on one page the next is fetched on a background thread; at most two pages
+    are held at a time. ``where`` overrides the default ``{"user_id": ...}``
+    filter and ``limit`` caps the total rows scanned.
+    """
+    fields = list(dict.fromkeys(include))
+    unknown = [f for f in fields if f not in _SCAN_FIELDS]
+    if unknown:
+        raise ValueError(f"Unsupported include fields: {unknown}")
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    col = col if col is not None else _get_collection()
+    where = where if where is not None else {"user_id": user_id}
 
-    return client.get_collection(_standard_collection_name())  # type: ignore[attr-defined]
+    def page_at(offset: int) -> int:
+        return page_size if limit is None else max(0, min(page_size, limit - offset))
+
+    def fetch(offset: int, size: int) -> Dict[str, Any]:
+        return col.get(where=where, limit=size, offset=offset, include=fields)  # type: ignore[attr-defined]
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="memory-scan")
+    try:
+        offset, size = 0, page_at(0)
+        pending = (
+            pool.submit(contextvars.copy_context().run, fetch, offset, size)
+            if size
+            else None
+        )
+        while pending is not None:
+            page = _memory_page(pending.result(), fields)
+            pending = None
+            offset += size
+            if len(page.ids) >= size:
+                size = page_at(offset)
+                if size:
+                    pending = pool.submit(
+                        contextvars.copy_context().run, fetch, offset, size
+                    )
+            if page.ids:
+                yield page
+    finally:
+        # An abandoned scan must not wait for (or keep) its prefetched page
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 def _hash_query(query: str) -> str:
@@ -67,53 +229,7 @@ def _hybrid_score(semantic: float, keyword: float) -> float:
     return 0.8 * semantic + 0.2 * keyword
 
 
-def search_memories(
-    user_id: str,
-    query: str,
-    filters: Optional[Dict[str, Any]] = None,
-    limit: int = 10,
-    offset: int = 0,
-) -> Tuple[List[Dict[str, Any]], int]:
-    filters = filters or {}
-    redis = get_redis_client()
-    use_cache = redis is not None and (filters.get("layer") == "short-term")
-    logger.info(
-        "[retrieve] user_id=%s query_len=%s filters=%s limit=%s offset=%s use_cache=%s",
-        user_id,
-        len(query or ""),
-        list(filters.keys()),
-        limit,
-        offset,
-        use_cache,
-    )
-
-    cache_key = None
-    if use_cache:
-        ns = redis.get(f"mem:ns:{user_id}") or "0"
-        cache_key = f"mem:srch:{user_id}:{_hash_query(query)}:v{ns}"
-        cached = redis.get(cache_key)
-        if cached:
-            data = json.loads(cached)
-            logger.info(
-                "[retrieve.cache.hit] user_id=%s key=%s count=%s",
-                user_id,
-                cache_key,
-                len(data.get("results", [])),
-            )
-            return data["results"], data.get("total", len(data["results"]))
-
-    try:
-        collection = _get_collection()
-        logger.info(
-            "[retrieve.chroma] collection=%s where_keys=%s",
-            getattr(collection, "name", "?"),
-            [],
-        )
-    except RuntimeError as e:
-        # Chroma is not available, return empty results
-        logger.warning("Chroma not available: %s", e)
-        return [], 0
-
+def _build_where(user_id: str, filters: Dict[str, Any]) -> Dict[str, Any]:
     # Basic metadata filter
     where: Dict[str, Any] = {"user_id": user_id}
     if "layer" in filters and filters["layer"]:
@@ -124,27 +240,63 @@ def search_memories(
     # Note: ChromaDB v2 may not support $contains, so we'll skip tags filtering for now
     # if "tags" in filters and filters["tags"]:
     #     where["tags"] = {"$contains": json.dumps(filters["tags"])[:256]}
+    return where
+
+
+def _unpack_get(results: Dict[str, Any]) -> Tuple[list, list, list, list]:
+    ids = results.get("ids", [])
+    return (
+        ids,
+        results.get("documents", []),
+        results.get("metadatas", []),
+        [0.0] * len(ids),
+    )
+
+
+def _unpack_query(results: Dict[str, Any]) -> Tuple[list, list, list, list]:
+    return (
+        results.get("ids", [[]])[0],
+        results.get("documents", [[]])[0],
+        results.get("metadatas", [[]])[0],
+        results.get("distances", [[]])[0],
+    )
+
+
+def decode_metadata(meta: Any) -> Dict[str, Any]:
+    """Decode the JSON-string metadata fields Chroma stores flattened."""
+    meta = meta or {}
+    if not isinstance(meta, dict):
+        return {"raw": meta}
+    persona_raw = meta.get("persona_tags")
+    if isinstance(persona_raw, str):
+        try:
+            meta["persona_tags"] = json.loads(persona_raw)
+        except Exception:
+            meta["persona_tags"] = []
+    emotional_raw = meta.get("emotional_signature")
+    if isinstance(emotional_raw, str):
+        try:
+            meta["emotional_signature"] = json.loads(emotional_raw)
+        except Exception:
+            meta["emotional_signature"] = {}
+    if "importance" in meta:
+        try:
+            meta["importance"] = float(meta["importance"])
+        except Exception:
+            meta["importance"] = 0.0
+    return meta
 
-    if not query or query.strip() == "":
-        # Metadata-only fetch via v2 get
-        semantic_results = collection.get(
-            where=where, limit=limit + offset, offset=offset
-        )  # type: ignore[attr-defined]
-        ids = semantic_results.get("ids", [])
-        docs = semantic_results.get("documents", [])
-        metas = semantic_results.get("metadatas", [])
-        scores = [0.0] * len(ids)
-    else:
-        # Semantic query
-        emb = generate_embedding(query) or []
-        semantic_results = collection.query(  # type: ignore[attr-defined]
-            query_embeddings=[emb], n_results=limit + offset, where=where
-        )
-        ids = semantic_results.get("ids", [[]])[0]
-        docs = semantic_results.get("documents", [[]])[0]
-        scores = semantic_results.get("distances", [[]])[0]
-        metas = semantic_results.get("metadatas", [[]])[0]
 
+def _rank_page(
+    user_id: str,
+    query: str,
+    filters: Dict[str, Any],
+    hits: Tuple[list, list, list, list],
+    limit: int,
+    offset: int,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Score, persona-filter and paginate raw Chroma hits."""
+    ids, docs, metas, scores = hits
     items: List[Dict[str, Any]] = []
     for i, mem_id in enumerate(ids):
         if i >= len(docs) or i >= len(metas) or i >= len(scores):
@@ -152,27 +304,7 @@ def search_memories(
         semantic_sim = 1.0 - float(scores[i]) if scores else 0.0
         k_score = _keyword_score(query, docs[i])
         final = _hybrid_score(semantic_sim, k_score)
-        meta = metas[i] or {}
-        if not isinstance(meta, dict):
-            meta = {"raw": meta}
-        if isinstance(meta, dict):
-            persona_raw = meta.get("persona_tags")
-            if isinstance(persona_raw, str):
-                try:
-                    meta["persona_tags"] = json.loads(persona_raw)
-                except Exception:
-                    meta["persona_tags"] = []
-            emotional_raw = meta.get("emotional_signature")
-            if isinstance(emotional_raw, str):
-                try:
-                    meta["emotional_signature"] = json.loads(emotional_raw)
-                except Exception:
-                    meta["emotional_signature"] = {}
-            if "importance" in meta:
-                try:
-                    meta["importance"] = float(meta["importance"])
-                except Exception:
-                    meta["importance"] = 0.0
+        meta = decode_metadata(metas[i])
         item = {
             "id": mem_id,
             "content": docs[i],
@@ -206,10 +338,95 @@ def search_memories(
     logger.info(
         "[retrieve.results] user_id=%s returned=%s total=%s", user_id, len(page), total
     )
+    return page, total
+
+
+def _log_search(
+    user_id: str,
+    query: str,
+    filters: Dict[str, Any],
+    limit: int,
+    offset: int,
+    use_cache: bool,
+) -> None:
+    logger.info(
+        "[retrieve] user_id=%s query_len=%s filters=%s limit=%s offset=%s use_cache=%s",
+        user_id,
+        len(query or ""),
+        list(filters.keys()),
+        limit,
+        offset,
+        use_cache,
+    )
+
+
+def search_memories(
+    user_id: str,
+    query: str,
+    filters: Optional[Dict[str, Any]] = None,
+    limit: int = 10,
+    offset: int = 0,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Sync entry point; runs ``asearch_memories`` on the shared event loop."""
+    return run_sync(
+        asearch_memories(user_id, query, filters=filters, limit=limit, offset=offset)
+    )
+
+
+async def asearch_memories(
+    user_id: str,
+    query: str,
+    filters: Optional[Dict[str, Any]] = None,
+    limit: int = 10,
+    offset: int = 0,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Search a user's memories (asyncio Redis, AsyncOpenAI, async Chroma).
+
+    Short-term layer searches are cached in Redis for 180 seconds.
+    """
+    filters = filters or {}
+    redis = get_async_redis_client()
+    use_cache = redis is not None and (filters.get("layer") == "short-term")
+    _log_search(user_id, query, filters, limit, offset, use_cache)
+
+    cache_key = None
+    if use_cache:
+        ns = await redis.get(f"mem:ns:{user_id}") or "0"
+        cache_key = f"mem:srch:{user_id}:{_hash_query(query)}:v{ns}"
+        cached = await redis.get(cache_key)
+        if cached:
+            data = json.loads(cached)
+            logger.info(
+                "[retrieve.cache.hit] user_id=%s key=%s count=%s",
+                user_id,
+                cache_key,
+                len(data.get("results", [])),
+            )
+            return data["results"], data.get("total", len(data["results"]))
+
+    try:
+        collection = await _aget_collection()
+    except RuntimeError as e:
+        logger.warning("Chroma not available: %s", e)
+        return [], 0
+
+    where = _build_where(user_id, filters)
+    if not query or query.strip() == "":
+        hits = _unpack_get(
+            await collection.aget(where=where, limit=limit + offset, offset=offset)
+        )
+    else:
+        emb = await agenerate_embedding(query) or []
+        hits = _unpack_query(
+            await collection.aquery(
+                query_embeddings=[emb], n_results=limit + offset, where=where
+            )
+        )
+
+    page, total = _rank_page(user_id, query, filters, hits, limit, offset)
 
-    # Cache short-term
     if use_cache and cache_key and redis is not None:
-        redis.setex(cache_key, 180, json.dumps({"results": page, "total": total}))
+        await redis.setex(cache_key, 180, json.dumps({"results": page, "total": total}))
         logger.info(
             "[retrieve.cache.store] user_id=%s key=%s count=%s ttl=%s",
             user_id,
@@ -43,6 +43,8 @@ def _build_metadata(memory: Memory) -> Dict[str, Any]:
         "usage_count": memory.usage_count,
         "importance": memory.importance,
         "content_hash": content_hash,
+        # Write time (epoch seconds); compaction watermarks filter on it.
+        "stored_at": int(time.time()),
         "persona_tags": json.dumps(memory.persona_tags or []),
         "tags": json.dumps(memory.metadata.get("tags", [])),  # Serialize list to string
     }
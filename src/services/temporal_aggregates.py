@@ -0,0 +1,129 @@
+"""
+Pre-aggregated emotional trajectories and episodic timelines.
+
+Reads the TimescaleDB continuous aggregates created by
+``migrations/timescaledb/005_continuous_aggregates`` (``emotional_hourly``,
+``emotional_daily`` and ``episodic_daily``), so long-range queries touch one
+row per user per bucket instead of every raw hypertable row. The aggregates
+are real-time (``materialized_only = false``), so the newest, not yet
+materialized buckets are still included.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from psycopg import Connection
+
+from src.dependencies.timescale import get_timescale_conn, release_timescale_conn
+
+
+logger = logging.getLogger("agentic_memories.temporal_aggregates")
+
+EMOTIONAL_BUCKET_VIEWS = {"hour": "emotional_hourly", "day": "emotional_daily"}
+
+# Continuous aggregates built on each hypertable
+AGGREGATE_VIEWS = {
+    "episodic_memories": ("episodic_daily",),
+    "emotional_memories": ("emotional_hourly", "emotional_daily"),
+}
+
+_EMOTIONAL_TRAJECTORY_SQL = """
+    SELECT bucket, state_count, avg_valence, min_valence, max_valence,
+           avg_arousal, avg_intensity, max_intensity
+    FROM {view}
+    WHERE user_id = %s AND bucket >= time_bucket(INTERVAL '1 {bucket}', %s::timestamptz)
+      AND bucket <= %s
+    ORDER BY bucket
+"""
+
+_EPISODIC_TIMELINE_SQL = """
+    SELECT bucket, event_count, avg_importance, max_importance,
+           avg_valence, avg_arousal
+    FROM episodic_daily
+    WHERE user_id = %s AND bucket >= time_bucket(INTERVAL '1 day', %s::timestamptz)
+      AND bucket <= %s
+    ORDER BY bucket
+"""
+
+
+def _fetch_buckets(name: str, sql: str, params: tuple) -> List[Dict[str, Any]]:
+    conn = get_timescale_conn()
+    if not conn:
+        logger.warning("[aggregates.%s] no TimescaleDB connection", name)
+        return []
+
+    try:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            rows = [dict(row) for row in cur.fetchall()]
+        # Commit read-only transaction before releasing
+        conn.commit()
+        return rows
+    except Exception as exc:
+        conn.rollback()
+        logger.error("[aggregates.%s.error] %s", name, exc)
+        return []
+    finally:
+        release_timescale_conn(conn)
+
+
+def get_emotional_trajectory(
+    user_id: str, start: datetime, end: datetime, bucket: str = "day"
+) -> List[Dict[str, Any]]:
+    """Hourly or daily valence/arousal/intensity buckets for ``[start, end]``, oldest first."""
+    view = EMOTIONAL_BUCKET_VIEWS.get(bucket)
+    if view is None:
+        raise ValueError(f"bucket must be one of {sorted(EMOTIONAL_BUCKET_VIEWS)}")
+    return _fetch_buckets(
+        "emotional_trajectory",
+        _EMOTIONAL_TRAJECTORY_SQL.format(view=view, bucket=bucket),
+        (user_id, start, end),
+    )
+
+
+def get_episodic_timeline(
+    user_id: str, start: datetime, end: datetime
+) -> List[Dict[str, Any]]:
+    """Daily episodic counts and importance stats for ``[start, end]``, oldest first."""
+    return _fetch_buckets(
+        "episodic_timeline", _EPISODIC_TIMELINE_SQL, (user_id, start, end)
+    )
+
+
+def refresh_aggregates(
+    conn: Connection, table: str, start: Optional[datetime], end: Optional[datetime]
+) -> None:
+    """Re-materialize ``table``'s continuous aggregates over ``[start, end]``.
+
+    The window is widened to whole days, since a refresh only rewrites buckets
+    that lie entirely inside it. ``refresh_continuous_aggregate`` cannot run in
+    a transaction, so ``conn`` must have no open transaction; it is switched to
+    autocommit for the calls and back afterwards. Failures are logged, not
+    raised: the deletes have already committed and a later refresh heals them.
+    """
+    if start is None or end is None:
+        return
+    day = timedelta(days=1)
+    window_start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    window_end = end.replace(hour=0, minute=0, second=0, microsecond=0) + day
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            for view in AGGREGATE_VIEWS[table]:
+                cur.execute(
+                    "CALL refresh_continuous_aggregate(%s::regclass, %s, %s)",
+                    (view, window_start, window_end),
+                )
+        logger.info(
+            "[aggregates.refresh] table=%s start=%s end=%s",
+            table,
+            window_start.isoformat(),
+            window_end.isoformat(),
+        )
+    except Exception as exc:
+        logger.error("[aggregates.refresh.error] table=%s %s", table, exc)
+    finally:
+        conn.autocommit = False
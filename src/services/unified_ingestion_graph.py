@@ -14,12 +14,17 @@ This replaces the previous separation between extraction and routing.
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import hashlib
 import logging
+import threading
 import time
 import json
 import uuid
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
 from langgraph.graph import StateGraph, END
@@ -32,8 +37,11 @@ from src.services.memory_context import (
 )
 from src.services.storage import upsert_memories
 from src.models import Memory
-from src.services.embedding_utils import generate_embedding
-from src.config import get_default_short_term_ttl_seconds
+from src.services.embedding_utils import get_embeddings
+from src.config import (
+    get_default_short_term_ttl_seconds,
+    get_ingestion_max_concurrency,
+)
 from src.services.profile_extraction import ProfileExtractor
 from src.services.profile_storage import ProfileStorageService
 
@@ -484,20 +492,24 @@ def node_build_memories(state: IngestionState) -> IngestionState:
         # This ensures profile_sources.source_memory_id is properly populated
         memory_id = f"mem_{uuid.uuid4().hex[:12]}"
 
-        embedding = generate_embedding(content)
         memory = Memory(
             id=memory_id,
             user_id=state["user_id"],
             content=content,
             layer=layer,
             type=mtype,
-            embedding=embedding,
             confidence=confidence,
             ttl=ttl,
             metadata=metadata,
         )
         memories.append(memory)
 
+    # One batched embedding request for the whole transcript
+    if memories:
+        embeddings = get_embeddings([m.content for m in memories])
+        for memory, embedding in zip(memories, embeddings):
+            memory.embedding = embedding
+
     state["memories"] = memories
     state["metrics"]["build_memories_ms"] = int(
         (time.perf_counter() - state["t_start"]) * 1000
@@ -513,14 +525,49 @@ def node_build_memories(state: IngestionState) -> IngestionState:
     return state
 
 
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.strip().lower().encode()).hexdigest()
+
+
+def _cosine_distance(a: List[float], b: List[float]) -> float:
+    """1 - cosine similarity, matching the collection's distance metric."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = sum(x * x for x in a) ** 0.5
+    norm_b = sum(y * y for y in b) ** 0.5
+    if not norm_a or not norm_b:
+        return 1.0
+    return 1.0 - dot / (norm_a * norm_b)
+
+
+def _existing_content_hashes(collection: Any, user_id: str, hashes: List[str]) -> set:
+    """Return which of ``hashes`` are already stored for the user (one request)."""
+    results = collection.get(
+        where={
+            "$and": [
+                {"user_id": user_id},
+                {"content_hash": {"$in": hashes}},
+            ]
+        },
+        include=["metadatas"],
+    )
+    return {
+        (meta or {}).get("content_hash")
+        for meta in (results or {}).get("metadatas") or []
+    }
+
+
 def node_dedup_check(state: IngestionState) -> IngestionState:
     """Remove duplicate memories before storage using content hash and semantic similarity.
 
-    Two-pass dedup:
-    1. **Exact match** — content_hash lookup in ChromaDB metadata (fast, zero tolerance).
-    2. **Semantic match** — cosine-distance query against existing user embeddings.
-       Collection uses cosine distance so values are `1 - cosine_similarity`.
-       Threshold 0.08 ≈ cosine similarity > 0.92, catching LLM paraphrases.
+    Batched two-pass dedup (two Chroma round trips per transcript):
+    1. **Exact match** — one ``get`` with ``content_hash $in [...]`` over the
+       whole batch (fast, zero tolerance).
+    2. **Semantic match** — one multi-vector ``query`` against existing user
+       embeddings. Collection uses cosine distance so values are
+       `1 - cosine_similarity`.
+
+    New memories are also deduplicated against each other (same hash, or
+    cosine distance under the same threshold); the first occurrence wins.
 
     Also filters classifications to stay aligned with the memories list so that
     downstream zip(memories, classifications) remains correct.
@@ -554,6 +601,7 @@ def node_dedup_check(state: IngestionState) -> IngestionState:
     duplicates_avoided = 0
     hash_dupes = 0
     semantic_dupes = 0
+    intra_batch_dupes = 0
     keep_indices: List[int] = []
 
     try:
@@ -563,82 +611,88 @@ def node_dedup_check(state: IngestionState) -> IngestionState:
         collection_name = _standard_collection_name()
         collection = client.get_or_create_collection(collection_name)
 
-        for idx, memory in enumerate(memories):
-            content_hash = hashlib.sha256(
-                memory.content.strip().lower().encode()
-            ).hexdigest()
+        hashes = [_content_hash(memory.content) for memory in memories]
+        for memory, content_hash in zip(memories, hashes):
             memory.metadata["content_hash"] = content_hash
 
-            is_duplicate = False
-            match_type = None
+        # --- Pass 1: exact content_hash match, one lookup for the batch ---
+        existing_hashes: set = set()
+        try:
+            existing_hashes = _existing_content_hashes(
+                collection, user_id, sorted(set(hashes))
+            )
+        except Exception as exc:
+            logger.debug(
+                "[graph.dedup_check.hash_query_error] user_id=%s error=%s",
+                user_id,
+                exc,
+            )
 
-            # --- Pass 1: exact content_hash match (fast metadata lookup) ---
+        # --- Pass 2: semantic similarity, one multi-vector query ---
+        query_indices = [
+            idx
+            for idx, memory in enumerate(memories)
+            if memory.embedding and hashes[idx] not in existing_hashes
+        ]
+        nearest: Dict[int, Tuple[float, str]] = {}
+        if query_indices:
             try:
-                hash_results = collection.get(
-                    where={
-                        "$and": [
-                            {"user_id": user_id},
-                            {"content_hash": content_hash},
-                        ]
-                    },
-                    limit=1,
+                results = collection.query(
+                    query_embeddings=[memories[i].embedding for i in query_indices],
+                    n_results=3,
+                    where={"user_id": user_id},
                 )
-                if (
-                    hash_results
-                    and hash_results.get("ids")
-                    and len(hash_results["ids"]) > 0
-                ):
-                    is_duplicate = True
-                    match_type = "exact_hash"
-                    hash_dupes += 1
+                all_distances = results.get("distances") or []
+                all_documents = results.get("documents") or []
+                for row, idx in enumerate(query_indices):
+                    distances = all_distances[row] if row < len(all_distances) else []
+                    documents = all_documents[row] if row < len(all_documents) else []
+                    for i, dist in enumerate(distances or []):
+                        # Cosine distance: 1 - cosine_sim. Lower = more similar.
+                        if dist < SEMANTIC_DISTANCE_THRESHOLD:
+                            existing_doc = documents[i] if i < len(documents) else ""
+                            nearest[idx] = (dist, existing_doc or "")
+                            break
             except Exception as exc:
-                logger.debug(
-                    "[graph.dedup_check.hash_query_error] user_id=%s error=%s",
+                logger.warning(
+                    "[graph.dedup_check.query_error] user_id=%s error=%s",
                     user_id,
                     exc,
                 )
 
-            # --- Pass 2: semantic similarity (embedding cosine distance) ---
-            if not is_duplicate and memory.embedding:
-                try:
-                    results = collection.query(
-                        query_embeddings=[memory.embedding],
-                        n_results=3,
-                        where={"user_id": user_id},
-                    )
-                    distances = results.get("distances", [[]])
-                    documents = results.get("documents", [[]])
-                    if distances and distances[0]:
-                        for i, dist in enumerate(distances[0]):
-                            # Cosine distance: 1 - cosine_sim. Lower = more similar.
-                            if dist < SEMANTIC_DISTANCE_THRESHOLD:
-                                is_duplicate = True
-                                match_type = "semantic"
-                                semantic_dupes += 1
-                                existing_doc = (
-                                    documents[0][i]
-                                    if documents
-                                    and documents[0]
-                                    and i < len(documents[0])
-                                    else ""
-                                )
-                                logger.info(
-                                    "[graph.dedup_check.semantic_match] user_id=%s dist=%.4f "
-                                    "new='%s' existing='%s'",
-                                    user_id,
-                                    dist,
-                                    memory.content[:60],
-                                    (existing_doc or "")[:60],
-                                )
-                                break
-                except Exception as exc:
-                    logger.warning(
-                        "[graph.dedup_check.query_error] user_id=%s error=%s",
-                        user_id,
-                        exc,
-                    )
-
-            if is_duplicate:
+        kept_hashes: set = set()
+        for idx, memory in enumerate(memories):
+            content_hash = hashes[idx]
+            match_type = None
+
+            if content_hash in existing_hashes:
+                match_type = "exact_hash"
+                hash_dupes += 1
+            elif idx in nearest:
+                match_type = "semantic"
+                semantic_dupes += 1
+                dist, existing_doc = nearest[idx]
+                logger.info(
+                    "[graph.dedup_check.semantic_match] user_id=%s dist=%.4f "
+                    "new='%s' existing='%s'",
+                    user_id,
+                    dist,
+                    memory.content[:60],
+                    existing_doc[:60],
+                )
+            elif content_hash in kept_hashes or (
+                memory.embedding
+                and any(
+                    memories[k].embedding
+                    and _cosine_distance(memory.embedding, memories[k].embedding)
+                    < SEMANTIC_DISTANCE_THRESHOLD
+                    for k in keep_indices
+                )
+            ):
+                match_type = "intra_batch"
+                intra_batch_dupes += 1
+
+            if match_type:
                 duplicates_avoided += 1
                 logger.info(
                     "[graph.dedup_check.duplicate] user_id=%s match=%s hash=%s content=%s",
@@ -649,6 +703,7 @@ def node_dedup_check(state: IngestionState) -> IngestionState:
                 )
             else:
                 keep_indices.append(idx)
+                kept_hashes.add(content_hash)
 
     except Exception as exc:
         logger.warning(
@@ -669,13 +724,14 @@ def node_dedup_check(state: IngestionState) -> IngestionState:
     state["metrics"]["duplicates_avoided"] = duplicates_avoided
 
     logger.info(
-        "[graph.dedup_check] user_id=%s input=%s output=%s duplicates_avoided=%s (hash=%s semantic=%s)",
+        "[graph.dedup_check] user_id=%s input=%s output=%s duplicates_avoided=%s (hash=%s semantic=%s intra_batch=%s)",
         user_id,
         len(memories),
         len(state["memories"]),
         duplicates_avoided,
         hash_dupes,
         semantic_dupes,
+        intra_batch_dupes,
     )
 
     end_span(
@@ -683,6 +739,7 @@ def node_dedup_check(state: IngestionState) -> IngestionState:
             "duplicates_avoided": duplicates_avoided,
             "hash_dupes": hash_dupes,
             "semantic_dupes": semantic_dupes,
+            "intra_batch_dupes": intra_batch_dupes,
             "memories_remaining": len(state["memories"]),
         }
     )
@@ -832,6 +889,8 @@ def node_store_episodic(state: IngestionState) -> IngestionState:
         import uuid
 
         service = EpisodicMemoryService()
+        batch: List[EpisodicMemory] = []
+        vectors: List[Optional[List[float]]] = []
 
         for i, (memory, classification) in enumerate(zip(memories, classifications)):
             if not classification.get("is_episodic"):
@@ -884,8 +943,12 @@ def node_store_episodic(state: IngestionState) -> IngestionState:
                 metadata=memory.metadata,
             )
 
-            if service.store_memory(episodic_memory):
-                stored_count += 1
+            batch.append(episodic_memory)
+            # Reuse the vector from node_build_memories instead of re-embedding
+            vectors.append(memory.embedding)
+
+        if batch:
+            stored_count = service.store_memories_bulk(batch, embeddings=vectors)
 
         state["storage_results"]["episodic_stored"] = stored_count
         logger.info("[graph.episodic] user_id=%s stored=%s", user_id, stored_count)
@@ -917,6 +980,7 @@ def node_store_emotional(state: IngestionState) -> IngestionState:
         from src.services.emotional_memory import EmotionalMemoryService
 
         service = EmotionalMemoryService()
+        states: List[Dict[str, Any]] = []
 
         for memory, classification in zip(memories, classifications):
             if not classification.get("is_emotional"):
@@ -930,17 +994,21 @@ def node_store_emotional(state: IngestionState) -> IngestionState:
             valence = sentiment.get("valence", 0.0)
             arousal = sentiment.get("arousal", 0.5)
 
-            if service.record_emotional_state(
-                user_id=user_id,
-                emotional_state=emotional_state,
-                valence=valence,
-                arousal=arousal,
-                context=memory.content,  # Use actual memory content, not tags
-                trigger_event=", ".join(
-                    memory.metadata.get("tags", [])
-                ),  # Tags as trigger
-            ):
-                stored_count += 1
+            states.append(
+                {
+                    "emotional_state": emotional_state,
+                    "valence": valence,
+                    "arousal": arousal,
+                    "context": memory.content,  # Use actual memory content, not tags
+                    "trigger_event": ", ".join(
+                        memory.metadata.get("tags", [])
+                    ),  # Tags as trigger
+                    "embedding": memory.embedding,
+                }
+            )
+
+        if states:
+            stored_count = len(service.record_emotional_states_bulk(user_id, states))
 
         state["storage_results"]["emotional_stored"] = stored_count
         logger.info("[graph.emotional] user_id=%s stored=%s", user_id, stored_count)
@@ -972,6 +1040,7 @@ def node_store_procedural(state: IngestionState) -> IngestionState:
         from src.services.procedural_memory import ProceduralMemoryService
 
         service = ProceduralMemoryService()
+        sessions: List[Dict[str, Any]] = []
 
         for memory, classification in zip(memories, classifications):
             if not classification.get("is_procedural"):
@@ -980,13 +1049,16 @@ def node_store_procedural(state: IngestionState) -> IngestionState:
             learning_journal = memory.metadata.get("learning_journal") or {}
             skill_name = learning_journal.get("topic") or memory.content[:100]
 
-            if service.practice_skill(
-                user_id=user_id,
-                skill_name=skill_name,
-                success_rate=memory.confidence,
-                notes=memory.content,
-            ):
-                stored_count += 1
+            sessions.append(
+                {
+                    "skill_name": skill_name,
+                    "success_rate": memory.confidence,
+                    "notes": memory.content,
+                }
+            )
+
+        if sessions:
+            stored_count = service.practice_skills_bulk(user_id, sessions)
 
         state["storage_results"]["procedural_stored"] = stored_count
         logger.info("[graph.procedural] user_id=%s stored=%s", user_id, stored_count)
@@ -1374,17 +1446,21 @@ def build_unified_ingestion_graph() -> StateGraph:
     return graph
 
 
+@lru_cache(maxsize=1)
+def get_compiled_ingestion_graph() -> Any:
+    """Compile the ingestion graph once per process.
+
+    The compiled graph holds no per-request state (no checkpointer), so one
+    instance is safely shared by concurrent ingestions.
+    """
+    return build_unified_ingestion_graph().compile()
+
+
 def run_unified_ingestion(request: TranscriptRequest) -> Dict[str, Any]:
     """Run the unified ingestion graph with native LangChain/Langfuse tracing"""
-    from src.config import (
-        is_langfuse_enabled,
-        get_langfuse_public_key,
-        get_langfuse_secret_key,
-        get_langfuse_host,
-    )
+    from src.dependencies.langfuse_client import get_langfuse_client
 
-    graph = build_unified_ingestion_graph()
-    compiled_graph = graph.compile()
+    compiled_graph = get_compiled_ingestion_graph()
 
     initial_state = {
         "request": request,
@@ -1392,18 +1468,12 @@ def run_unified_ingestion(request: TranscriptRequest) -> Dict[str, Any]:
         "history": request.history,
     }
 
-    # Use LangChain's native Langfuse callback handler with Langfuse v3 context propagation
-    if is_langfuse_enabled():
+    # Use LangChain's native Langfuse callback handler with Langfuse v3 context propagation.
+    # The shared client batches and exports spans from its background worker.
+    langfuse_client = get_langfuse_client()
+    if langfuse_client is not None:
         try:
             from langfuse.langchain import CallbackHandler
-            from langfuse import Langfuse
-
-            # Create Langfuse client
-            langfuse_client = Langfuse(
-                public_key=get_langfuse_public_key(),
-                secret_key=get_langfuse_secret_key(),
-                host=get_langfuse_host(),
-            )
 
             # Prepare input for tracing
             trace_input = {
@@ -1460,11 +1530,6 @@ def run_unified_ingestion(request: TranscriptRequest) -> Dict[str, Any]:
                 }
                 root_span.update(output=trace_output)
 
-            # Flush all traces
-            langfuse_client.flush()
-
-            logger.info("[unified_graph] Flushed Langfuse traces")
-
         except ImportError as e:
             logger.warning(
                 "[unified_graph] LangChain not available for Langfuse integration: %s. Install langchain-core.",
@@ -1490,3 +1555,37 @@ def run_unified_ingestion(request: TranscriptRequest) -> Dict[str, Any]:
     )
 
     return final_state
+
+
+# Ingestion runs the (sync) graph on its own bounded pool so slow /v1/store
+# calls never occupy the server's shared threadpool used by other endpoints.
+_ingestion_executor: Optional[ThreadPoolExecutor] = None
+_ingestion_executor_lock = threading.Lock()
+
+
+def _get_ingestion_executor() -> ThreadPoolExecutor:
+    global _ingestion_executor
+    if _ingestion_executor is None:
+        with _ingestion_executor_lock:
+            if _ingestion_executor is None:
+                _ingestion_executor = ThreadPoolExecutor(
+                    max_workers=max(1, get_ingestion_max_concurrency()),
+                    thread_name_prefix="ingestion",
+                )
+    return _ingestion_executor
+
+
+async def arun_unified_ingestion(request: TranscriptRequest) -> Dict[str, Any]:
+    """Await ``run_unified_ingestion`` without blocking the event loop.
+
+    The graph runs on the dedicated ingestion pool (INGESTION_MAX_CONCURRENCY)
+    with the caller's context, so tracing context vars carry over. It stays a
+    sync LangGraph on a thread on purpose: its nodes are sync LLM calls and
+    batched writes, and the retrieval it does (existing-memory context) goes
+    through ``search_memories``, which runs the async search on the app loop.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(
+        _get_ingestion_executor(), ctx.run, run_unified_ingestion, request
+    )
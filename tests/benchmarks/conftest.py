@@ -0,0 +1,25 @@
+"""
+Benchmarks are opt-in.
+
+They take tens of seconds and assert wall-clock ratios that are only
+meaningful on an otherwise idle machine, so the default ``pytest`` run skips
+them. Run them explicitly with:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks -s
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+_BENCH_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.getenv("RUN_BENCHMARKS") == "1":
+        return
+    skip = pytest.mark.skip(reason="benchmark; set RUN_BENCHMARKS=1 to run")
+    for item in items:
+        if _BENCH_DIR in Path(item.fspath).parents:
+            item.add_marker(skip)
@@ -0,0 +1,114 @@
+"""
+Benchmark: compaction clustering, pure-Python loop vs vectorized engine.
+
+The previous ``_cluster_memories`` body is reproduced below as the baseline.
+It is quadratic in pure Python, so by default it is timed at 500 memories only
+and extrapolated (n² scaling) to 5k and 20k; set ``BENCH_CLUSTER_LEGACY_FULL=1``
+to time it at every size (hours at 20k). Run with ``-s`` to see timings:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_bench_cluster_memories.py -s
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from src.services.compaction_graph import _greedy_cluster_indices
+
+DIM = int(os.getenv("BENCH_CLUSTER_DIM", "1536"))
+THRESHOLD = 0.75
+LEGACY_BASE_SIZE = 500
+
+
+def _legacy_cluster(valid_memories, embeddings, threshold):
+    n = len(valid_memories)
+    used = set()
+    clusters = []
+    for i in range(n):
+        if i in used:
+            continue
+        cluster = [valid_memories[i]]
+        used.add(i)
+        for j in range(i + 1, n):
+            if j in used:
+                continue
+            a, b = embeddings[i], embeddings[j]
+            if len(a) != len(b):
+                continue
+            dot = sum(x * y for x, y in zip(a, b))
+            na = sum(x * x for x in a) ** 0.5
+            nb = sum(y * y for y in b) ** 0.5
+            if na <= 0 or nb <= 0:
+                continue
+            cos_sim = dot / (na * nb)
+            if cos_sim >= threshold:
+                is_similar_to_all = True
+                for k_idx, k_mem in enumerate(cluster):
+                    if k_idx == 0:
+                        continue
+                    k_orig_idx = valid_memories.index(k_mem)
+                    k_emb = embeddings[k_orig_idx]
+                    dot_k = sum(x * y for x, y in zip(k_emb, b))
+                    na_k = sum(x * x for x in k_emb) ** 0.5
+                    cos_k = dot_k / (na_k * nb) if na_k > 0 else 0
+                    if cos_k < threshold:
+                        is_similar_to_all = False
+                        break
+                if is_similar_to_all and len(cluster) < 10:
+                    cluster.append(valid_memories[j])
+                    used.add(j)
+        if 3 <= len(cluster) <= 10:
+            clusters.append(cluster)
+    return clusters
+
+
+def _synthetic_embeddings(n, seed=0):
+    """Topic centers plus noise, so that a realistic share of rows cluster."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, n // 8), DIM)).astype(np.float32)
+    noise = rng.standard_normal((n, DIM)).astype(np.float32) * 0.025
+    return centers[rng.integers(0, len(centers), n)] + noise
+
+
+def _time_new(vectors):
+    start = time.perf_counter()
+    clusters = _greedy_cluster_indices(vectors, THRESHOLD)
+    return time.perf_counter() - start, clusters
+
+
+def _time_legacy(vectors):
+    embeddings = vectors.tolist()
+    memories = [{"id": str(i)} for i in range(len(embeddings))]
+    start = time.perf_counter()
+    clusters = _legacy_cluster(memories, embeddings, THRESHOLD)
+    elapsed = time.perf_counter() - start
+    return elapsed, [[int(m["id"]) for m in c] for c in clusters]
+
+
+@pytest.mark.slow
+def test_vectorized_clustering_scales():
+    legacy_full = os.getenv("BENCH_CLUSTER_LEGACY_FULL") == "1"
+
+    base_vectors = _synthetic_embeddings(LEGACY_BASE_SIZE)
+    legacy_base_s, legacy_clusters = _time_legacy(base_vectors)
+    new_base_s, new_clusters = _time_new(base_vectors)
+    assert new_clusters == legacy_clusters
+
+    for n in (LEGACY_BASE_SIZE, 5_000, 20_000):
+        vectors = base_vectors if n == LEGACY_BASE_SIZE else _synthetic_embeddings(n)
+        new_s = new_base_s if n == LEGACY_BASE_SIZE else _time_new(vectors)[0]
+        if n == LEGACY_BASE_SIZE:
+            legacy_s, note = legacy_base_s, "measured"
+        elif legacy_full:
+            legacy_s, note = _time_legacy(vectors)[0], "measured"
+        else:
+            legacy_s = legacy_base_s * (n / LEGACY_BASE_SIZE) ** 2
+            note = "extrapolated"
+        print(
+            f"\n[bench.cluster_memories] n={n} dim={DIM} "
+            f"legacy={legacy_s:.2f}s ({note}) vectorized={new_s:.3f}s "
+            f"speedup={legacy_s / max(new_s, 1e-9):.0f}x"
+        )
+        assert new_s * 10 < legacy_s
@@ -0,0 +1,94 @@
+"""
+Benchmark: next-check computation, fresh croniter per call vs cached schedules.
+
+10k distinct cron expressions (spread over a few timezones) each get
+several next-fire lookups, as they would across repeated fires and pending
+polls. The baseline resolves the ZoneInfo and parses the expression on every
+call, like intent_service did before schedules were cached. Run with ``-s``
+to see timings:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_bench_cron_schedule.py -s
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from croniter import croniter
+
+from src.services.cron_schedule import get_cron_schedule
+
+N_CRONS = 10_000
+LOOKUPS_PER_CRON = 5
+TIMEZONES = ("America/Los_Angeles", "America/New_York", "Europe/London", "UTC")
+
+
+def _crons():
+    crons = []
+    for i in range(N_CRONS):
+        minute, rest = i % 60, i // 60
+        hour, dow = rest % 24, rest // 24
+        crons.append((f"{minute} {hour} * * {dow}", TIMEZONES[i % len(TIMEZONES)]))
+    return crons
+
+
+def _legacy_next(expression, tz_name, now):
+    tz = ZoneInfo(tz_name)
+    cron = croniter(expression, now.astimezone(tz))
+    return cron.get_next(datetime).astimezone(timezone.utc)
+
+
+@pytest.mark.slow
+def test_cached_cron_schedules():
+    crons = _crons()
+    assert len(set(crons)) == N_CRONS
+    base = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    instants = [base + timedelta(hours=7 * k) for k in range(LOOKUPS_PER_CRON)]
+    get_cron_schedule.cache_clear()
+
+    start = time.perf_counter()
+    expected = [_legacy_next(e, tz, now) for now in instants for e, tz in crons]
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for expression, tz_name in crons:
+        get_cron_schedule(expression, tz_name)
+    warm_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = [
+        get_cron_schedule(e, tz).next_fire(now) for now in instants for e, tz in crons
+    ]
+    cached_s = time.perf_counter() - start
+
+    assert got == expected
+
+    # Pending polls re-ask for the same intent a minute apart
+    polls = [base + timedelta(minutes=k) for k in range(LOOKUPS_PER_CRON)]
+    start = time.perf_counter()
+    for expression, tz_name in crons:
+        for now in polls:
+            _legacy_next(expression, tz_name, now)
+    legacy_poll_s = time.perf_counter() - start
+    start = time.perf_counter()
+    for expression, tz_name in crons:
+        schedule = get_cron_schedule(expression, tz_name)
+        for now in polls:
+            schedule.next_fire(now)
+    poll_s = time.perf_counter() - start
+
+    info = get_cron_schedule.cache_info()
+    lookups = N_CRONS * LOOKUPS_PER_CRON
+    print(
+        f"\n[bench.cron_schedule] crons={N_CRONS} lookups={lookups} "
+        f"legacy={legacy_s * 1e6 / lookups:.1f}us/lookup "
+        f"cached={cached_s * 1e6 / lookups:.1f}us/lookup "
+        f"parse={warm_s * 1e6 / N_CRONS:.1f}us/cron "
+        f"speedup={legacy_s / cached_s:.1f}x hits={info.hits} misses={info.misses}"
+        f"\n  polls: legacy={legacy_poll_s * 1e6 / lookups:.1f}us/lookup "
+        f"cached={poll_s * 1e6 / lookups:.1f}us/lookup "
+        f"speedup={legacy_poll_s / poll_s:.1f}x"
+    )
+    assert cached_s < legacy_s
+    assert poll_s * 3 < legacy_poll_s
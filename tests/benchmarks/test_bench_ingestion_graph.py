@@ -0,0 +1,44 @@
+"""
+Micro-benchmark: per-request setup cost of the unified ingestion graph.
+
+Compares building + compiling the graph on every request (previous behaviour)
+with reusing the process-wide compiled graph. Run with ``-s`` to see timings:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_bench_ingestion_graph.py -s
+"""
+
+import time
+
+import pytest
+
+from src.services import unified_ingestion_graph
+
+ITERATIONS = 50
+
+
+def _per_call_ms(fn, iterations: int = ITERATIONS) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+@pytest.mark.slow
+def test_compiled_graph_reuse_removes_setup_cost():
+    unified_ingestion_graph.get_compiled_ingestion_graph.cache_clear()
+
+    rebuild_ms = _per_call_ms(
+        lambda: unified_ingestion_graph.build_unified_ingestion_graph().compile()
+    )
+    unified_ingestion_graph.get_compiled_ingestion_graph()
+    cached_ms = _per_call_ms(unified_ingestion_graph.get_compiled_ingestion_graph)
+
+    print(
+        f"\n[bench.ingestion_graph] build+compile={rebuild_ms:.3f}ms/request "
+        f"cached={cached_ms:.5f}ms/request speedup={rebuild_ms / max(cached_ms, 1e-9):.0f}x"
+    )
+    assert (
+        unified_ingestion_graph.get_compiled_ingestion_graph()
+        is unified_ingestion_graph.get_compiled_ingestion_graph()
+    )
+    assert cached_ms * 100 < rebuild_ms
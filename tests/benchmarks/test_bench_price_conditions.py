@@ -0,0 +1,137 @@
+"""
+Benchmark: price-condition evaluation, per-intent Python loop vs vectorized engine.
+
+100k synthetic price intents spread over 2,000 tickers are evaluated against
+a tick batch that quotes every ticker, then against a single-ticker update.
+The baseline compiles nothing up front: it parses each intent's expression
+and checks cooldown per intent, the way external evaluators do today. Run
+with ``-s`` to see timings:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_bench_price_conditions.py -s
+"""
+
+import operator
+import re
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.services.intent_service import IntentService
+from src.services.price_conditions import OPERATORS, PriceConditionEngine
+
+N_INTENTS = 100_000
+N_TICKERS = 2_000
+NOW = datetime(2025, 6, 1, 15, 30, tzinfo=timezone.utc)
+
+_PY_OPS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+_EXPR = re.compile(r"^([A-Z]{1,5})\s*(<=|>=|==|!=|<|>)\s*([0-9.]+)$")
+
+
+def _ticker(i):
+    letters = ""
+    for _ in range(4):
+        i, rem = divmod(i, 26)
+        letters += chr(ord("A") + rem)
+    return letters
+
+
+def _synthetic_rows(seed=0):
+    rng = np.random.default_rng(seed)
+    tickers = [_ticker(i) for i in range(N_TICKERS)]
+    last = {t: float(rng.uniform(50, 150)) for t in tickers}
+    rows = []
+    for i in range(N_INTENTS):
+        ticker = tickers[rng.integers(N_TICKERS)]
+        op = OPERATORS[rng.integers(4)]  # <, <=, >, >=
+        # Alerts sit 1-20% away from the last price, on the side they watch
+        offset = last[ticker] * rng.uniform(0.01, 0.2)
+        threshold = last[ticker] + (offset if op.startswith(">") else -offset)
+        fired = rng.random() < 0.3
+        rows.append(
+            {
+                "id": str(i),
+                "user_id": f"u{i % 5000}",
+                "trigger_condition": {
+                    "expression": f"{ticker} {op} {threshold:.2f}",
+                    "cooldown_hours": 24,
+                },
+                "last_condition_fire": (
+                    NOW - timedelta(hours=float(rng.uniform(0, 48))) if fired else None
+                ),
+            }
+        )
+    # The tick batch moves every price by up to 5%
+    prices = {t: round(p * rng.uniform(0.95, 1.05), 2) for t, p in last.items()}
+    return rows, prices
+
+
+def _legacy_evaluate(rows, prices):
+    service = IntentService(None)
+    fired = []
+    for row in rows:
+        condition = row["trigger_condition"]
+        ticker, op, value = _EXPR.match(condition["expression"]).groups()
+        price = prices.get(ticker)
+        if price is None or not _PY_OPS[op](price, float(value)):
+            continue
+        in_cooldown, _ = service._check_cooldown(
+            "price", row["last_condition_fire"], condition["cooldown_hours"], NOW
+        )
+        if not in_cooldown:
+            fired.append(row["id"])
+    return fired
+
+
+@pytest.mark.slow
+def test_vectorized_price_conditions():
+    rows, prices = _synthetic_rows()
+
+    start = time.perf_counter()
+    expected = _legacy_evaluate(rows, prices)
+    legacy_s = time.perf_counter() - start
+
+    engine = PriceConditionEngine()
+    start = time.perf_counter()
+    engine.load(rows)
+    engine.evaluate({}, now=NOW)  # builds the columnar index
+    build_s = time.perf_counter() - start
+
+    ticks = []
+    for _ in range(5):
+        start = time.perf_counter()
+        matches = engine.evaluate(prices, now=NOW)
+        ticks.append(time.perf_counter() - start)
+    tick_s = min(ticks)
+    assert sorted(m.intent_id for m in matches) == sorted(expected)
+
+    # A streaming feed usually updates one ticker at a time
+    ticker = next(iter(prices))
+    single = {ticker: prices[ticker]}
+    start = time.perf_counter()
+    expected_single = _legacy_evaluate(rows, single)
+    legacy_single_s = time.perf_counter() - start
+    start = time.perf_counter()
+    single_matches = engine.evaluate(single, now=NOW)
+    single_s = time.perf_counter() - start
+    assert sorted(m.intent_id for m in single_matches) == sorted(expected_single)
+
+    print(
+        f"\n[bench.price_conditions] intents={N_INTENTS} tickers={N_TICKERS} "
+        f"matches={len(matches)} build={build_s * 1000:.1f}ms"
+        f"\n  full batch: legacy={legacy_s * 1000:.1f}ms tick={tick_s * 1000:.2f}ms "
+        f"speedup={legacy_s / max(tick_s, 1e-9):.0f}x"
+        f"\n  one ticker: legacy={legacy_single_s * 1000:.1f}ms "
+        f"tick={single_s * 1000:.3f}ms "
+        f"speedup={legacy_single_s / max(single_s, 1e-9):.0f}x"
+    )
+    assert tick_s * 4 < legacy_s
+    assert single_s * 50 < legacy_single_s
@@ -59,6 +59,40 @@ class _RedisStub:
         self.values.pop(key, None)
 
 
+class _AsyncRedisStub:
+    """asyncio facade over ``_RedisStub`` so sync and async paths share state."""
+
+    def __init__(self, sync: _RedisStub) -> None:
+        self._sync = sync
+
+    def __getattr__(self, name: str):
+        method = getattr(self._sync, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return call
+
+    def pipeline(self, transaction: bool = True) -> "_AsyncPipelineStub":
+        return _AsyncPipelineStub(self._sync)
+
+
+class _AsyncPipelineStub:
+    def __init__(self, sync: _RedisStub) -> None:
+        self._sync = sync
+        self._calls = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self._calls.append((getattr(self._sync, name), args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        return [method(*args, **kwargs) for method, args, kwargs in self._calls]
+
+
 def _prepare_app(monkeypatch: pytest.MonkeyPatch, redis_stub: _RedisStub):
     monkeypatch.setenv("LLM_PROVIDER", "openai")
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
@@ -100,6 +134,8 @@ def _prepare_app(monkeypatch: pytest.MonkeyPatch, redis_stub: _RedisStub):
 
     monkeypatch.setattr(app_module, "ping_timescale", lambda: (True, None))
     monkeypatch.setattr(app_module, "get_redis_client", lambda: redis_stub)
+    async_redis_stub = _AsyncRedisStub(redis_stub)
+    monkeypatch.setattr(app_module, "get_async_redis_client", lambda: async_redis_stub)
 
     class _HTTPXStub:
         def __enter__(self):
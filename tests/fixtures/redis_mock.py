@@ -37,6 +37,24 @@ class MockRedisClient:
             self._expires[key] = ex
         return True
 
+    def setex(self, key: str, ttl: int, value: Union[str, bytes]) -> bool:
+        """Mock setex method."""
+        return self.set(key, value, ex=ttl)
+
+    def mget(self, keys: list) -> list:
+        """Mock mget method."""
+        return [self.get(key) for key in keys]
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        """Mock incr method."""
+        value = int(self._data.get(key, b"0")) + amount
+        self._data[key] = str(value).encode()
+        return value
+
+    def pipeline(self, transaction: bool = True) -> "MockPipeline":
+        """Mock pipeline method."""
+        return MockPipeline(self)
+
     def delete(self, *keys: str) -> int:
         """Mock delete method."""
         count = 0
@@ -61,6 +79,113 @@ class MockRedisClient:
 
         return [key for key in self._data.keys() if fnmatch.fnmatch(key, pattern)]
 
+    # Sets, hashes and sorted sets (stored as set / dict values in ``_data``)
+
+    def sadd(self, key: str, *members: str) -> int:
+        bucket = self._data.setdefault(key, set())
+        before = len(bucket)
+        bucket.update(members)
+        return len(bucket) - before
+
+    def srem(self, key: str, *members: str) -> int:
+        bucket = self._data.get(key, set())
+        removed = len(bucket & set(members))
+        bucket.difference_update(members)
+        return removed
+
+    def smembers(self, key: str) -> set:
+        return set(self._data.get(key, set()))
+
+    def sismember(self, key: str, member: str) -> bool:
+        return member in self._data.get(key, set())
+
+    def scard(self, key: str) -> int:
+        return len(self._data.get(key, set()))
+
+    def hset(
+        self,
+        key: str,
+        field: Optional[str] = None,
+        value: Any = None,
+        mapping: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        bucket = self._data.setdefault(key, {})
+        items = dict(mapping or {})
+        if field is not None:
+            items[field] = value
+        added = sum(1 for f in items if f not in bucket)
+        bucket.update({f: str(v) for f, v in items.items()})
+        return added
+
+    def hget(self, key: str, field: str) -> Optional[str]:
+        return self._data.get(key, {}).get(field)
+
+    def hgetall(self, key: str) -> Dict[str, str]:
+        return dict(self._data.get(key, {}))
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        bucket = self._data.setdefault(key, {})
+        value = int(bucket.get(field, 0)) + amount
+        bucket[field] = str(value)
+        return value
+
+    def hdel(self, key: str, *fields: str) -> int:
+        bucket = self._data.get(key, {})
+        return sum(1 for f in fields if bucket.pop(f, None) is not None)
+
+    def zadd(self, key: str, mapping: Dict[str, float], nx: bool = False) -> int:
+        zset = self._data.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if member in zset:
+                if nx:
+                    continue
+            else:
+                added += 1
+            zset[member] = float(score)
+        return added
+
+    def zrem(self, key: str, *members: str) -> int:
+        zset = self._data.get(key, {})
+        return sum(1 for m in members if zset.pop(m, None) is not None)
+
+    def zscore(self, key: str, member: str) -> Optional[float]:
+        return self._data.get(key, {}).get(member)
+
+    def zcard(self, key: str) -> int:
+        return len(self._data.get(key, {}))
+
+    def _zsorted(self, key: str) -> list:
+        return sorted(self._data.get(key, {}).items(), key=lambda kv: (kv[1], kv[0]))
+
+    def zrange(self, key: str, start: int, end: int, withscores: bool = False) -> list:
+        items = self._zsorted(key)
+        items = items[start : None if end == -1 else end + 1]
+        return items if withscores else [m for m, _ in items]
+
+    def zrangebyscore(
+        self,
+        key: str,
+        min: Union[str, float],
+        max: Union[str, float],
+        start: Optional[int] = None,
+        num: Optional[int] = None,
+        withscores: bool = False,
+    ) -> list:
+        lo, hi = float(min), float(max)
+        items = [(m, s) for m, s in self._zsorted(key) if lo <= s <= hi]
+        if start is not None and num is not None:
+            items = items[start : start + num]
+        return items if withscores else [m for m, _ in items]
+
+    def zcount(self, key: str, min: Union[str, float], max: Union[str, float]) -> int:
+        return len(self.zrangebyscore(key, min, max))
+
+    def lock(
+        self, name: str, timeout: Optional[float] = None, blocking: bool = True
+    ) -> "MockLock":
+        return MockLock(self, name, timeout)
+
     def flushdb(self) -> bool:
         """Mock flushdb method."""
         self._data.clear()
@@ -68,6 +193,59 @@ class MockRedisClient:
         return True
 
 
+class MockPipeline:
+    """Buffers commands and applies them to the mock client on execute()."""
+
+    def __init__(self, client: MockRedisClient):
+        self._client = client
+        self._commands: list = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._client, name)
+
+        def queue(*args: Any, **kwargs: Any) -> "MockPipeline":
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list:
+        results = [method(*args, **kwargs) for method, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+
+class MockLock:
+    """Non-blocking stand-in for ``redis.lock.Lock``; expiry is simulated by
+    deleting the lock key."""
+
+    def __init__(self, client: MockRedisClient, name: str, timeout: Optional[float]):
+        self._client = client
+        self.name = name
+        self.timeout = timeout
+        self._token = f"token-{id(self)}".encode()
+
+    def acquire(self, blocking: Optional[bool] = None) -> bool:
+        return self._client.set(self.name, self._token, nx=True)
+
+    def owned(self) -> bool:
+        return self._client.get(self.name) == self._token
+
+    def extend(self, additional_time: float, replace_ttl: bool = False) -> bool:
+        from redis.exceptions import LockNotOwnedError
+
+        if not self.owned():
+            raise LockNotOwnedError("Cannot extend a lock that's no longer owned")
+        return True
+
+    def release(self) -> None:
+        from redis.exceptions import LockNotOwnedError
+
+        if not self.owned():
+            raise LockNotOwnedError("Cannot release a lock that's no longer owned")
+        self._client.delete(self.name)
+
+
 def create_mock_redis_client() -> MockRedisClient:
     """Create a mock Redis client."""
     return MockRedisClient()
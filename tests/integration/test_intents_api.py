@@ -2493,6 +2493,239 @@ class TestClaimIntent:
         assert "database" in response.json()["detail"].lower()
 
 
+class TestClaimIntentsBatch:
+    """Tests for POST /v1/intents/claim-batch (atomic multi-intent claim)."""
+
+    @staticmethod
+    def _due_row(minutes_overdue, **overrides):
+        now = datetime.now(timezone.utc)
+        row = {
+            "id": uuid4(),
+            "user_id": "test-user",
+            "intent_name": "Price Alert",
+            "description": None,
+            "trigger_type": "price",
+            "trigger_schedule": {"check_interval_minutes": 5},
+            "trigger_condition": {"expression": "NVDA < 130", "cooldown_hours": 24},
+            "action_type": "notify",
+            "action_context": "Price alert",
+            "action_priority": "normal",
+            "next_check": now - timedelta(minutes=minutes_overdue),
+            "execution_count": 0,
+            "enabled": True,
+            "created_at": now - timedelta(days=1),
+            "updated_at": now,
+            "metadata": {},
+            "last_condition_fire": None,
+            "claimed_at": now,
+            "claimed_by": "worker-1",
+        }
+        row.update(overrides)
+        return row
+
+    @patch("src.routers.intents.get_timescale_conn")
+    @patch("src.routers.intents.release_timescale_conn")
+    def test_claims_in_one_statement(
+        self, mock_release, mock_get_conn, client, mock_db_connection
+    ):
+        """One UPDATE ... SKIP LOCKED ... RETURNING claims and returns the batch."""
+        conn, cursor = mock_db_connection
+        mock_get_conn.return_value = conn
+        recent_fire = datetime.now(timezone.utc) - timedelta(hours=1)
+        cursor.fetchall.return_value = [
+            self._due_row(1),
+            self._due_row(10, last_condition_fire=recent_fire),
+        ]
+
+        response = client.post(
+            "/v1/intents/claim-batch", params={"worker_id": "worker-1", "limit": 2}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["worker_id"] == "worker-1"
+        # Most overdue first, regardless of RETURNING order
+        assert [i["metadata"]["in_cooldown"] for i in data["intents"]] == [
+            True,
+            False,
+        ]
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args[0]
+        assert sql.lstrip().startswith("UPDATE scheduled_intents")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING *" in sql
+        assert "user_id = %(user_id)s" not in sql
+        assert params["limit"] == 2 and params["worker_id"] == "worker-1"
+        conn.commit.assert_called_once()
+        cursor.fetchone.assert_not_called()
+
+    @patch("src.routers.intents.get_timescale_conn")
+    @patch("src.routers.intents.release_timescale_conn")
+    def test_user_filter_and_empty_batch(
+        self, mock_release, mock_get_conn, client, mock_db_connection
+    ):
+        """Nothing due (or all locked) returns an empty batch, not an error."""
+        conn, cursor = mock_db_connection
+        mock_get_conn.return_value = conn
+        cursor.fetchall.return_value = []
+
+        response = client.post(
+            "/v1/intents/claim-batch",
+            params={"worker_id": "worker-2", "user_id": "test-user"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["intents"] == []
+        sql, params = cursor.execute.call_args[0]
+        assert "user_id = %(user_id)s" in sql
+        assert params["user_id"] == "test-user"
+
+    def test_limit_and_worker_id_validated(self, client):
+        """limit is bounded and worker_id is required."""
+        assert client.post("/v1/intents/claim-batch?limit=5").status_code == 422
+        response = client.post(
+            "/v1/intents/claim-batch", params={"worker_id": "w", "limit": 10_000}
+        )
+        assert response.status_code == 422
+
+    @patch("src.routers.intents.get_timescale_conn")
+    @patch("src.routers.intents.release_timescale_conn")
+    def test_database_error_rolls_back(
+        self, mock_release, mock_get_conn, client, mock_db_connection
+    ):
+        """A failed claim statement rolls back and returns 500."""
+        conn, cursor = mock_db_connection
+        mock_get_conn.return_value = conn
+        cursor.execute.side_effect = Exception("deadlock detected")
+
+        response = client.post(
+            "/v1/intents/claim-batch", params={"worker_id": "worker-1"}
+        )
+
+        assert response.status_code == 500
+        conn.rollback.assert_called_once()
+
+
+class TestFireIntentsBatch:
+    """Tests for POST /v1/intents/fire-batch (one transaction, per-item results)."""
+
+    @staticmethod
+    def _row(trigger_type="cron", **overrides):
+        now = datetime.now(timezone.utc)
+        row = {
+            "id": uuid4(),
+            "user_id": "test-user",
+            "intent_name": "Intent",
+            "description": None,
+            "trigger_type": trigger_type,
+            "trigger_schedule": {"cron": "0 9 * * *"},
+            "trigger_condition": None,
+            "action_type": "notify",
+            "action_context": "Context",
+            "action_priority": "normal",
+            "next_check": now,
+            "execution_count": 0,
+            "enabled": True,
+            "max_executions": None,
+            "expires_at": None,
+            "created_at": now - timedelta(days=1),
+            "updated_at": now,
+            "metadata": {},
+            "last_condition_fire": None,
+            "claimed_at": now,
+        }
+        row.update(overrides)
+        return row
+
+    @patch("src.routers.intents.get_timescale_conn")
+    @patch("src.routers.intents.release_timescale_conn")
+    def test_bulk_writes_and_per_item_results(
+        self, mock_release, mock_get_conn, client, mock_db_connection
+    ):
+        """Found intents are written with one executemany each; others fail per item."""
+        conn, cursor = mock_db_connection
+        mock_get_conn.return_value = conn
+        cron = self._row()
+        once = self._row("once", trigger_schedule={"trigger_at": "2030-01-01T00:00"})
+        cooling = self._row(
+            "price",
+            trigger_schedule={"check_interval_minutes": 5},
+            trigger_condition={"expression": "NVDA < 130", "cooldown_hours": 24},
+            last_condition_fire=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        cursor.fetchall.return_value = [cron, once, cooling]
+        missing = uuid4()
+
+        response = client.post(
+            "/v1/intents/fire-batch",
+            json={
+                "results": [
+                    {"intent_id": str(cron["id"]), "status": "success"},
+                    {"intent_id": str(missing), "status": "success"},
+                    {"intent_id": str(once["id"]), "status": "success"},
+                    {"intent_id": str(cooling["id"]), "status": "success"},
+                    {"intent_id": str(cron["id"]), "status": "failed"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["succeeded"] == 3 and data["failed"] == 2
+        results = data["results"]
+        assert results[0]["response"]["execution_count"] == 1
+        assert results[1] == {
+            "intent_id": str(missing),
+            "success": False,
+            "response": None,
+            "error": "Intent not found",
+        }
+        assert results[2]["response"]["enabled"] is False
+        assert results[3]["response"]["status"] == "cooldown_active"
+        assert "Duplicate" in results[4]["error"]
+
+        select_sql, (ids,) = cursor.execute.call_args[0]
+        assert "id = ANY(%s) ORDER BY id FOR UPDATE" in select_sql
+        assert ids == sorted(ids) and len(ids) == 4
+        update_call, insert_call = cursor.executemany.call_args_list
+        assert "claimed_at = NULL" in update_call[0][0]
+        # Cooldown-blocked intents are neither updated nor logged
+        assert [p["id"] for p in update_call[0][1]] == [
+            str(cron["id"]),
+            str(once["id"]),
+        ]
+        assert "INSERT INTO intent_executions" in insert_call[0][0]
+        assert len(insert_call[0][1]) == 2
+        conn.commit.assert_called_once()
+
+    @patch("src.routers.intents.get_timescale_conn")
+    @patch("src.routers.intents.release_timescale_conn")
+    def test_database_error_fails_whole_batch(
+        self, mock_release, mock_get_conn, client, mock_db_connection
+    ):
+        """A failed bulk write rolls back every item."""
+        conn, cursor = mock_db_connection
+        mock_get_conn.return_value = conn
+        row = self._row()
+        cursor.fetchall.return_value = [row]
+        cursor.executemany.side_effect = Exception("connection reset")
+
+        response = client.post(
+            "/v1/intents/fire-batch",
+            json={"results": [{"intent_id": str(row["id"]), "status": "success"}]},
+        )
+
+        assert response.status_code == 500
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+
+    def test_empty_batch_rejected(self, client):
+        """An empty results list is a validation error."""
+        response = client.post("/v1/intents/fire-batch", json={"results": []})
+
+        assert response.status_code == 422
+
+
 class TestPendingIntentsWithCooldown:
     """Tests for pending intents with cooldown/claim filtering (Story 6.3)."""
 
@@ -2552,6 +2785,35 @@ class TestPendingIntentsWithCooldown:
         assert len(data) == 1
         assert "metadata" in data[0]
         assert data[0]["metadata"]["in_cooldown"] is True
+        assert "next_scheduled_fire" not in data[0]["metadata"]
+
+    @patch("src.routers.intents.get_timescale_conn")
+    @patch("src.routers.intents.release_timescale_conn")
+    def test_pending_cron_includes_next_scheduled_fire(
+        self,
+        mock_release,
+        mock_get_conn,
+        client,
+        mock_db_connection,
+        sample_intent_row,
+    ):
+        """GET /pending adds the next cron slot, in the schedule's timezone."""
+        conn, cursor = mock_db_connection
+        mock_get_conn.return_value = conn
+        row = dict(sample_intent_row)
+        row["trigger_schedule"] = {"cron": "0 9 * * *", "timezone": "Asia/Tokyo"}
+        row["next_check"] = datetime.now(timezone.utc) - timedelta(hours=1)
+        cursor.fetchall.return_value = [row]
+
+        response = client.get("/v1/intents/pending")
+
+        assert response.status_code == 200
+        next_fire = datetime.fromisoformat(
+            response.json()[0]["metadata"]["next_scheduled_fire"]
+        )
+        assert next_fire > datetime.now(timezone.utc)
+        assert next_fire - datetime.now(timezone.utc) <= timedelta(days=1)
+        assert (next_fire.hour, next_fire.minute) == (0, 0)  # 09:00 JST
 
     @patch("src.routers.intents.get_timescale_conn")
     @patch("src.routers.intents.release_timescale_conn")
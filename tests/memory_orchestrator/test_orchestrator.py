@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 from typing import Dict, List, Sequence, Tuple
 
+from src.memory_orchestrator import orchestrator as orchestrator_module
 from src.memory_orchestrator import (
     AdaptiveMemoryOrchestrator,
     MemoryInjectionSource,
@@ -233,3 +234,40 @@ def test_scoped_subscription_filters_other_conversations() -> None:
     asyncio.run(scenario())
 
     assert captured == ["conv-a"]
+
+
+def test_default_search_is_awaited_on_the_running_loop(monkeypatch) -> None:
+    calls: List[Tuple[str, str, int]] = []
+
+    async def asearch_stub(user_id, query, filters=None, limit=10, offset=0):
+        asyncio.get_running_loop()
+        calls.append((user_id, query, limit))
+        return (
+            [
+                {
+                    "id": "memory-1",
+                    "content": "remember to hydrate",
+                    "score": 0.1,
+                    "metadata": {"layer": "short-term"},
+                }
+            ],
+            1,
+        )
+
+    monkeypatch.setattr(orchestrator_module, "asearch_memories", asearch_stub)
+    orchestrator = AdaptiveMemoryOrchestrator(
+        persist_fn=PersistRecorder(),
+        retrieval_policy=RetrievalPolicy(min_similarity=0.2),
+    )
+
+    async def scenario() -> List[str]:
+        injections = await orchestrator.fetch_memories(
+            conversation_id="conv-7",
+            query="hydrate",
+            metadata={"user_id": "user-7"},
+            limit=3,
+        )
+        return [item.memory_id for item in injections]
+
+    assert asyncio.run(scenario()) == ["memory-1"]
+    assert calls == [("user-7", "hydrate", 3)]
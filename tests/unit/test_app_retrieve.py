@@ -22,14 +22,15 @@ def test_retrieve_uses_persona_results(api_client, monkeypatch):
         source="hybrid",
     )
 
-    monkeypatch.setattr(
-        "src.app._persona_copilot.retrieve", lambda **_: {"identity": persona_result}
-    )
+    async def aretrieve_stub(**_):
+        return {"identity": persona_result}
+
+    monkeypatch.setattr("src.app._persona_copilot.aretrieve", aretrieve_stub)
 
-    def search_stub(**_):
-        raise AssertionError("search_memories should not be called")
+    async def search_stub(**_):
+        raise AssertionError("asearch_memories should not be called")
 
-    monkeypatch.setattr("src.app.search_memories", search_stub)
+    monkeypatch.setattr("src.app.asearch_memories", search_stub)
     monkeypatch.setattr("src.services.tracing.start_trace", lambda **_: None)
 
     response = api_client.get(
@@ -45,7 +46,10 @@ def test_retrieve_uses_persona_results(api_client, monkeypatch):
 
 
 def test_retrieve_falls_back_to_semantic_search(api_client, monkeypatch):
-    monkeypatch.setattr("src.app._persona_copilot.retrieve", lambda **_: {})
+    async def aretrieve_stub(**_):
+        return {}
+
+    monkeypatch.setattr("src.app._persona_copilot.aretrieve", aretrieve_stub)
 
     fallback_items = [
         {
@@ -59,7 +63,11 @@ def test_retrieve_falls_back_to_semantic_search(api_client, monkeypatch):
             },
         }
     ]
-    monkeypatch.setattr("src.app.search_memories", lambda **_: (fallback_items, 1))
+
+    async def search_stub(**_):
+        return fallback_items, 1
+
+    monkeypatch.setattr("src.app.asearch_memories", search_stub)
     monkeypatch.setattr("src.services.tracing.start_trace", lambda **_: None)
 
     response = api_client.get(
@@ -0,0 +1,165 @@
+"""
+Unit tests for the async request path (embeddings, search, hybrid retrieval,
+ingestion offload).
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import embedding_utils, retrieval, unified_ingestion_graph
+from src.services.hybrid_retrieval import (
+    HybridRetrievalService,
+    RetrievalQuery,
+    RetrievalResult,
+)
+
+
+def _result(memory_id: str) -> RetrievalResult:
+    return RetrievalResult(
+        memory_id=memory_id,
+        memory_type="semantic",
+        content=memory_id,
+        relevance_score=0.5,
+        recency_score=0.5,
+        importance_score=0.5,
+    )
+
+
+class TestAsyncEmbeddings:
+    """aget_embeddings mirrors get_embeddings over the async client."""
+
+    def test_batches_preserve_order(self, monkeypatch):
+        calls = []
+
+        async def create(model, input):
+            calls.append(list(input))
+            data = [
+                SimpleNamespace(index=i, embedding=[float(len(t))])
+                for i, t in enumerate(input)
+            ]
+            return SimpleNamespace(data=list(reversed(data)))
+
+        client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setattr(embedding_utils, "get_embedding_cache", lambda: None)
+        monkeypatch.setattr(
+            embedding_utils, "get_async_llm_client", lambda *a, **k: client
+        )
+        monkeypatch.setattr(embedding_utils, "EMBEDDING_BATCH_MAX_ITEMS", 2)
+
+        vectors = asyncio.run(embedding_utils.aget_embeddings(["a", "bb", "ccc", "a"]))
+
+        assert calls == [["a", "bb"], ["ccc"]]
+        assert vectors == [[1.0], [2.0], [3.0], [1.0]]
+
+
+class TestAsyncSearch:
+    """asearch_memories uses the async collection and embedding calls."""
+
+    def test_semantic_query_is_scored_and_paginated(self, monkeypatch):
+        class _Collection:
+            name = "memories_3"
+
+            async def aquery(self, query_embeddings, n_results, where):
+                assert where == {"user_id": "u1", "layer": "semantic"}
+                return {
+                    "ids": [["m1", "m2"]],
+                    "documents": [["call mom", "buy milk"]],
+                    "metadatas": [[{"persona_tags": '["identity"]'}, {}]],
+                    "distances": [[0.1, 0.6]],
+                }
+
+        async def aget_collection():
+            return _Collection()
+
+        async def agenerate_embedding(text):
+            return [0.1, 0.2]
+
+        monkeypatch.setattr(retrieval, "get_async_redis_client", lambda: None)
+        monkeypatch.setattr(retrieval, "_aget_collection", aget_collection)
+        monkeypatch.setattr(retrieval, "agenerate_embedding", agenerate_embedding)
+
+        page, total = asyncio.run(
+            retrieval.asearch_memories(
+                "u1", "call mom", filters={"layer": "semantic"}, limit=1
+            )
+        )
+
+        assert total == 2
+        assert [item["id"] for item in page] == ["m1"]
+        assert page[0]["persona_tags"] == ["identity"]
+
+        # The sync entry point runs the same async implementation
+        assert retrieval.search_memories(
+            "u1", "call mom", filters={"layer": "semantic"}, limit=1
+        ) == (page, total)
+
+
+class TestAsyncHybridRetrieval:
+    """aretrieve_memories runs strategies concurrently on the event loop."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        monkeypatch.setattr(
+            "src.services.hybrid_retrieval.get_hybrid_retrieval_timeout_seconds",
+            lambda: 0.5,
+        )
+        svc = HybridRetrievalService.__new__(HybridRetrievalService)
+
+        def slow(name, delay):
+            async def strategy(query):
+                await asyncio.sleep(delay)
+                return [_result(name)]
+
+            return strategy
+
+        svc._semantic_retrieval = slow("semantic", 0.2)
+        svc._emotional_retrieval = slow("emotional", 0.2)
+        svc._procedural_retrieval = slow("procedural", 2.0)
+        return svc
+
+    def test_concurrent_with_timeout_degradation(self, service):
+        query = RetrievalQuery(
+            user_id="u1",
+            query_text="walk",
+            emotional_context={"valence": 0.1, "arousal": 0.2},
+        )
+
+        start = time.monotonic()
+        results = asyncio.run(service.aretrieve_memories(query))
+
+        assert time.monotonic() - start < 1.0
+        assert {r.memory_id for r in results} == {"semantic", "emotional"}
+
+
+class TestIngestionOffload:
+    """arun_unified_ingestion keeps the event loop free while the graph runs."""
+
+    def test_ingestions_overlap_off_the_loop(self, monkeypatch):
+        loop_thread = []
+        worker_threads = set()
+
+        def fake_run(request):
+            worker_threads.add(threading.get_ident())
+            time.sleep(0.2)
+            return {"user_id": request}
+
+        monkeypatch.setattr(unified_ingestion_graph, "run_unified_ingestion", fake_run)
+
+        async def main():
+            loop_thread.append(threading.get_ident())
+            start = time.monotonic()
+            states = await asyncio.gather(
+                *(unified_ingestion_graph.arun_unified_ingestion(i) for i in range(4))
+            )
+            return states, time.monotonic() - start
+
+        states, elapsed = asyncio.run(main())
+
+        assert [s["user_id"] for s in states] == [0, 1, 2, 3]
+        assert elapsed < 0.6
+        assert loop_thread[0] not in worker_threads
@@ -0,0 +1,230 @@
+"""
+Unit tests for the bulk episodic, emotional and procedural write APIs.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services import (
+    emotional_memory,
+    episodic_memory,
+    procedural_memory,
+    unified_ingestion_graph,
+)
+from src.services.emotional_memory import EmotionalMemoryService
+from src.services.episodic_memory import EpisodicMemory, EpisodicMemoryService
+from src.services.procedural_memory import ProceduralMemoryService
+
+
+class _Cursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.calls.append(("execute", " ".join(sql.split()), params))
+
+    def executemany(self, sql, rows):
+        self.conn.calls.append(("executemany", " ".join(sql.split()), list(rows)))
+
+    def fetchall(self):
+        return self.conn.rows
+
+
+class _Conn:
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.calls = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return _Cursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """One connection per checkout, recorded in order."""
+    checkouts = []
+
+    def install(rows=None):
+        def get_conn():
+            conn = _Conn(rows)
+            checkouts.append(conn)
+            return conn
+
+        for module in (episodic_memory, emotional_memory, procedural_memory):
+            monkeypatch.setattr(module, "get_timescale_conn", get_conn)
+            monkeypatch.setattr(module, "release_timescale_conn", lambda conn: None)
+        return checkouts
+
+    return install
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = MagicMock()
+    client = MagicMock()
+    client.get_or_create_collection.return_value = collection
+    monkeypatch.setattr(episodic_memory, "get_chroma_client", lambda: client)
+    monkeypatch.setattr(emotional_memory, "get_chroma_client", lambda: client)
+    monkeypatch.setattr(procedural_memory, "get_chroma_client", lambda: client)
+    return collection
+
+
+@pytest.fixture
+def embed_calls(monkeypatch):
+    calls = []
+
+    def fake_get_embeddings(texts):
+        calls.append(list(texts))
+        return [[0.0, 1.0] for _ in texts]
+
+    monkeypatch.setattr(episodic_memory, "get_embeddings", fake_get_embeddings)
+    monkeypatch.setattr(
+        "src.services.embedding_utils.get_embeddings", fake_get_embeddings
+    )
+    return calls
+
+
+def _episodic(i: int) -> EpisodicMemory:
+    return EpisodicMemory(
+        id=f"ep-{i}",
+        user_id="u1",
+        event_timestamp=datetime.now(timezone.utc),
+        event_type="experience",
+        content=f"event {i}",
+        tags=["t"],
+    )
+
+
+class TestEpisodicBulk:
+    """store_memories_bulk: one transaction, one upsert, one embed call."""
+
+    def test_one_round_trip_per_store(self, pool, collection, embed_calls):
+        checkouts = pool()
+        memories = [_episodic(i) for i in range(5)]
+
+        stored = EpisodicMemoryService().store_memories_bulk(
+            memories, embeddings=[[1.0, 0.0], None, [1.0, 0.0], None, [1.0, 0.0]]
+        )
+
+        assert stored == 5
+        assert len(checkouts) == 1
+        ((kind, sql, rows),) = checkouts[0].calls
+        assert kind == "executemany" and sql.startswith("INSERT INTO episodic")
+        assert [r[0] for r in rows] == [m.id for m in memories]
+        assert checkouts[0].commits == 1
+        assert embed_calls == [["event 1", "event 3"]]
+        collection.upsert.assert_called_once()
+        assert collection.upsert.call_args.kwargs["ids"] == [m.id for m in memories]
+
+    def test_timescale_failure_stores_nothing(self, monkeypatch, collection):
+        monkeypatch.setattr(episodic_memory, "get_timescale_conn", lambda: None)
+
+        assert EpisodicMemoryService().store_memories_bulk([_episodic(0)]) == 0
+        collection.upsert.assert_not_called()
+
+
+class TestEmotionalBulk:
+    """record_emotional_states_bulk writes rows and patterns in one transaction."""
+
+    def test_batch_writes(self, pool, collection, embed_calls):
+        checkouts = pool()
+        service = EmotionalMemoryService()
+
+        ids = service.record_emotional_states_bulk(
+            "u1",
+            [
+                {"emotional_state": "joy", "valence": 0.8, "arousal": 0.6},
+                {
+                    "emotional_state": "calm",
+                    "valence": 0.2,
+                    "arousal": 0.1,
+                    "embedding": [0.5, 0.5],
+                },
+            ],
+        )
+
+        assert len(ids) == 2
+        assert len(checkouts) == 1
+        conn = checkouts[0]
+        (kind, _, rows), (_, pattern_sql, patterns) = conn.calls
+        assert kind == "executemany" and [r[0] for r in rows] == ids
+        assert rows[0][9] is not None  # intensity derived from valence/arousal
+        assert "INSERT INTO emotional_patterns" in pattern_sql
+        assert {p["emotion"] for p in patterns} == {"joy", "calm"}
+        assert conn.commits == 1
+        assert embed_calls == [["joy  "]]
+        collection.upsert.assert_called_once()
+        assert collection.upsert.call_args.kwargs["embeddings"][1] == [0.5, 0.5]
+
+
+class TestProceduralBulk:
+    """practice_skills_bulk shares one connection and transaction."""
+
+    def test_sessions_in_one_transaction(self, pool):
+        checkouts = pool(rows=[{"skill_name": "chess", "proficiency_level": "expert"}])
+
+        recorded = ProceduralMemoryService().practice_skills_bulk(
+            "u1",
+            [
+                {"skill_name": "chess", "success_rate": 0.5},
+                {"skill_name": "go", "notes": "first game"},
+                {"skill_name": "chess", "success_rate": 0.9},
+            ],
+        )
+
+        assert recorded == 3
+        assert len(checkouts) == 1
+        conn = checkouts[0]
+        kinds = [c[0] for c in conn.calls]
+        assert kinds == ["executemany", "execute", "executemany"]
+        updates = conn.calls[0][2]
+        assert [u[4] for u in updates] == ["chess", "go", "chess"]
+        progressions = conn.calls[2][2]
+        assert [p[4] for p in progressions] == ["expert", "beginner", "expert"]
+        assert progressions[1][7] == "first game"
+        assert conn.commits == 1
+
+
+def test_ingestion_nodes_write_in_bulk(monkeypatch):
+    memory = MagicMock()
+    memory.content = "Practiced chess openings"
+    memory.embedding = [0.1, 0.2]
+    memory.confidence = 0.7
+    memory.metadata = {"tags": ["chess"]}
+    memory.timestamp = None
+    memory.type = "explicit"
+
+    procedural_service = MagicMock()
+    procedural_service.practice_skills_bulk.return_value = 2
+    monkeypatch.setattr(
+        procedural_memory, "ProceduralMemoryService", lambda: procedural_service
+    )
+    state = {
+        "user_id": "u1",
+        "memories": [memory, memory],
+        "classifications": [{"is_procedural": True}, {"is_procedural": True}],
+        "storage_results": {},
+        "errors": [],
+    }
+
+    unified_ingestion_graph.node_store_procedural(state)
+
+    procedural_service.practice_skills_bulk.assert_called_once()
+    procedural_service.practice_skill.assert_not_called()
+    assert state["storage_results"]["procedural_stored"] == 2
@@ -0,0 +1,135 @@
+"""
+Unit tests for the process-wide Chroma collection registry and the cached
+embedding dimension used to pick the standard collection name.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.dependencies import chroma as chroma_module
+from src.dependencies.chroma import ChromaNotFoundError, V2ChromaClient
+from src.services import retrieval
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    chroma_module.get_collection_registry().invalidate()
+    retrieval._reset_embedding_dim()
+    yield
+    chroma_module.get_collection_registry().invalidate()
+    retrieval._reset_embedding_dim()
+
+
+def _client_with_collections(collections):
+    client = V2ChromaClient("localhost", 8000, "t", "d")
+    client._make_request = MagicMock(return_value=collections)
+    return client
+
+
+class TestCollectionRegistry:
+    """Handles are resolved once and reused across calls and client instances."""
+
+    def test_get_collection_is_cached(self):
+        client = _client_with_collections([{"name": "memories_3072", "id": "c1"}])
+
+        first = client.get_collection("memories_3072")
+        second = client.get_collection("memories_3072")
+
+        assert first is second
+        assert client._make_request.call_count == 1
+
+    def test_cache_is_shared_between_clients(self):
+        client_a = _client_with_collections([{"name": "memories_3072", "id": "c1"}])
+        client_b = _client_with_collections([])
+
+        handle = client_a.get_or_create_collection("memories_3072")
+
+        assert client_b.get_collection("memories_3072") is handle
+        client_b._make_request.assert_not_called()
+
+    def test_missing_collection_is_not_cached(self):
+        client = _client_with_collections([])
+
+        with pytest.raises(ValueError):
+            client.get_collection("memories_3072")
+        with pytest.raises(ValueError):
+            client.get_collection("memories_3072")
+
+        assert client._make_request.call_count == 2
+
+    def test_404_re_resolves_handle_and_retries(self):
+        client = V2ChromaClient("localhost", 8000, "t", "d")
+        responses = iter(
+            [
+                [{"name": "memories_3072", "id": "old"}],
+                ChromaNotFoundError("gone"),
+                [{"name": "memories_3072", "id": "new"}],
+                {"ids": [["m1"]]},
+            ]
+        )
+
+        def fake_request(method, endpoint, json_data=None, retries=3):
+            value = next(responses)
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        client._make_request = MagicMock(side_effect=fake_request)
+
+        collection = client.get_collection("memories_3072")
+        result = collection.query(query_embeddings=[[0.1]], n_results=1)
+
+        assert result == {"ids": [["m1"]]}
+        assert collection.id == "new"
+        assert client.get_collection("memories_3072").id == "new"
+        last_endpoint = client._make_request.call_args_list[-1].args[1]
+        assert "/collections/new/query" in last_endpoint
+
+
+class TestStandardCollectionName:
+    """Dimension is resolved once instead of probing on every call."""
+
+    def test_probe_runs_once(self, monkeypatch):
+        probe = MagicMock(return_value=[0.0] * 1536)
+        monkeypatch.setattr(retrieval, "generate_embedding", probe)
+        monkeypatch.setattr(retrieval, "get_embedding_dimension", lambda: None)
+
+        names = {retrieval._standard_collection_name() for _ in range(5)}
+
+        assert names == {"memories_1536"}
+        assert probe.call_count == 1
+
+    def test_configured_dimension_skips_probe(self, monkeypatch):
+        probe = MagicMock(return_value=[0.0] * 1536)
+        monkeypatch.setattr(retrieval, "generate_embedding", probe)
+        monkeypatch.setattr(retrieval, "get_embedding_dimension", lambda: 3072)
+        monkeypatch.setattr(retrieval, "get_observed_dimension", lambda: None)
+
+        assert retrieval._standard_collection_name() == "memories_3072"
+        probe.assert_not_called()
+
+    def test_configured_dimension_is_confirmed_lazily(self, monkeypatch):
+        observed = {"dim": None}
+        monkeypatch.setattr(retrieval, "get_embedding_dimension", lambda: 3072)
+        monkeypatch.setattr(
+            retrieval, "get_observed_dimension", lambda: observed["dim"]
+        )
+
+        assert retrieval._standard_collection_name() == "memories_3072"
+
+        observed["dim"] = 1536
+        assert retrieval._standard_collection_name() == "memories_1536"
+
+    def test_probe_failure_falls_back_to_model_heuristic(self, monkeypatch):
+        def failing_probe(_text):
+            raise RuntimeError("no key")
+
+        monkeypatch.setattr(retrieval, "generate_embedding", failing_probe)
+        monkeypatch.setattr(retrieval, "get_embedding_dimension", lambda: None)
+        monkeypatch.setattr(retrieval, "get_observed_dimension", lambda: None)
+        monkeypatch.setattr(
+            retrieval, "get_embedding_model_name", lambda: "text-embedding-3-small"
+        )
+
+        assert retrieval._standard_collection_name() == "memories_1536"
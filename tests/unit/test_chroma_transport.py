@@ -0,0 +1,101 @@
+"""
+Unit tests for the pooled V2ChromaClient transport (sync and async).
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.dependencies import chroma as chroma_module
+from src.dependencies.chroma import ChromaNotFoundError, V2ChromaClient
+
+
+def _client(handler, **kwargs) -> V2ChromaClient:
+    client = V2ChromaClient("localhost", 8000, "t", "d", retry_backoff=0.0, **kwargs)
+    transport = httpx.MockTransport(handler)
+    client._http = httpx.Client(transport=transport, **client._client_kwargs())
+    client._async_http = httpx.AsyncClient(
+        transport=transport, **client._client_kwargs()
+    )
+    return client
+
+
+def test_requests_reuse_the_pooled_client():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"nanosecond heartbeat": 1})
+
+    client = _client(handler)
+    pooled = client._get_http()
+
+    client.heartbeat()
+    client.heartbeat()
+
+    assert client._get_http() is pooled
+    assert seen == ["/api/v2/heartbeat", "/api/v2/heartbeat"]
+
+
+def test_connect_errors_are_retried(monkeypatch):
+    attempts = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts["n"] += 1
+        if attempts["n"] < 3:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    monkeypatch.setattr(chroma_module.time, "sleep", lambda _s: None)
+    client = _client(handler)
+
+    assert client._make_request("GET", "/heartbeat") == {"ok": True}
+    assert attempts["n"] == 3
+
+
+def test_404_maps_to_not_found_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"error": "NotFound"})
+
+    client = _client(handler)
+
+    with pytest.raises(ChromaNotFoundError):
+        client._make_request("POST", "/collections/x/query", {})
+
+
+def test_async_twin_uses_async_client_and_non_blocking_backoff(monkeypatch):
+    attempts = {"n": 0}
+    sleeps = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts["n"] += 1
+        if attempts["n"] == 1:
+            raise httpx.ConnectTimeout("slow", request=request)
+        return httpx.Response(200, json={"ids": [["m1"]]})
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    def blocking_sleep(_seconds):
+        raise AssertionError("async path must not call time.sleep")
+
+    monkeypatch.setattr(chroma_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(chroma_module.time, "sleep", blocking_sleep)
+    client = _client(handler)
+    collection = chroma_module.V2Collection(client, "memories_3072", "c1")
+
+    result = asyncio.run(collection.aquery(query_embeddings=[[0.1]], n_results=1))
+
+    assert result == {"ids": [["m1"]]}
+    assert len(sleeps) == 1
+
+
+def test_http2_falls_back_without_h2(monkeypatch, caplog):
+    monkeypatch.setattr(chroma_module, "_http2_available", lambda: False)
+
+    with caplog.at_level("WARNING", logger="agentic_memories.chroma"):
+        client = V2ChromaClient("localhost", 8000, "t", "d", http2=True)
+
+    assert client.http2 is False
+    assert "'h2' is not installed" in caplog.text
@@ -0,0 +1,121 @@
+"""
+Unit tests for the vectorized greedy clustering used by compaction.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.services import compaction_graph
+from src.services.compaction_graph import _cluster_memories, _greedy_cluster_indices
+
+
+def _reference_clusters(vectors, threshold):
+    """Pure-Python greedy complete-linkage clustering (previous implementation)."""
+
+    def cos(a, b):
+        na = sum(x * x for x in a) ** 0.5
+        nb = sum(y * y for y in b) ** 0.5
+        if na <= 0 or nb <= 0:
+            return None
+        return sum(x * y for x, y in zip(a, b)) / (na * nb)
+
+    used, clusters = set(), []
+    for i in range(len(vectors)):
+        if i in used:
+            continue
+        cluster = [i]
+        used.add(i)
+        for j in range(i + 1, len(vectors)):
+            if j in used:
+                continue
+            sim = cos(vectors[i], vectors[j])
+            if sim is None or sim < threshold:
+                continue
+            if all(cos(vectors[k], vectors[j]) >= threshold for k in cluster[1:]):
+                if len(cluster) < 10:
+                    cluster.append(j)
+                    used.add(j)
+        if 3 <= len(cluster) <= 10:
+            clusters.append(cluster)
+    return clusters
+
+
+def _topic_vectors(n, dim=16, topics=6, noise=0.35, seed=7):
+    rng = random.Random(seed)
+    centers = [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(topics)]
+    return [
+        [c + rng.gauss(0, noise) for c in centers[rng.randrange(topics)]]
+        for _ in range(n)
+    ]
+
+
+class TestGreedyClusterIndices:
+    """The vectorized engine reproduces the greedy complete-linkage result."""
+
+    @pytest.mark.parametrize("threshold", [0.6, 0.75, 0.9])
+    def test_matches_reference(self, threshold):
+        vectors = _topic_vectors(120)
+
+        assert _greedy_cluster_indices(vectors, threshold) == _reference_clusters(
+            vectors, threshold
+        )
+
+    def test_tiling_does_not_change_result(self):
+        vectors = _topic_vectors(90)
+
+        expected = _greedy_cluster_indices(vectors, 0.75)
+
+        assert expected
+        assert _greedy_cluster_indices(vectors, 0.75, tile_rows=1) == expected
+        assert _greedy_cluster_indices(vectors, 0.75, tile_rows=7) == expected
+
+    def test_cluster_size_bounds(self):
+        vectors = [[1.0, 0.0]] * 25 + [[0.0, 1.0]] * 2
+
+        clusters = _greedy_cluster_indices(vectors, 0.75)
+
+        assert [len(c) for c in clusters] == [10, 10, 5]
+        assert all(i < 25 for c in clusters for i in c)
+
+    def test_complete_linkage_rejects_chain(self):
+        # b and c are both close to the seed a, but not to each other.
+        a, b, c, d = [1.0, 0.0], [0.866, 0.5], [0.866, -0.5], [0.97, 0.26]
+
+        assert _greedy_cluster_indices([a, b, c], 0.75) == []
+        assert _greedy_cluster_indices([a, b, c, d], 0.75) == [[0, 1, 3]]
+        assert _reference_clusters([a, b, c, d], 0.75) == [[0, 1, 3]]
+
+    def test_zero_vectors_never_cluster(self):
+        vectors = np.array([[0.0, 0.0]] * 3 + [[1.0, 0.0]] * 3, dtype=np.float32)
+
+        assert _greedy_cluster_indices(vectors, 0.75) == [[3, 4, 5]]
+        assert vectors[3].tolist() == [1.0, 0.0]
+
+
+class TestClusterMemories:
+    """_cluster_memories maps engine clusters back to memory dicts."""
+
+    def test_groups_by_dimension_in_seed_order(self, monkeypatch):
+        vectors = {
+            "a": [1.0, 0.0],
+            "b": [1.0, 0.0, 0.0],
+            "c": [0.9, 0.1],
+            "d": [0.9, 0.1, 0.0],
+            "e": [1.0, 0.05],
+            "f": [1.0, 0.05, 0.0],
+        }
+        monkeypatch.setattr(
+            compaction_graph,
+            "get_embeddings",
+            lambda texts: [vectors[t] for t in texts],
+        )
+        memories = [{"id": k, "content": k} for k in vectors]
+
+        clusters = _cluster_memories(memories)
+
+        assert [[m["id"] for m in c] for c in clusters] == [
+            ["a", "c", "e"],
+            ["b", "d", "f"],
+        ]
@@ -0,0 +1,200 @@
+"""
+Unit tests for the Redis-backed per-user compaction job queue.
+"""
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.services import compaction_graph, compaction_queue
+from src.services.compaction_queue import (
+    DEAD_KEY,
+    LEASE_KEY,
+    QUEUE_KEY,
+    claim_job,
+    complete_job,
+    enqueue_users,
+    fail_job,
+    queue_progress,
+)
+from tests.fixtures.redis_mock import MockRedisClient
+
+
+@pytest.fixture
+def r(monkeypatch):
+    monkeypatch.setattr(compaction_queue, "get_compaction_max_attempts", lambda: 3)
+    monkeypatch.setattr(
+        compaction_queue, "get_compaction_retry_backoff_seconds", lambda: 60
+    )
+    monkeypatch.setattr(compaction_queue, "get_compaction_lease_seconds", lambda: 30)
+    return MockRedisClient()
+
+
+class TestQueue:
+    """Claiming, completing and failing per-user jobs."""
+
+    def test_enqueue_is_idempotent(self, r):
+        assert enqueue_users(r, ["u1", "u2", "u1"], now=100) == 2
+        assert enqueue_users(r, ["u2", "u3"], now=200) == 1
+
+        progress = queue_progress(r, now=300)
+        assert progress["queued"] == 3
+        assert progress["enqueued"] == 3
+
+    def test_each_user_is_leased_once(self, r):
+        enqueue_users(r, ["u1"], now=100)
+
+        lease = claim_job(r, "w1", now=100)
+
+        assert lease.user_id == "u1"
+        assert lease.attempt == 1
+        assert claim_job(r, "w2", now=100) is None
+        assert queue_progress(r, now=100)["running"] == 1
+
+        complete_job(r, lease)
+
+        progress = queue_progress(r, now=100)
+        assert (progress["running"], progress["completed"]) == (0, 1)
+        assert not r.exists(LEASE_KEY.format(user_id="u1"))
+
+    def test_failures_back_off_then_dead_letter(self, r):
+        enqueue_users(r, ["u1"], now=0)
+
+        lease = claim_job(r, "w1", now=0)
+        assert fail_job(r, lease, "boom", now=0) == "retry"
+        assert r.zscore(QUEUE_KEY, "u1") == 60
+        assert claim_job(r, "w1", now=59) is None
+
+        lease = claim_job(r, "w1", now=60)
+        assert lease.attempt == 2
+        assert fail_job(r, lease, "boom", now=60) == "retry"
+        assert r.zscore(QUEUE_KEY, "u1") == 60 + 120
+
+        lease = claim_job(r, "w1", now=180)
+        assert lease.attempt == 3
+        assert fail_job(r, lease, "boom", now=180) == "dead_lettered"
+        assert r.sismember(DEAD_KEY, "u1")
+        assert r.zcard(QUEUE_KEY) == 0
+        assert r.hget(compaction_queue.ERRORS_KEY, "u1") == "boom"
+
+    def test_expired_lease_is_retried(self, r):
+        enqueue_users(r, ["u1"], now=0)
+        claim_job(r, "w1", now=0)
+
+        # The worker died: its lease key expires without a heartbeat.
+        r.delete(LEASE_KEY.format(user_id="u1"))
+
+        assert claim_job(r, "w2", now=10) is None
+        assert r.zscore(QUEUE_KEY, "u1") == 70
+        lease = claim_job(r, "w2", now=70)
+        assert (lease.user_id, lease.attempt) == ("u1", 2)
+
+    def test_stale_holder_cannot_heartbeat(self, r):
+        enqueue_users(r, ["u1"], now=0)
+        lease = claim_job(r, "w1", now=0)
+
+        r.delete(LEASE_KEY.format(user_id="u1"))
+
+        assert compaction_queue.heartbeat(r, lease) is False
+
+
+class TestDrain:
+    """drain_queue runs jobs across a worker pool and isolates failures."""
+
+    def test_failed_user_does_not_block_others(self, r, monkeypatch):
+        ran = []
+
+        def fake_compaction(user_id):
+            ran.append(user_id)
+            if user_id == "bad":
+                raise RuntimeError("stuck")
+            time.sleep(0.05)
+            return {"user_id": user_id, "dedup_removed": 0}
+
+        monkeypatch.setattr(
+            "src.services.forget.run_compaction_for_user", fake_compaction
+        )
+        enqueue_users(r, ["a", "bad", "c", "d"])
+
+        processed = compaction_queue.drain_queue(workers=3, r=r)
+
+        progress = queue_progress(r)
+        assert processed == 4
+        assert sorted(ran) == ["a", "bad", "c", "d"]
+        assert progress["completed"] == 3
+        assert progress["retried"] == 1
+        # The failed user is scheduled for a later retry, not re-run immediately.
+        assert progress["queued"] == 1 and progress["ready"] == 0
+
+
+class TestLLMConcurrencyCap:
+    """_llm_slots bounds concurrent LLM-bound compaction stages."""
+
+    def test_caps_in_flight_calls(self, monkeypatch):
+        monkeypatch.setattr(
+            compaction_graph, "get_compaction_llm_concurrency", lambda: 2
+        )
+        compaction_graph._llm_slots.cache_clear()
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def call():
+            with compaction_graph._llm_slots():
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.05)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        compaction_graph._llm_slots.cache_clear()
+
+        assert peak[0] == 2
+
+
+class TestMaintenanceEndpoint:
+    """/v1/maintenance enqueues jobs and reports queue progress."""
+
+    def test_post_enqueues_and_get_reports(self, app_module, monkeypatch):
+        r = MockRedisClient()
+        r.sadd("recent_users:" + time.strftime("%Y%m%d", time.gmtime()), "u1", "u2")
+        started = []
+        monkeypatch.setattr(app_module, "get_redis_client", lambda: r)
+        monkeypatch.setattr(
+            app_module,
+            "_drain_compaction_queue_in_background",
+            lambda: started.append(True),
+        )
+
+        with TestClient(app_module.app) as client:
+            posted = client.post("/v1/maintenance", json={"jobs": ["compaction"]})
+            status = client.get("/v1/maintenance")
+
+        assert posted.status_code == 200
+        assert posted.json()["status"] == "queued"
+        assert posted.json()["progress"]["queued"] == 2
+        assert started == [True]
+        assert status.json()["status"] == "running"
+        assert status.json()["progress"]["enqueued"] == 2
+
+    def test_post_without_redis_is_unavailable(self, app_module, monkeypatch):
+        started = []
+        monkeypatch.setattr(app_module, "get_redis_client", lambda: None)
+        monkeypatch.setattr(
+            app_module,
+            "_drain_compaction_queue_in_background",
+            lambda: started.append(True),
+        )
+
+        with TestClient(app_module.app) as client:
+            posted = client.post("/v1/maintenance", json={"jobs": ["compaction"]})
+
+        assert posted.status_code == 503
+        assert started == []
@@ -0,0 +1,143 @@
+"""
+Unit tests for compaction reading stored embeddings instead of re-embedding.
+"""
+
+import numpy as np
+import pytest
+
+from src.services import compaction_graph, compaction_ops, forget
+
+
+class _Collection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.get_calls = []
+        self.deleted = []
+
+    def get(self, where=None, limit=None, offset=None, include=None):
+        self.get_calls.append({"limit": limit, "offset": offset, "include": include})
+        page = self.rows[offset : offset + limit]
+        return {
+            "ids": [r[0] for r in page],
+            "documents": [r[1] for r in page],
+            "metadatas": [{"user_id": "u1"} for _ in page],
+            "embeddings": [r[2] for r in page],
+        }
+
+    def delete(self, ids=None, where=None):
+        self.deleted.extend(ids)
+
+
+@pytest.fixture
+def no_embedding_calls(monkeypatch):
+    calls = []
+
+    def fake_get_embeddings(texts):
+        calls.append(list(texts))
+        return [[0.0, 1.0] for _ in texts]
+
+    monkeypatch.setattr(compaction_ops, "get_embeddings", fake_get_embeddings)
+    monkeypatch.setattr(compaction_graph, "get_embeddings", fake_get_embeddings)
+    return calls
+
+
+class TestFetchUserEmbeddings:
+    """fetch_user_embeddings pages through Chroma and returns a float32 matrix."""
+
+    def test_pages_with_offset_and_includes_embeddings(self, no_embedding_calls):
+        rows = [(f"m{i}", f"doc {i}", [float(i), 1.0]) for i in range(7)]
+        col = _Collection(rows)
+
+        stored = compaction_ops.fetch_user_embeddings(
+            "u1", limit=100, page_size=3, col=col
+        )
+
+        assert [(c["offset"], c["limit"]) for c in col.get_calls] == [
+            (0, 3),
+            (3, 3),
+            (6, 3),
+        ]
+        assert all("embeddings" in c["include"] for c in col.get_calls)
+        assert stored.ids == [r[0] for r in rows]
+        assert stored.embeddings.dtype == np.float32
+        assert stored.embeddings.flags["C_CONTIGUOUS"]
+        assert stored.embeddings.shape == (7, 2)
+        assert no_embedding_calls == []
+
+    def test_limit_caps_last_page(self, no_embedding_calls):
+        col = _Collection([(f"m{i}", "d", [1.0, 0.0]) for i in range(10)])
+
+        stored = compaction_ops.fetch_user_embeddings(
+            "u1", limit=5, page_size=3, col=col
+        )
+
+        assert [(c["offset"], c["limit"]) for c in col.get_calls] == [(0, 3), (3, 2)]
+        assert len(stored.ids) == 5
+
+    def test_missing_vectors_are_backfilled(self, no_embedding_calls):
+        col = _Collection([("a", "has", [1.0, 0.0]), ("b", "missing", None)])
+
+        stored = compaction_ops.fetch_user_embeddings("u1", col=col)
+
+        assert no_embedding_calls == [["missing"]]
+        assert stored.embeddings.tolist() == [[1.0, 0.0], [0.0, 1.0]]
+
+
+class TestNearDuplicateRows:
+    """near_duplicate_rows keeps the first row of each near-duplicate group."""
+
+    def test_greedy_order(self):
+        vectors = [
+            [1.0, 0.0],
+            [0.0, 1.0],
+            [0.99, 0.05],
+            [0.0, 0.0],
+            [0.02, 1.0],
+            [1.0, 0.01],
+        ]
+
+        assert sorted(compaction_ops.near_duplicate_rows(vectors, 0.9)) == [2, 4, 5]
+
+    def test_removed_rows_do_not_remove_others(self):
+        # b duplicates a; c duplicates b but not a, so c survives.
+        a, b, c = [1.0, 0.0], [0.9, 0.44], [0.6, 0.8]
+
+        assert compaction_ops.near_duplicate_rows([a, b, c], 0.88) == [1]
+
+
+class TestDedupUsesStoredVectors:
+    """Both simple_deduplicate variants make zero embedding calls."""
+
+    @pytest.mark.parametrize("module", [compaction_ops, forget])
+    def test_no_reembedding(self, module, monkeypatch, no_embedding_calls):
+        col = _Collection(
+            [
+                ("a", "likes tea", [1.0, 0.0]),
+                ("b", "enjoys tea", [0.999, 0.01]),
+                ("c", "has a dog", [0.0, 1.0]),
+            ]
+        )
+        monkeypatch.setattr(module, "_get_collection", lambda: col)
+
+        stats = module.simple_deduplicate("u1")
+
+        assert stats == {"scanned": 3, "removed": 1}
+        assert col.deleted == ["b"]
+        assert no_embedding_calls == []
+
+
+class TestClusterWithStoredEmbeddings:
+    """_cluster_memories uses supplied vectors and skips empty content."""
+
+    def test_supplied_matrix(self, no_embedding_calls):
+        memories = [{"id": str(i), "content": "x"} for i in range(6)]
+        memories[1]["content"] = ""
+        matrix = np.array(
+            [[1, 0], [1, 0], [0.98, 0.1], [0, 1], [0.99, 0.05], [0.1, 1]],
+            dtype=np.float32,
+        )
+
+        clusters = compaction_graph._cluster_memories(memories, embeddings=matrix)
+
+        assert [[m["id"] for m in c] for c in clusters] == [["0", "2", "4"]]
+        assert no_embedding_calls == []
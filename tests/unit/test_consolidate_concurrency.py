@@ -0,0 +1,112 @@
+"""
+Unit tests for concurrent cluster consolidation and batched apply.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models import Memory
+from src.services import compaction_graph
+
+
+def _cluster(prefix):
+    return [{"id": f"{prefix}-{i}", "content": prefix} for i in range(3)]
+
+
+def _golden(prefix):
+    return {
+        "memory": Memory(
+            user_id="u1", content=f"golden {prefix}", layer="semantic", type="explicit"
+        ),
+        "source_ids": [m["id"] for m in _cluster(prefix)],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _no_rate_limit(monkeypatch):
+    monkeypatch.setattr(
+        compaction_graph, "_llm_rate_limiter", lambda: compaction_graph._RateLimiter(0)
+    )
+    monkeypatch.setattr(
+        compaction_graph, "get_compaction_consolidate_parallelism", lambda: 4
+    )
+
+
+class TestConsolidateClusters:
+    """Clusters are consolidated concurrently with per-cluster isolation."""
+
+    def test_runs_concurrently_and_keeps_order(self, monkeypatch):
+        def fake(user_id, cluster):
+            time.sleep(0.2)
+            if cluster[0]["content"] == "bad":
+                raise RuntimeError("llm down")
+            return _golden(cluster[0]["content"])
+
+        monkeypatch.setattr(compaction_graph, "_consolidate_cluster", fake)
+        clusters = [_cluster(p) for p in ("a", "bad", "c", "d")]
+
+        start = time.monotonic()
+        results = compaction_graph._consolidate_clusters("u1", clusters)
+
+        assert time.monotonic() - start < 0.5
+        assert [r["memory"] and r["memory"].content for r in results] == [
+            "golden a",
+            None,
+            "golden c",
+            "golden d",
+        ]
+
+    def test_rate_limiter_spaces_calls(self):
+        limiter = compaction_graph._RateLimiter(600)  # one call per 0.1s
+
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+
+        assert time.monotonic() - start >= 0.29
+
+
+class TestApplyConsolidations:
+    """Golden records are applied with one upsert and one delete."""
+
+    @pytest.fixture
+    def collection(self, monkeypatch):
+        col = MagicMock()
+        monkeypatch.setattr(compaction_graph, "_get_collection", lambda: col)
+        monkeypatch.setattr(
+            compaction_graph,
+            "get_embeddings",
+            lambda texts: [[0.1, 0.2] for _ in texts],
+        )
+        return col
+
+    def test_single_batched_upsert_and_delete(self, collection, monkeypatch):
+        upserts = []
+        monkeypatch.setattr(
+            compaction_graph,
+            "upsert_memories",
+            lambda user_id, memories: upserts.append(list(memories)),
+        )
+        golden = [_golden("a"), _golden("b")]
+
+        assert compaction_graph._apply_consolidations("u1", golden) == (2, 6, 0)
+        assert len(upserts) == 1 and len(upserts[0]) == 2
+        assert all(m.embedding == [0.1, 0.2] for m in upserts[0])
+        collection.delete.assert_called_once_with(
+            ids=["a-0", "a-1", "a-2", "b-0", "b-1", "b-2"]
+        )
+
+    def test_batch_failure_falls_back_per_cluster(self, collection, monkeypatch):
+        def upsert(user_id, memories):
+            if len(memories) > 1 or memories[0].content == "golden bad":
+                raise RuntimeError("rejected")
+
+        monkeypatch.setattr(compaction_graph, "upsert_memories", upsert)
+        golden = [_golden("a"), _golden("bad"), _golden("c")]
+
+        assert compaction_graph._apply_consolidations("u1", golden) == (2, 6, 1)
+        collection.delete.assert_called_once_with(
+            ids=["a-0", "a-1", "a-2", "c-0", "c-1", "c-2"]
+        )
@@ -0,0 +1,122 @@
+"""
+Unit tests for cached, pre-parsed cron schedules.
+"""
+
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from croniter import croniter
+
+from src.services.cron_schedule import CronSchedule, get_cron_schedule
+
+
+def _reference_next(expression, tz_name, after):
+    """What intent_service computed before schedules were cached."""
+    now_local = after.astimezone(ZoneInfo(tz_name))
+    return croniter(expression, now_local).get_next(datetime).astimezone(timezone.utc)
+
+
+class TestNextFires:
+    """Re-seeded schedules agree with a fresh croniter."""
+
+    @pytest.mark.parametrize(
+        "expression,tz_name",
+        [
+            ("0 9 * * *", "America/Los_Angeles"),
+            ("30 2 * * *", "America/New_York"),  # skipped on spring-forward day
+            ("*/15 9-17 * * 1-5", "Europe/London"),
+            ("0 0 L * *", "Asia/Tokyo"),
+            ("5 4 * * sun", "UTC"),
+        ],
+    )
+    def test_matches_fresh_croniter_across_dst(self, expression, tz_name):
+        schedule = CronSchedule(expression, tz_name)
+        rng = random.Random(7)
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for _ in range(50):
+            after = start + timedelta(minutes=rng.randrange(365 * 24 * 60))
+
+            assert schedule.next_fire(after) == _reference_next(
+                expression, tz_name, after
+            )
+
+    def test_next_n_fires_are_consecutive(self):
+        schedule = CronSchedule("0 */6 * * *", "UTC")
+        after = datetime(2025, 3, 1, 1, 0, tzinfo=timezone.utc)
+
+        fires = schedule.next_fires(after, 5)
+
+        assert fires[0] == datetime(2025, 3, 1, 6, 0, tzinfo=timezone.utc)
+        assert [b - a for a, b in zip(fires, fires[1:])] == [timedelta(hours=6)] * 4
+        assert all(f.tzinfo == timezone.utc for f in fires)
+
+    def test_until_bounds_iteration(self):
+        schedule = CronSchedule("0 * * * *", "UTC")
+        after = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+        fires = schedule.next_fires(after, 1000, until=after + timedelta(hours=24))
+
+        assert len(fires) == 24
+        assert fires[-1] == after + timedelta(hours=24)
+
+    def test_naive_after_is_utc(self):
+        schedule = CronSchedule("0 12 * * *", "UTC")
+
+        assert schedule.next_fire(datetime(2025, 3, 1, 11, 0)) == datetime(
+            2025, 3, 1, 12, 0, tzinfo=timezone.utc
+        )
+
+    def test_remembered_fire_is_reused_only_within_its_window(self):
+        schedule = CronSchedule("0 9 * * *", "UTC")
+        nine = datetime(2025, 3, 1, 9, 0, tzinfo=timezone.utc)
+
+        assert schedule.next_fire(nine - timedelta(hours=5)) == nine
+        assert schedule.next_fire(nine - timedelta(seconds=1)) == nine
+        assert schedule.next_fire(nine) == nine + timedelta(days=1)
+        assert schedule.next_fire(nine - timedelta(hours=6)) == nine
+
+    def test_concurrent_callers_share_one_schedule(self):
+        schedule = CronSchedule("*/5 * * * *", "UTC")
+        base = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        mismatches = []
+
+        def worker(offset):
+            for i in range(200):
+                after = base + timedelta(minutes=offset * 1000 + i)
+                if schedule.next_fire(after) != _reference_next(
+                    "*/5 * * * *", "UTC", after
+                ):
+                    mismatches.append(after)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert mismatches == []
+
+
+class TestCache:
+    """Schedules are cached by (expression, timezone); failures are not."""
+
+    def test_same_key_returns_same_schedule(self):
+        a = get_cron_schedule("0 9 * * *", "Europe/Paris")
+
+        assert get_cron_schedule("0 9 * * *", "Europe/Paris") is a
+        assert get_cron_schedule("0 9 * * *", "Europe/Berlin") is not a
+
+    @pytest.mark.parametrize(
+        "expression,tz_name",
+        [("not a cron", "UTC"), ("0 9 * * *", "Mars/Olympus_Mons")],
+    )
+    def test_invalid_input_raises_and_is_not_cached(self, expression, tz_name):
+        before = get_cron_schedule.cache_info().currsize
+
+        with pytest.raises(Exception):
+            get_cron_schedule(expression, tz_name)
+
+        assert get_cron_schedule.cache_info().currsize == before
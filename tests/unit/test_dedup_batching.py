@@ -0,0 +1,140 @@
+"""
+Unit tests for the batched duplicate check in the ingestion graph.
+"""
+
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import unified_ingestion_graph
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.strip().lower().encode()).hexdigest()
+
+
+class _Collection:
+    def __init__(self, stored_hashes=(), distances=None):
+        self.stored_hashes = set(stored_hashes)
+        self.distances = distances or {}
+        self.get_calls = []
+        self.query_calls = []
+
+    def get(self, where=None, include=None, **kwargs):
+        self.get_calls.append(where)
+        wanted = where["$and"][1]["content_hash"]["$in"]
+        found = [h for h in wanted if h in self.stored_hashes]
+        return {
+            "ids": found,
+            "metadatas": [{"content_hash": h} for h in found],
+        }
+
+    def query(self, query_embeddings, n_results, where):
+        self.query_calls.append(query_embeddings)
+        return {
+            "distances": [
+                [self.distances.get(tuple(e), 0.9)] for e in query_embeddings
+            ],
+            "documents": [["existing"] for _ in query_embeddings],
+        }
+
+
+def _memory(content, embedding):
+    return SimpleNamespace(content=content, embedding=embedding, metadata={})
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = _Collection()
+    client = SimpleNamespace(get_or_create_collection=lambda name: collection)
+    monkeypatch.setattr("src.dependencies.chroma.get_chroma_client", lambda: client)
+    monkeypatch.setattr(
+        "src.services.retrieval._standard_collection_name", lambda: "memories_3"
+    )
+    return collection
+
+
+def _run(memories):
+    state = {
+        "user_id": "u1",
+        "memories": memories,
+        "classifications": [{"i": i} for i in range(len(memories))],
+        "metrics": {},
+    }
+    return unified_ingestion_graph.node_dedup_check(state)
+
+
+class TestBatchedDedup:
+    """One hash lookup and one vector query per transcript."""
+
+    def test_single_round_trip_per_pass(self, collection):
+        memories = [
+            _memory("Runs every morning", [1.0, 0.0]),
+            _memory("Has a dog named Rex", [0.0, 1.0]),
+            _memory("Likes green tea", [0.6, 0.8]),
+        ]
+
+        state = _run(memories)
+
+        assert len(collection.get_calls) == 1
+        clause = collection.get_calls[0]["$and"]
+        assert clause[0] == {"user_id": "u1"}
+        assert sorted(clause[1]["content_hash"]["$in"]) == sorted(
+            _hash(m.content) for m in memories
+        )
+        assert collection.query_calls == [[[1.0, 0.0], [0.0, 1.0], [0.6, 0.8]]]
+        assert len(state["memories"]) == 3
+        assert state["metrics"]["duplicates_avoided"] == 0
+
+    def test_existing_hash_and_semantic_matches_are_dropped(self, collection):
+        collection.stored_hashes = {_hash("Runs every morning")}
+        collection.distances = {(0.0, 1.0): 0.1}
+        memories = [
+            _memory("  RUNS every morning ", [1.0, 0.0]),
+            _memory("Has a dog named Rex", [0.0, 1.0]),
+            _memory("Likes green tea", [0.6, 0.8]),
+        ]
+
+        state = _run(memories)
+
+        # Exact hash matches are not re-queried semantically.
+        assert collection.query_calls == [[[0.0, 1.0], [0.6, 0.8]]]
+        assert [m.content for m in state["memories"]] == ["Likes green tea"]
+        assert state["classifications"] == [{"i": 2}]
+        assert state["metrics"]["duplicates_avoided"] == 2
+
+    def test_threshold_is_unchanged(self, collection):
+        collection.distances = {(1.0, 0.0): 0.15, (0.0, 1.0): 0.149}
+
+        state = _run([_memory("a", [1.0, 0.0]), _memory("b", [0.0, 1.0])])
+
+        assert [m.content for m in state["memories"]] == ["a"]
+
+    def test_intra_batch_duplicates_collapse(self, collection):
+        memories = [
+            _memory("Likes green tea", [0.6, 0.8]),
+            _memory("likes green tea", [0.6, 0.8]),
+            _memory("Enjoys green tea", [0.61, 0.79]),
+            _memory("Has a dog named Rex", [0.0, 1.0]),
+        ]
+
+        state = _run(memories)
+
+        assert [m.content for m in state["memories"]] == [
+            "Likes green tea",
+            "Has a dog named Rex",
+        ]
+        assert state["classifications"] == [{"i": 0}, {"i": 3}]
+        assert state["metrics"]["duplicates_avoided"] == 2
+
+    def test_lookup_failures_pass_memories_through(self, collection):
+        def boom(*args, **kwargs):
+            raise RuntimeError("chroma down")
+
+        collection.get = boom
+        collection.query = boom
+
+        state = _run([_memory("a", [1.0, 0.0]), _memory("b", [0.0, 1.0])])
+
+        assert len(state["memories"]) == 2
@@ -0,0 +1,149 @@
+"""
+Unit tests for batched embedding generation in embedding_utils.get_embeddings.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import embedding_utils
+
+
+class _ProviderError(Exception):
+    """Stand-in for an openai.APIStatusError carrying an HTTP status."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class _FakeEmbeddings:
+    """Records each request and returns vectors derived from the input text."""
+
+    def __init__(self, fail_times: int = 0, shuffle: bool = False):
+        self.calls = []
+        self.fail_times = fail_times
+        self.shuffle = shuffle
+
+    def create(self, model, input):
+        self.calls.append(list(input))
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise _ProviderError(429)
+        data = [
+            SimpleNamespace(index=i, embedding=[float(len(text)), float(i)])
+            for i, text in enumerate(input)
+        ]
+        if self.shuffle:
+            data.reverse()
+        return SimpleNamespace(data=data)
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(embedding_utils, "get_embedding_cache", lambda: None)
+    embeddings = _FakeEmbeddings()
+    client = SimpleNamespace(embeddings=embeddings)
+    monkeypatch.setattr(embedding_utils, "get_llm_client", lambda *a, **k: client)
+    embeddings.sleeps = []
+    monkeypatch.setattr(embedding_utils.time, "sleep", embeddings.sleeps.append)
+    return embeddings
+
+
+def test_single_request_for_small_batch(fake_client):
+    vectors = embedding_utils.get_embeddings(["a", "bb", "ccc"])
+
+    assert len(fake_client.calls) == 1
+    assert [v[0] for v in vectors] == [1.0, 2.0, 3.0]
+
+
+def test_order_is_preserved_when_provider_reorders(fake_client):
+    fake_client.shuffle = True
+
+    vectors = embedding_utils.get_embeddings(["a", "bb", "ccc"])
+
+    assert [v[0] for v in vectors] == [1.0, 2.0, 3.0]
+
+
+def test_item_limit_splits_batches(fake_client, monkeypatch):
+    monkeypatch.setattr(embedding_utils, "EMBEDDING_BATCH_MAX_ITEMS", 2)
+
+    vectors = embedding_utils.get_embeddings(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert [len(call) for call in fake_client.calls] == [2, 2, 1]
+    assert [v[0] for v in vectors] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_token_budget_splits_batches(fake_client, monkeypatch):
+    monkeypatch.setattr(embedding_utils, "EMBEDDING_BATCH_MAX_TOKENS", 30)
+    texts = ["x" * 80, "y" * 80, "z" * 8]
+
+    embedding_utils.get_embeddings(texts)
+
+    assert [len(call) for call in fake_client.calls] == [1, 2]
+
+
+def test_only_failed_sub_batch_is_retried(fake_client, monkeypatch):
+    monkeypatch.setattr(embedding_utils, "EMBEDDING_BATCH_MAX_ITEMS", 2)
+    original_create = fake_client.create
+    state = {"failed": False}
+
+    def flaky_create(model, input):
+        if input == ["ccc"] and not state["failed"]:
+            state["failed"] = True
+            fake_client.calls.append(list(input))
+            raise _ProviderError(503)
+        return original_create(model, input)
+
+    fake_client.create = flaky_create
+
+    vectors = embedding_utils.get_embeddings(["a", "bb", "ccc"])
+
+    assert fake_client.calls == [["a", "bb"], ["ccc"], ["ccc"]]
+    assert [v[0] for v in vectors] == [1.0, 2.0, 3.0]
+    assert fake_client.sleeps == [embedding_utils.EMBEDDING_RETRY_BACKOFF_SECONDS]
+
+
+def test_persistent_failure_raises(fake_client, monkeypatch):
+    monkeypatch.setattr(embedding_utils, "EMBEDDING_BATCH_RETRIES", 1)
+    monkeypatch.setattr("src.services.tracing.trace_error", lambda *a, **k: None)
+    fake_client.fail_times = 5
+
+    with pytest.raises(RuntimeError):
+        embedding_utils.get_embeddings(["a"])
+
+    assert len(fake_client.calls) == 2
+
+
+def test_retries_back_off_exponentially(fake_client, monkeypatch):
+    monkeypatch.setattr("src.services.tracing.trace_error", lambda *a, **k: None)
+    fake_client.fail_times = 5
+
+    with pytest.raises(RuntimeError):
+        embedding_utils.get_embeddings(["a"])
+
+    base = embedding_utils.EMBEDDING_RETRY_BACKOFF_SECONDS
+    assert len(fake_client.calls) == embedding_utils.EMBEDDING_BATCH_RETRIES + 1
+    assert fake_client.sleeps == [base, base * 2]
+
+
+def test_non_retryable_error_is_not_retried(fake_client, monkeypatch):
+    monkeypatch.setattr("src.services.tracing.trace_error", lambda *a, **k: None)
+
+    def bad_request(model, input):
+        fake_client.calls.append(list(input))
+        raise _ProviderError(400)
+
+    fake_client.create = bad_request
+
+    with pytest.raises(RuntimeError):
+        embedding_utils.get_embeddings(["a"])
+
+    assert len(fake_client.calls) == 1
+    assert fake_client.sleeps == []
+
+
+def test_empty_input_makes_no_request(fake_client):
+    assert embedding_utils.get_embeddings([]) == []
+    assert fake_client.calls == []
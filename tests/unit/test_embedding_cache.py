@@ -0,0 +1,104 @@
+"""
+Unit tests for the two-tier (LRU + Redis) embedding cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import embedding_utils
+from src.services.embedding_cache import EmbeddingCache, decode_vector, encode_vector
+from tests.fixtures.redis_mock import MockRedisClient
+
+
+@pytest.fixture
+def redis():
+    return MockRedisClient()
+
+
+@pytest.fixture
+def cache(redis):
+    return EmbeddingCache(max_items=2, ttl_seconds=60, redis_factory=lambda: redis)
+
+
+def test_vectors_round_trip_as_float32_blobs():
+    blob = encode_vector([0.5, -1.25, 3.0])
+
+    assert len(blob) == 12
+    assert decode_vector(blob) == [0.5, -1.25, 3.0]
+
+
+def test_miss_then_local_hit(cache):
+    assert cache.get("m", "hello") is None
+
+    cache.put("m", "hello", [1.0, 2.0])
+
+    assert cache.get("m", "hello") == [1.0, 2.0]
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["local_hits"] == 1
+
+
+def test_redis_tier_serves_other_processes(cache, redis):
+    cache.put("m", "hello", [1.0, 2.0])
+    other = EmbeddingCache(max_items=2, ttl_seconds=60, redis_factory=lambda: redis)
+
+    assert other.get("m", "hello") == [1.0, 2.0]
+    assert other.stats()["redis_hits"] == 1
+    assert all(isinstance(v, bytes) for v in redis._data.values())
+
+
+def test_lru_evicts_oldest_entry(cache):
+    cache._redis_factory = lambda: None
+    cache.put("m", "a", [1.0])
+    cache.put("m", "b", [2.0])
+    cache.get("m", "a")
+    cache.put("m", "c", [3.0])
+
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") == [1.0]
+    assert cache.stats()["local_size"] == 2
+
+
+def test_keys_are_per_model(cache):
+    cache.put("model-a", "hello", [1.0])
+
+    assert cache.get("model-b", "hello") is None
+
+
+def test_invalidate_model_drops_both_tiers(cache, redis):
+    cache.put("m", "hello", [1.0])
+    cache.put("other", "hello", [2.0])
+
+    cache.invalidate_model("m")
+
+    assert cache.get("m", "hello") is None
+    assert cache.get("other", "hello") == [2.0]
+    fresh = EmbeddingCache(max_items=2, ttl_seconds=60, redis_factory=lambda: redis)
+    assert fresh.get("m", "hello") is None
+
+
+def test_get_embeddings_only_embeds_uncached_distinct_texts(cache, monkeypatch):
+    calls = []
+
+    def create(model, input):
+        calls.append(list(input))
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(index=i, embedding=[float(len(t))])
+                for i, t in enumerate(input)
+            ]
+        )
+
+    client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(embedding_utils, "get_llm_client", lambda *a, **k: client)
+    monkeypatch.setattr(embedding_utils, "get_embedding_cache", lambda: cache)
+    cache.put(embedding_utils.EMBEDDING_MODEL, "recent memories", [9.0])
+
+    vectors = embedding_utils.get_embeddings(["recent memories", "abc", "abc"])
+
+    assert calls == [["abc"]]
+    assert vectors == [[9.0], [3.0], [3.0]]
+    assert embedding_utils.get_embeddings(["abc"]) == [[3.0]]
+    assert len(calls) == 1
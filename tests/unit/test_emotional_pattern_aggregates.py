@@ -0,0 +1,179 @@
+"""
+Unit tests for running (Welford) emotional pattern aggregates.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.services import emotional_memory
+from src.services.emotional_memory import (
+    EmotionalMemory,
+    EmotionalMemoryService,
+    _aggregate_states,
+)
+
+
+def _state(emotion, valence, arousal, minutes=0, trigger=None):
+    return EmotionalMemory(
+        id=f"{emotion}-{minutes}",
+        user_id="u1",
+        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc)
+        + timedelta(minutes=minutes),
+        emotional_state=emotion,
+        valence=valence,
+        arousal=arousal,
+        trigger_event=trigger,
+    )
+
+
+class _Cursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.calls.append(("execute", sql, params))
+
+    def executemany(self, sql, rows):
+        if self.conn.fail_on and self.conn.fail_on in sql:
+            raise RuntimeError("boom")
+        self.conn.calls.append(("executemany", sql, list(rows)))
+
+    def fetchall(self):
+        return []
+
+
+class _Conn:
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_on = fail_on
+
+    def cursor(self):
+        return _Cursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def conns(monkeypatch):
+    opened = []
+
+    def get_conn():
+        opened.append(_Conn())
+        return opened[-1]
+
+    monkeypatch.setattr(emotional_memory, "get_timescale_conn", get_conn)
+    monkeypatch.setattr(emotional_memory, "release_timescale_conn", lambda c: None)
+    monkeypatch.setattr(emotional_memory, "get_chroma_client", lambda: None)
+    return opened
+
+
+class TestAggregateStates:
+    """Batch aggregates match a direct population mean/variance."""
+
+    def test_matches_numpy(self):
+        rng = np.random.default_rng(7)
+        valence = rng.uniform(-1, 1, 50)
+        arousal = rng.uniform(0, 1, 50)
+        states = [
+            _state("joy", float(v), float(a), minutes=i)
+            for i, (v, a) in enumerate(zip(valence, arousal))
+        ]
+
+        agg = _aggregate_states(states)["joy"]
+
+        assert agg["count"] == 50
+        assert agg["mean_valence"] == pytest.approx(valence.mean())
+        assert agg["m2_valence"] / 50 == pytest.approx(valence.var())
+        assert agg["m2_arousal"] / 50 == pytest.approx(arousal.var())
+        assert agg["start_time"] == states[0].timestamp
+        assert agg["end_time"] == states[-1].timestamp
+
+    def test_groups_by_emotion_and_dedups_triggers(self):
+        agg = _aggregate_states(
+            [
+                _state("joy", 0.5, 0.5, 0, "run"),
+                _state("calm", 0.1, 0.1, 1),
+                _state("joy", 0.7, 0.3, 2, "run"),
+            ]
+        )
+
+        assert set(agg) == {"joy", "calm"}
+        assert agg["joy"]["triggers"] == ["run"]
+        assert agg["calm"]["triggers"] is None
+        assert agg["calm"]["m2_valence"] == 0.0
+
+
+class TestPatternUpsert:
+    """Recording states costs one upsert batch in the insert's transaction."""
+
+    def test_record_state_upserts_without_rescan(self, conns, monkeypatch):
+        service = EmotionalMemoryService()
+        monkeypatch.setattr(
+            service,
+            "_get_recent_emotional_states",
+            lambda *a: pytest.fail("patterns must not rescan recent states"),
+        )
+
+        service.record_emotional_state("u1", "joy", valence=0.6, arousal=0.4)
+
+        (conn,) = conns
+        insert, (kind, sql, rows) = conn.calls
+        assert "INSERT INTO emotional_memories" in insert[1]
+        assert kind == "executemany"
+        assert "ON CONFLICT (user_id, pattern_type, dominant_emotion)" in sql
+        assert len(rows) == 1
+        assert rows[0]["count"] == 1 and rows[0]["m2_valence"] == 0.0
+        assert rows[0]["mean_valence"] == 0.6
+        assert conn.commits == 1
+
+    def test_bulk_folds_one_row_per_emotion(self, conns):
+        EmotionalMemoryService().record_emotional_states_bulk(
+            "u1",
+            [
+                {"emotional_state": "joy", "valence": 0.2, "arousal": 0.4},
+                {"emotional_state": "joy", "valence": 0.6, "arousal": 0.6},
+                {"emotional_state": "fear", "valence": -0.5, "arousal": 0.9},
+            ],
+        )
+
+        (conn,) = conns
+        rows = conn.calls[1][2]
+        by_emotion = {r["emotion"]: r for r in rows}
+        assert set(by_emotion) == {"joy", "fear"}
+        assert by_emotion["joy"]["count"] == 2
+        assert by_emotion["joy"]["mean_valence"] == pytest.approx(0.4)
+        assert by_emotion["joy"]["m2_valence"] == pytest.approx(0.08)
+
+    def test_pattern_failure_rolls_back_the_rows(self, monkeypatch):
+        conn = _Conn(fail_on="emotional_patterns")
+        monkeypatch.setattr(emotional_memory, "get_timescale_conn", lambda: conn)
+        monkeypatch.setattr(emotional_memory, "release_timescale_conn", lambda c: None)
+        monkeypatch.setattr(emotional_memory, "get_chroma_client", lambda: None)
+
+        with pytest.raises(RuntimeError):
+            EmotionalMemoryService().record_emotional_states_bulk(
+                "u1", [{"emotional_state": "joy", "valence": 0.2, "arousal": 0.4}]
+            )
+
+        assert (conn.commits, conn.rollbacks) == (0, 1)
+
+    def test_patterns_read_applies_min_states(self, conns):
+        EmotionalMemoryService().get_emotional_patterns("u1")
+
+        ((_, sql, params),) = conns[0].calls
+        assert "frequency >= %s" in sql
+        assert params == ("u1", emotional_memory.PATTERN_MIN_STATES)
@@ -0,0 +1,65 @@
+"""
+Unit tests for running async implementations from sync callers.
+"""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from src.dependencies import event_loop
+
+_request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class TestRunSync:
+    """run_sync drives coroutines on one shared loop from any thread."""
+
+    def test_returns_result_and_keeps_context(self):
+        async def work():
+            await asyncio.sleep(0)
+            return _request_id.get(), threading.current_thread().name
+
+        token = _request_id.set("req-1")
+        try:
+            value, thread = event_loop.run_sync(work())
+        finally:
+            _request_id.reset(token)
+
+        assert value == "req-1"
+        assert thread != threading.current_thread().name
+
+    def test_exceptions_propagate(self):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            event_loop.run_sync(fail())
+
+    def test_uses_registered_app_loop(self):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        event_loop.set_app_loop(loop)
+        try:
+
+            async def which_loop():
+                return asyncio.get_running_loop()
+
+            assert event_loop.run_sync(which_loop()) is loop
+        finally:
+            event_loop.set_app_loop(None)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def test_refuses_event_loop_thread(self):
+        async def noop():
+            return None
+
+        async def main():
+            event_loop.run_sync(noop())
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(main())
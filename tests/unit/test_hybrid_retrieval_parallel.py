@@ -0,0 +1,138 @@
+"""
+Unit tests for the concurrent strategy fan-out in HybridRetrievalService,
+driven through the sync ``retrieve_memories`` entry point.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.services import hybrid_retrieval
+from src.services.hybrid_retrieval import (
+    HybridRetrievalService,
+    RetrievalQuery,
+    RetrievalResult,
+)
+
+
+def _result(memory_id: str) -> RetrievalResult:
+    return RetrievalResult(
+        memory_id=memory_id,
+        memory_type="episodic",
+        content=memory_id,
+        relevance_score=0.5,
+        recency_score=0.5,
+        importance_score=0.5,
+    )
+
+
+def _slow(memory_id: str, delay: float):
+    async def strategy(query):
+        await asyncio.sleep(delay)
+        return [_result(memory_id)]
+
+    return strategy
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(
+        hybrid_retrieval, "get_hybrid_retrieval_timeout_seconds", lambda: 2.0
+    )
+    svc = HybridRetrievalService.__new__(HybridRetrievalService)
+    svc._semantic_retrieval = _slow("semantic", 0.2)
+    svc._temporal_retrieval = _slow("temporal", 0.2)
+    svc._emotional_retrieval = _slow("emotional", 0.2)
+    svc._procedural_retrieval = _slow("procedural", 0.2)
+    return svc
+
+
+@pytest.fixture
+def query():
+    now = datetime.now(timezone.utc)
+    return RetrievalQuery(
+        user_id="u1",
+        query_text="hiking",
+        time_range=(now - timedelta(days=1), now),
+        emotional_context={"valence": 0.5, "arousal": 0.3},
+        limit=10,
+    )
+
+
+class TestParallelFanOut:
+    """Strategies run concurrently and degrade independently."""
+
+    def test_latency_tracks_slowest_strategy(self, service, query):
+        start = time.monotonic()
+        results = service.retrieve_memories(query, parallel=True)
+        elapsed = time.monotonic() - start
+
+        assert {r.memory_id for r in results} == {
+            "semantic",
+            "temporal",
+            "emotional",
+            "procedural",
+        }
+        assert elapsed < 0.6
+
+    def test_slow_strategy_is_dropped_after_timeout(self, service, query, monkeypatch):
+        monkeypatch.setattr(
+            hybrid_retrieval, "get_hybrid_retrieval_timeout_seconds", lambda: 0.4
+        )
+        service._temporal_retrieval = _slow("temporal", 1.5)
+
+        start = time.monotonic()
+        results = service.retrieve_memories(query, parallel=True)
+
+        assert time.monotonic() - start < 1.0
+        assert "temporal" not in {r.memory_id for r in results}
+        assert len(results) == 3
+
+    def test_failing_strategy_does_not_fail_request(self, service, query):
+        async def boom(query):
+            raise RuntimeError("backend down")
+
+        service._emotional_retrieval = boom
+
+        results = service.retrieve_memories(query, parallel=True)
+
+        assert {r.memory_id for r in results} == {
+            "semantic",
+            "temporal",
+            "procedural",
+        }
+
+    def test_sequential_mode_runs_in_plan_order(self, service, query):
+        order = []
+
+        def record(name):
+            async def strategy(query):
+                order.append(name)
+                return []
+
+            return strategy
+
+        service._semantic_retrieval = record("semantic")
+        service._temporal_retrieval = record("temporal")
+        service._emotional_retrieval = record("emotional")
+        service._procedural_retrieval = record("procedural")
+
+        service.retrieve_memories(query, parallel=False)
+
+        assert order == ["semantic", "temporal", "emotional", "procedural"]
+
+    def test_plan_uses_browse_without_query_text(self, service):
+        plan = service._plan_strategies(
+            RetrievalQuery(user_id="u1", memory_types=["episodic"])
+        )
+
+        assert [name for name, _ in plan] == ["browse"]
+
+    def test_sync_entry_point_refuses_event_loop_thread(self, service, query):
+        async def main():
+            service.retrieve_memories(query)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(main())
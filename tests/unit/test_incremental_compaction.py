@@ -0,0 +1,289 @@
+"""
+Unit tests for watermark-based incremental compaction.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.services import compaction_graph, compaction_ops, compaction_watermark
+from src.services.compaction_watermark import CompactionWatermark, plan_since
+from tests.fixtures.redis_mock import MockRedisClient
+
+DAY = 86400
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = MockRedisClient()
+    monkeypatch.setattr(compaction_watermark, "get_redis_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def cadence(monkeypatch):
+    monkeypatch.setattr(
+        compaction_watermark, "get_compaction_full_recluster_days", lambda: 7
+    )
+
+
+class TestPlanSince:
+    """plan_since picks a full or incremental run."""
+
+    def test_no_watermark_is_full(self, cadence):
+        assert plan_since(None) is None
+        assert plan_since(None, incremental=True) is None
+
+    def test_incremental_until_cadence_is_due(self, cadence):
+        wm = CompactionWatermark(stored_at=500, full_at=1_000)
+
+        assert plan_since(wm, now=1_000 + 6 * DAY) == 500
+        assert plan_since(wm, now=1_000 + 7 * DAY) is None
+        assert plan_since(wm, incremental=True, now=1_000 + 30 * DAY) == 500
+        assert plan_since(wm, incremental=False, now=1_001) is None
+
+    def test_zero_cadence_disables_incremental(self, monkeypatch):
+        monkeypatch.setattr(
+            compaction_watermark, "get_compaction_full_recluster_days", lambda: 0
+        )
+
+        assert plan_since(CompactionWatermark(5, 10), now=11) is None
+
+    def test_watermark_round_trip(self, redis):
+        compaction_watermark.set_watermark("u1", CompactionWatermark(42, 7))
+
+        assert compaction_watermark.get_watermark("u1") == CompactionWatermark(42, 7)
+        assert compaction_watermark.get_watermark("u2") is None
+
+
+class _Collection:
+    """Chroma stand-in holding (id, doc, vector, stored_at) rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.get_wheres = []
+        self.deleted = []
+
+    def _visible(self, where):
+        since = None
+        if "$and" in where:
+            since = where["$and"][1]["stored_at"]["$gt"]
+        return [r for r in self.rows if since is None or (r[3] or 0) > since]
+
+    def get(self, where=None, limit=None, offset=None, include=None):
+        self.get_wheres.append(where)
+        page = self._visible(where)[offset : offset + limit]
+        return {
+            "ids": [r[0] for r in page],
+            "documents": [r[1] for r in page],
+            "metadatas": [{"user_id": "u1"} for _ in page],
+            "embeddings": [r[2] for r in page],
+        }
+
+    def query(self, query_embeddings, n_results, where, include=None):
+        out = {"ids": [], "documents": [], "metadatas": [], "embeddings": []}
+        for q in query_embeddings:
+            q = np.asarray(q)
+            ranked = sorted(self.rows, key=lambda r: -float(np.dot(q, r[2])))
+            ranked = ranked[:n_results]
+            out["ids"].append([r[0] for r in ranked])
+            out["documents"].append([r[1] for r in ranked])
+            out["metadatas"].append([{"user_id": "u1"} for _ in ranked])
+            out["embeddings"].append([r[2] for r in ranked])
+        return out
+
+    def delete(self, ids=None, where=None):
+        self.deleted.extend(ids)
+
+
+class TestIncrementalDedup:
+    """incremental_deduplicate only scans memories newer than the watermark."""
+
+    def test_new_rows_checked_against_corpus(self):
+        col = _Collection(
+            [
+                ("old-tea", "likes tea", [1.0, 0.0, 0.0], 100),
+                ("old-dog", "has a dog", [0.0, 1.0, 0.0], None),
+                ("new-tea", "enjoys tea", [0.99, 0.05, 0.0], 300),
+                ("new-run", "runs daily", [0.0, 0.0, 1.0], 300),
+                ("new-run-2", "jogs daily", [0.0, 0.02, 1.0], 301),
+            ]
+        )
+
+        stats = compaction_ops.incremental_deduplicate("u1", since=200, col=col)
+
+        assert col.get_wheres[0] == {
+            "$and": [{"user_id": "u1"}, {"stored_at": {"$gt": 200}}]
+        }
+        assert stats == {"scanned": 3, "removed": 2}
+        assert col.deleted == ["new-tea", "new-run-2"]
+
+
+class TestIncrementalConsolidation:
+    """Incremental consolidation clusters new memories with their neighbours."""
+
+    def test_candidates_are_new_plus_neighbours(self, monkeypatch):
+        rows = [(f"old-{i}", "x", [1.0, 0.01 * i], 100) for i in range(4)]
+        rows += [("old-far", "y", [0.0, 1.0], 100), ("new", "z", [1.0, 0.02], 300)]
+        col = _Collection(rows)
+        monkeypatch.setattr(compaction_ops, "_get_collection", lambda: col)
+        monkeypatch.setattr(compaction_graph, "_get_collection", lambda: col)
+
+        memories, matrix, fresh_ids = compaction_graph._load_consolidation_candidates(
+            "u1", limit=100, since=200
+        )
+
+        assert fresh_ids == {"new"}
+        assert memories[0]["id"] == "new"
+        assert {m["id"] for m in memories} == {r[0] for r in rows}
+        assert matrix.shape == (len(memories), 2)
+        assert matrix.dtype == np.float32
+
+
+class TestTimescaleDedupLookback:
+    """TimescaleDB dedup is bounded on both incremental and full runs."""
+
+    def test_incremental_covers_time_since_watermark(self, monkeypatch):
+        monkeypatch.setattr(compaction_graph._time, "time", lambda: 10 * DAY)
+
+        lookback = compaction_graph._timescale_dedup_lookback(9 * DAY)
+
+        assert lookback == timedelta(days=1, hours=1)
+
+    def test_full_run_uses_configured_window(self, monkeypatch):
+        monkeypatch.setattr(
+            compaction_graph, "get_compaction_dedup_lookback_days", lambda: 30
+        )
+
+        assert compaction_graph._timescale_dedup_lookback(None) == timedelta(days=30)
+
+    def test_zero_days_scans_whole_history(self, monkeypatch):
+        monkeypatch.setattr(
+            compaction_graph, "get_compaction_dedup_lookback_days", lambda: 0
+        )
+
+        assert compaction_graph._timescale_dedup_lookback(None) is None
+
+
+class _Invocations(list):
+    """Graph inputs seen by the stub, plus the metrics it returns."""
+
+    metrics: dict = {}
+
+
+class TestRunCompactionGraph:
+    """run_compaction_graph threads the watermark through the graph."""
+
+    @pytest.fixture
+    def invoked(self, monkeypatch):
+        calls = _Invocations()
+
+        def invoke(state):
+            calls.append(dict(state))
+            return {"metrics": dict(calls.metrics)}
+
+        graph = SimpleNamespace(compile=lambda: SimpleNamespace(invoke=invoke))
+        monkeypatch.setattr(compaction_graph, "build_compaction_graph", lambda: graph)
+        monkeypatch.setattr(compaction_graph._time, "time", lambda: 10 * DAY)
+        return calls
+
+    def test_first_run_is_full_and_sets_watermark(self, redis, cadence, invoked):
+        final = compaction_graph.run_compaction_graph("u1")
+
+        assert invoked[0]["since"] is None
+        assert final["metrics"]["mode"] == "full"
+        assert compaction_watermark.get_watermark("u1") == CompactionWatermark(
+            stored_at=10 * DAY - 1, full_at=10 * DAY
+        )
+
+    def test_next_run_is_incremental(self, redis, cadence, invoked):
+        compaction_watermark.set_watermark("u1", CompactionWatermark(9 * DAY, 8 * DAY))
+
+        final = compaction_graph.run_compaction_graph("u1")
+
+        assert invoked[0]["since"] == 9 * DAY
+        assert final["metrics"]["mode"] == "incremental"
+        assert compaction_watermark.get_watermark("u1") == CompactionWatermark(
+            stored_at=10 * DAY - 1, full_at=8 * DAY
+        )
+
+    def test_dry_run_keeps_watermark(self, redis, cadence, invoked):
+        compaction_watermark.set_watermark("u1", CompactionWatermark(9 * DAY, 8 * DAY))
+
+        compaction_graph.run_compaction_graph("u1", dry_run=True)
+
+        assert compaction_watermark.get_watermark("u1") == CompactionWatermark(
+            9 * DAY, 8 * DAY
+        )
+
+    def test_stage_errors_hold_watermark(self, redis, cadence, invoked):
+        compaction_watermark.set_watermark("u1", CompactionWatermark(9 * DAY, 8 * DAY))
+        invoked.metrics = {"errors": ["consolidate"]}
+
+        final = compaction_graph.run_compaction_graph("u1")
+
+        assert final["metrics"]["errors"] == ["consolidate"]
+        assert compaction_watermark.get_watermark("u1") == CompactionWatermark(
+            9 * DAY, 8 * DAY
+        )
+
+    def test_clean_run_reports_no_errors(self, redis, cadence, invoked):
+        final = compaction_graph.run_compaction_graph("u1")
+
+        assert final["metrics"]["errors"] == []
+
+
+class TestStageErrors:
+    """Failed stages are surfaced in metrics["errors"]."""
+
+    def test_failed_consolidation_is_recorded(self, monkeypatch):
+        monkeypatch.setattr(
+            compaction_graph,
+            "_llm_rate_limiter",
+            lambda: compaction_graph._RateLimiter(0),
+        )
+
+        def fail(user_id, cluster):
+            raise RuntimeError("llm down")
+
+        monkeypatch.setattr(compaction_graph, "_consolidate_cluster", fail)
+        memories = [{"id": f"m{i}", "content": "same"} for i in range(5)]
+        monkeypatch.setattr(
+            compaction_graph,
+            "_load_consolidation_candidates",
+            lambda user_id, limit, since=None: (memories, None, None),
+        )
+        monkeypatch.setattr(
+            compaction_graph,
+            "_cluster_memories",
+            lambda memories, threshold, embeddings=None: [memories],
+        )
+        nodes = compaction_graph.build_compaction_graph().nodes
+        consolidate = nodes["consolidate"].runnable.func
+
+        state = consolidate({"user_id": "u1", "skip_consolidate": False, "metrics": {}})
+
+        assert state["metrics"]["errors"] == ["consolidate"]
+        assert state["metrics"]["consolidated_count"] == 0
+
+    def test_failed_apply_is_recorded(self, monkeypatch):
+        def fail(user_id, memories):
+            raise RuntimeError("chroma down")
+
+        monkeypatch.setattr(compaction_graph, "upsert_memories", fail)
+        nodes = compaction_graph.build_compaction_graph().nodes
+        apply = nodes["apply"].runnable.func
+        memory = SimpleNamespace(content="x")
+
+        state = apply(
+            {
+                "user_id": "u1",
+                "metrics": {},
+                "reextract": {"new_memories": [memory], "delete_ids": ["old"]},
+            }
+        )
+
+        assert state["metrics"]["errors"] == ["apply"]
+        assert state["metrics"]["applied_deletes"] == 0
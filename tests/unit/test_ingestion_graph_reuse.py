@@ -0,0 +1,59 @@
+"""
+Unit tests for reusing the compiled ingestion graph and the shared Langfuse client.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.schemas import Message, TranscriptRequest
+from src.services import unified_ingestion_graph
+
+
+@pytest.fixture
+def request_body():
+    return TranscriptRequest(
+        user_id="u1", history=[Message(role="user", content="I ran 5k today")]
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_graph_cache():
+    unified_ingestion_graph.get_compiled_ingestion_graph.cache_clear()
+    yield
+    unified_ingestion_graph.get_compiled_ingestion_graph.cache_clear()
+
+
+def test_graph_is_built_once_across_requests(monkeypatch, request_body):
+    compiled = MagicMock()
+    compiled.invoke.return_value = {"memory_ids": []}
+    graph = MagicMock()
+    graph.compile.return_value = compiled
+    build = MagicMock(return_value=graph)
+    monkeypatch.setattr(unified_ingestion_graph, "build_unified_ingestion_graph", build)
+    monkeypatch.setattr(
+        "src.dependencies.langfuse_client.get_langfuse_client", lambda: None
+    )
+
+    unified_ingestion_graph.run_unified_ingestion(request_body)
+    unified_ingestion_graph.run_unified_ingestion(request_body)
+
+    assert build.call_count == 1
+    assert compiled.invoke.call_count == 2
+
+
+def test_shared_langfuse_client_is_not_flushed_per_request(monkeypatch, request_body):
+    compiled = MagicMock()
+    compiled.invoke.return_value = {"memory_ids": ["m1"]}
+    monkeypatch.setattr(
+        unified_ingestion_graph, "get_compiled_ingestion_graph", lambda: compiled
+    )
+    client = MagicMock()
+    monkeypatch.setattr(
+        "src.dependencies.langfuse_client.get_langfuse_client", lambda: client
+    )
+
+    state = unified_ingestion_graph.run_unified_ingestion(request_body)
+
+    assert state == {"memory_ids": ["m1"]}
+    client.flush.assert_not_called()
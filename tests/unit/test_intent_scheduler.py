@@ -0,0 +1,315 @@
+"""
+Unit tests for the embedded heap-based intent trigger scheduler.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.services import intent_scheduler
+from src.services.intent_scheduler import (
+    CHANGES_CHANNEL,
+    DUE_STREAM,
+    IntentScheduler,
+    TriggerHeap,
+)
+from src.services.intent_service import IntentClaimBatchResult, IntentService
+
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+def _iso(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+class _Cursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((" ".join(sql.split()), params))
+
+    def fetchall(self):
+        return self.conn.rows
+
+
+class _Conn:
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.executed = []
+
+    def cursor(self):
+        return _Cursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = _Conn()
+    monkeypatch.setattr(intent_scheduler, "get_timescale_conn", lambda: conn)
+    monkeypatch.setattr(intent_scheduler, "release_timescale_conn", lambda c: None)
+    return conn
+
+
+@pytest.fixture
+def scheduler():
+    return IntentScheduler(MagicMock(), resync_seconds=60, worker_id="sched-1")
+
+
+class TestTriggerHeap:
+    """Ordering, rescheduling and lazy removal."""
+
+    def test_pops_due_in_order(self):
+        heap = TriggerHeap()
+        heap.schedule("b", 20.0)
+        heap.schedule("a", 10.0)
+        heap.schedule("c", 30.0)
+
+        assert heap.pop_due(25.0) == ["a", "b"]
+        assert heap.next_due() == 30.0
+        assert len(heap) == 1
+
+    def test_reschedule_and_remove_supersede_old_entries(self):
+        heap = TriggerHeap()
+        heap.schedule("a", 10.0)
+        heap.schedule("b", 15.0)
+        heap.schedule("a", 50.0)
+        heap.remove("b")
+
+        assert heap.pop_due(40.0) == []
+        assert heap.next_due() == 50.0
+        assert "b" not in heap
+
+    def test_stale_entries_are_compacted(self):
+        heap = TriggerHeap()
+        for i in range(500):
+            heap.schedule("a", float(i))
+
+        assert len(heap._heap) <= 2 * len(heap) + 64
+        assert heap.pop_due(1000.0) == ["a"]
+
+
+class TestChanges:
+    """Pub/sub change messages keep the heap in step with the database."""
+
+    def test_upsert_within_horizon(self, scheduler):
+        scheduler.apply_change(
+            json.dumps({"id": "i1", "next_check": _iso(NOW + 30), "enabled": True}),
+            now=NOW,
+        )
+
+        assert scheduler.heap.next_due() == NOW + 30
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"enabled": False, "next_check": None},
+            {"enabled": True, "next_check": None},
+            {"enabled": True, "offset": 3600},
+            {"enabled": True, "offset": 5, "trigger_type": "price"},
+        ],
+    )
+    def test_removals(self, scheduler, change):
+        scheduler.heap.schedule("i1", NOW + 10)
+        offset = change.pop("offset", None)
+        if offset is not None:
+            change["next_check"] = _iso(NOW + offset)
+
+        scheduler.apply_change({"id": "i1", **change}, now=NOW)
+
+        assert "i1" not in scheduler.heap
+
+    def test_bad_message_ignored(self, scheduler):
+        scheduler.apply_change("not json", now=NOW)
+
+        assert len(scheduler.heap) == 0
+
+
+class TestResync:
+    """Resync reloads upcoming time-based intents from the pending index."""
+
+    def test_loads_rows_into_heap(self, scheduler, conn):
+        due = datetime.fromtimestamp(NOW + 5, timezone.utc)
+        conn.rows = [{"id": uuid4(), "due_at": due}, {"id": uuid4(), "due_at": due}]
+        scheduler.heap.schedule("stale", NOW)
+
+        assert scheduler.resync(now=NOW) == 2
+
+        ((sql, params),) = conn.executed
+        assert "GREATEST(next_check, claimed_at + %(claim_timeout)s)" in sql
+        assert params["trigger_types"] == ["cron", "interval", "once"]
+        assert params["horizon"].timestamp() == NOW + 120
+        assert "stale" not in scheduler.heap
+        assert scheduler._wait_seconds(NOW) == pytest.approx(1.0)
+
+
+class TestDispatch:
+    """Due intents are claimed in the database and pushed to the stream."""
+
+    def test_claims_and_pushes(self, scheduler, conn, monkeypatch):
+        claimed_at = datetime.fromtimestamp(NOW, timezone.utc)
+        intents = [
+            SimpleNamespace(
+                id=uuid4(), user_id="u1", trigger_type="cron", next_check=claimed_at
+            )
+        ]
+        calls = []
+
+        def fake_claim(self, worker_id, limit, user_id=None, trigger_types=None):
+            calls.append((worker_id, trigger_types))
+            return IntentClaimBatchResult(
+                success=True,
+                response=SimpleNamespace(intents=intents, claimed_at=claimed_at),
+            )
+
+        monkeypatch.setattr(IntentService, "claim_intents_batch", fake_claim)
+        scheduler.heap.schedule(str(intents[0].id), NOW - 1)
+        scheduler.heap.schedule("later", NOW + 30)
+
+        assert scheduler.dispatch(now=NOW) == 1
+
+        assert calls == [("sched-1", ["cron", "interval", "once"])]
+        pipe = scheduler._r.pipeline.return_value
+        stream, fields = pipe.xadd.call_args[0]
+        assert stream == DUE_STREAM
+        assert fields["intent_id"] == str(intents[0].id)
+        assert fields["user_id"] == "u1"
+        pipe.execute.assert_called_once()
+        assert list(scheduler.heap._due) == ["later"]
+
+    def test_nothing_due_skips_database(self, scheduler, monkeypatch):
+        monkeypatch.setattr(
+            intent_scheduler,
+            "get_timescale_conn",
+            lambda: pytest.fail("must not touch the database"),
+        )
+        scheduler.heap.schedule("later", NOW + 30)
+
+        assert scheduler.dispatch(now=NOW) == 0
+
+    def test_database_unavailable_retries_shortly(self, scheduler, monkeypatch):
+        monkeypatch.setattr(intent_scheduler, "get_timescale_conn", lambda: None)
+        scheduler.heap.schedule("i1", NOW - 1)
+
+        assert scheduler.dispatch(now=NOW) == 0
+        assert scheduler.heap.next_due() == NOW + 1.0
+
+    def test_claim_failure_retries_shortly(self, scheduler, conn, monkeypatch):
+        def failing_claim(self, worker_id, limit, user_id=None, trigger_types=None):
+            return IntentClaimBatchResult(success=False, errors=["Database error"])
+
+        monkeypatch.setattr(IntentService, "claim_intents_batch", failing_claim)
+        scheduler.heap.schedule("i1", NOW - 1)
+        scheduler.heap.schedule("i2", NOW - 2)
+
+        assert scheduler.dispatch(now=NOW) == 0
+        assert scheduler.heap.next_due() == NOW + 1.0
+        assert sorted(scheduler.heap.pop_due(NOW + 1.0)) == ["i1", "i2"]
+
+
+class TestRunLoop:
+    """The loop subscribes, resyncs, applies changes and stops cleanly."""
+
+    def test_applies_changes_until_stopped(self, scheduler, conn):
+        pubsub = scheduler._r.pubsub.return_value
+        message = {
+            "data": json.dumps(
+                {"id": "i1", "next_check": _iso(NOW + 1e6), "enabled": True}
+            )
+        }
+        messages = [message, None]
+
+        def get_message(timeout):
+            if not messages:
+                scheduler._stop.set()
+                return None
+            return messages.pop(0)
+
+        pubsub.get_message.side_effect = get_message
+
+        scheduler.run()
+
+        pubsub.subscribe.assert_called_once_with(CHANGES_CHANNEL)
+        assert conn.executed  # resynced on the first iteration
+        pubsub.close.assert_called_once()
+
+
+class TestNotify:
+    """The intents API publishes changes only when the scheduler is enabled."""
+
+    def test_disabled_is_noop(self, monkeypatch):
+        r = MagicMock()
+        monkeypatch.setattr(
+            intent_scheduler, "is_intent_scheduler_enabled", lambda: False
+        )
+
+        intent_scheduler.notify_intent_changes([("i1", None, False, None)], r=r)
+
+        r.pipeline.assert_not_called()
+
+    def test_publishes_json(self, monkeypatch):
+        r = MagicMock()
+        monkeypatch.setattr(
+            intent_scheduler, "is_intent_scheduler_enabled", lambda: True
+        )
+        next_check = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+        intent_scheduler.notify_intent_changes([("i1", next_check, True, "cron")], r=r)
+
+        channel, payload = r.pipeline.return_value.publish.call_args[0]
+        assert channel == CHANGES_CHANNEL
+        assert json.loads(payload) == {
+            "id": "i1",
+            "next_check": next_check.isoformat(),
+            "enabled": True,
+            "trigger_type": "cron",
+        }
+
+    def test_fire_endpoint_notifies(self, api_client, monkeypatch):
+        from src.routers import intents as intents_router
+
+        changes = []
+        monkeypatch.setattr(
+            intents_router, "notify_intent_changes", lambda c: changes.extend(c)
+        )
+        monkeypatch.setattr(intents_router, "get_timescale_conn", lambda: MagicMock())
+        monkeypatch.setattr(intents_router, "release_timescale_conn", lambda c: None)
+        intent_id = uuid4()
+        next_check = datetime.now(timezone.utc) + timedelta(days=1)
+        monkeypatch.setattr(
+            IntentService,
+            "fire_intent",
+            lambda self, iid, req: SimpleNamespace(
+                success=True,
+                response=intents_router.IntentFireResponse(
+                    intent_id=iid,
+                    status="success",
+                    next_check=next_check,
+                    enabled=True,
+                    execution_count=1,
+                ),
+            ),
+        )
+
+        response = api_client.post(
+            f"/v1/intents/{intent_id}/fire", json={"status": "success"}
+        )
+
+        assert response.status_code == 200
+        assert changes == [(intent_id, next_check, True, None)]
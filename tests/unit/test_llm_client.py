@@ -0,0 +1,58 @@
+"""
+Unit tests for the shared OpenAI/xAI client registry.
+"""
+
+import pytest
+
+from src.dependencies import llm_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients(monkeypatch):
+    monkeypatch.setattr("src.config.is_langfuse_enabled", lambda: False)
+    llm_client.reset_llm_clients()
+    yield
+    llm_client.reset_llm_clients()
+
+
+def test_same_provider_and_key_share_one_client():
+    first = llm_client.get_llm_client("openai", api_key="sk-a")
+    second = llm_client.get_llm_client("openai", api_key="sk-a")
+
+    assert first is second
+
+
+def test_registry_is_keyed_by_api_key_and_base_url():
+    openai_a = llm_client.get_llm_client("openai", api_key="sk-a")
+    openai_b = llm_client.get_llm_client("openai", api_key="sk-b")
+    xai = llm_client.get_llm_client("xai", api_key="sk-a", base_url="https://x/v1")
+
+    assert openai_a is not openai_b
+    assert openai_a is not xai
+    assert str(xai.base_url).startswith("https://x/v1")
+
+
+def test_async_variant_is_cached_separately():
+    sync_client = llm_client.get_llm_client("openai", api_key="sk-a")
+    async_client = llm_client.get_async_llm_client("openai", api_key="sk-a")
+
+    assert async_client is not sync_client
+    assert llm_client.get_async_llm_client("openai", api_key="sk-a") is async_client
+
+
+def test_connection_limits_are_applied(monkeypatch):
+    monkeypatch.setattr(llm_client, "get_llm_max_connections", lambda: 7)
+    monkeypatch.setattr(llm_client, "get_llm_max_keepalive_connections", lambda: 3)
+
+    client = llm_client.get_llm_client("openai", api_key="sk-limits")
+    pool = client._client._transport._pool
+
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+
+
+def test_missing_api_key_raises(monkeypatch):
+    monkeypatch.setattr(llm_client, "get_openai_api_key", lambda: None)
+
+    with pytest.raises(RuntimeError):
+        llm_client.get_llm_client("openai")
@@ -0,0 +1,163 @@
+"""
+Unit tests for the streaming per-user memory scan (iter_user_memories).
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.services import compaction_graph, compaction_ops, retrieval
+
+
+class _Collection:
+    def __init__(self, rows, delay=0.0):
+        self.rows = rows
+        self.delay = delay
+        self.get_calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get(self, ids=None, where=None, limit=None, offset=None, include=None):
+        with self._lock:
+            self.get_calls.append(
+                {
+                    "ids": ids,
+                    "where": where,
+                    "limit": limit,
+                    "offset": offset,
+                    "include": include,
+                }
+            )
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if ids is not None:
+            page = [r for r in self.rows if r[0] in ids]
+        else:
+            page = self.rows[offset : offset + limit]
+        res = {"ids": [r[0] for r in page]}
+        if "documents" in include:
+            res["documents"] = [r[1] for r in page]
+        if "metadatas" in include:
+            res["metadatas"] = [{"layer": "semantic", "n": r[0]} for r in page]
+        if "embeddings" in include:
+            res["embeddings"] = [r[2] for r in page]
+        return res
+
+
+def _rows(n):
+    return [(f"m{i}", f"doc {i}", [float(i), 1.0]) for i in range(n)]
+
+
+class TestIterUserMemories:
+    """Paging, projection and prefetch over collection.get."""
+
+    def test_pages_until_short_page(self):
+        col = _Collection(_rows(7))
+
+        pages = list(retrieval.iter_user_memories("u1", page_size=3, col=col))
+
+        assert [p.ids for p in pages] == [
+            ["m0", "m1", "m2"],
+            ["m3", "m4", "m5"],
+            ["m6"],
+        ]
+        assert [(c["offset"], c["limit"]) for c in col.get_calls] == [
+            (0, 3),
+            (3, 3),
+            (6, 3),
+        ]
+        assert all(c["where"] == {"user_id": "u1"} for c in col.get_calls)
+
+    def test_exact_multiple_stops_on_empty_page(self):
+        col = _Collection(_rows(6))
+
+        pages = list(retrieval.iter_user_memories("u1", page_size=3, col=col))
+
+        assert sum(len(p.ids) for p in pages) == 6
+        assert len(col.get_calls) == 3
+
+    def test_limit_caps_last_page(self):
+        col = _Collection(_rows(10))
+
+        pages = list(retrieval.iter_user_memories("u1", page_size=3, limit=5, col=col))
+
+        assert [(c["offset"], c["limit"]) for c in col.get_calls] == [(0, 3), (3, 2)]
+        assert sum(len(p.ids) for p in pages) == 5
+
+    def test_projection_skips_unrequested_fields(self):
+        col = _Collection(_rows(2))
+
+        (page,) = retrieval.iter_user_memories("u1", include=("embeddings",), col=col)
+
+        assert col.get_calls[0]["include"] == ["embeddings"]
+        assert page.documents is None and page.metadatas is None
+        assert page.embeddings == [[0.0, 1.0], [1.0, 1.0]]
+
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValueError):
+            list(
+                retrieval.iter_user_memories(
+                    "u1", include=("distances",), col=_Collection([])
+                )
+            )
+
+    def test_next_page_is_fetched_while_caller_works(self):
+        col = _Collection(_rows(8), delay=0.1)
+
+        start = time.monotonic()
+        for _ in retrieval.iter_user_memories("u1", page_size=2, col=col):
+            time.sleep(0.1)
+        elapsed = time.monotonic() - start
+
+        # 5 fetches + 4 pages of work serially would take ~0.9s
+        assert elapsed < 0.75
+        assert col.max_in_flight == 1
+
+    def test_abandoned_scan_stops_fetching(self):
+        col = _Collection(_rows(100))
+
+        scan = retrieval.iter_user_memories("u1", page_size=10, col=col)
+        next(scan)
+        scan.close()
+
+        assert len(col.get_calls) <= 2
+
+
+class TestScanConsumers:
+    """Compaction and dedup read only the fields they need."""
+
+    def test_dedup_fetch_skips_documents_and_metadatas(self, monkeypatch):
+        rows = _rows(3) + [("gap", "needs a vector", None)]
+        col = _Collection(rows)
+        embedded = []
+
+        def fake_get_embeddings(texts):
+            embedded.extend(texts)
+            return [[9.0, 9.0] for _ in texts]
+
+        monkeypatch.setattr(compaction_ops, "get_embeddings", fake_get_embeddings)
+
+        stored = compaction_ops.fetch_user_embeddings("u1", col=col, include=())
+
+        assert col.get_calls[0]["include"] == ["embeddings"]
+        assert stored.documents == [] and stored.metadatas == []
+        # Only the row without a vector has its document fetched, by id
+        assert col.get_calls[-1]["ids"] == ["gap"]
+        assert embedded == ["needs a vector"]
+        assert stored.embeddings[3].tolist() == [9.0, 9.0]
+
+    def test_fetch_user_memories_streams_without_embeddings(self, monkeypatch):
+        col = _Collection(_rows(5))
+        monkeypatch.setattr(compaction_graph, "_get_collection", lambda: col)
+
+        items = compaction_graph._fetch_user_memories("u1", limit=4)
+
+        assert [i["id"] for i in items] == ["m0", "m1", "m2", "m3"]
+        assert items[0]["content"] == "doc 0"
+        assert items[0]["metadata"]["layer"] == "semantic"
+        assert all("embeddings" not in c["include"] for c in col.get_calls)
@@ -0,0 +1,191 @@
+"""
+Unit tests for the vectorized price-condition engine, driven by synthetic feeds.
+"""
+
+import operator
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.services.intent_service import IntentService
+from src.services.price_conditions import (
+    OPERATORS,
+    PriceConditionEngine,
+    compile_condition,
+    load_price_intents,
+)
+
+
+NOW = datetime(2025, 6, 1, 15, 30, tzinfo=timezone.utc)
+_PY_OPS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+class TestCompile:
+    """Expressions and structured fields compile to the same condition."""
+
+    def test_expression_and_structured_agree(self):
+        a = compile_condition({"expression": "NVDA <= 130.5"})
+        b = compile_condition({"ticker": "nvda", "operator": "<=", "value": 130.5})
+
+        assert a == b
+        assert (a.ticker, a.operator, a.threshold) == ("NVDA", "<=", 130.5)
+
+    def test_expression_takes_precedence(self):
+        condition = compile_condition(
+            {"expression": "AAPL > 200", "ticker": "NVDA", "operator": "<", "value": 1}
+        )
+
+        assert condition.ticker == "AAPL"
+
+    @pytest.mark.parametrize(
+        "trigger_condition",
+        [
+            {"expression": "NVDA => 130"},
+            {"expression": "any_holding_change > 5%"},
+            {"ticker": "NVDA", "operator": "~", "value": 1},
+            {"ticker": "NVDA", "operator": "<"},
+            {},
+        ],
+    )
+    def test_unsupported_conditions_raise(self, trigger_condition):
+        with pytest.raises(ValueError):
+            compile_condition(trigger_condition)
+
+
+class TestEvaluate:
+    """One vectorized pass matches a per-intent Python evaluation."""
+
+    def test_matches_reference_on_synthetic_feed(self):
+        rng = np.random.default_rng(3)
+        tickers = [f"T{i:03d}" for i in range(40)]
+        engine = PriceConditionEngine()
+        conditions = {}
+        for i in range(2_000):
+            ticker = tickers[rng.integers(len(tickers))]
+            op = OPERATORS[rng.integers(len(OPERATORS))]
+            value = float(rng.integers(90, 111))
+            conditions[str(i)] = (ticker, op, value)
+            engine.add(i, "u1", {"ticker": ticker, "operator": op, "value": value})
+
+        for _ in range(5):
+            quoted = rng.choice(tickers, size=25, replace=False)
+            prices = {t: float(rng.integers(90, 111)) for t in quoted}
+
+            got = {m.intent_id for m in engine.evaluate(prices, now=NOW)}
+
+            expected = {
+                iid
+                for iid, (ticker, op, value) in conditions.items()
+                if ticker in prices and _PY_OPS[op](prices[ticker], value)
+            }
+            assert got == expected
+
+    def test_unquoted_and_nan_prices_are_ignored(self):
+        engine = PriceConditionEngine()
+        engine.add("a", "u1", {"expression": "NVDA < 130"})
+        engine.add("b", "u1", {"expression": "AAPL < 300"})
+
+        assert engine.evaluate({"AAPL": float("nan"), "MSFT": 1.0}, now=NOW) == []
+        (match,) = engine.evaluate({"NVDA": 120.0}, now=NOW)
+        assert (match.intent_id, match.ticker, match.price) == ("a", "NVDA", 120.0)
+
+
+class TestCooldown:
+    """Cooldown filtering mirrors IntentService._check_cooldown."""
+
+    def test_parity_with_check_cooldown(self):
+        rng = np.random.default_rng(11)
+        engine = PriceConditionEngine()
+        expected = set()
+        service = IntentService(None)
+        for i in range(500):
+            cooldown = int(rng.integers(1, 169))
+            last_fire = (
+                None
+                if i % 5 == 0
+                else NOW - timedelta(hours=float(rng.uniform(0, 200)))
+            )
+            engine.add(
+                i,
+                "u1",
+                {"expression": "NVDA > 1", "cooldown_hours": cooldown},
+                last_condition_fire=last_fire,
+            )
+            in_cooldown, _ = service._check_cooldown("price", last_fire, cooldown, NOW)
+            if not in_cooldown:
+                expected.add(str(i))
+
+        got = {m.intent_id for m in engine.evaluate({"NVDA": 10.0}, now=NOW)}
+
+        assert got == expected
+
+    def test_record_fires_starts_cooldown_and_drops_once(self):
+        engine = PriceConditionEngine()
+        engine.add("recurring", "u1", {"expression": "NVDA < 130", "cooldown_hours": 2})
+        engine.add("once", "u1", {"expression": "NVDA < 130", "fire_mode": "once"})
+        assert len(engine.evaluate({"NVDA": 100.0}, now=NOW)) == 2
+
+        engine.record_fires(["recurring", "once", "unknown"], when=NOW)
+
+        assert "once" not in engine
+        assert engine.evaluate({"NVDA": 100.0}, now=NOW + timedelta(hours=1)) == []
+        (match,) = engine.evaluate({"NVDA": 100.0}, now=NOW + timedelta(hours=3))
+        assert match.intent_id == "recurring"
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.sql = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.sql = sql
+
+    def fetchall(self):
+        return self.rows
+
+
+class _Conn:
+    def __init__(self, rows):
+        self.cur = _Cursor(rows)
+        self.commits = 0
+
+    def cursor(self):
+        return self.cur
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_load_price_intents_skips_unsupported():
+    conn = _Conn(
+        [
+            {
+                "id": "a",
+                "user_id": "u1",
+                "trigger_condition": {"expression": "NVDA < 1"},
+            },
+            {"id": "b", "user_id": "u2", "trigger_condition": {"expression": "bad"}},
+            {"id": "c", "user_id": "u3", "trigger_condition": None},
+        ]
+    )
+
+    engine = load_price_intents(conn)
+
+    assert len(engine) == 1 and "a" in engine
+    assert "trigger_type = 'price'" in conn.cur.sql
+    assert conn.commits == 1
@@ -0,0 +1,222 @@
+"""
+Unit tests for the set-based, chunk-bounded TimescaleDB dedup.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.services import compaction_ops
+
+
+class _Cursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((" ".join(sql.split()), params))
+        if sql.lstrip().startswith("DELETE"):
+            self.rowcount = self.conn.removed_per_window
+        else:
+            self.rowcount = 1
+
+    def fetchone(self):
+        return self.conn.span
+
+    def fetchall(self):
+        raise AssertionError("dedup must not pull rows into Python")
+
+
+class _Conn:
+    def __init__(self, span, removed_per_window=0):
+        self.span = span
+        self.removed_per_window = removed_per_window
+        self.executed = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return _Cursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def conn_factory(monkeypatch):
+    released = []
+
+    def install(conn):
+        monkeypatch.setattr(compaction_ops, "get_timescale_conn", lambda: conn)
+        monkeypatch.setattr(
+            compaction_ops, "release_timescale_conn", lambda c: released.append(c)
+        )
+        return conn
+
+    install.released = released
+    return install
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestChunkWindows:
+    """Windows are epoch-aligned and cover the whole span."""
+
+    def test_windows_cover_span(self):
+        first, last = _utc(2025, 1, 2, 5), _utc(2025, 1, 20, 1)
+
+        windows = compaction_ops._chunk_windows(first, last, timedelta(days=7))
+
+        assert windows[0][0] <= first < windows[0][1]
+        assert windows[-1][0] <= last < windows[-1][1]
+        assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        assert (windows[0][0] - epoch) % timedelta(days=7) == timedelta(0)
+
+
+class TestEpisodicDedup:
+    """One DELETE ... USING per chunk window, matched on content_hash."""
+
+    def test_deletes_per_window_without_fetching_rows(self, conn_factory):
+        conn = conn_factory(
+            _Conn(
+                {"cnt": 40, "first": _utc(2025, 1, 1), "last": _utc(2025, 1, 20)},
+                removed_per_window=2,
+            )
+        )
+
+        stats = compaction_ops.deduplicate_episodic("u1")
+
+        windows = compaction_ops._chunk_windows(
+            _utc(2025, 1, 1), _utc(2025, 1, 20), timedelta(days=7)
+        )
+        deletes = [(sql, p) for sql, p in conn.executed if sql.startswith("DELETE")]
+        assert len(deletes) == len(windows) == 4
+        sql, params = deletes[0]
+        assert "USING episodic_memories k" in sql
+        assert "k.content_hash = d.content_hash" in sql
+        assert params["user_id"] == "u1"
+        assert params["end"] - params["start"] == timedelta(days=7)
+        assert stats == {"scanned": 40, "removed": 8}
+        assert conn.commits == 5
+        assert conn_factory.released == [conn]
+
+    def test_refreshes_aggregates_over_touched_windows(self, conn_factory):
+        conn = conn_factory(
+            _Conn(
+                {"cnt": 40, "first": _utc(2025, 1, 1), "last": _utc(2025, 1, 20)},
+                removed_per_window=2,
+            )
+        )
+
+        compaction_ops.deduplicate_episodic("u1")
+
+        windows = compaction_ops._chunk_windows(
+            _utc(2025, 1, 1), _utc(2025, 1, 20), timedelta(days=7)
+        )
+        ((sql, params),) = [(s, p) for s, p in conn.executed if s.startswith("CALL")]
+        assert "refresh_continuous_aggregate" in sql
+        # Days are widened to whole buckets, including the day the last window ends
+        assert params == (
+            "episodic_daily",
+            windows[0][0],
+            windows[-1][1] + timedelta(days=1),
+        )
+
+    def test_nothing_removed_skips_refresh(self, conn_factory):
+        conn = conn_factory(
+            _Conn({"cnt": 40, "first": _utc(2025, 1, 1), "last": _utc(2025, 1, 20)})
+        )
+
+        compaction_ops.deduplicate_episodic("u1")
+
+        assert not any(sql.startswith("CALL") for sql, _ in conn.executed)
+
+    def test_single_row_skips_deletes(self, conn_factory):
+        conn = conn_factory(
+            _Conn({"cnt": 1, "first": _utc(2025, 1, 1), "last": _utc(2025, 1, 1)})
+        )
+
+        stats = compaction_ops.deduplicate_episodic("u1")
+
+        assert stats == {"scanned": 1, "removed": 0}
+        assert not any(sql.startswith("DELETE") for sql, _ in conn.executed)
+
+    def test_lookback_bounds_scan_and_first_window(self, conn_factory):
+        now = datetime.now(timezone.utc)
+        conn = conn_factory(
+            _Conn({"cnt": 5, "first": now - timedelta(days=1), "last": now})
+        )
+
+        compaction_ops.deduplicate_episodic("u1", lookback=timedelta(days=2))
+
+        count_sql, count_params = conn.executed[0]
+        assert "event_timestamp >= %(cutoff)s" in count_sql
+        cutoff = count_params["cutoff"]
+        assert cutoff.minute == cutoff.second == 0
+        first_delete = next(p for s, p in conn.executed if s.startswith("DELETE"))
+        assert first_delete["start"] >= cutoff
+
+    def test_errors_roll_back(self, conn_factory):
+        conn = conn_factory(_Conn({"cnt": 3, "first": None, "last": None}))
+
+        stats = compaction_ops.deduplicate_episodic("u1")
+
+        assert stats == {"scanned": 0, "removed": 0}
+        assert conn.rollbacks == 1
+
+
+class TestEmotionalDedup:
+    """Keeper search stays inside the window and the same hour bucket."""
+
+    def test_delete_is_bucketed_by_hour(self, conn_factory):
+        conn = conn_factory(
+            _Conn(
+                {"cnt": 10, "first": _utc(2025, 1, 1), "last": _utc(2025, 1, 2)},
+                removed_per_window=1,
+            )
+        )
+
+        stats = compaction_ops.deduplicate_emotional("u1")
+
+        deletes = [(sql, p) for sql, p in conn.executed if sql.startswith("DELETE")]
+        assert len(deletes) == 1  # 2025-01-01..02 sits in one 3-day window
+        sql, params = deletes[0]
+        assert "k.timestamp >= %(start)s" in sql
+        assert "time_bucket(INTERVAL '1 hour', k.timestamp)" in sql
+        # NULL and '' triggers are duplicates of each other, as before
+        assert "COALESCE(k.trigger_event, '') = COALESCE(d.trigger_event, '')" in sql
+        assert params["end"] - params["start"] == timedelta(days=3)
+        assert stats == {"scanned": 10, "removed": 1}
+
+
+class TestTtlCleanup:
+    """TTL deletes report their span and refresh the aggregates over it."""
+
+    def test_refreshes_each_table_with_deletions(self, conn_factory):
+        conn = conn_factory(
+            _Conn({"cnt": 3, "first": _utc(2024, 1, 1, 6), "last": _utc(2024, 2, 1, 6)})
+        )
+
+        assert compaction_ops.ttl_cleanup_timescale() == 6
+
+        calls = [p for s, p in conn.executed if s.startswith("CALL")]
+        assert [p[0] for p in calls] == [
+            "episodic_daily",
+            "emotional_hourly",
+            "emotional_daily",
+        ]
+        assert calls[0][1:] == (_utc(2024, 1, 1), _utc(2024, 2, 2))
+        assert conn.commits == 1
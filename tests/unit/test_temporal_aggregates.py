@@ -0,0 +1,263 @@
+"""
+Unit tests for continuous-aggregate trajectories, timelines and long-range
+temporal retrieval.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.config import get_temporal_aggregate_after_days
+from src.routers import memories as memories_router
+from src.services import hybrid_retrieval, temporal_aggregates
+from src.services.hybrid_retrieval import RetrievalQuery
+
+
+class _Cursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((" ".join(sql.split()), params))
+
+    def fetchall(self):
+        return self.conn.rows
+
+
+class _Conn:
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.executed = []
+        self.commits = 0
+
+    def cursor(self):
+        return _Cursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = _Conn()
+    monkeypatch.setattr(temporal_aggregates, "get_timescale_conn", lambda: conn)
+    monkeypatch.setattr(temporal_aggregates, "release_timescale_conn", lambda c: None)
+    return conn
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestTemporalAggregates:
+    """Service reads pick the right aggregate view."""
+
+    @pytest.mark.parametrize(
+        "bucket,view", [("hour", "emotional_hourly"), ("day", "emotional_daily")]
+    )
+    def test_trajectory_reads_bucket_view(self, conn, bucket, view):
+        conn.rows = [{"bucket": _utc(2025, 1, 1), "state_count": 3}]
+
+        rows = temporal_aggregates.get_emotional_trajectory(
+            "u1", _utc(2025, 1, 1), _utc(2025, 1, 8), bucket=bucket
+        )
+
+        ((sql, params),) = conn.executed
+        assert f"FROM {view}" in sql
+        assert f"INTERVAL '1 {bucket}'" in sql
+        assert params == ("u1", _utc(2025, 1, 1), _utc(2025, 1, 8))
+        assert rows == conn.rows
+        assert conn.commits == 1
+
+    def test_trajectory_rejects_unknown_bucket(self, conn):
+        with pytest.raises(ValueError):
+            temporal_aggregates.get_emotional_trajectory(
+                "u1", _utc(2025, 1, 1), _utc(2025, 1, 2), bucket="week"
+            )
+        assert conn.executed == []
+
+    def test_timeline_reads_episodic_daily(self, conn):
+        temporal_aggregates.get_episodic_timeline(
+            "u1", _utc(2025, 1, 1), _utc(2025, 3, 1)
+        )
+
+        ((sql, _),) = conn.executed
+        assert "FROM episodic_daily" in sql
+
+    def test_missing_connection_returns_empty(self, monkeypatch):
+        monkeypatch.setattr(temporal_aggregates, "get_timescale_conn", lambda: None)
+
+        assert (
+            temporal_aggregates.get_episodic_timeline(
+                "u1", _utc(2025, 1, 1), _utc(2025, 1, 2)
+            )
+            == []
+        )
+
+
+class TestAggregateEndpoints:
+    """GET /v1/memories/emotional-trajectory and /v1/memories/timeline."""
+
+    def test_trajectory_endpoint(self, api_client, monkeypatch):
+        calls = []
+
+        def fake_trajectory(user_id, start, end, bucket):
+            calls.append((user_id, end - start, bucket))
+            return [{"bucket": _utc(2025, 1, 1), "state_count": 4, "avg_valence": 0.2}]
+
+        monkeypatch.setattr(
+            memories_router, "get_emotional_trajectory", fake_trajectory
+        )
+
+        response = api_client.get(
+            "/v1/memories/emotional-trajectory",
+            params={"user_id": "u1", "bucket": "hour", "days": 2},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["bucket"] == "hour"
+        assert body["buckets"][0]["state_count"] == 4
+        assert calls == [("u1", timedelta(days=2), "hour")]
+
+    def test_timeline_endpoint_totals(self, api_client, monkeypatch):
+        monkeypatch.setattr(
+            memories_router,
+            "get_episodic_timeline",
+            lambda *a: [
+                {"bucket": _utc(2025, 1, 1), "event_count": 3},
+                {"bucket": _utc(2025, 1, 2), "event_count": 5},
+            ],
+        )
+
+        response = api_client.get("/v1/memories/timeline", params={"user_id": "u1"})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_events"] == 8
+        assert body["active_days"] == 2
+
+    def test_inverted_range_rejected(self, api_client):
+        response = api_client.get(
+            "/v1/memories/timeline",
+            params={
+                "user_id": "u1",
+                "start": "2025-02-01T00:00:00Z",
+                "end": "2025-01-01T00:00:00Z",
+            },
+        )
+
+        assert response.status_code == 400
+
+
+class TestTemporalRetrievalStatements:
+    """Ranges scan raw rows unless the aggregate path is enabled."""
+
+    def test_short_range_scans_raw_rows(self):
+        query = RetrievalQuery(
+            user_id="u1", time_range=(_utc(2025, 1, 1), _utc(2025, 1, 3))
+        )
+
+        (episodic, _), (emotional, _) = hybrid_retrieval._temporal_statements(query)
+
+        assert episodic is hybrid_retrieval._TEMPORAL_EPISODIC_SQL
+        assert emotional is hybrid_retrieval._TEMPORAL_EMOTIONAL_SQL
+
+    def test_long_range_scans_every_row_by_default(self, monkeypatch):
+        monkeypatch.delenv("TEMPORAL_AGGREGATE_AFTER_DAYS", raising=False)
+        monkeypatch.setattr(
+            hybrid_retrieval,
+            "get_temporal_aggregate_after_days",
+            get_temporal_aggregate_after_days.__wrapped__,
+        )
+        query = RetrievalQuery(
+            user_id="u1", time_range=(_utc(2024, 1, 1), _utc(2025, 6, 1))
+        )
+
+        (episodic, params), (emotional, _) = hybrid_retrieval._temporal_statements(
+            query
+        )
+
+        assert episodic is hybrid_retrieval._TEMPORAL_EPISODIC_SQL
+        assert emotional is hybrid_retrieval._TEMPORAL_EMOTIONAL_SQL
+        assert "LIMIT" not in episodic.upper()
+        assert "days" not in params and "per_day" not in params
+
+    def test_long_range_uses_top_days_when_enabled(self, monkeypatch):
+        monkeypatch.setattr(
+            hybrid_retrieval, "get_temporal_aggregate_after_days", lambda: 7
+        )
+        query = RetrievalQuery(
+            user_id="u1", time_range=(_utc(2025, 1, 1), _utc(2025, 6, 1))
+        )
+
+        (episodic, params), (emotional, _) = hybrid_retrieval._temporal_statements(
+            query
+        )
+
+        assert "FROM episodic_daily" in episodic
+        assert "FROM emotional_daily" in emotional
+        assert params["days"] == 14
+        assert params["per_day"] == 10
+
+    def test_caps_are_configurable(self, monkeypatch):
+        monkeypatch.setattr(
+            hybrid_retrieval, "get_temporal_aggregate_after_days", lambda: 7
+        )
+        monkeypatch.setattr(hybrid_retrieval, "get_temporal_top_days", lambda: 30)
+        monkeypatch.setattr(hybrid_retrieval, "get_temporal_rows_per_day", lambda: 50)
+        query = RetrievalQuery(
+            user_id="u1", time_range=(_utc(2025, 1, 1), _utc(2025, 6, 1))
+        )
+
+        (_, params), _ = hybrid_retrieval._temporal_statements(query)
+
+        assert (params["days"], params["per_day"]) == (30, 50)
+
+    def test_zero_threshold_always_scans_raw_rows(self, monkeypatch):
+        monkeypatch.setattr(
+            hybrid_retrieval, "get_temporal_aggregate_after_days", lambda: 0
+        )
+        query = RetrievalQuery(
+            user_id="u1", time_range=(_utc(2025, 1, 1), _utc(2025, 6, 1))
+        )
+
+        (episodic, _), _ = hybrid_retrieval._temporal_statements(query)
+
+        assert episodic is hybrid_retrieval._TEMPORAL_EPISODIC_SQL
+
+
+class TestRefreshAggregates:
+    """Deleted ranges are re-materialized in whole days, outside a transaction."""
+
+    def test_refreshes_every_view_over_whole_days(self):
+        conn = _Conn()
+
+        temporal_aggregates.refresh_aggregates(
+            conn, "emotional_memories", _utc(2025, 1, 3, 5), _utc(2025, 1, 9, 23)
+        )
+
+        assert [p[0] for _, p in conn.executed] == [
+            "emotional_hourly",
+            "emotional_daily",
+        ]
+        sql, params = conn.executed[0]
+        assert sql.startswith("CALL refresh_continuous_aggregate(")
+        assert params[1:] == (_utc(2025, 1, 3), _utc(2025, 1, 10))
+        assert conn.autocommit is False
+
+    def test_empty_range_is_a_no_op(self):
+        conn = _Conn()
+
+        temporal_aggregates.refresh_aggregates(conn, "episodic_memories", None, None)
+
+        assert conn.executed == []
@@ -0,0 +1,120 @@
+"""
+Unit tests for reusing precomputed embeddings in the typed memory stores.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services import emotional_memory, episodic_memory, unified_ingestion_graph
+from src.services.episodic_memory import EpisodicMemory, EpisodicMemoryService
+from src.services.emotional_memory import EmotionalMemoryService
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = MagicMock()
+    client = MagicMock()
+    client.get_or_create_collection.return_value = collection
+    monkeypatch.setattr(episodic_memory, "get_chroma_client", lambda: client)
+    monkeypatch.setattr(emotional_memory, "get_chroma_client", lambda: client)
+    return collection
+
+
+@pytest.fixture
+def embed_calls(monkeypatch):
+    calls = []
+
+    def fake_get_embeddings(texts):
+        calls.append(list(texts))
+        return [[0.0, 1.0] for _ in texts]
+
+    monkeypatch.setattr(episodic_memory, "get_embeddings", fake_get_embeddings)
+    monkeypatch.setattr(
+        "src.services.embedding_utils.get_embeddings", fake_get_embeddings
+    )
+    return calls
+
+
+def _episodic(content: str = "Went hiking") -> EpisodicMemory:
+    return EpisodicMemory(
+        id="ep-1",
+        user_id="u1",
+        event_timestamp=datetime.now(timezone.utc),
+        event_type="experience",
+        content=content,
+    )
+
+
+def test_episodic_store_uses_supplied_vector(collection, embed_calls):
+    service = EpisodicMemoryService()
+
+    service._store_in_chroma(_episodic(), embedding=[0.5, 0.5])
+
+    assert embed_calls == []
+    assert collection.upsert.call_args.kwargs["embeddings"] == [[0.5, 0.5]]
+
+
+def test_episodic_store_embeds_without_vector(collection, embed_calls):
+    EpisodicMemoryService()._store_in_chroma(_episodic())
+
+    assert embed_calls == [["Went hiking"]]
+
+
+def test_emotional_state_uses_supplied_vector(collection, embed_calls, monkeypatch):
+    service = EmotionalMemoryService()
+    monkeypatch.setattr(service, "_store_emotional_memory", lambda memory: None)
+
+    service.record_emotional_state(
+        user_id="u1",
+        emotional_state="joy",
+        valence=0.8,
+        arousal=0.6,
+        embedding=[0.25, 0.75],
+    )
+
+    assert embed_calls == []
+    assert collection.upsert.call_args.kwargs["embeddings"] == [[0.25, 0.75]]
+
+
+def test_ingestion_nodes_pass_build_embedding(monkeypatch):
+    memory = MagicMock()
+    memory.content = "Felt great after the run"
+    memory.embedding = [0.1, 0.2]
+    memory.confidence = 0.9
+    memory.metadata = {"tags": ["running"]}
+    memory.timestamp = None
+    memory.type = "explicit"
+
+    episodic_service = MagicMock()
+    emotional_service = MagicMock()
+    monkeypatch.setattr(
+        episodic_memory, "EpisodicMemoryService", lambda: episodic_service
+    )
+    monkeypatch.setattr(
+        emotional_memory, "EmotionalMemoryService", lambda: emotional_service
+    )
+
+    state = {
+        "user_id": "u1",
+        "memories": [memory],
+        "classifications": [
+            {
+                "is_episodic": True,
+                "is_emotional": True,
+                "sentiment": {"dominant_emotion": "joy", "valence": 0.7},
+            }
+        ],
+        "storage_results": {},
+        "errors": [],
+    }
+
+    unified_ingestion_graph.node_store_episodic(state)
+    unified_ingestion_graph.node_store_emotional(state)
+
+    assert episodic_service.store_memories_bulk.call_args.kwargs["embeddings"] == [
+        [0.1, 0.2]
+    ]
+    (_, states), _ = emotional_service.record_emotional_states_bulk.call_args
+    assert states[0]["embedding"] == [0.1, 0.2]